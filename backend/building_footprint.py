@@ -9,17 +9,31 @@ directly due to CORS restrictions.
 from __future__ import annotations
 
 import asyncio
-import http.client
+import hashlib
+import itertools
 import json
+import logging
 import math
 import os
 import re
-import socket
-import time
-import urllib.error
-import urllib.parse
-import urllib.request
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+import sqlite3
+import threading
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import httpx
+
+from circuit_breaker import CircuitOpenError, provider_breaker, upstream_status_failed
+from footprint_store import FootprintStore
+from mercator_tiles import WEB_MERCATOR_ORIGIN_SHIFT, Tile, bbox_param, cached_tile, child_tiles, tile_bounds, tiles_for_bbox
+from provider_cache import EvidenceCache, SingleFlight
+from request_deadline import bounded_timeout
+from spatial_index import GridIndex, bboxes_intersect, point_bbox, ring_bbox
+from upstream_clients import register_provider, upstream_client
+from write_behind import WriteBehindQueue
+
+
+LOGGER = logging.getLogger(__name__)
 
 
 VWORLD_WFS_ENDPOINT = "https://api.vworld.kr/req/wfs"
@@ -33,13 +47,63 @@ OVERPASS_ENDPOINTS = [
     ).split(",")
     if endpoint.strip()
 ]
+# Pooled keep-alive clients (see upstream_clients); the FastAPI lifespan
+# opens and closes them together with the other provider pools.
+VWORLD_FOOTPRINT_PROVIDER = "vworld_footprint"
+OVERPASS_PROVIDER = "overpass"
+VWORLD_FOOTPRINT_TIMEOUT_S = float(os.getenv("VWORLD_FOOTPRINT_TIMEOUT_S", "10"))
+OVERPASS_TIMEOUT_S = float(os.getenv("OVERPASS_TIMEOUT_S", "20"))
+register_provider(VWORLD_FOOTPRINT_PROVIDER, VWORLD_FOOTPRINT_TIMEOUT_S, connect_timeout_s=5.0)
+register_provider(OVERPASS_PROVIDER, OVERPASS_TIMEOUT_S, connect_timeout_s=5.0, max_connections=8, max_keepalive_connections=4)
+# Official lt_c_spbd features are cached per zoom-16 Web-Mercator tile
+# (~480 m across in Korea); a tile that hits MAXFEATURES is refetched as its
+# children down to VWORLD_BUILDING_TILE_MAX_ZOOM.
+VWORLD_BUILDING_TILE_ZOOM = int(os.getenv("VWORLD_BUILDING_TILE_ZOOM", "16"))
+VWORLD_BUILDING_TILE_MAX_ZOOM = int(os.getenv("VWORLD_BUILDING_TILE_MAX_ZOOM", "18"))
+VWORLD_BUILDING_TILE_MAX_FEATURES = int(os.getenv("VWORLD_BUILDING_TILE_MAX_FEATURES", "1000"))
+VWORLD_BUILDING_TILE_TTL_S = float(os.getenv("VWORLD_BUILDING_TILE_TTL_S", str(6 * 3600)))
+VWORLD_BUILDING_TILE_STALE_TTL_S = float(os.getenv("VWORLD_BUILDING_TILE_STALE_TTL_S", str(24 * 3600)))
+VWORLD_BUILDING_TILE_CACHE_MAX = int(os.getenv("VWORLD_BUILDING_TILE_CACHE_MAX", "512"))
+BUILDING_TILE_CACHE = EvidenceCache(
+    "vworld_building_tiles",
+    ttl_s=VWORLD_BUILDING_TILE_TTL_S,
+    max_entries=VWORLD_BUILDING_TILE_CACHE_MAX,
+    stale_ttl_s=VWORLD_BUILDING_TILE_STALE_TTL_S,
+)
+BUILDING_TILE_FLIGHTS = SingleFlight("vworld_building_tiles")
 DEFAULT_SEARCH_RADIUS_M = 40
 DEFAULT_MAX_FEATURES = 25
 DEFAULT_VWORLD_REFERER = "http://localhost:8000/"
 DEFAULT_VWORLD_TYPENAME = "lt_c_spbd"
-WEB_MERCATOR_ORIGIN_SHIFT = 20_037_508.34
 BUILDING_KEYWORDS = ("bldg", "build", "building", "건물", "bd")
 FOOTPRINT_CACHE_PATH = os.path.join(os.path.dirname(__file__), "static", "footprint_cache.json")
+# Grid cells slightly wider than the widest cache match radius (2 x 0.0012 deg),
+# so a lookup visits at most the 3 x 3 cells around the click.
+FOOTPRINT_INDEX_CELL_DEG = float(os.getenv("FOOTPRINT_INDEX_CELL_DEG", "0.0025"))
+# Persistent footprint cache. The tracked JSON file above holds the shipped
+# seed entries (scripts/seed_footprint_cache.py writes it); each version of it
+# is merged into the store once per database, keyed by its content digest.
+FOOTPRINT_STORE_PATH = os.getenv(
+    "FOOTPRINT_STORE_PATH",
+    os.path.join(os.path.dirname(__file__), "var", "footprint_store.sqlite3"),
+)
+SEED_FOOTPRINT_DIGEST_KEY = "footprint_cache_json_sha256"
+FOOTPRINT_CACHE_DEDUPE_DEG = 0.00025
+# Cache writes from lookups are queued and flushed in batches by a
+# lifespan-scoped task, so clicks never wait on the store.
+FOOTPRINT_WRITE_BEHIND_INTERVAL_S = float(os.getenv("FOOTPRINT_WRITE_BEHIND_INTERVAL_S", "2"))
+FOOTPRINT_WRITE_BEHIND_MAX_PENDING = int(os.getenv("FOOTPRINT_WRITE_BEHIND_MAX_PENDING", "32"))
+_FOOTPRINT_CACHE_LOCK = threading.Lock()
+_FOOTPRINT_CACHE_STATE: Dict[str, Any] = {
+    "store": None,
+    "revision": 0,
+    "entries": [],
+    "positions": {},
+    "index_source": None,
+    "index": None,
+}
+_FOOTPRINT_PENDING_LOCK = threading.Lock()
+_FOOTPRINT_PENDING_SEQ = itertools.count(1)
 VWORLD_ENV_FILE_CANDIDATES = [
     os.getenv("VWORLD_ENV_FILE"),
     os.path.join(os.path.dirname(__file__), "cctv-vworld.env"),
@@ -90,9 +154,13 @@ def _lonlat_to_web_mercator(lon: float, lat: float) -> Tuple[float, float]:
     return x, y * WEB_MERCATOR_ORIGIN_SHIFT / 180.0
 
 
-def _build_mercator_bbox(lat: float, lon: float, radius_m: float) -> str:
+def _mercator_bbox(lat: float, lon: float, radius_m: float) -> Tuple[float, float, float, float]:
     x, y = _lonlat_to_web_mercator(lon, lat)
-    return f"{x - radius_m},{y - radius_m},{x + radius_m},{y + radius_m}"
+    return (x - radius_m, y - radius_m, x + radius_m, y + radius_m)
+
+
+def _build_mercator_bbox(lat: float, lon: float, radius_m: float) -> str:
+    return ",".join(str(value) for value in _mercator_bbox(lat, lon, radius_m))
 
 
 def _web_mercator_to_lonlat(x: float, y: float) -> Tuple[float, float]:
@@ -367,56 +435,33 @@ def _find_display_name_candidate(lat: float, lon: float, max_distance_deg: float
     best_candidate: Optional[Dict[str, Any]] = None
     best_score: Optional[tuple] = None
 
-    for entry in _load_footprint_cache():
-        geometry = entry.get("geometry")
-        if not isinstance(geometry, list) or len(geometry) < 4:
-            continue
-
-        properties = _sanitize_properties(entry.get("properties"))
-        display_name = _extract_display_name(properties)
+    for record in _cached_footprint_records(point_bbox(lon, lat, max_distance_deg * 2)):
+        display_name = record["display_name"]
         if not display_name:
             continue
 
-        origin = entry.get("source_origin") or entry.get("source")
-        origin_rank = _source_origin_rank(origin)
+        origin = record["origin"]
+        origin_rank = record["origin_rank"]
         if origin_rank < 3:
             continue
 
-        center = entry.get("center")
-        if isinstance(center, dict):
-            try:
-                center_lat = float(center.get("lat", 0.0))
-                center_lon = float(center.get("lon", 0.0))
-            except Exception:
-                computed_center = _average_ring_center(geometry)
-                if not computed_center:
-                    continue
-                center_lat = computed_center["lat"]
-                center_lon = computed_center["lon"]
-        else:
-            computed_center = _average_ring_center(geometry)
-            if not computed_center:
-                continue
-            center_lat = computed_center["lat"]
-            center_lon = computed_center["lon"]
-
-        distance = math.sqrt(((center_lat - lat) ** 2) + ((center_lon - lon) ** 2))
+        distance = math.sqrt(((record["center_lat"] - lat) ** 2) + ((record["center_lon"] - lon) ** 2))
         if distance > max_distance_deg * 2:
             continue
 
         score = (
             origin_rank,
-            1 if properties.get("buld_nm") else 0,
-            _property_richness(properties),
+            1 if record["properties"].get("buld_nm") else 0,
+            record["richness"],
             -distance,
         )
         if best_score is None or score > best_score:
             best_score = score
             best_candidate = {
                 "display_name": display_name,
-                "display_name_source": entry.get("source") or origin,
+                "display_name_source": record["source"] or origin,
                 "display_name_source_origin": origin,
-                "display_name_source_chain": [entry.get("source") or origin or "footprint_cache"],
+                "display_name_source_chain": [record["source"] or origin or "footprint_cache"],
                 "display_name_distance_m": round(distance * 111000, 1),
             }
 
@@ -712,48 +757,48 @@ def _request_headers() -> Dict[str, str]:
         "Accept": "application/json, application/xml, text/xml, */*",
         "User-Agent": "UAV-Dash/3.0 render footprint proxy",
         "Referer": os.getenv("VWORLD_REFERER", DEFAULT_VWORLD_REFERER),
-        "Connection": "close",
     }
 
 
-def _fetch_text_sync(
+async def _fetch_text(
     params: Dict[str, Any],
     timeout_s: float = 20.0,
     endpoint: str = VWORLD_WFS_ENDPOINT,
 ) -> str:
-    query = urllib.parse.urlencode(params)
-    url = f"{endpoint}?{query}"
-    request = urllib.request.Request(url, headers=_request_headers(), method="GET")
-    with urllib.request.urlopen(request, timeout=timeout_s) as response:
-        return response.read().decode("utf-8", "replace")
-
-
-def _post_text_sync(url: str, data: str, timeout_s: float = 20.0) -> str:
-    encoded = data.encode("utf-8")
-    request = urllib.request.Request(
-        url,
-        data=encoded,
-        headers={
-            "Accept": "application/json, text/plain, */*",
-            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "User-Agent": "UAV-Dash/3.0 overpass fallback",
-            "Connection": "close",
-        },
-        method="POST",
-    )
-    with urllib.request.urlopen(request, timeout=timeout_s) as response:
-        return response.read().decode("utf-8", "replace")
+    async with upstream_client(VWORLD_FOOTPRINT_PROVIDER) as client:
+        response = await client.get(endpoint, params=params, headers=_request_headers(), timeout=timeout_s)
+    response.raise_for_status()
+    return response.text
+
+
+async def _post_text(url: str, data: Dict[str, str], timeout_s: float = 20.0) -> str:
+    async with upstream_client(OVERPASS_PROVIDER) as client:
+        response = await client.post(
+            url,
+            data=data,
+            headers={
+                "Accept": "application/json, text/plain, */*",
+                "User-Agent": "UAV-Dash/3.0 overpass fallback",
+            },
+            timeout=timeout_s,
+        )
+    response.raise_for_status()
+    return response.text
 
 
-def _post_text_with_endpoint_fallback_sync(
+async def _post_text_with_endpoint_fallback(
     urls: List[str],
-    data: str,
+    data: Dict[str, str],
     timeout_s: float = 20.0,
 ) -> str:
     last_error: Optional[Exception] = None
+    breaker = provider_breaker("overpass")
     for url in urls:
         try:
-            return _post_text_sync(url, data, timeout_s=timeout_s)
+            with breaker.call():
+                return await _post_text(url, data, timeout_s=timeout_s)
+        except CircuitOpenError:
+            raise
         except Exception as error:
             last_error = error
             continue
@@ -762,7 +807,7 @@ def _post_text_with_endpoint_fallback_sync(
     raise RuntimeError("overpass_request_failed")
 
 
-def _fetch_text_with_retries_sync(
+async def _fetch_text_with_retries(
     params: Dict[str, Any],
     timeout_s: float = 20.0,
     retries: int = 3,
@@ -771,19 +816,19 @@ def _fetch_text_with_retries_sync(
     last_error: Optional[Exception] = None
     for attempt in range(retries):
         try:
-            return _fetch_text_sync(params, timeout_s=timeout_s, endpoint=endpoint)
-        except (urllib.error.URLError, http.client.RemoteDisconnected, ConnectionResetError, socket.timeout) as error:
+            return await _fetch_text(params, timeout_s=timeout_s, endpoint=endpoint)
+        except httpx.TransportError as error:
             last_error = error
             if attempt == retries - 1:
                 raise
             time_to_sleep = 0.6 * (attempt + 1)
-            time.sleep(time_to_sleep)
+            await asyncio.sleep(bounded_timeout(time_to_sleep))
     if last_error:
         raise last_error
     raise RuntimeError("footprint_fetch_failed")
 
 
-def _fetch_official_building_collection_payload_sync(
+async def _fetch_official_building_collection_payload(
     api_key: str,
     type_name: str,
     bbox: str,
@@ -822,24 +867,32 @@ def _fetch_official_building_collection_payload_sync(
     last_error: Optional[Exception] = None
     for endpoint, params, source_origin in attempts:
         try:
-            payload_text = _fetch_text_with_retries_sync(
-                params,
-                timeout_s=10.0,
-                retries=1,
-                endpoint=endpoint,
-            )
+            rejected: Optional[httpx.HTTPStatusError] = None
+            with provider_breaker(source_origin).call() as outcome:
+                try:
+                    payload_text = await _fetch_text_with_retries(
+                        params,
+                        timeout_s=10.0,
+                        retries=1,
+                        endpoint=endpoint,
+                    )
+                except httpx.HTTPStatusError as error:
+                    # An HTTP answer is only a provider failure for 5xx/429.
+                    if upstream_status_failed(error.response.status_code):
+                        outcome.fail(f"upstream_status_{error.response.status_code}")
+                    rejected = error
+            if rejected is not None:
+                raise rejected
             payload = json.loads(payload_text)
             if isinstance(payload, dict) and isinstance(payload.get("features"), list):
                 return payload, source_origin
             last_error = ValueError("official_building_collection_not_geojson")
         except (
-            urllib.error.HTTPError,
-            urllib.error.URLError,
-            http.client.RemoteDisconnected,
-            ConnectionResetError,
-            socket.timeout,
+            httpx.HTTPError,
+            TimeoutError,
             json.JSONDecodeError,
             RuntimeError,
+            CircuitOpenError,
         ) as error:
             last_error = error
 
@@ -848,12 +901,17 @@ def _fetch_official_building_collection_payload_sync(
     raise RuntimeError("official_building_collection_request_failed")
 
 
-def _load_footprint_cache() -> List[Dict[str, Any]]:
+def _read_footprint_cache_bytes(path: Optional[str] = None) -> bytes:
     try:
-        with open(FOOTPRINT_CACHE_PATH, "r", encoding="utf-8") as fp:
-            payload = json.load(fp)
-    except FileNotFoundError:
-        return []
+        with open(path or FOOTPRINT_CACHE_PATH, "rb") as fp:
+            return fp.read()
+    except OSError:
+        return b""
+
+
+def _parse_footprint_cache_payload(raw: bytes) -> List[Dict[str, Any]]:
+    try:
+        payload = json.loads(raw.decode("utf-8"))
     except Exception:
         return []
 
@@ -864,142 +922,416 @@ def _load_footprint_cache() -> List[Dict[str, Any]]:
     return entries if isinstance(entries, list) else []
 
 
-def _write_footprint_cache(entries: List[Dict[str, Any]]) -> None:
-    os.makedirs(os.path.dirname(FOOTPRINT_CACHE_PATH), exist_ok=True)
-    with open(FOOTPRINT_CACHE_PATH, "w", encoding="utf-8") as fp:
-        json.dump(entries, fp, ensure_ascii=False, indent=2)
+def _read_footprint_cache_file(path: Optional[str] = None) -> List[Dict[str, Any]]:
+    return _parse_footprint_cache_payload(_read_footprint_cache_bytes(path))
 
 
-def _store_footprint_cache_entry(
+def _legacy_footprint_entries(entries: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+    """Normalise legacy JSON entries into the store's shape, skipping unusable ones."""
+    for entry in entries:
+        record = _index_footprint_entry(entry)
+        if record is None:
+            continue
+        yield {
+            "center": {"lat": record["center_lat"], "lon": record["center_lon"]},
+            "geometry": record["geometry"],
+            "properties": record["properties"],
+            "source": record["source"],
+            "source_origin": record["origin"],
+        }
+
+
+def import_legacy_footprint_cache(store: FootprintStore, path: Optional[str] = None) -> int:
+    """Merge ``footprint_cache.json`` into ``store`` once per version of the file.
+
+    Entries are upserted like cache writes, so importing an edited file
+    updates the rows of earlier versions instead of duplicating them.
+    """
+    raw = _read_footprint_cache_bytes(path)
+    entries = list(_legacy_footprint_entries(_parse_footprint_cache_payload(raw)))
+    upserts = [
+        (
+            float(entry["center"]["lat"]),
+            float(entry["center"]["lon"]),
+            FOOTPRINT_CACHE_DEDUPE_DEG,
+            partial(_merge_footprint_entry, incoming=entry),
+        )
+        for entry in entries
+    ]
+    return len(store.upsert_many(upserts, meta=(SEED_FOOTPRINT_DIGEST_KEY, hashlib.sha256(raw).hexdigest())))
+
+
+def write_footprint_seed(
     lat: float,
     lon: float,
     geometry: Iterable[Iterable[float]],
     properties: Optional[Dict[str, Any]] = None,
-    source: str = "manual_seed",
-    dedupe_distance_deg: float = 0.00025,
+    source: str = "seed_script",
+    path: Optional[str] = None,
 ) -> Dict[str, Any]:
+    """Merge one entry into the tracked ``footprint_cache.json`` seed file.
+
+    An entry within ``FOOTPRINT_CACHE_DEDUPE_DEG`` of the new one is merged
+    the way the store merges writes; no entry is removed.
+    """
     ring = [list(point) for point in (geometry or []) if isinstance(point, (list, tuple)) and len(point) >= 2]
     if len(ring) < 4:
         raise ValueError("invalid_geometry")
-
     center = _average_ring_center(ring) or {"lat": lat, "lon": lon}
-    entries = _load_footprint_cache()
-    updated = False
+    incoming = {
+        "center": center,
+        "geometry": ring,
+        "properties": _sanitize_properties(properties or {}),
+        "source": source,
+        "source_origin": source,
+    }
+    entries = _read_footprint_cache_file(path)
+    for position, entry in enumerate(entries):
+        entry_center = entry.get("center") if isinstance(entry, dict) else None
+        if isinstance(entry_center, dict) and _within_deg(entry_center, center["lat"], center["lon"], FOOTPRINT_CACHE_DEDUPE_DEG):
+            merged = _merge_footprint_entry(entry, incoming)
+            entries[position] = merged
+            break
+    else:
+        merged = incoming
+        entries.append(merged)
+    with open(path or FOOTPRINT_CACHE_PATH, "w", encoding="utf-8") as fp:
+        json.dump(entries, fp, ensure_ascii=False, indent=2)
+    return merged
 
-    for entry in entries:
-        entry_center = entry.get("center") or {}
+
+def _footprint_store() -> FootprintStore:
+    with _FOOTPRINT_CACHE_LOCK:
+        store = _FOOTPRINT_CACHE_STATE["store"]
+        if store is not None and store.path == FOOTPRINT_STORE_PATH:
+            return store
+        store = FootprintStore(FOOTPRINT_STORE_PATH)
+        _FOOTPRINT_CACHE_STATE.update(
+            store=store, revision=0, entries=[], positions={}, index_source=None, index=None
+        )
+    import_legacy_footprint_cache(store)
+    return store
+
+
+def _load_footprint_cache() -> List[Dict[str, Any]]:
+    """Return the in-memory cache entries after pulling writes made since the last call.
+
+    The returned list is shared and kept in sync in place; callers must not
+    modify it. Writes go through ``_store_footprint_cache_entry``.
+    """
+    try:
+        store = _footprint_store()
+        with _FOOTPRINT_CACHE_LOCK:
+            revision, changes = store.changes_since(_FOOTPRINT_CACHE_STATE["revision"])
+            _apply_footprint_changes(changes)
+            _FOOTPRINT_CACHE_STATE["revision"] = revision
+            return _FOOTPRINT_CACHE_STATE["entries"]
+    except sqlite3.Error as error:
+        LOGGER.warning("footprint_store_unavailable error=%s", type(error).__name__)
+        return _FOOTPRINT_CACHE_STATE["entries"]
+
+
+def _apply_footprint_changes(changes: List[Dict[str, Any]]) -> None:
+    entries = _FOOTPRINT_CACHE_STATE["entries"]
+    positions = _FOOTPRINT_CACHE_STATE["positions"]
+    index = _FOOTPRINT_CACHE_STATE["index"] if _FOOTPRINT_CACHE_STATE["index_source"] is entries else None
+    for entry in changes:
+        position = positions.get(entry["id"])
+        if position is None:
+            positions[entry["id"]] = len(entries)
+            entries.append(entry)
+        else:
+            entries[position] = entry
+        if index is not None:
+            record = _index_footprint_entry(entry)
+            if record is not None:
+                index.insert(record, record["bbox"], key=entry["id"])
+
+
+def _index_footprint_entry(entry: Any) -> Optional[Dict[str, Any]]:
+    """Precompute everything the cache lookups score, once per entry."""
+    if not isinstance(entry, dict):
+        return None
+    geometry = entry.get("geometry")
+    if not isinstance(geometry, list) or len(geometry) < 4:
+        return None
+
+    center = entry.get("center")
+    center_lat: Optional[float] = None
+    center_lon: Optional[float] = None
+    if isinstance(center, dict):
         try:
-            entry_lat = float(entry_center.get("lat"))
-            entry_lon = float(entry_center.get("lon"))
+            center_lat = float(center.get("lat", 0.0))
+            center_lon = float(center.get("lon", 0.0))
         except Exception:
-            continue
+            center_lat = center_lon = None
+    if center_lat is None or center_lon is None:
+        try:
+            computed_center = _average_ring_center(geometry)
+        except (TypeError, ValueError):
+            computed_center = None
+        if not computed_center:
+            return None
+        center_lat = computed_center["lat"]
+        center_lon = computed_center["lon"]
 
-        distance = math.sqrt(((entry_lat - center["lat"]) ** 2) + ((entry_lon - center["lon"]) ** 2))
-        if distance <= dedupe_distance_deg:
-            existing_props = _sanitize_properties(entry.get("properties"))
-            incoming_props = _sanitize_properties(properties or {})
-            existing_score = _property_richness(existing_props)
-            incoming_score = _property_richness(incoming_props)
-            if incoming_score >= existing_score:
-                entry["properties"] = _merge_properties(incoming_props, existing_props)
-            else:
-                entry["properties"] = _merge_properties(existing_props, incoming_props)
-            entry["geometry"] = ring
-            entry["center"] = center
-            if _source_rank(source) >= _source_rank(entry.get("source")):
-                entry["source"] = source
-            if source:
-                entry["source_origin"] = source
-            updated = True
-            break
+    bbox = point_bbox(center_lon, center_lat)
+    try:
+        ring_box = ring_bbox(point for point in geometry if isinstance(point, (list, tuple)) and len(point) >= 2)
+        bbox = (
+            min(bbox[0], ring_box[0]),
+            min(bbox[1], ring_box[1]),
+            max(bbox[2], ring_box[2]),
+            max(bbox[3], ring_box[3]),
+        )
+    except (TypeError, ValueError):
+        pass
 
-    if not updated:
-        entries.append({
-            "center": center,
-            "geometry": ring,
-            "properties": _sanitize_properties(properties or {}),
-            "source": source,
-            "source_origin": source,
+    properties = _sanitize_properties(entry.get("properties"))
+    source = entry.get("source")
+    origin = entry.get("source_origin") or source
+    return {
+        "geometry": geometry,
+        "properties": properties,
+        "center_lat": center_lat,
+        "center_lon": center_lon,
+        "bbox": bbox,
+        "source": source,
+        "origin": origin,
+        "richness": _property_richness(properties),
+        "source_rank": _source_rank(source),
+        "source_penalty": _source_penalty(source),
+        "origin_rank": _source_origin_rank(origin),
+        "display_name": _extract_display_name(properties),
+        "id": entry.get("id"),
+    }
+
+
+def _footprint_cache_index() -> GridIndex:
+    """Grid index over the current cache entries.
+
+    Built once per entry list; store writes are applied to it incrementally.
+    """
+    entries = _load_footprint_cache()
+    with _FOOTPRINT_CACHE_LOCK:
+        if _FOOTPRINT_CACHE_STATE["index_source"] is entries:
+            return _FOOTPRINT_CACHE_STATE["index"]
+        index: GridIndex = GridIndex(FOOTPRINT_INDEX_CELL_DEG)
+        for entry in entries:
+            record = _index_footprint_entry(entry)
+            if record is not None:
+                index.insert(record, record["bbox"], key=entry.get("id"))
+        _FOOTPRINT_CACHE_STATE["index_source"] = entries
+        _FOOTPRINT_CACHE_STATE["index"] = index
+        return index
+
+
+def _merge_footprint_entry(existing: Optional[Dict[str, Any]], incoming: Dict[str, Any]) -> Dict[str, Any]:
+    if existing is None:
+        return dict(incoming)
+    entry = dict(existing)
+    incoming_props = incoming["properties"]
+    existing_props = _sanitize_properties(existing.get("properties"))
+    if _property_richness(incoming_props) >= _property_richness(existing_props):
+        entry["properties"] = _merge_properties(incoming_props, existing_props)
+    else:
+        entry["properties"] = _merge_properties(existing_props, incoming_props)
+    entry["geometry"] = incoming["geometry"]
+    entry["center"] = incoming["center"]
+    if _source_rank(incoming.get("source")) >= _source_rank(entry.get("source")):
+        entry["source"] = incoming.get("source")
+    if incoming.get("source_origin"):
+        entry["source_origin"] = incoming["source_origin"]
+    return entry
+
+
+def _within_deg(center: Dict[str, Any], lat: float, lon: float, radius_deg: float) -> bool:
+    return math.hypot(float(center["lat"]) - lat, float(center["lon"]) - lon) <= radius_deg
+
+
+def _queue_footprint_write(incoming: Dict[str, Any], radius_deg: float) -> None:
+    """Merge ``incoming`` in memory now and leave the store write to the flusher.
+
+    The merge target is chosen like ``FootprintStore.upsert_near`` would: a
+    pending write nearby first, else the oldest cached entry within
+    ``radius_deg``. The merged entry shadows that cached entry for reads
+    until the flush lands.
+    """
+    lat = float(incoming["center"]["lat"])
+    lon = float(incoming["center"]["lon"])
+    index = _footprint_cache_index()
+    with _FOOTPRINT_PENDING_LOCK:
+        key: Any = None
+        base: Optional[Dict[str, Any]] = None
+        shadows = None
+        for pending_key, write in FOOTPRINT_WRITE_BEHIND.pending():
+            if _within_deg(write["entry"]["center"], lat, lon, radius_deg):
+                key, base, shadows = pending_key, write["entry"], write["shadows"]
+                break
+        if key is None:
+            nearby = [
+                record
+                for record in index.query(point_bbox(lon, lat, radius_deg))
+                if record.get("id") is not None
+                and math.hypot(record["center_lat"] - lat, record["center_lon"] - lon) <= radius_deg
+            ]
+            if nearby:
+                record = min(nearby, key=lambda candidate: candidate["id"])
+                shadows = record["id"]
+                key = ("entry", shadows)
+                base = {
+                    "center": {"lat": record["center_lat"], "lon": record["center_lon"]},
+                    "geometry": record["geometry"],
+                    "properties": record["properties"],
+                    "source": record["source"],
+                    "source_origin": record["origin"],
+                }
+            else:
+                key = ("new", next(_FOOTPRINT_PENDING_SEQ))
+        entry = _merge_footprint_entry(base, incoming)
+        FOOTPRINT_WRITE_BEHIND.submit(key, {
+            "entry": entry,
+            "record": _index_footprint_entry(entry),
+            "radius_deg": radius_deg,
+            "shadows": shadows,
         })
 
-    _write_footprint_cache(entries)
+
+def _flush_footprint_writes(batch: List[Tuple[Any, Dict[str, Any]]]) -> None:
+    upserts = [
+        (
+            float(write["entry"]["center"]["lat"]),
+            float(write["entry"]["center"]["lon"]),
+            write["radius_deg"],
+            partial(_merge_footprint_entry, incoming=write["entry"]),
+        )
+        for _key, write in batch
+    ]
+    _footprint_store().upsert_many(upserts)
+    _load_footprint_cache()
+
+
+def _cached_footprint_records(bbox: Tuple[float, float, float, float]) -> List[Dict[str, Any]]:
+    """Cache index candidates for ``bbox`` with writes still waiting to be flushed applied."""
+    records = _footprint_cache_index().query(bbox)
+    pending = FOOTPRINT_WRITE_BEHIND.pending()
+    if not pending:
+        return records
+    shadowed = {write["shadows"] for _key, write in pending if write["shadows"] is not None}
+    overlay = [
+        write["record"]
+        for _key, write in pending
+        if write["record"] is not None and bboxes_intersect(write["record"]["bbox"], bbox)
+    ]
+    return [record for record in records if record.get("id") not in shadowed] + overlay
+
+
+FOOTPRINT_WRITE_BEHIND: WriteBehindQueue[Dict[str, Any]] = WriteBehindQueue(
+    "footprint_cache",
+    _flush_footprint_writes,
+    interval_s=FOOTPRINT_WRITE_BEHIND_INTERVAL_S,
+    max_pending=FOOTPRINT_WRITE_BEHIND_MAX_PENDING,
+)
+
+
+def _store_footprint_cache_entry(
+    lat: float,
+    lon: float,
+    geometry: Iterable[Iterable[float]],
+    properties: Optional[Dict[str, Any]] = None,
+    source: str = "manual_seed",
+    dedupe_distance_deg: float = FOOTPRINT_CACHE_DEDUPE_DEG,
+) -> Dict[str, Any]:
+    ring = [list(point) for point in (geometry or []) if isinstance(point, (list, tuple)) and len(point) >= 2]
+    if len(ring) < 4:
+        raise ValueError("invalid_geometry")
+
+    center = _average_ring_center(ring) or {"lat": lat, "lon": lon}
+    incoming_props = _sanitize_properties(properties or {})
+    incoming = {
+        "center": center,
+        "geometry": ring,
+        "properties": incoming_props,
+        "source": source,
+        "source_origin": source,
+    }
+    if FOOTPRINT_WRITE_BEHIND.running:
+        _queue_footprint_write(incoming, dedupe_distance_deg)
+    else:
+        _footprint_store().upsert_near(
+            center["lat"], center["lon"], dedupe_distance_deg, partial(_merge_footprint_entry, incoming=incoming)
+        )
+        _load_footprint_cache()
     return _annotate_footprint_result({
         "available": True,
         "source": "footprint_cache",
         "geometry": ring,
-        "properties": _sanitize_properties(properties or {}),
+        "properties": incoming_props,
     }, source_chain=["footprint_cache"], profile_source="cache", source_origin=source)
 
 
-def _match_cached_footprint(lat: float, lon: float, max_distance_deg: float = 0.0012) -> Optional[Dict[str, Any]]:
-    best_entry: Optional[Dict[str, Any]] = None
-    best_score: Optional[tuple] = None
+# Largest richness credit in the cache match score (richness capped at 24).
+_FOOTPRINT_RICHNESS_CREDIT_DEG = 24 * 0.0001
 
-    for entry in _load_footprint_cache():
-        geometry = entry.get("geometry")
-        properties = _sanitize_properties(entry.get("properties"))
-        if not isinstance(geometry, list) or len(geometry) < 4:
-            continue
 
-        center = entry.get("center")
-        if isinstance(center, dict):
-            try:
-                center_lat = float(center.get("lat", 0.0))
-                center_lon = float(center.get("lon", 0.0))
-            except Exception:
-                computed_center = _average_ring_center(geometry)
-                if not computed_center:
-                    continue
-                center_lat = computed_center["lat"]
-                center_lon = computed_center["lon"]
-        else:
-            computed_center = _average_ring_center(geometry)
-            if not computed_center:
-                continue
-            center_lat = computed_center["lat"]
-            center_lon = computed_center["lon"]
-
-        distance = math.sqrt(((center_lat - lat) ** 2) + ((center_lon - lon) ** 2))
-        richness = _property_richness(properties)
-        source_rank = _source_rank(entry.get("source"))
-        point_in_polygon = _point_in_polygon(lon, lat, geometry)
+def _best_cached_footprint(lat: float, lon: float, radius_deg: float) -> Optional[Tuple[tuple, Dict[str, Any], bool]]:
+    best: Optional[Tuple[tuple, Dict[str, Any], bool]] = None
+    for record in _cached_footprint_records(point_bbox(lon, lat, radius_deg)):
+        distance = math.sqrt(((record["center_lat"] - lat) ** 2) + ((record["center_lon"] - lon) ** 2))
+        richness = record["richness"]
+        point_in_polygon = _point_in_polygon(lon, lat, record["geometry"])
         candidate_distance = 0.0 if point_in_polygon else distance
-        adjusted_distance = candidate_distance + _source_penalty(entry.get("source")) - min(richness, 24) * 0.0001
-        candidate_score = (adjusted_distance, -richness, -source_rank, candidate_distance)
-
-        if best_score is None or candidate_score < best_score:
-            best_score = candidate_score
-            best_entry = {
-                "available": True,
-                "source": "footprint_cache",
-                "geometry": geometry,
-                "properties": properties,
-                "source_origin": entry.get("source_origin") or entry.get("source"),
-                "cache_point_inside": point_in_polygon,
-            }
+        adjusted_distance = candidate_distance + record["source_penalty"] - min(richness, 24) * 0.0001
+        candidate_score = (adjusted_distance, -richness, -record["source_rank"], candidate_distance)
+        if best is None or candidate_score < best[0]:
+            best = (candidate_score, record, point_in_polygon)
+    return best
 
-    if best_entry and best_score is not None:
-        best_distance = best_score[3]
-        best_richness = -best_score[1]
-        best_source_rank = -best_score[2]
-        allowed_distance = max_distance_deg
-        if best_richness >= 8 or best_source_rank >= 3:
-            allowed_distance = max_distance_deg * 2
-        if best_distance <= allowed_distance or best_distance == 0.0:
-            display_name_candidate = _find_display_name_candidate(lat, lon, max_distance_deg=max_distance_deg)
-            if display_name_candidate:
-                best_entry["display_name"] = display_name_candidate.get("display_name")
-                best_entry["display_name_source"] = display_name_candidate.get("display_name_source")
-                best_entry["display_name_source_origin"] = display_name_candidate.get("display_name_source_origin")
-                best_entry["display_name_source_chain"] = display_name_candidate.get("display_name_source_chain")
-                best_entry["display_name_distance_m"] = display_name_candidate.get("display_name_distance_m")
-            return _annotate_footprint_result(
-                best_entry,
-                source_chain=["footprint_cache"],
-                profile_source="cache",
-                source_origin=best_entry.get("source_origin")
-            )
-    return None
+
+def _match_cached_footprint(lat: float, lon: float, max_distance_deg: float = 0.0012) -> Optional[Dict[str, Any]]:
+    # Only nearby grid cells are scored. An entry outside them neither
+    # contains the click nor lies within the widest allowed distance, so its
+    # score is above its distance minus the richness credit; when that could
+    # still beat the best nearby score, the search widens so such an entry
+    # wins (and is rejected) exactly as it did under a full scan.
+    radius_deg = max_distance_deg * 2
+    best = _best_cached_footprint(lat, lon, radius_deg)
+    if best is not None and best[0][0] + _FOOTPRINT_RICHNESS_CREDIT_DEG > radius_deg:
+        best = _best_cached_footprint(lat, lon, best[0][0] + _FOOTPRINT_RICHNESS_CREDIT_DEG)
+
+    if best is None:
+        return None
+    best_score, record, point_in_polygon = best
+    best_distance = best_score[3]
+    best_richness = -best_score[1]
+    best_source_rank = -best_score[2]
+    allowed_distance = max_distance_deg
+    if best_richness >= 8 or best_source_rank >= 3:
+        allowed_distance = max_distance_deg * 2
+    if best_distance > allowed_distance and best_distance != 0.0:
+        return None
+
+    best_entry: Dict[str, Any] = {
+        "available": True,
+        "source": "footprint_cache",
+        "geometry": [list(point) for point in record["geometry"]],
+        "properties": dict(record["properties"]),
+        "source_origin": record["origin"],
+        "cache_point_inside": point_in_polygon,
+    }
+    display_name_candidate = _find_display_name_candidate(lat, lon, max_distance_deg=max_distance_deg)
+    if display_name_candidate:
+        best_entry["display_name"] = display_name_candidate.get("display_name")
+        best_entry["display_name_source"] = display_name_candidate.get("display_name_source")
+        best_entry["display_name_source_origin"] = display_name_candidate.get("display_name_source_origin")
+        best_entry["display_name_source_chain"] = display_name_candidate.get("display_name_source_chain")
+        best_entry["display_name_distance_m"] = display_name_candidate.get("display_name_distance_m")
+    return _annotate_footprint_result(
+        best_entry,
+        source_chain=["footprint_cache"],
+        profile_source="cache",
+        source_origin=best_entry.get("source_origin")
+    )
 
 
 def _osm_query(lat: float, lon: float, radius_m: float = 60.0) -> str:
@@ -1036,10 +1368,10 @@ def _normalize_osm_ring(element: Dict[str, Any]) -> Optional[List[List[float]]]:
     return ring if len(ring) >= 4 else None
 
 
-def _lookup_osm_fallback_sync(lat: float, lon: float, radius_m: float = 60.0) -> Optional[Dict[str, Any]]:
+async def _lookup_osm_fallback(lat: float, lon: float, radius_m: float = 60.0) -> Optional[Dict[str, Any]]:
     try:
-        query = urllib.parse.urlencode({"data": _osm_query(lat, lon, radius_m=radius_m)})
-        payload_text = _post_text_with_endpoint_fallback_sync(OVERPASS_ENDPOINTS, query, timeout_s=20.0)
+        query = {"data": _osm_query(lat, lon, radius_m=radius_m)}
+        payload_text = await _post_text_with_endpoint_fallback(OVERPASS_ENDPOINTS, query, timeout_s=OVERPASS_TIMEOUT_S)
         payload = json.loads(payload_text)
     except Exception:
         return None
@@ -1072,12 +1404,102 @@ def _lookup_osm_fallback_sync(lat: float, lon: float, radius_m: float = 60.0) ->
     }, source_chain=["osm_fallback"], profile_source="fallback", source_origin="osm_fallback")
 
 
+def _parse_building_tile_features(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    raw_features = payload.get("features") if isinstance(payload, dict) else []
+    features: List[Dict[str, Any]] = []
+    for feature in raw_features if isinstance(raw_features, list) else []:
+        if not isinstance(feature, dict):
+            continue
+        mercator_ring = _get_polygon_ring(feature)
+        if not mercator_ring or len(mercator_ring) < 4:
+            continue
+        ring = _web_mercator_ring_to_wgs84(mercator_ring)
+        if len(ring) < 4:
+            continue
+        # The canyon engine measures in EPSG:3857. Canyon receipts have always
+        # hashed the WGS84 ring projected back, which differs from VWorld's
+        # native coordinates in the last bits, so that projection is kept and
+        # done once per tile here instead of per canyon request.
+        projected_ring = tuple(_lonlat_to_web_mercator(lon, lat) for lon, lat in ring)
+        properties = _sanitize_properties(feature.get("properties"))
+        feature_id = next(
+            (
+                properties.get(key)
+                for key in ("bd_mgt_sn", "pk", "bld_mgt_sn", "id", "fid")
+                if _is_meaningful_value(properties.get(key))
+            ),
+            feature.get("id"),
+        )
+        features.append({
+            "id": str(feature_id) if _is_meaningful_value(feature_id) else None,
+            # Buildings crossing a tile edge come back from every tile they touch.
+            "key": str(feature_id) if _is_meaningful_value(feature_id) else tuple(tuple(point) for point in ring),
+            "ring": ring,
+            "mercator_ring": projected_ring,
+            "properties": properties,
+            "bbox": ring_bbox(mercator_ring),
+        })
+    return features
+
+
+def _unique_tile_features(features: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    seen = set()
+    unique: List[Dict[str, Any]] = []
+    for feature in features:
+        if feature["key"] in seen:
+            continue
+        seen.add(feature["key"])
+        unique.append(feature)
+    return unique
+
+
+async def _fetch_building_tile(api_key: str, type_name: str, tile: Tile) -> Dict[str, Any]:
+    payload, source_origin = await _fetch_official_building_collection_payload(
+        api_key,
+        type_name,
+        bbox_param(tile_bounds(tile)),
+        VWORLD_BUILDING_TILE_MAX_FEATURES,
+    )
+    raw_count = len(payload.get("features") or [])
+    if raw_count >= VWORLD_BUILDING_TILE_MAX_FEATURES and tile[0] < VWORLD_BUILDING_TILE_MAX_ZOOM:
+        # MAXFEATURES cut the answer short; a dense tile is fetched as its
+        # four children instead so the cached tile is complete.
+        children = await asyncio.gather(*(
+            _fetch_building_tile(api_key, type_name, child) for child in child_tiles(tile)
+        ))
+        return {
+            "features": _unique_tile_features(feature for child in children for feature in child["features"]),
+            "source_origin": children[0]["source_origin"],
+            "truncated": any(child["truncated"] for child in children),
+        }
+    return {
+        "features": _parse_building_tile_features(payload),
+        "source_origin": source_origin,
+        "truncated": raw_count >= VWORLD_BUILDING_TILE_MAX_FEATURES,
+    }
+
+
+async def _building_tile(api_key: str, type_name: str, tile: Tile) -> Dict[str, Any]:
+    return await cached_tile(
+        BUILDING_TILE_CACHE,
+        BUILDING_TILE_FLIGHTS,
+        (type_name, *tile),
+        lambda: _fetch_building_tile(api_key, type_name, tile),
+        stale_on=(RuntimeError,),
+    )
+
+
 async def lookup_official_building_collection(
     lat: float,
     lon: float,
     radius_m: float = 180.0,
     max_features: int = 100,
 ) -> Dict[str, Any]:
+    """Official buildings whose box meets the ``radius_m`` query box around the click.
+
+    Served from cached Web-Mercator tiles, so the footprint and canyon
+    lookups of one evaluation (and neighbouring clicks) share WFS fetches.
+    """
     api_key = _resolve_vworld_api_key()
     if not api_key:
         return {
@@ -1090,15 +1512,13 @@ async def lookup_official_building_collection(
         }
 
     preferred_type_name = os.getenv("VWORLD_WFS_TYPENAME")
+    type_name = preferred_type_name or DEFAULT_VWORLD_TYPENAME
+    query_bbox = _mercator_bbox(lat, lon, radius_m)
     try:
-        type_name = preferred_type_name or DEFAULT_VWORLD_TYPENAME
-        payload, source_origin = await asyncio.to_thread(
-            _fetch_official_building_collection_payload_sync,
-            api_key,
-            type_name,
-            _build_mercator_bbox(lat, lon, radius_m=radius_m),
-            max(25, min(max_features, 200)),
-        )
+        tiles = await asyncio.gather(*(
+            _building_tile(api_key, type_name, tile)
+            for tile in tiles_for_bbox(query_bbox, VWORLD_BUILDING_TILE_ZOOM)
+        ))
     except RuntimeError:
         return {
             "available": False,
@@ -1108,33 +1528,48 @@ async def lookup_official_building_collection(
             "source_chain": ["vworld_wfs"],
             "reason": "official_building_collection_request_failed",
         }
+    except TimeoutError:
+        # The request budget ran out before a shared tile fetch finished.
+        return {
+            "available": False,
+            "official_available": False,
+            "features": [],
+            "source": "vworld_wfs",
+            "source_chain": ["vworld_wfs"],
+            "reason": "official_building_footprint_timeout",
+        }
 
-    raw_features = payload.get("features") if isinstance(payload, dict) else []
-    features: List[Dict[str, Any]] = []
-    for index, feature in enumerate(raw_features if isinstance(raw_features, list) else []):
-        if not isinstance(feature, dict):
-            continue
-        ring = _get_polygon_ring(feature)
-        if not ring or len(ring) < 4:
-            continue
-        ring = _web_mercator_ring_to_wgs84(ring)
-        if len(ring) < 4:
-            continue
-        properties = _sanitize_properties(feature.get("properties"))
-        feature_id = next(
-            (
-                properties.get(key)
-                for key in ("bd_mgt_sn", "pk", "bld_mgt_sn", "id", "fid")
-                if _is_meaningful_value(properties.get(key))
+    candidates = _unique_tile_features(
+        feature
+        for tile in tiles
+        for feature in tile["features"]
+        if bboxes_intersect(feature["bbox"], query_bbox)
+    )
+    # A tile still cut short at VWORLD_BUILDING_TILE_MAX_ZOOM is missing
+    # buildings, so an empty match in it is not a negative answer.
+    truncated = any(tile["truncated"] for tile in tiles)
+    limit = max(25, min(max_features, 200))
+    if len(candidates) > limit:
+        click_x, click_y = _lonlat_to_web_mercator(lon, lat)
+        candidates = sorted(
+            candidates,
+            key=lambda feature: math.hypot(
+                max(feature["bbox"][0] - click_x, 0.0, click_x - feature["bbox"][2]),
+                max(feature["bbox"][1] - click_y, 0.0, click_y - feature["bbox"][3]),
             ),
-            feature.get("id") or f"vworld-building-{index}",
-        )
-        features.append({
-            "id": str(feature_id),
-            "name": _extract_display_name(properties),
-            "ring": ring,
-            "properties": properties,
-        })
+        )[:limit]
+    features = [
+        {
+            "id": feature["id"] or f"vworld-building-{index}",
+            "name": _extract_display_name(feature["properties"]),
+            "ring": [list(point) for point in feature["ring"]],
+            # Shared with the tile cache; treated as read-only.
+            "mercator_ring": feature["mercator_ring"],
+            "properties": dict(feature["properties"]),
+        }
+        for index, feature in enumerate(candidates)
+    ]
+    source_origin = tiles[0]["source_origin"] if tiles else "vworld_map_wfs"
 
     return {
         "available": bool(features),
@@ -1144,6 +1579,7 @@ async def lookup_official_building_collection(
         "source_origin": source_origin,
         "source_chain": ["vworld_wfs", source_origin, "official_building_collection"],
         "typeName": type_name,
+        "truncated": truncated,
         "reason": None if features else "official_building_collection_empty",
     }
 
@@ -1152,7 +1588,9 @@ async def lookup_building_footprint(lat: float, lon: float) -> Dict[str, Any]:
     api_key = _resolve_vworld_api_key()
     preferred_type_name = os.getenv("VWORLD_WFS_TYPENAME")
 
-    cached_match = _match_cached_footprint(lat, lon)
+    # The first lookup imports the seed file and every lookup syncs with the
+    # store, so the match runs off the event loop.
+    cached_match = await asyncio.to_thread(_match_cached_footprint, lat, lon)
     if cached_match and "source_status" not in cached_match:
         cached_match = _annotate_footprint_result(
             cached_match,
@@ -1166,7 +1604,7 @@ async def lookup_building_footprint(lat: float, lon: float) -> Dict[str, Any]:
         nonlocal osm_fallback
         if osm_fallback is not None:
             return osm_fallback
-        osm_fallback = await asyncio.to_thread(_lookup_osm_fallback_sync, lat, lon)
+        osm_fallback = await _lookup_osm_fallback(lat, lon)
         if osm_fallback and "source_status" not in osm_fallback:
             osm_fallback = _annotate_footprint_result(
                 osm_fallback,
@@ -1176,7 +1614,8 @@ async def lookup_building_footprint(lat: float, lon: float) -> Dict[str, Any]:
             )
         if osm_fallback and osm_fallback.get("available"):
             try:
-                _store_footprint_cache_entry(
+                await asyncio.to_thread(
+                    _store_footprint_cache_entry,
                     lat,
                     lon,
                     osm_fallback.get("geometry") or [],
@@ -1216,6 +1655,13 @@ async def lookup_building_footprint(lat: float, lon: float) -> Dict[str, Any]:
             feature for feature in features
             if isinstance(feature, dict) and _point_in_polygon(lon, lat, feature.get("ring") or [])
         ]
+        if not matched_features and collection.get("truncated"):
+            return cached_match or await get_osm_fallback() or _annotate_footprint_result({
+                "available": False,
+                "source": "vworld_wfs",
+                "typeName": type_name,
+                "reason": "official_building_collection_truncated",
+            }, source_chain=collection.get("source_chain") or ["vworld_wfs"], profile_source="wfs", source_origin=source_origin)
         if not matched_features:
             # A road or open-space click must not be silently reassigned to the
             # nearest building. This keeps the drone assessment chain tied to
@@ -1285,7 +1731,8 @@ async def lookup_building_footprint(lat: float, lon: float) -> Dict[str, Any]:
             result["display_name_source"] = "vworld_wfs"
             result["display_name_source_origin"] = source_origin
         try:
-            _store_footprint_cache_entry(
+            await asyncio.to_thread(
+                _store_footprint_cache_entry,
                 lat,
                 lon,
                 result["geometry"],
@@ -1295,9 +1742,9 @@ async def lookup_building_footprint(lat: float, lon: float) -> Dict[str, Any]:
         except Exception:
             pass
         return result
-    except urllib.error.HTTPError as error:
+    except httpx.HTTPStatusError as error:
         try:
-            detail = error.read().decode("utf-8", "replace")[:400]
+            detail = error.response.text[:400]
         except Exception:
             detail = str(error)
         return cached_match or await get_osm_fallback() or _annotate_footprint_result({
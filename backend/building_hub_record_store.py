@@ -0,0 +1,89 @@
+"""SQLite-backed persistent store for MOLIT Building HUB title records.
+
+Rows are keyed by the Building HUB title query (sigungu, bjdong, plat, bun,
+ji) and hold the raw record list with its expiry, so an empty list records a
+confirmed ``molit_building_hub_not_found``. Registry records barely change,
+so a restarted worker reads them back instead of spending data.go.kr quota.
+The database runs in WAL mode like the footprint store, so several workers
+can share it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+BUILDING_HUB_RECORD_STORE_BUSY_TIMEOUT_S = float(os.getenv("MOLIT_BUILDING_HUB_RECORD_STORE_BUSY_TIMEOUT_S", "5"))
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS title_records (
+        query_key TEXT PRIMARY KEY,
+        records TEXT NOT NULL,
+        fetched_at REAL NOT NULL,
+        expires_at REAL NOT NULL
+    )
+    """,
+)
+
+
+class TitleRecordStore:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connection(self) -> sqlite3.Connection:
+        # Reads and writes run in asyncio.to_thread workers, so each thread
+        # keeps its own connection.
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=BUILDING_HUB_RECORD_STORE_BUSY_TIMEOUT_S, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._ensure_schema(connection)
+        return connection
+
+    def _ensure_schema(self, connection: sqlite3.Connection) -> None:
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            self._schema_ready = True
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def get(self, query_key: str, now: Optional[float] = None) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        """Return ``(records, expires_at)`` for an unexpired row, else ``None``."""
+        row = self._connection().execute(
+            "SELECT records, expires_at FROM title_records WHERE query_key = ?",
+            (query_key,),
+        ).fetchone()
+        if row is None or float(row[1]) <= (time.time() if now is None else now):
+            return None
+        return json.loads(row[0]), float(row[1])
+
+    def put(self, query_key: str, records: List[Dict[str, Any]], expires_at: float) -> None:
+        self._connection().execute(
+            "INSERT INTO title_records (query_key, records, fetched_at, expires_at) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT(query_key) DO UPDATE SET records = excluded.records,"
+            " fetched_at = excluded.fetched_at, expires_at = excluded.expires_at",
+            (query_key, json.dumps(records, ensure_ascii=False), time.time(), float(expires_at)),
+        )
@@ -0,0 +1,257 @@
+"""Per-provider circuit breakers for upstream evidence sources.
+
+Each breaker keeps a rolling window of recent call outcomes and latencies.
+When the failure rate over at least ``minimum_calls`` reaches
+``failure_rate_threshold`` the breaker opens, and callers fail fast with the
+typed reason of the last failure instead of waiting out another timeout.
+After ``open_s`` one probe call is let through (half-open). If it succeeds,
+the breaker closes; if it fails, the breaker re-opens.
+
+Breakers are shared by the async fetchers and the ``asyncio.to_thread``
+footprint workers, so state changes are guarded by a lock.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+import httpx
+
+from request_deadline import remaining_s
+
+
+LOGGER = logging.getLogger(__name__)
+
+CIRCUIT_BREAKER_WINDOW = int(os.getenv("CIRCUIT_BREAKER_WINDOW", "20"))
+CIRCUIT_BREAKER_MIN_CALLS = int(os.getenv("CIRCUIT_BREAKER_MIN_CALLS", "5"))
+CIRCUIT_BREAKER_FAILURE_RATE = float(os.getenv("CIRCUIT_BREAKER_FAILURE_RATE", "0.5"))
+CIRCUIT_BREAKER_OPEN_S = float(os.getenv("CIRCUIT_BREAKER_OPEN_S", "30"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def upstream_status_failed(status_code: int) -> bool:
+    """Statuses that mean the provider itself is unhealthy, not the request."""
+    return status_code >= 500 or status_code == 429
+
+
+def _default_failure_reason(provider: str, error: Exception) -> str:
+    reason = getattr(error, "reason", None)
+    if isinstance(reason, str) and reason:
+        return reason
+    if isinstance(error, (TimeoutError, httpx.TimeoutException)):
+        return f"{provider}_timeout"
+    return f"{provider}_network_error"
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, provider: str, reason: str):
+        super().__init__(f"circuit_open:{provider}:{reason}")
+        self.provider = provider
+        self.reason = reason
+
+
+@dataclass
+class CallOutcome:
+    """Handle yielded by ``CircuitBreaker.call`` to report a non-raising failure."""
+
+    failure_reason: Optional[str] = None
+
+    def fail(self, reason: str) -> None:
+        self.failure_reason = reason
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        *,
+        window: int = CIRCUIT_BREAKER_WINDOW,
+        minimum_calls: int = CIRCUIT_BREAKER_MIN_CALLS,
+        failure_rate_threshold: float = CIRCUIT_BREAKER_FAILURE_RATE,
+        open_s: float = CIRCUIT_BREAKER_OPEN_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.minimum_calls = max(1, int(minimum_calls))
+        self.failure_rate_threshold = float(failure_rate_threshold)
+        self.open_s = float(open_s)
+        self._clock = clock
+        self._outcomes: Deque[bool] = deque(maxlen=max(1, int(window)))
+        self._latencies_ms: Deque[float] = deque(maxlen=max(1, int(window)))
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at: Optional[float] = None
+        self._probe_inflight = False
+        self._last_failure_reason: Optional[str] = None
+        self.rejected = 0
+        self.opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and self._opened_at is not None and self._clock() - self._opened_at >= self.open_s:
+            self._state = HALF_OPEN
+            self._probe_inflight = False
+        return self._state
+
+    def before_call(self) -> None:
+        """Raise ``CircuitOpenError`` unless a call may go upstream now."""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and not self._probe_inflight:
+                self._probe_inflight = True
+                return
+            self.rejected += 1
+            raise CircuitOpenError(self.name, self._last_failure_reason or "circuit_open")
+
+    def record_success(self, latency_s: float) -> None:
+        with self._lock:
+            self._latencies_ms.append(latency_s * 1000.0)
+            if self._state == HALF_OPEN:
+                self._close()
+            self._outcomes.append(True)
+
+    def record_failure(self, reason: str, latency_s: float) -> None:
+        with self._lock:
+            self._latencies_ms.append(latency_s * 1000.0)
+            self._outcomes.append(False)
+            self._last_failure_reason = reason
+            if self._state == HALF_OPEN or self._failure_rate_exceeded():
+                self._open()
+
+    def release_probe(self) -> None:
+        """Free the half-open probe slot when a call ended without an outcome."""
+        with self._lock:
+            self._probe_inflight = False
+
+    def _failure_rate_exceeded(self) -> bool:
+        if self._state != CLOSED or len(self._outcomes) < self.minimum_calls:
+            return False
+        failures = sum(1 for ok in self._outcomes if not ok)
+        return failures / len(self._outcomes) >= self.failure_rate_threshold
+
+    def _open(self) -> None:
+        if self._state != OPEN:
+            self.opened += 1
+            LOGGER.warning("provider_circuit_open provider=%s reason=%s", self.name, self._last_failure_reason)
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._probe_inflight = False
+
+    def _close(self) -> None:
+        LOGGER.info("provider_circuit_closed provider=%s", self.name)
+        self._state = CLOSED
+        self._opened_at = None
+        self._probe_inflight = False
+        self._outcomes.clear()
+
+    @contextmanager
+    def call(self, error_reason: Optional[str] = None) -> Iterator[CallOutcome]:
+        """Guard one upstream call.
+
+        Exceptions count as failures. Their reason is ``outcome.fail``, else
+        ``error_reason``, else the exception's typed ``reason``, else
+        ``<provider>_timeout`` / ``<provider>_network_error``.
+        ``outcome.fail(reason)`` also records a failure for responses that
+        did not raise, e.g. an HTTP 503.
+        Cancellation records nothing, and neither does a failure after the
+        request deadline ran out, since that says nothing about the provider.
+        """
+        self.before_call()
+        started = time.perf_counter()
+        outcome = CallOutcome()
+        try:
+            yield outcome
+        except (asyncio.CancelledError, GeneratorExit):
+            self.release_probe()
+            raise
+        except Exception as error:
+            budget_left = remaining_s()
+            if budget_left is not None and budget_left <= 0.0:
+                self.release_probe()
+                raise
+            reason = outcome.failure_reason or error_reason or _default_failure_reason(self.name, error)
+            self.record_failure(reason, time.perf_counter() - started)
+            raise
+        if outcome.failure_reason is not None:
+            self.record_failure(outcome.failure_reason, time.perf_counter() - started)
+        else:
+            self.record_success(time.perf_counter() - started)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._opened_at = None
+            self._probe_inflight = False
+            self._last_failure_reason = None
+            self._outcomes.clear()
+            self._latencies_ms.clear()
+            self.rejected = 0
+            self.opened = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self._current_state()
+            calls = len(self._outcomes)
+            failures = sum(1 for ok in self._outcomes if not ok)
+            latencies = sorted(self._latencies_ms)
+            retry_in_s = None
+            if state == OPEN and self._opened_at is not None:
+                retry_in_s = round(max(0.0, self.open_s - (self._clock() - self._opened_at)), 1)
+            return {
+                "provider": self.name,
+                "state": state,
+                "recent_calls": calls,
+                "failure_rate": round(failures / calls, 3) if calls else 0.0,
+                "latency_ms_p50": round(latencies[len(latencies) // 2], 1) if latencies else None,
+                "latency_ms_p95": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 1) if latencies else None,
+                "last_failure_reason": self._last_failure_reason,
+                "retry_in_s": retry_in_s,
+                "opened": self.opened,
+                "rejected": self.rejected,
+            }
+
+
+class CircuitBreakerRegistry:
+    def __init__(self) -> None:
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(name)
+                self._breakers[name] = breaker
+            return breaker
+
+    def reset(self) -> None:
+        for breaker in list(self._breakers.values()):
+            breaker.reset()
+
+    def snapshot(self, names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        selected = sorted(self._breakers) if names is None else names
+        return [self.breaker(name).snapshot() for name in selected]
+
+
+CIRCUIT_BREAKERS = CircuitBreakerRegistry()
+
+
+def provider_breaker(name: str) -> CircuitBreaker:
+    return CIRCUIT_BREAKERS.breaker(name)
@@ -0,0 +1,107 @@
+"""Failover memory for providers configured with several credentials.
+
+A key the gateway rejects as expired, unregistered or denied keeps failing
+until an operator rotates it, so walking the configured order on every
+request spends a failed round-trip on it each time. The registry remembers
+the last key that worked, which is tried first, and demotes a rejected key
+behind the others for ``CREDENTIAL_DEMOTION_S``. Demoted keys remain
+last-resort candidates, so a provider whose keys are all demoted still
+tries them. State is per worker process; keys are tracked by digest and
+reported by label only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+LOGGER = logging.getLogger(__name__)
+
+CREDENTIAL_DEMOTION_S = float(os.getenv("CREDENTIAL_DEMOTION_S", "3600"))
+
+
+def _digest(credential: str) -> str:
+    return hashlib.sha256(credential.encode("utf-8")).hexdigest()
+
+
+class CredentialHealthRegistry:
+    def __init__(self, demotion_s: float = CREDENTIAL_DEMOTION_S, clock: Callable[[], float] = time.monotonic) -> None:
+        self.demotion_s = demotion_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (provider, digest) -> (demoted until, reason)
+        self._demoted: Dict[Tuple[str, str], Tuple[float, str]] = {}
+        self._last_good: Dict[str, str] = {}
+
+    def _is_demoted(self, provider: str, digest: str, now: float) -> bool:
+        demotion = self._demoted.get((provider, digest))
+        return demotion is not None and demotion[0] > now
+
+    def order(self, provider: str, candidates: Sequence[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """``(label, credential)`` candidates: last known-good first, demoted keys last."""
+        now = self._clock()
+        with self._lock:
+            last_good = self._last_good.get(provider)
+            ranked = sorted(
+                enumerate(candidates),
+                key=lambda item: (
+                    self._is_demoted(provider, _digest(item[1][1]), now),
+                    _digest(item[1][1]) != last_good,
+                    item[0],
+                ),
+            )
+        return [candidate for _position, candidate in ranked]
+
+    def record_success(self, provider: str, credential: str) -> None:
+        digest = _digest(credential)
+        with self._lock:
+            self._last_good[provider] = digest
+            self._demoted.pop((provider, digest), None)
+
+    def record_failure(self, provider: str, label: str, credential: str, reason: str) -> None:
+        """The gateway rejected the credential itself; demote it for the cool-down."""
+        digest = _digest(credential)
+        with self._lock:
+            if self._last_good.get(provider) == digest:
+                del self._last_good[provider]
+            self._demoted[(provider, digest)] = (self._clock() + self.demotion_s, reason)
+        LOGGER.warning(
+            "provider_credential_demoted provider=%s credential=%s reason=%s demotion_s=%.0f",
+            provider,
+            label,
+            reason,
+            self.demotion_s,
+        )
+
+    def snapshot(self, provider: str, candidates: Sequence[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        now = self._clock()
+        with self._lock:
+            last_good = self._last_good.get(provider)
+            entries = []
+            for label, credential in candidates:
+                digest = _digest(credential)
+                demoted = self._is_demoted(provider, digest, now)
+                until, reason = self._demoted.get((provider, digest), (0.0, None))
+                entries.append(
+                    {
+                        "credential": label,
+                        "last_known_good": digest == last_good,
+                        "demoted": demoted,
+                        "demoted_reason": reason if demoted else None,
+                        "demoted_for_s": round(until - now, 1) if demoted else None,
+                    }
+                )
+            return entries
+
+    def reset(self) -> None:
+        with self._lock:
+            self._demoted.clear()
+            self._last_good.clear()
+
+
+CREDENTIAL_HEALTH = CredentialHealthRegistry()
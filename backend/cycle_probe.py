@@ -0,0 +1,136 @@
+"""Concurrent newest-first probing of provider publication cycles.
+
+KMA products are requested by cycle timestamp, and the newest cycles are often
+not published yet. Instead of walking candidate cycles one round-trip at a
+time, a batch of the newest cycles is requested concurrently and the newest
+cycle that returns data wins; older in-flight probes are cancelled. The last
+published cycle per provider is remembered so the next batch stretches just
+far enough to include a known-good cycle.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+
+T = TypeVar("T")
+CYCLE_FORMAT = "%Y%m%d%H%M"
+# Upper bound on a first batch stretched back to a remembered cycle, so a
+# long-stale memory cannot fan out into a burst against the provider quota.
+MAX_FIRST_BATCH = 6
+
+
+def parse_cycle(cycle: str, tz: tzinfo = timezone.utc) -> Optional[datetime]:
+    try:
+        return datetime.strptime(str(cycle).strip(), CYCLE_FORMAT).replace(tzinfo=tz)
+    except ValueError:
+        return None
+
+
+def cycle_is_past(cycle: str, interval: timedelta, tz: tzinfo = timezone.utc, now: Optional[datetime] = None) -> bool:
+    """True once the following cycle has started, so this cycle's payload is final."""
+    cycle_start = parse_cycle(cycle, tz)
+    if cycle_start is None:
+        return False
+    return cycle_start + interval <= (now or datetime.now(timezone.utc))
+
+
+def cycle_cache_expiry(
+    observed_at: datetime,
+    *,
+    interval: timedelta,
+    publication_lag: timedelta,
+    retry_after_s: float,
+    not_after: Optional[datetime] = None,
+    now: Optional[datetime] = None,
+) -> float:
+    """Epoch expiry for a payload observed at ``observed_at``.
+
+    The entry stays fresh until the next cycle is expected to be published.
+    When that moment has already passed (the newer cycle is late), the entry
+    is retried after ``retry_after_s`` instead. ``not_after`` caps the expiry,
+    e.g. at an authority receipt's own expiry.
+    """
+    current_time = now or datetime.now(timezone.utc)
+    expires_at = max(
+        observed_at + interval + publication_lag,
+        current_time + timedelta(seconds=retry_after_s),
+    )
+    if not_after is not None:
+        expires_at = min(expires_at, not_after)
+    return expires_at.timestamp()
+
+
+class PublishedCycleTracker:
+    def __init__(self) -> None:
+        self._last_published: Dict[str, str] = {}
+
+    def last(self, provider: str) -> Optional[str]:
+        return self._last_published.get(provider)
+
+    def remember(self, provider: str, cycle: str) -> None:
+        self._last_published[provider] = cycle
+
+    def forget(self, provider: Optional[str] = None) -> None:
+        if provider is None:
+            self._last_published.clear()
+        else:
+            self._last_published.pop(provider, None)
+
+    def snapshot(self) -> Dict[str, str]:
+        return dict(self._last_published)
+
+    def plan(self, provider: str, cycles: Sequence[str], window: int) -> List[List[str]]:
+        """Split newest-first ``cycles`` into concurrent probe batches.
+
+        Once a provider has published, the first batch is every newer cycle
+        plus the remembered one, so a warm provider resolves in one
+        round-trip even when newer cycles are still missing upstream. The
+        stretch is capped at ``MAX_FIRST_BATCH`` cycles (or ``window`` when
+        that is larger); older cycles follow in ``window``-sized batches.
+        """
+        window = max(1, int(window))
+        first_size = window
+        known = self.last(provider)
+        if known in cycles:
+            first_size = min(list(cycles).index(known) + 1, max(window, MAX_FIRST_BATCH))
+        batches = [list(cycles[:first_size])]
+        for start in range(first_size, len(cycles), window):
+            batches.append(list(cycles[start:start + window]))
+        return [batch for batch in batches if batch]
+
+    async def probe(
+        self,
+        provider: str,
+        cycles: Sequence[str],
+        fetch_cycle: Callable[[str], Awaitable[Optional[T]]],
+        *,
+        window: int,
+    ) -> Optional[Tuple[str, T]]:
+        """Return ``(cycle, result)`` for the newest cycle whose fetch is not ``None``.
+
+        An exception from a cycle aborts probing exactly where a sequential
+        walk would have stopped: newer cycles are resolved first, older ones
+        are cancelled.
+        """
+        for batch in self.plan(provider, cycles, window):
+            tasks = [asyncio.ensure_future(fetch_cycle(cycle)) for cycle in batch]
+            try:
+                for cycle, task in zip(batch, tasks):
+                    result = await task
+                    if result is not None:
+                        self.remember(provider, cycle)
+                        return cycle, result
+            finally:
+                await _cancel_pending(tasks)
+        return None
+
+
+async def _cancel_pending(tasks: List["asyncio.Future[Any]"]) -> None:
+    pending = [task for task in tasks if not task.done()]
+    for task in pending:
+        task.cancel()
+    # Collect every outcome so unretrieved exceptions are not logged later.
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,145 @@
+"""Fan-out/fan-in executor for the evidence an evaluation depends on.
+
+Each ``EvidenceNode`` names the nodes whose results it needs; everything else
+runs concurrently. The whole graph shares one deadline: nodes still running
+when it expires are cancelled and replaced by their ``fallback`` value (a
+typed "unavailable" payload), so the request latency tracks the longest
+dependency path instead of the sum of every upstream call. A node that
+raises fails the graph at once and cancels the nodes still running.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+EVIDENCE_DEADLINE_REASON = "evaluation_deadline_exceeded"
+
+
+class EvidenceDeadlineExceeded(Exception):
+    def __init__(self, nodes: List[str]):
+        super().__init__(f"{EVIDENCE_DEADLINE_REASON}:{','.join(nodes)}")
+        self.nodes = nodes
+
+
+@dataclass(frozen=True)
+class EvidenceNode:
+    name: str
+    run: Callable[..., Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+    fallback: Optional[Callable[[str], Any]] = None
+
+
+@dataclass
+class EvidenceGraphResult:
+    values: Dict[str, Any]
+    timings: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    total_ms: float = 0.0
+
+    def __getitem__(self, name: str) -> Any:
+        return self.values[name]
+
+    def server_timing(self) -> str:
+        """Render the timings as a ``Server-Timing`` header value."""
+        entries = [
+            f'{name};dur={timing["duration_ms"]:.1f};desc="{timing["status"]}"'
+            for name, timing in self.timings.items()
+        ]
+        entries.append(f"evidence_total;dur={self.total_ms:.1f}")
+        return ", ".join(entries)
+
+
+class EvidenceGraph:
+    def __init__(self, nodes: Iterable[EvidenceNode]) -> None:
+        self.nodes: Dict[str, EvidenceNode] = {}
+        for node in nodes:
+            if node.name in self.nodes:
+                raise ValueError(f"duplicate_evidence_node:{node.name}")
+            self.nodes[node.name] = node
+        for node in self.nodes.values():
+            for dependency in node.depends_on:
+                if dependency not in self.nodes:
+                    raise ValueError(f"unknown_evidence_dependency:{node.name}->{dependency}")
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        visiting: set = set()
+        done: set = set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"evidence_dependency_cycle:{name}")
+            visiting.add(name)
+            for dependency in self.nodes[name].depends_on:
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.nodes:
+            visit(name)
+
+    async def run(self, *, deadline_s: Optional[float] = None) -> EvidenceGraphResult:
+        started = time.perf_counter()
+        timings: Dict[str, Dict[str, Any]] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_node(node: EvidenceNode) -> Any:
+            inputs = {dependency: await tasks[dependency] for dependency in node.depends_on}
+            node_started = time.perf_counter()
+            timings[node.name] = {
+                "started_ms": round((node_started - started) * 1000.0, 1),
+                "duration_ms": 0.0,
+                "status": "running",
+            }
+            try:
+                value = await node.run(**inputs)
+            except asyncio.CancelledError:
+                timings[node.name]["status"] = "cancelled"
+                raise
+            except Exception:
+                timings[node.name]["status"] = "error"
+                raise
+            finally:
+                timings[node.name]["duration_ms"] = round((time.perf_counter() - node_started) * 1000.0, 1)
+            timings[node.name]["status"] = "ok"
+            return value
+
+        for node in self.nodes.values():
+            tasks[node.name] = asyncio.create_task(run_node(node), name=f"evidence:{node.name}")
+
+        # The first failing node fails the graph, so the rest are not awaited.
+        done, pending = await asyncio.wait(tasks.values(), timeout=deadline_s, return_when=asyncio.FIRST_EXCEPTION)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        failed = next((task for task in tasks.values() if task in done and task.exception() is not None), None)
+        if failed is not None:
+            raise failed.exception()
+
+        values: Dict[str, Any] = {}
+        expired: List[str] = []
+        for name, task in tasks.items():
+            if task.cancelled():
+                node = self.nodes[name]
+                timing = timings.setdefault(name, {"started_ms": None, "duration_ms": 0.0})
+                timing["status"] = "deadline_exceeded"
+                if node.fallback is None:
+                    expired.append(name)
+                    continue
+                values[name] = node.fallback(EVIDENCE_DEADLINE_REASON)
+                continue
+            values[name] = task.result()
+
+        if expired:
+            raise EvidenceDeadlineExceeded(expired)
+        return EvidenceGraphResult(
+            values=values,
+            timings={name: timings[name] for name in self.nodes if name in timings},
+            total_ms=round((time.perf_counter() - started) * 1000.0, 1),
+        )
@@ -0,0 +1,233 @@
+"""SQLite-backed persistent store for building footprint cache entries.
+
+Entries keep the legacy ``footprint_cache.json`` shape (``center``,
+``geometry``, ``properties``, ``source``, ``source_origin``) plus a stable
+``id``. Each row is filed under a lon/lat bucket with a B-tree index, so the
+dedupe probe of an upsert touches a handful of rows instead of the whole
+cache. Every write gets a monotonically increasing ``revision``;
+readers keep an in-memory copy in sync by pulling ``changes_since`` their
+last revision. The database runs in WAL mode, so several workers can read
+while one writes, and upserts run inside ``BEGIN IMMEDIATE`` so concurrent
+writers serialise instead of clobbering each other.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+FOOTPRINT_STORE_BUCKET_DEG = 0.001
+FOOTPRINT_STORE_BUSY_TIMEOUT_S = float(os.getenv("FOOTPRINT_STORE_BUSY_TIMEOUT_S", "5"))
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS footprints (
+        id INTEGER PRIMARY KEY,
+        bucket_x INTEGER NOT NULL,
+        bucket_y INTEGER NOT NULL,
+        center_lat REAL NOT NULL,
+        center_lon REAL NOT NULL,
+        geometry TEXT NOT NULL,
+        properties TEXT NOT NULL,
+        source TEXT,
+        source_origin TEXT,
+        revision INTEGER NOT NULL,
+        updated_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS footprints_bucket ON footprints (bucket_x, bucket_y)",
+    "CREATE INDEX IF NOT EXISTS footprints_revision ON footprints (revision)",
+    "CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+)
+_COLUMNS = "id, center_lat, center_lon, geometry, properties, source, source_origin, revision"
+
+# (lat, lon, radius_deg, build) for one ``upsert_near``.
+Upsert = Tuple[float, float, float, Callable[[Optional[Dict[str, Any]]], Dict[str, Any]]]
+
+
+class FootprintStore:
+    def __init__(self, path: str, *, bucket_deg: float = FOOTPRINT_STORE_BUCKET_DEG) -> None:
+        self.path = path
+        self.bucket_deg = float(bucket_deg)
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections are not shared across threads; the footprint
+        # lookups run in asyncio.to_thread workers, so each gets its own.
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=FOOTPRINT_STORE_BUSY_TIMEOUT_S, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._ensure_schema(connection)
+        return connection
+
+    def _ensure_schema(self, connection: sqlite3.Connection) -> None:
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            self._schema_ready = True
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _bucket(self, lat: float, lon: float) -> Tuple[int, int]:
+        return math.floor(lon / self.bucket_deg), math.floor(lat / self.bucket_deg)
+
+    @staticmethod
+    def _row_to_entry(row: Tuple[Any, ...]) -> Dict[str, Any]:
+        row_id, center_lat, center_lon, geometry, properties, source, source_origin, revision = row
+        return {
+            "id": row_id,
+            "center": {"lat": center_lat, "lon": center_lon},
+            "geometry": json.loads(geometry),
+            "properties": json.loads(properties),
+            "source": source,
+            "source_origin": source_origin,
+            "revision": revision,
+        }
+
+    def _write_values(self, entry: Dict[str, Any], revision: int) -> Tuple[Any, ...]:
+        center_lat = float(entry["center"]["lat"])
+        center_lon = float(entry["center"]["lon"])
+        bucket_x, bucket_y = self._bucket(center_lat, center_lon)
+        return (
+            bucket_x,
+            bucket_y,
+            center_lat,
+            center_lon,
+            json.dumps(entry.get("geometry") or [], ensure_ascii=False),
+            json.dumps(entry.get("properties") or {}, ensure_ascii=False),
+            entry.get("source"),
+            entry.get("source_origin"),
+            revision,
+            time.time(),
+        )
+
+    @staticmethod
+    def _next_revision(connection: sqlite3.Connection) -> int:
+        (current,) = connection.execute("SELECT COALESCE(MAX(revision), 0) FROM footprints").fetchone()
+        return int(current) + 1
+
+    def _insert(self, connection: sqlite3.Connection, entry: Dict[str, Any], revision: int) -> int:
+        cursor = connection.execute(
+            "INSERT INTO footprints (bucket_x, bucket_y, center_lat, center_lon, geometry, properties,"
+            " source, source_origin, revision, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            self._write_values(entry, revision),
+        )
+        return int(cursor.lastrowid)
+
+    def upsert_near(
+        self,
+        lat: float,
+        lon: float,
+        radius_deg: float,
+        build: Callable[[Optional[Dict[str, Any]]], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Merge into the oldest entry whose center lies within ``radius_deg``, else insert.
+
+        ``build(existing)`` returns the entry to persist; it runs inside the
+        write transaction so concurrent writers see each other's merges.
+        """
+        return self.upsert_many([(lat, lon, radius_deg, build)])[0]
+
+    def upsert_many(
+        self,
+        upserts: Iterable[Upsert],
+        *,
+        meta: Optional[Tuple[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Apply several ``upsert_near`` calls in one transaction (one fsync).
+
+        With ``meta=(key, value)`` the batch is skipped when ``store_meta``
+        already holds ``value`` under ``key`` and records it otherwise, so
+        concurrent workers apply a given batch once.
+        """
+        connection = self._connection()
+        written: List[Dict[str, Any]] = []
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            if meta is not None:
+                done = connection.execute("SELECT value FROM store_meta WHERE key = ?", (meta[0],)).fetchone()
+                if done and done[0] == meta[1]:
+                    connection.execute("COMMIT")
+                    return written
+            revision = self._next_revision(connection)
+            for lat, lon, radius_deg, build in upserts:
+                written.append(self._upsert(connection, lat, lon, radius_deg, build, revision))
+                revision += 1
+            if meta is not None:
+                connection.execute("INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)", meta)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return written
+
+    def _upsert(
+        self,
+        connection: sqlite3.Connection,
+        lat: float,
+        lon: float,
+        radius_deg: float,
+        build: Callable[[Optional[Dict[str, Any]]], Dict[str, Any]],
+        revision: int,
+    ) -> Dict[str, Any]:
+        min_x, min_y = self._bucket(lat - radius_deg, lon - radius_deg)
+        max_x, max_y = self._bucket(lat + radius_deg, lon + radius_deg)
+        existing: Optional[Dict[str, Any]] = None
+        rows = connection.execute(
+            f"SELECT {_COLUMNS} FROM footprints"
+            " WHERE bucket_x BETWEEN ? AND ? AND bucket_y BETWEEN ? AND ? ORDER BY id",
+            (min_x, max_x, min_y, max_y),
+        ).fetchall()
+        for row in rows:
+            if math.hypot(row[1] - lat, row[2] - lon) <= radius_deg:
+                existing = self._row_to_entry(row)
+                break
+        entry = build(existing)
+        if existing is None:
+            row_id = self._insert(connection, entry, revision)
+        else:
+            row_id = existing["id"]
+            connection.execute(
+                "UPDATE footprints SET bucket_x = ?, bucket_y = ?, center_lat = ?, center_lon = ?,"
+                " geometry = ?, properties = ?, source = ?, source_origin = ?, revision = ?, updated_at = ?"
+                " WHERE id = ?",
+                (*self._write_values(entry, revision), row_id),
+            )
+        return {**entry, "id": row_id, "revision": revision}
+
+    def changes_since(self, revision: int) -> Tuple[int, List[Dict[str, Any]]]:
+        """Entries written after ``revision`` (oldest first) and the newest revision seen."""
+        rows = self._connection().execute(
+            f"SELECT {_COLUMNS} FROM footprints WHERE revision > ? ORDER BY revision",
+            (int(revision),),
+        ).fetchall()
+        entries = [self._row_to_entry(row) for row in rows]
+        return (entries[-1]["revision"] if entries else int(revision)), entries
+
+    def count(self) -> int:
+        (total,) = self._connection().execute("SELECT COUNT(*) FROM footprints").fetchone()
+        return int(total)
+
+    def meta(self, key: str) -> Optional[str]:
+        row = self._connection().execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
@@ -0,0 +1,79 @@
+"""Hedged races over alternative ways of fetching the same evidence.
+
+Attempts are listed in preference order. The first starts at once and each
+later one starts ``hedge_s`` after the previous, or as soon as every running
+attempt has finished without an accepted result. The first accepted result
+wins and the attempts still running are cancelled, so a slow or failing
+source costs at most one hedge delay instead of a full timeout.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple, Type
+
+
+Attempt = Callable[[], Awaitable[Any]]
+
+
+class NoAcceptedResult(Exception):
+    """Every attempt finished without an accepted result.
+
+    ``outcomes`` holds each attempt's result or exception, in attempt order.
+    """
+
+    def __init__(self, outcomes: List[Any]):
+        super().__init__("no_accepted_result")
+        self.outcomes = outcomes
+
+
+async def _cancel(tasks: Sequence[asyncio.Task]) -> None:
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def first_accepted(
+    attempts: Sequence[Attempt],
+    *,
+    hedge_s: Optional[float],
+    accept: Callable[[Any], bool] = lambda result: True,
+    abort_on: Tuple[Type[BaseException], ...] = (),
+) -> Tuple[int, Any]:
+    """Race ``attempts``; returns ``(index, result)`` of the first accepted result.
+
+    ``hedge_s=None`` runs the attempts one after another. An exception from
+    an attempt counts as not accepted, except ``abort_on`` types, which
+    cancel the race and propagate. Raises ``NoAcceptedResult`` when every
+    attempt finished unaccepted.
+    """
+    outcomes: List[Any] = [None] * len(attempts)
+    running = {}
+    started = 0
+    try:
+        while started < len(attempts) or running:
+            if not running and started < len(attempts):
+                running[asyncio.ensure_future(attempts[started]())] = started
+                started += 1
+            timeout = hedge_s if hedge_s is not None and started < len(attempts) else None
+            done, _pending = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                running[asyncio.ensure_future(attempts[started]())] = started
+                started += 1
+                continue
+            # Settle finished attempts in preference order so a tie goes to the earlier one.
+            for task in sorted(done, key=running.__getitem__):
+                index = running.pop(task)
+                error = task.exception()
+                if error is not None:
+                    if isinstance(error, abort_on):
+                        raise error
+                    outcomes[index] = error
+                    continue
+                result = task.result()
+                if accept(result):
+                    return index, result
+                outcomes[index] = result
+    finally:
+        await _cancel(list(running))
+    raise NoAcceptedResult(outcomes)
@@ -10,9 +10,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, JSONResponse, Response
 from pydantic import BaseModel, ConfigDict, Field, StringConstraints
-from typing import Annotated, Optional, List, Dict, Any
+from typing import Annotated, Optional, List, Dict, Any, Iterable, Sequence, Tuple
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import partial
 import httpx
 import asyncio
 import logging
@@ -30,17 +32,57 @@ from evaluation_authority import (
     build_weather_evidence as _build_weather_evidence,
 )
 from urban_canyon import measure_facade_gap
-from official_building_registry import enrich_verified_footprint, service_key_configured as molit_building_hub_key_configured
+from official_building_registry import (
+    TITLE_RECORD_CACHE,
+    enrich_verified_footprint,
+    service_key_configured as molit_building_hub_key_configured,
+    service_key_health_snapshot as molit_building_hub_health_snapshot,
+    service_key_quota_snapshot as molit_building_hub_quota_snapshot,
+)
+from circuit_breaker import CIRCUIT_BREAKERS, CircuitOpenError, provider_breaker, upstream_status_failed
+from cycle_probe import PublishedCycleTracker, cycle_cache_expiry, cycle_is_past, parse_cycle
+from evidence_graph import EvidenceGraph, EvidenceGraphResult, EvidenceNode
+from hedging import NoAcceptedResult, first_accepted
+from mercator_tiles import Tile, bbox_param, cached_tile, child_tiles, tile_bounds, tiles_for_bbox
+from provider_cache import EvidenceCache, SingleFlight
+from provider_quota import PROVIDER_QUOTAS, QuotaExhausted, register_quota
+from refresh_scheduler import RefreshJob, RefreshScheduler, parse_operating_areas
+from request_deadline import deadline_wait_for, remaining_s, request_deadline
+from spatial_index import bboxes_intersect, ring_bbox
+from upstream_clients import UPSTREAM_CLIENTS, register_provider, upstream_client
 
 LOGGER = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    # Provider pools live for the worker lifetime so repeated evaluations
+    # reuse TCP/TLS sessions to KMA, VWorld and data.go.kr.
+    await UPSTREAM_CLIENTS.start()
+    if WEATHER_REFRESH_ENABLED:
+        await WEATHER_REFRESH_SCHEDULER.start()
+    if FOOTPRINT_WRITE_BEHIND is not None:
+        await FOOTPRINT_WRITE_BEHIND.start()
+    try:
+        yield
+    finally:
+        if FOOTPRINT_WRITE_BEHIND is not None:
+            # Drain queued footprint cache writes before the worker exits.
+            await FOOTPRINT_WRITE_BEHIND.aclose()
+        await WEATHER_REFRESH_SCHEDULER.aclose()
+        await UPSTREAM_CLIENTS.aclose()
+
+
 app = FastAPI(
     title="UAV Urban Ops API",
     description="승리 도시지역 드론 운용 판단 프로그램",
-    version="2.2.0"
+    version="2.2.0",
+    lifespan=_lifespan,
 )
 
 CACHE_WRITE_TOKEN_ENV_KEY = "UAV_CACHE_WRITE_TOKEN"
+# Set by the building footprint import below when that module is available.
+FOOTPRINT_WRITE_BEHIND = None
 CACHE_WRITE_PATH = "/api/building-footprint/cache"
 SelectionId = Annotated[
     str,
@@ -93,6 +135,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def bind_request_deadline(request, call_next):
+    # Every upstream call made while serving the request shares this budget.
+    with request_deadline(_request_deadline_budget_s(request.url.path)):
+        return await call_next(request)
+
+
 @app.middleware("http")
 async def add_no_cache_header(request, call_next):
     if request.method == "POST" and request.url.path == CACHE_WRITE_PATH:
@@ -217,6 +266,49 @@ def _kma_credential_scope(capability: str) -> str:
     return "unconfigured"
 
 
+# Per-key request budgets for the KMA API hub; see provider_quota.
+for _capability in KMA_CREDENTIAL_ENV_BY_CAPABILITY:
+    register_quota(
+        f"kma_{_capability}",
+        rate_per_s=float(os.getenv("KMA_RATE_PER_S", "5")),
+        burst=int(os.getenv("KMA_BURST", "10")),
+        daily_limit=int(os.getenv("KMA_DAILY_LIMIT", "20000")),
+    )
+
+
+def _kma_credential_label(capability: str) -> str:
+    if _kma_credential_scope(capability) == "dedicated":
+        return KMA_CREDENTIAL_ENV_BY_CAPABILITY[capability]
+    return "KMA_API_KEY"
+
+
+async def _acquire_kma_quota(capability: str, api_key: str) -> None:
+    """Spend one request of the key's budget; raises ``QuotaExhausted`` to shed it."""
+    await PROVIDER_QUOTAS.acquire(f"kma_{capability}", [(_kma_credential_label(capability), api_key)])
+
+
+def _record_kma_quota_response(capability: str, api_key: str, response: httpx.Response) -> None:
+    """Feed gateway quota rejections back into the key's budget."""
+    text = response.text[:8192].upper()
+    if response.status_code == 429 or "LIMITED_NUMBER_OF_SERVICE_REQUESTS_PER_SECOND" in text:
+        PROVIDER_QUOTAS.budget(f"kma_{capability}", _kma_credential_label(capability), api_key).throttle()
+    elif "LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS" in text:
+        PROVIDER_QUOTAS.budget(f"kma_{capability}", _kma_credential_label(capability), api_key).exhaust()
+
+
+def _kma_quota_snapshot() -> Dict[str, Optional[Dict[str, Any]]]:
+    """Remaining request budget per capability, labelled by env var name only."""
+    snapshot: Dict[str, Optional[Dict[str, Any]]] = {}
+    for capability in KMA_CREDENTIAL_ENV_BY_CAPABILITY:
+        api_key = _kma_api_key_for(capability)
+        snapshot[capability] = (
+            PROVIDER_QUOTAS.budget(f"kma_{capability}", _kma_credential_label(capability), api_key).snapshot()
+            if api_key
+            else None
+        )
+    return snapshot
+
+
 def _kma_capability_configuration() -> Dict[str, bool]:
     """Report credential presence without returning provider credentials."""
     return {
@@ -240,6 +332,7 @@ KMA_SURFACE_STATIONS = [
     {"id": 165, "name": "목포", "lat": 34.817, "lon": 126.381},
     {"id": 184, "name": "제주", "lat": 33.514, "lon": 126.529},
 ]
+KMA_SURFACE_STATION_IDS = frozenset(station["id"] for station in KMA_SURFACE_STATIONS)
 KMA_DEFAULT_STATIONS = [
     {"id": 47102, "name": "백령도", "lat": 37.967, "lon": 124.630},
     {"id": 47122, "name": "오산", "lat": 37.090, "lon": 127.029},
@@ -249,19 +342,107 @@ KMA_DEFAULT_STATIONS = [
 WIS2_STATION_ENDPOINT = "https://wis2box.kma.go.kr/oapi/collections/stations/items/0-20000-0-{stn}?f=json"
 WIND_PROFILER_MODE = os.getenv("KMA_WIND_PROFILER_MODE", "L")
 WIND_PROFILER_MAX_ALT_M = float(os.getenv("KMA_WIND_PROFILER_MAX_ALT_M", "5000"))
-WIS2_STATION_CACHE: Dict[int, Dict[str, Any]] = {}
 WEATHER_CACHE_TTL_S = float(os.getenv("WEATHER_CACHE_TTL_S", "180"))
 UPPER_AIR_CACHE_TTL_S = float(os.getenv("UPPER_AIR_CACHE_TTL_S", "900"))
 WIND_PROFILER_CACHE_TTL_S = float(os.getenv("WIND_PROFILER_CACHE_TTL_S", "300"))
 WEATHER_STALE_TTL_S = float(os.getenv("WEATHER_STALE_TTL_S", "1800"))
 UPPER_AIR_STALE_TTL_S = float(os.getenv("UPPER_AIR_STALE_TTL_S", "21600"))
 WIND_PROFILER_STALE_TTL_S = float(os.getenv("WIND_PROFILER_STALE_TTL_S", "1800"))
-WEATHER_CACHE: Dict[str, Dict[str, Any]] = {}
-UPPER_AIR_CACHE: Dict[str, Dict[str, Any]] = {}
-WIND_PROFILER_CACHE: Dict[str, Dict[str, Any]] = {}
-WEATHER_LAST_GOOD_CACHE: Dict[str, Dict[str, Any]] = {}
-UPPER_AIR_LAST_GOOD_CACHE: Dict[str, Dict[str, Any]] = {}
-WIND_PROFILER_LAST_GOOD_CACHE: Dict[str, Dict[str, Any]] = {}
+WEATHER_CACHE_MAX_ENTRIES = int(os.getenv("WEATHER_CACHE_MAX_ENTRIES", "2048"))
+UPPER_AIR_CACHE_MAX_ENTRIES = int(os.getenv("UPPER_AIR_CACHE_MAX_ENTRIES", "512"))
+WIND_PROFILER_CACHE_MAX_ENTRIES = int(os.getenv("WIND_PROFILER_CACHE_MAX_ENTRIES", "512"))
+# Foreground reads may serve an entry this old while a background fetch
+# revalidates it; surface receipts are still checked against their own expiry.
+WEATHER_REVALIDATE_TTL_S = float(os.getenv("WEATHER_REVALIDATE_TTL_S", "900"))
+UPPER_AIR_REVALIDATE_TTL_S = float(os.getenv("UPPER_AIR_REVALIDATE_TTL_S", "43200"))
+WIND_PROFILER_REVALIDATE_TTL_S = float(os.getenv("WIND_PROFILER_REVALIDATE_TTL_S", "900"))
+# KMA publication cadence. Cached products stay fresh until the next cycle is
+# expected upstream (cycle start + interval + lag) rather than for a fixed TTL;
+# the *_CACHE_TTL_S values become the retry interval when a cycle is late.
+KMA_SURFACE_CYCLE_INTERVAL = timedelta(hours=1)
+KMA_UPPER_AIR_CYCLE_INTERVAL = timedelta(hours=12)
+KMA_WIND_PROFILER_CYCLE_INTERVAL = timedelta(minutes=10)
+KMA_SURFACE_PUBLICATION_LAG_S = float(os.getenv("KMA_SURFACE_PUBLICATION_LAG_S", "300"))
+KMA_UPPER_AIR_PUBLICATION_LAG_S = float(os.getenv("KMA_UPPER_AIR_PUBLICATION_LAG_S", "5400"))
+KMA_WIND_PROFILER_PUBLICATION_LAG_S = float(os.getenv("KMA_WIND_PROFILER_PUBLICATION_LAG_S", "600"))
+# Payloads of cycles whose successor has started no longer change upstream.
+KMA_CYCLE_PAYLOAD_TTL_S = float(os.getenv("KMA_CYCLE_PAYLOAD_TTL_S", "172800"))
+WIS2_STATION_CACHE_TTL_S = float(os.getenv("WIS2_STATION_CACHE_TTL_S", "86400"))
+WIS2_STATION_CACHE_MAX_ENTRIES = int(os.getenv("WIS2_STATION_CACHE_MAX_ENTRIES", "256"))
+KMA_SURFACE_SNAPSHOT_TTL_S = float(os.getenv("KMA_SURFACE_SNAPSHOT_TTL_S", str(WEATHER_CACHE_TTL_S)))
+# All-station surface rows keyed by KST cycle; lat/lon lookups resolve to a
+# station row here without another upstream request.
+KMA_SURFACE_SNAPSHOT_CACHE = EvidenceCache("kma_surface_snapshot", ttl_s=KMA_SURFACE_SNAPSHOT_TTL_S, max_entries=8)
+KMA_SURFACE_SNAPSHOT_SINGLE_FLIGHT = SingleFlight("kma_surface_snapshot")
+WEATHER_CACHE = EvidenceCache(
+    "weather",
+    ttl_s=WEATHER_CACHE_TTL_S,
+    stale_ttl_s=WEATHER_REVALIDATE_TTL_S,
+    max_entries=WEATHER_CACHE_MAX_ENTRIES,
+)
+UPPER_AIR_CACHE = EvidenceCache(
+    "upper_air",
+    ttl_s=UPPER_AIR_CACHE_TTL_S,
+    stale_ttl_s=UPPER_AIR_REVALIDATE_TTL_S,
+    max_entries=UPPER_AIR_CACHE_MAX_ENTRIES,
+)
+WIND_PROFILER_CACHE = EvidenceCache(
+    "wind_profiler",
+    ttl_s=WIND_PROFILER_CACHE_TTL_S,
+    stale_ttl_s=WIND_PROFILER_REVALIDATE_TTL_S,
+    max_entries=WIND_PROFILER_CACHE_MAX_ENTRIES,
+)
+WEATHER_LAST_GOOD_CACHE = EvidenceCache(
+    "weather_last_good",
+    ttl_s=WEATHER_CACHE_TTL_S,
+    stale_ttl_s=WEATHER_STALE_TTL_S,
+    max_entries=WEATHER_CACHE_MAX_ENTRIES,
+)
+UPPER_AIR_LAST_GOOD_CACHE = EvidenceCache(
+    "upper_air_last_good",
+    ttl_s=UPPER_AIR_CACHE_TTL_S,
+    stale_ttl_s=UPPER_AIR_STALE_TTL_S,
+    max_entries=UPPER_AIR_CACHE_MAX_ENTRIES,
+)
+WIND_PROFILER_LAST_GOOD_CACHE = EvidenceCache(
+    "wind_profiler_last_good",
+    ttl_s=WIND_PROFILER_CACHE_TTL_S,
+    stale_ttl_s=WIND_PROFILER_STALE_TTL_S,
+    max_entries=WIND_PROFILER_CACHE_MAX_ENTRIES,
+)
+UPPER_AIR_CYCLE_CACHE = EvidenceCache("upper_air_cycle", ttl_s=KMA_CYCLE_PAYLOAD_TTL_S, max_entries=64)
+WIND_PROFILER_CYCLE_CACHE = EvidenceCache("wind_profiler_cycle", ttl_s=KMA_CYCLE_PAYLOAD_TTL_S, max_entries=64)
+WIS2_STATION_CACHE = EvidenceCache(
+    "wis2_station", ttl_s=WIS2_STATION_CACHE_TTL_S, max_entries=WIS2_STATION_CACHE_MAX_ENTRIES
+)
+# Concurrent misses on the caches above share one upstream fetch per cache key.
+WEATHER_SINGLE_FLIGHT = SingleFlight("weather")
+UPPER_AIR_SINGLE_FLIGHT = SingleFlight("upper_air")
+WIND_PROFILER_SINGLE_FLIGHT = SingleFlight("wind_profiler")
+# Newest cycles probed concurrently per round-trip; PUBLISHED_CYCLES extends
+# the first batch to the last cycle each provider was seen to publish.
+KMA_SURFACE_CYCLE_PROBE_WINDOW = int(os.getenv("KMA_SURFACE_CYCLE_PROBE_WINDOW", "2"))
+KMA_WIND_PROFILER_CYCLE_PROBE_WINDOW = int(os.getenv("KMA_WIND_PROFILER_CYCLE_PROBE_WINDOW", "3"))
+PUBLISHED_CYCLES = PublishedCycleTracker()
+KP_CACHE_TTL_S = float(os.getenv("KP_CACHE_TTL_S", "300"))
+KP_STALE_TTL_S = float(os.getenv("KP_STALE_TTL_S", "10800"))
+KP_INDEX_CACHE = EvidenceCache("kp_index", ttl_s=KP_CACHE_TTL_S, stale_ttl_s=KP_STALE_TTL_S, max_entries=1)
+KP_SINGLE_FLIGHT = SingleFlight("kp_index")
+KP_CACHE_KEY = "planetary_k_index_1m"
+# Off unless the deployment turns it on (the Dockerfile does), so test and
+# local app lifespans never poll NOAA/KMA in the background.
+WEATHER_REFRESH_ENABLED = os.getenv("WEATHER_REFRESH_ENABLED", "false").strip().lower() in {"1", "true", "yes", "on"}
+WEATHER_REFRESH_AREAS = parse_operating_areas(
+    os.getenv("WEATHER_REFRESH_AREAS", "37.558056,126.708333;37.5665,126.9780")
+)
+KMA_SURFACE_REFRESH_INTERVAL_S = float(os.getenv("KMA_SURFACE_REFRESH_INTERVAL_S", "600"))
+KMA_WIND_PROFILER_REFRESH_INTERVAL_S = float(os.getenv("KMA_WIND_PROFILER_REFRESH_INTERVAL_S", "600"))
+# Radiosonde launches are 00/12 UTC; refresh once the decoded TEMP has landed.
+KMA_UPPER_AIR_REFRESH_INTERVAL_S = float(os.getenv("KMA_UPPER_AIR_REFRESH_INTERVAL_S", "43200"))
+KMA_UPPER_AIR_REFRESH_OFFSET_S = float(
+    os.getenv("KMA_UPPER_AIR_REFRESH_OFFSET_S", str(KMA_UPPER_AIR_PUBLICATION_LAG_S))
+)
+KP_REFRESH_INTERVAL_S = float(os.getenv("KP_REFRESH_INTERVAL_S", "300"))
 KMA_SURFACE_REQUEST_TIMEOUT_S = float(os.getenv("KMA_SURFACE_REQUEST_TIMEOUT_S", "2.0"))
 OPEN_METEO_DISPLAY_REQUEST_TIMEOUT_S = float(os.getenv("OPEN_METEO_DISPLAY_REQUEST_TIMEOUT_S", "2.0"))
 KMA_UPPER_AIR_REQUEST_TIMEOUT_S = float(os.getenv("KMA_UPPER_AIR_REQUEST_TIMEOUT_S", "3.5"))
@@ -271,23 +452,109 @@ SURFACE_WEATHER_REQUEST_TIMEOUT_S = max(
     KMA_SURFACE_REQUEST_TIMEOUT_S + OPEN_METEO_DISPLAY_REQUEST_TIMEOUT_S + 0.5,
 )
 KP_REQUEST_TIMEOUT_S = float(os.getenv("KP_REQUEST_TIMEOUT_S", "2.0"))
+# Evidence fetches of an /api/evaluate request share the request deadline,
+# less this reserve for scoring and serialising the response; inputs that miss
+# it are reported unavailable instead of holding the response open.
+EVALUATE_RESPONSE_RESERVE_S = float(os.getenv("EVALUATE_RESPONSE_RESERVE_S", "0.5"))
+# Hard wall-clock budget per API request, shared by every upstream call it
+# makes (KMA, VWorld, the GIS bridge, Building HUB, Overpass). Endpoints not
+# listed use API_REQUEST_DEADLINE_S; 0 disables the bound.
+API_REQUEST_DEADLINE_S = float(os.getenv("API_REQUEST_DEADLINE_S", "20"))
+ENDPOINT_REQUEST_DEADLINES_S = {
+    "/api/evaluate": float(os.getenv("EVALUATE_REQUEST_DEADLINE_S", "12")),
+    "/api/corridor-analysis": float(os.getenv("CORRIDOR_REQUEST_DEADLINE_S", "20")),
+    "/api/weather": float(os.getenv("WEATHER_REQUEST_DEADLINE_S", "6")),
+    "/api/kp": float(os.getenv("KP_ENDPOINT_REQUEST_DEADLINE_S", "4")),
+}
+
+
+def _request_deadline_budget_s(path: str) -> Optional[float]:
+    if not path.startswith("/api/"):
+        return None
+    budget_s = ENDPOINT_REQUEST_DEADLINES_S.get(path, API_REQUEST_DEADLINE_S)
+    return budget_s if budget_s > 0 else None
+
 VWORLD_WFS_API_ENDPOINTS = (
     {"url": "https://api.vworld.kr/req/wfs", "mode": "api"},
     {"url": "https://map.vworld.kr/js/wfs.do", "mode": "map"},
 )
 VWORLD_ROAD_LAYER = "lt_l_n3a0020000"
+# Bump when VWorld republishes the road layer so cached canyon geometry keyed
+# by target building is not served across dataset versions.
+VWORLD_ROAD_LAYER_VERSION = (os.getenv("VWORLD_ROAD_LAYER_VERSION") or "").strip()
 VWORLD_ROAD_PROPERTY_KEYS = ("rvwd", "rdln", "rdnm", "ag_geom")
 VWORLD_ROAD_QUERY_RADII_M = (180, 500, 1500)
 VWORLD_REQUEST_TIMEOUT_S = float(os.getenv("VWORLD_REQUEST_TIMEOUT_S", "5.0"))
+# Road segments are cached per zoom-15 Web-Mercator tile (~970 m across in
+# Korea) and the nearest-road search runs locally over the cached segments.
+VWORLD_ROAD_TILE_ZOOM = int(os.getenv("VWORLD_ROAD_TILE_ZOOM", "15"))
+VWORLD_ROAD_TILE_MAX_ZOOM = int(os.getenv("VWORLD_ROAD_TILE_MAX_ZOOM", "17"))
+VWORLD_ROAD_TILE_MAX_FEATURES = int(os.getenv("VWORLD_ROAD_TILE_MAX_FEATURES", "1000"))
+VWORLD_ROAD_TILE_TTL_S = float(os.getenv("VWORLD_ROAD_TILE_TTL_S", str(6 * 3600)))
+VWORLD_ROAD_TILE_STALE_TTL_S = float(os.getenv("VWORLD_ROAD_TILE_STALE_TTL_S", str(24 * 3600)))
+VWORLD_ROAD_TILE_CACHE_MAX = int(os.getenv("VWORLD_ROAD_TILE_CACHE_MAX", "512"))
+# Hedged search races the WFS endpoints per tile and starts each wider radius
+# after a short delay instead of waiting out the narrower one; off restores
+# the sequential api-then-map, radius-by-radius walk.
+VWORLD_ROAD_HEDGED_SEARCH = os.getenv("VWORLD_ROAD_HEDGED_SEARCH", "true").strip().lower() not in {"0", "false", "no", "off"}
+# The map endpoint is only asked once the api endpoint has been slow for a
+# fifth of its timeout (or has failed), so a healthy tile costs one request.
+VWORLD_WFS_ENDPOINT_HEDGE_S = float(os.getenv("VWORLD_WFS_ENDPOINT_HEDGE_S", str(VWORLD_REQUEST_TIMEOUT_S / 5)))
+VWORLD_ROAD_RADIUS_HEDGE_S = float(os.getenv("VWORLD_ROAD_RADIUS_HEDGE_S", "0.75"))
+# Only passes covering at most this many tiles are started speculatively.
+# Tile fetches are shared through single-flight and outlive a losing pass, so
+# the wide pass (12 tiles at 1500 m) waits for the narrower ones to miss.
+VWORLD_ROAD_HEDGE_MAX_TILES = int(os.getenv("VWORLD_ROAD_HEDGE_MAX_TILES", "4"))
+ROAD_TILE_CACHE = EvidenceCache(
+    "vworld_road_tiles",
+    ttl_s=VWORLD_ROAD_TILE_TTL_S,
+    max_entries=VWORLD_ROAD_TILE_CACHE_MAX,
+    stale_ttl_s=VWORLD_ROAD_TILE_STALE_TTL_S,
+)
+ROAD_TILE_FLIGHTS = SingleFlight("vworld_road_tiles")
 CANYON_EVIDENCE_CACHE_TTL_S = float(os.getenv("CANYON_EVIDENCE_CACHE_TTL_S", "300"))
-CANYON_EVIDENCE_CACHE: Dict[str, Dict[str, Any]] = {}
+CANYON_EVIDENCE_CACHE_MAX_ENTRIES = int(os.getenv("CANYON_EVIDENCE_CACHE_MAX_ENTRIES", "1024"))
+CANYON_EVIDENCE_CACHE = EvidenceCache(
+    "canyon_evidence", ttl_s=CANYON_EVIDENCE_CACHE_TTL_S, max_entries=CANYON_EVIDENCE_CACHE_MAX_ENTRIES
+)
+EVIDENCE_CACHES = (
+    ROAD_TILE_CACHE,
+    KMA_SURFACE_SNAPSHOT_CACHE,
+    KP_INDEX_CACHE,
+    WEATHER_CACHE,
+    WEATHER_LAST_GOOD_CACHE,
+    UPPER_AIR_CACHE,
+    UPPER_AIR_LAST_GOOD_CACHE,
+    UPPER_AIR_CYCLE_CACHE,
+    WIND_PROFILER_CACHE,
+    WIND_PROFILER_LAST_GOOD_CACHE,
+    WIND_PROFILER_CYCLE_CACHE,
+    WIS2_STATION_CACHE,
+    CANYON_EVIDENCE_CACHE,
+    TITLE_RECORD_CACHE,
+)
 # Full server-side endpoint of the fixed-egress official GIS bridge. This is
 # intentionally not part of runtime-config.js or any browser payload.
 OFFICIAL_GIS_BRIDGE_URL = (os.getenv("OFFICIAL_GIS_BRIDGE_URL") or "").strip()
 OFFICIAL_GIS_BRIDGE_TOKEN = (os.getenv("OFFICIAL_GIS_BRIDGE_TOKEN") or "").strip()
 OFFICIAL_GIS_BRIDGE_TIMEOUT_S = float(os.getenv("OFFICIAL_GIS_BRIDGE_TIMEOUT_S", "6.0"))
+# When set, the direct VWorld canyon computation starts this long after the
+# bridge call if the bridge has not answered, and the first verified receipt
+# set wins. Unset keeps the bridge-first, direct-on-fallback order.
+OFFICIAL_GIS_BRIDGE_HEDGE_S = (
+    float(os.environ["OFFICIAL_GIS_BRIDGE_HEDGE_S"]) if (os.getenv("OFFICIAL_GIS_BRIDGE_HEDGE_S") or "").strip() else None
+)
 # Set only on the dedicated bridge deployment. The primary API keeps this empty.
 OFFICIAL_GIS_BRIDGE_INBOUND_TOKEN = (os.getenv("OFFICIAL_GIS_BRIDGE_INBOUND_TOKEN") or "").strip()
+# Circuit breaker state reported by the readiness and KMA status endpoints.
+OFFICIAL_GIS_CIRCUIT_PROVIDERS = (
+    "vworld_api_wfs",
+    "vworld_map_wfs",
+    "molit_building_hub",
+    "overpass",
+    "official_gis_bridge",
+)
+KMA_CIRCUIT_PROVIDERS = ("kma_surface", "kma_upper_air", "kma_wind_profiler")
 AUTHORITATIVE_WEATHER_SOURCE_TOKENS = (
     "kma_surface_observation",
     "kma_surface_forecast",
@@ -314,6 +581,7 @@ SURFACE_WEATHER_REASON_TIMEOUT = "surface_weather_timeout"
 SURFACE_WEATHER_REASON_HTTP = "surface_weather_http_error"
 SURFACE_WEATHER_REASON_AUTH = "surface_weather_auth_denied"
 SURFACE_WEATHER_REASON_QUOTA = "surface_weather_quota_exceeded"
+SURFACE_WEATHER_REASON_RATE_LIMITED = "surface_weather_rate_limited"
 SURFACE_WEATHER_REASON_UPSTREAM = "surface_weather_upstream_unavailable"
 SURFACE_WEATHER_REASON_PARSE = "surface_weather_parse_error"
 SURFACE_WEATHER_REASON_UNCONFIGURED = "surface_weather_unconfigured"
@@ -321,6 +589,33 @@ SURFACE_WEATHER_REASON_STALE = "surface_weather_stale"
 SURFACE_WEATHER_REASON_FRESHNESS_INVALID = "surface_weather_freshness_invalid"
 SURFACE_WEATHER_RECEIPT_TTL = timedelta(hours=1)
 KST = timezone(timedelta(hours=9))
+KMA_UPPER_AIR_HTTP_TIMEOUT_S = float(os.getenv("KMA_UPPER_AIR_HTTP_TIMEOUT_S", "8"))
+KMA_WIND_PROFILER_HTTP_TIMEOUT_S = float(os.getenv("KMA_WIND_PROFILER_HTTP_TIMEOUT_S", "10"))
+WIS2_REQUEST_TIMEOUT_S = float(os.getenv("WIS2_REQUEST_TIMEOUT_S", "8"))
+KP_HTTP_TIMEOUT_S = float(os.getenv("KP_HTTP_TIMEOUT_S", "5"))
+UPSTREAM_MAX_CONNECTIONS = int(os.getenv("UPSTREAM_MAX_CONNECTIONS", "20"))
+UPSTREAM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("UPSTREAM_MAX_KEEPALIVE_CONNECTIONS", "10"))
+UPSTREAM_KEEPALIVE_EXPIRY_S = float(os.getenv("UPSTREAM_KEEPALIVE_EXPIRY_S", "30"))
+
+# One keep-alive pool per provider. Timeouts match the previous per-call
+# clients; limits are shared defaults that Render can tune per deployment.
+for _provider_name, _provider_timeout_s in (
+    ("kma_surface", KMA_SURFACE_REQUEST_TIMEOUT_S),
+    ("kma_upper_air", KMA_UPPER_AIR_HTTP_TIMEOUT_S),
+    ("kma_wind_profiler", KMA_WIND_PROFILER_HTTP_TIMEOUT_S),
+    ("wis2_station", WIS2_REQUEST_TIMEOUT_S),
+    ("open_meteo", OPEN_METEO_DISPLAY_REQUEST_TIMEOUT_S),
+    ("noaa_kp", KP_HTTP_TIMEOUT_S),
+    ("vworld_wfs", VWORLD_REQUEST_TIMEOUT_S),
+    ("official_gis_bridge", OFFICIAL_GIS_BRIDGE_TIMEOUT_S),
+):
+    register_provider(
+        _provider_name,
+        _provider_timeout_s,
+        max_connections=UPSTREAM_MAX_CONNECTIONS,
+        max_keepalive_connections=UPSTREAM_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry_s=UPSTREAM_KEEPALIVE_EXPIRY_S,
+    )
 
 class GateResult(BaseModel):
     gate: str
@@ -470,31 +765,6 @@ def _round_coord(value: float, precision: int = 3) -> float:
     return round(value, precision)
 
 
-def _cache_get(store: Dict[str, Dict[str, Any]], key: str, ttl_s: float):
-    entry = store.get(key)
-    if not entry:
-        return None
-    if (time.time() - entry["ts"]) > ttl_s:
-        store.pop(key, None)
-        return None
-    return entry["value"]
-
-
-def _cache_set(store: Dict[str, Dict[str, Any]], key: str, value: Any):
-    store[key] = {"ts": time.time(), "value": value}
-    return value
-
-
-def _cache_get_stale(store: Dict[str, Dict[str, Any]], key: str, max_age_s: float):
-    entry = store.get(key)
-    if not entry:
-        return None
-    if (time.time() - entry["ts"]) > max_age_s:
-        store.pop(key, None)
-        return None
-    return entry["value"]
-
-
 def _mark_stale_payload(value: Any):
     if value is None:
         return None
@@ -509,6 +779,10 @@ def _cache_key_for_latlon(lat: float, lon: float) -> str:
     return f"{_round_coord(lat)},{_round_coord(lon)}"
 
 
+def _normalize_road_name(road_name: Optional[str]) -> str:
+    return " ".join(str(road_name or "").split()).lower()
+
+
 def _canyon_cache_key(
     lat: float,
     lon: float,
@@ -516,14 +790,33 @@ def _canyon_cache_key(
     selection_id: Optional[str] = None,
     target_identifier: Optional[Dict[str, str]] = None,
 ) -> str:
-    normalized_road_name = " ".join(str(road_name or "").split()).lower()
     identifier = target_identifier or {}
     return (
-        f"{_round_coord(lat, 5)},{_round_coord(lon, 5)}:{normalized_road_name}:"
+        f"{_round_coord(lat, 5)},{_round_coord(lon, 5)}:{_normalize_road_name(road_name)}:"
         f"{selection_id or ''}:{identifier.get('kind', '')}:{identifier.get('value', '')}"
     )
 
 
+def _canyon_geometry_cache_key(target_identifier: Dict[str, str], road_name: Optional[str]) -> str:
+    """Key direct canyon geometry by the target building, not by the click that selected it.
+
+    The entry maps each measured road (``_canyon_road_identity``) to its
+    geometry, since clicks on one building can resolve different nearest roads.
+    """
+    return (
+        f"geometry:{target_identifier['kind']}:{target_identifier['value']}:"
+        f"{VWORLD_ROAD_LAYER}@{VWORLD_ROAD_LAYER_VERSION}:{_normalize_road_name(road_name)}"
+    )
+
+
+def _canyon_road_identity(road_evidence: Dict[str, Any]) -> Optional[str]:
+    """Identity of the road geometry a direct canyon measurement runs against."""
+    road_paths = road_evidence.get("geometry_paths") or []
+    if not road_evidence.get("official_available") or not road_evidence.get("geometry_receipt") or not road_paths:
+        return None
+    return str(uuid5(NAMESPACE_URL, "uav-canyon-road:" + json.dumps(road_paths[0], separators=(",", ":"))))
+
+
 def _mark_source_suffix(payload: Optional[Dict[str, Any]], suffix: str, fallback_source: str) -> Optional[Dict[str, Any]]:
     if not payload:
         return payload
@@ -950,7 +1243,7 @@ def _fresh_authoritative_weather_cache(
     longitude: float,
     selection_id: Optional[str],
 ) -> Optional[Dict[str, Any]]:
-    cached = _cache_get(WEATHER_CACHE, cache_key, WEATHER_CACHE_TTL_S)
+    cached = WEATHER_CACHE.get_fresh(cache_key)
     if not cached:
         return None
     source_chain = _normalize_source_chain(cached.get("source_chain") or [], cached.get("source"))
@@ -1158,6 +1451,9 @@ def _official_gis_readiness() -> Dict[str, Any]:
         "building_hub_key_resolution": "semantic_aliases_v2",
         "facade_gap_policy": "verified_official_geometry_only",
         "missing_prerequisites": missing,
+        "provider_circuits": CIRCUIT_BREAKERS.snapshot(list(OFFICIAL_GIS_CIRCUIT_PROVIDERS)),
+        "molit_building_hub_quota": molit_building_hub_quota_snapshot(),
+        "molit_building_hub_credentials": molit_building_hub_health_snapshot(),
     }
 
 
@@ -1217,9 +1513,13 @@ def _mercator_to_lonlat(x: float, y: float) -> tuple[float, float]:
     return lon, lat
 
 
-def _build_mercator_bbox(lon: float, lat: float, radius_m: float) -> str:
+def _mercator_bbox(lon: float, lat: float, radius_m: float) -> Tuple[float, float, float, float]:
     x, y = _lonlat_to_mercator(lon, lat)
-    return f"{x - radius_m},{y - radius_m},{x + radius_m},{y + radius_m}"
+    return (x - radius_m, y - radius_m, x + radius_m, y + radius_m)
+
+
+def _build_mercator_bbox(lon: float, lat: float, radius_m: float) -> str:
+    return ",".join(str(value) for value in _mercator_bbox(lon, lat, radius_m))
 
 
 def _point_to_segment_distance(px: float, py: float, ax: float, ay: float, bx: float, by: float) -> float:
@@ -1317,7 +1617,13 @@ def _normalize_road_candidate(feature: Dict[str, Any], lat: float, lon: float) -
     }
 
 
-def _build_vworld_wfs_request_url(endpoint: Dict[str, str], bbox: str, key: str, referer: str) -> str:
+def _build_vworld_wfs_request_url(
+    endpoint: Dict[str, str],
+    bbox: str,
+    key: str,
+    referer: str,
+    max_features: int = 40,
+) -> str:
     url = httpx.URL(endpoint["url"])
     registered_domain = referer
     if "://" in referer:
@@ -1327,7 +1633,7 @@ def _build_vworld_wfs_request_url(endpoint: Dict[str, str], bbox: str, key: str,
         "request" if endpoint["mode"] == "api" else "REQUEST": "GetFeature",
         "version" if endpoint["mode"] == "api" else "VERSION": "1.1.0",
         "typename" if endpoint["mode"] == "api" else "TYPENAME": VWORLD_ROAD_LAYER,
-        "maxfeatures" if endpoint["mode"] == "api" else "MAXFEATURES": "40",
+        "maxfeatures" if endpoint["mode"] == "api" else "MAXFEATURES": str(max_features),
         "srsname" if endpoint["mode"] == "api" else "SRSNAME": "EPSG:3857",
         "output" if endpoint["mode"] == "api" else "OUTPUT": "application/json",
         "exceptions" if endpoint["mode"] == "api" else "EXCEPTIONS": "text/xml",
@@ -1343,6 +1649,168 @@ def _build_vworld_wfs_request_url(endpoint: Dict[str, str], bbox: str, key: str,
     return str(url.copy_merge_params(params))
 
 
+class RoadTileUnavailable(Exception):
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def _index_road_feature(feature: Dict[str, Any], tile: Tile, endpoint_mode: str) -> Optional[Dict[str, Any]]:
+    """Parse one road feature into a cached segment with its EPSG:3857 box."""
+    if not isinstance(feature, dict):
+        return None
+    properties = dict(feature.get("properties") or feature.get("attributes") or {})
+    paths = _geometry_paths(feature)
+    points = [point for path in paths for point in path if isinstance(point, (list, tuple)) and len(point) >= 2]
+    try:
+        bbox = ring_bbox(points) if points else tile_bounds(tile)
+    except (TypeError, ValueError):
+        bbox = tile_bounds(tile)
+    # Segments crossing a tile edge come back from every tile they touch.
+    feature_id = feature.get("id")
+    key = str(feature_id) if feature_id not in (None, "") else json.dumps([paths, sorted(properties.items())], default=str)
+    return {
+        "key": key,
+        # Paths are stored already parsed so ag_geom WKT is read once per tile.
+        "feature": {"properties": properties, "geometry": {"type": "MultiLineString", "coordinates": paths}},
+        "bbox": bbox,
+        "endpoint_mode": endpoint_mode,
+    }
+
+
+def _unique_road_segments(segments: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    seen = set()
+    unique: List[Dict[str, Any]] = []
+    for segment in segments:
+        if segment["key"] in seen:
+            continue
+        seen.add(segment["key"])
+        unique.append(segment)
+    return unique
+
+
+async def _fetch_road_tile_from(
+    client: httpx.AsyncClient,
+    endpoint: Dict[str, str],
+    key: str,
+    referer: str,
+    bbox: str,
+) -> Tuple[List[Dict[str, Any]], str]:
+    request_url = _build_vworld_wfs_request_url(endpoint, bbox, key, referer, max_features=VWORLD_ROAD_TILE_MAX_FEATURES)
+    try:
+        with provider_breaker(f"vworld_{endpoint['mode']}_wfs").call("network_error") as outcome:
+            response = await client.get(
+                request_url,
+                headers={
+                    "Accept": "application/json",
+                    "Referer": referer,
+                    "User-Agent": "uav-dashboard/road-width-authority",
+                },
+            )
+            if upstream_status_failed(response.status_code):
+                outcome.fail(f"upstream_status_{response.status_code}")
+    except CircuitOpenError as error:
+        raise RoadTileUnavailable(error.reason) from error
+    except Exception as error:
+        raise RoadTileUnavailable("network_error") from error
+    if response.status_code != 200:
+        raise RoadTileUnavailable(f"upstream_status_{response.status_code}")
+    if "ServiceException" in response.text:
+        raise RoadTileUnavailable("road_feature_not_matched")
+    try:
+        payload = json.loads(response.text)
+    except json.JSONDecodeError as error:
+        raise RoadTileUnavailable("malformed_upstream_payload") from error
+    return [feature for feature in _extract_vworld_features(payload) if isinstance(feature, dict)], endpoint["mode"]
+
+
+async def _fetch_road_tile(key: str, referer: str, tile: Tile) -> Dict[str, Any]:
+    """Fetch one road tile from the WFS endpoints; raises ``RoadTileUnavailable`` with the last reason.
+
+    In hedged mode both endpoints are raced and the first non-empty answer
+    wins; otherwise the api endpoint is tried first.
+    """
+    bbox = bbox_param(tile_bounds(tile))
+    async with upstream_client("vworld_wfs") as client:
+        try:
+            _index, (features, endpoint_mode) = await first_accepted(
+                [
+                    lambda endpoint=endpoint: _fetch_road_tile_from(client, endpoint, key, referer, bbox)
+                    for endpoint in VWORLD_WFS_API_ENDPOINTS
+                ],
+                hedge_s=VWORLD_WFS_ENDPOINT_HEDGE_S if VWORLD_ROAD_HEDGED_SEARCH else None,
+                # An empty answer from one endpoint is confirmed against the
+                # other before an empty tile is cached.
+                accept=lambda fetched: bool(fetched[0]),
+            )
+        except NoAcceptedResult as exhausted:
+            # An empty tile is only trusted (and cached) when every endpoint
+            # answered; otherwise the stale tile or the unavailable path is used.
+            errors = [outcome for outcome in exhausted.outcomes if isinstance(outcome, BaseException)]
+            if errors:
+                raise errors[-1]
+            features, endpoint_mode = exhausted.outcomes[0]
+
+    if len(features) >= VWORLD_ROAD_TILE_MAX_FEATURES and tile[0] < VWORLD_ROAD_TILE_MAX_ZOOM:
+        # MAXFEATURES cut the answer short; fetch the four children instead.
+        children = await asyncio.gather(*(_fetch_road_tile(key, referer, child) for child in child_tiles(tile)))
+        return {
+            "segments": _unique_road_segments(segment for child in children for segment in child["segments"]),
+            "endpoint_mode": children[0]["endpoint_mode"],
+        }
+    segments = [_index_road_feature(feature, tile, endpoint_mode) for feature in features]
+    return {
+        "segments": _unique_road_segments(segment for segment in segments if segment is not None),
+        "endpoint_mode": endpoint_mode,
+    }
+
+
+async def _road_tile(key: str, referer: str, tile: Tile) -> Dict[str, Any]:
+    try:
+        return await cached_tile(
+            ROAD_TILE_CACHE,
+            ROAD_TILE_FLIGHTS,
+            tile,
+            lambda: _fetch_road_tile(key, referer, tile),
+            stale_on=(RoadTileUnavailable,),
+        )
+    except TimeoutError as error:
+        # The request budget ran out while the shared tile fetch was still in
+        # flight; report it like a timed-out fetch of our own.
+        raise RoadTileUnavailable("network_error") from error
+
+
+def _select_road_candidate(
+    tile_segments: Iterable[Iterable[Dict[str, Any]]],
+    query_bbox: Tuple[float, float, float, float],
+    lat: float,
+    lon: float,
+) -> Optional[Dict[str, Any]]:
+    """Best road candidate among cached segments inside ``query_bbox``, by the usual sort."""
+    segments = _unique_road_segments(
+        segment
+        for segments in tile_segments
+        for segment in segments
+        if bboxes_intersect(segment["bbox"], query_bbox)
+    )
+    candidates = []
+    for segment in segments:
+        candidate = _normalize_road_candidate(segment["feature"], lat, lon)
+        if candidate and candidate.get("available"):
+            candidate["endpoint_mode"] = segment["endpoint_mode"]
+            candidates.append(candidate)
+    if not candidates:
+        return None
+    candidates.sort(
+        key=lambda item: (
+            not bool(item.get("official_available")),
+            item.get("edge_distance_m") if item.get("edge_distance_m") is not None else float("inf"),
+            -(item.get("width_m") or 0.0),
+        )
+    )
+    return dict(candidates[0])
+
+
 async def fetch_road_width_evidence(lat: float, lon: float, road_name: Optional[str] = None) -> Dict[str, Any]:
     key = _vworld_api_key()
     referer = _vworld_referer()
@@ -1359,65 +1827,67 @@ async def fetch_road_width_evidence(lat: float, lon: float, road_name: Optional[
             "query_meta": {"layer": VWORLD_ROAD_LAYER},
         }
 
-    last_reason = "road_feature_not_matched"
-    async with httpx.AsyncClient(timeout=VWORLD_REQUEST_TIMEOUT_S) as client:
-        for radius_m in VWORLD_ROAD_QUERY_RADII_M:
-            bbox = _build_mercator_bbox(lon, lat, radius_m)
-            for endpoint in VWORLD_WFS_API_ENDPOINTS:
-                request_url = _build_vworld_wfs_request_url(endpoint, bbox, key, referer)
-                query_meta = {
+    query_bboxes = [_mercator_bbox(lon, lat, radius_m) for radius_m in VWORLD_ROAD_QUERY_RADII_M]
+    query_tiles = [tiles_for_bbox(query_bbox, VWORLD_ROAD_TILE_ZOOM) for query_bbox in query_bboxes]
+
+    async def search_up_to(widest: int) -> Optional[Dict[str, Any]]:
+        # Wider radii cover the narrower ones' tiles, so every pass re-checks
+        # the narrower radii first and picks what a sequential search would.
+        loaded = await asyncio.gather(*(_road_tile(key, referer, tile) for tile in query_tiles[widest]))
+        segments_by_tile = dict(zip(query_tiles[widest], loaded))
+        for index in range(widest + 1):
+            selected = _select_road_candidate(
+                (segments_by_tile[tile]["segments"] for tile in query_tiles[index]),
+                query_bboxes[index],
+                lat,
+                lon,
+            )
+            if selected is not None:
+                radius_m = VWORLD_ROAD_QUERY_RADII_M[index]
+                selected["query_meta"] = {
                     "layer": VWORLD_ROAD_LAYER,
                     "radius_m": radius_m,
-                    "bbox": bbox,
-                    "endpoint_mode": endpoint["mode"],
+                    "bbox": _build_mercator_bbox(lon, lat, radius_m),
+                    "endpoint_mode": selected.pop("endpoint_mode"),
                     "property_names": list(VWORLD_ROAD_PROPERTY_KEYS),
+                    "tile_zoom": VWORLD_ROAD_TILE_ZOOM,
+                    "tile_count": len(query_tiles[index]),
                 }
-                try:
-                    response = await client.get(
-                        request_url,
-                        headers={
-                            "Accept": "application/json",
-                            "Referer": referer,
-                            "User-Agent": "uav-dashboard/road-width-authority",
-                        },
-                    )
-                except Exception:
-                    last_reason = "network_error"
-                    continue
-                if response.status_code != 200:
-                    last_reason = f"upstream_status_{response.status_code}"
-                    continue
-                if "ServiceException" in response.text:
-                    last_reason = "road_feature_not_matched"
-                    continue
-                try:
-                    payload = json.loads(response.text)
-                except json.JSONDecodeError:
-                    last_reason = "malformed_upstream_payload"
-                    continue
-                candidates = [
-                    candidate
-                    for candidate in (
-                        _normalize_road_candidate(feature, lat, lon)
-                        for feature in _extract_vworld_features(payload)
-                    )
-                    if candidate and candidate.get("available")
-                ]
-                if not candidates:
-                    last_reason = "road_feature_not_matched"
-                    continue
-                candidates.sort(
-                    key=lambda item: (
-                        not bool(item.get("official_available")),
-                        item.get("edge_distance_m") if item.get("edge_distance_m") is not None else float("inf"),
-                        -(item.get("width_m") or 0.0),
-                    )
-                )
-                selected = dict(candidates[0])
-                selected["query_meta"] = query_meta
-                selected["source_chain"] = ["vworld_wfs", selected.get("source", "official_road_right_of_way"), VWORLD_ROAD_LAYER]
-                selected["reason"] = "official_road_right_of_way" if selected.get("official_available") else "official_road_lanes_estimate"
                 return selected
+        return None
+
+    passes = range(len(VWORLD_ROAD_QUERY_RADII_M))
+    hedged_passes = [widest for widest in passes if len(query_tiles[widest]) <= VWORLD_ROAD_HEDGE_MAX_TILES]
+    if not VWORLD_ROAD_HEDGED_SEARCH or not hedged_passes:
+        hedged_passes = [0]
+    stages = [
+        (hedged_passes, VWORLD_ROAD_RADIUS_HEDGE_S if VWORLD_ROAD_HEDGED_SEARCH else None),
+        ([widest for widest in passes if widest > hedged_passes[-1]], None),
+    ]
+    last_reason = "road_feature_not_matched"
+    for stage_passes, hedge_s in stages:
+        if not stage_passes:
+            continue
+        try:
+            # A provider failure aborts the search: wider radii need the same
+            # tiles, so escalating would only multiply requests against it.
+            _index, selected = await first_accepted(
+                [lambda widest=widest: search_up_to(widest) for widest in stage_passes],
+                hedge_s=hedge_s,
+                accept=lambda selected: selected is not None,
+                abort_on=(RoadTileUnavailable,),
+            )
+        except RoadTileUnavailable as error:
+            last_reason = error.reason
+            break
+        except NoAcceptedResult as exhausted:
+            errors = [outcome for outcome in exhausted.outcomes if isinstance(outcome, BaseException)]
+            if errors:
+                raise errors[0]
+        else:
+            selected["source_chain"] = ["vworld_wfs", selected.get("source", "official_road_right_of_way"), VWORLD_ROAD_LAYER]
+            selected["reason"] = "official_road_right_of_way" if selected.get("official_available") else "official_road_lanes_estimate"
+            return selected
 
     return {
         "available": False,
@@ -1432,6 +1902,14 @@ async def fetch_road_width_evidence(lat: float, lon: float, road_name: Optional[
     }
 
 
+def _feature_mercator_ring(feature: Dict[str, Any]) -> Sequence[Sequence[float]]:
+    """EPSG:3857 ring of a collection feature, projected only if the collection did not carry one."""
+    mercator_ring = feature.get("mercator_ring")
+    if mercator_ring:
+        return mercator_ring
+    return _project_lonlat_ring(feature.get("ring") or [])
+
+
 def _project_lonlat_ring(ring: List[List[float]]) -> List[List[float]]:
     projected: List[List[float]] = []
     for point in ring:
@@ -1544,6 +2022,17 @@ def _canyon_receipt_bundle(
     }
 
 
+def _bind_canyon_geometry_to_selection(geometry: Dict[str, Any], selection_id: str) -> Dict[str, Any]:
+    """Issue a selection's receipts over cached, selection-free canyon geometry evidence."""
+    result = dict(geometry["evidence"])
+    receipt = dict(result["receipt"])
+    receipt["selection_id"] = selection_id
+    receipt.update(_canyon_receipt_bundle(selection_id, result["source"], geometry["receipt_values"]))
+    result["selection_id"] = selection_id
+    result["receipt"] = receipt
+    return result
+
+
 def _canyon_receipt_set_is_verified(
     payload: Any,
     supplier: str,
@@ -1699,6 +2188,7 @@ def _select_target_building_from_collection(
         "id": native_feature_id or bd_mgt_sn,
         "name": selected.get("name") or properties.get("buld_nm"),
         "ring": selected.get("ring"),
+        "mercator_ring": _feature_mercator_ring(selected),
         "properties": properties,
         "native_feature_id": native_feature_id,
         "bd_mgt_sn": bd_mgt_sn,
@@ -1871,18 +2361,31 @@ async def fetch_official_gis_bridge_canyon_evidence(
         params["target_identifier_value"] = target_identifier["value"]
 
     try:
-        async with httpx.AsyncClient(timeout=OFFICIAL_GIS_BRIDGE_TIMEOUT_S) as client:
-            response = await client.get(
-                OFFICIAL_GIS_BRIDGE_URL,
-                params=params,
-                headers={"Authorization": f"Bearer {OFFICIAL_GIS_BRIDGE_TOKEN}"},
-            )
+        with provider_breaker("official_gis_bridge").call() as outcome:
+            try:
+                async with upstream_client("official_gis_bridge") as client:
+                    response = await client.get(
+                        OFFICIAL_GIS_BRIDGE_URL,
+                        params=params,
+                        headers={"Authorization": f"Bearer {OFFICIAL_GIS_BRIDGE_TOKEN}"},
+                    )
+            except httpx.HTTPError as error:
+                if not isinstance(error, httpx.TimeoutException):
+                    outcome.fail("official_gis_bridge_transport_error")
+                raise
+            if upstream_status_failed(response.status_code):
+                outcome.fail(f"official_gis_bridge_http_{response.status_code}")
         if response.status_code != 200:
             return _bind_unavailable_canyon_to_selection(
                 _unavailable_official_gis_bridge_evidence(f"official_gis_bridge_http_{response.status_code}"),
                 selection_id,
             )
         payload = response.json()
+    except CircuitOpenError as error:
+        return _bind_unavailable_canyon_to_selection(
+            _unavailable_official_gis_bridge_evidence(error.reason),
+            selection_id,
+        )
     except httpx.TimeoutException:
         return _bind_unavailable_canyon_to_selection(
             _unavailable_official_gis_bridge_evidence("official_gis_bridge_timeout"),
@@ -1908,6 +2411,45 @@ async def fetch_official_gis_bridge_canyon_evidence(
     return payload
 
 
+def _bridge_canyon_verdict(
+    bridge_evidence: Optional[Dict[str, Any]],
+    selection_id: str,
+    target_identifier: Dict[str, str],
+) -> Tuple[Optional[Dict[str, Any]], Optional[str], List[Dict[str, str]]]:
+    """Split a bridge answer into final evidence, or the direct-fallback reason and upstream attempts."""
+    if bridge_evidence is None:
+        return None, None, []
+    if _bridge_canyon_evidence_is_verified(bridge_evidence, selection_id, target_identifier):
+        return _with_official_gis_bridge_provenance(bridge_evidence), None, []
+    if _bridge_canyon_evidence_is_explicitly_unavailable(bridge_evidence):
+        if _bridge_vworld_upstream_failure_allows_direct_fallback(bridge_evidence):
+            return (
+                None,
+                str(bridge_evidence["reason"]),
+                _sanitize_bridge_upstream_attempts(bridge_evidence.get("upstream_attempts")),
+            )
+        return (
+            _bind_unavailable_canyon_to_selection(
+                _with_official_gis_bridge_unavailable_provenance(bridge_evidence),
+                selection_id,
+            ),
+            None,
+            [],
+        )
+    return (
+        _bind_unavailable_canyon_to_selection(
+            _with_official_gis_bridge_unavailable_provenance(
+                _unavailable_official_gis_bridge_evidence(
+                    _bridge_canyon_rejection_reason(bridge_evidence, target_identifier)
+                )
+            ),
+            selection_id,
+        ),
+        None,
+        [],
+    )
+
+
 async def fetch_canyon_width_evidence(
     lat: float,
     lon: float,
@@ -1925,41 +2467,93 @@ async def fetch_canyon_width_evidence(
             _unavailable_canyon_evidence({}, "canyon_target_identifier_missing"),
             selection_id,
         )
+    # Direct geometry evidence depends on the target building and the road
+    # the click resolves to, so any selection of it is served by rebinding
+    # receipts. The road lookup is answered from the cached road tiles. Bridge
+    # receipts are hashed by the Worker and stay bound to the selection that
+    # fetched them.
+    cached_roads = CANYON_EVIDENCE_CACHE.get_fresh(_canyon_geometry_cache_key(target_identifier, road_name))
+    if cached_roads:
+        road_identity = _canyon_road_identity(await fetch_road_width_evidence(lat, lon, road_name=road_name))
+        cached_geometry = cached_roads.get(road_identity) if road_identity else None
+        if cached_geometry:
+            return _bind_canyon_geometry_to_selection(cached_geometry, selection_id)
     cache_key = _canyon_cache_key(lat, lon, road_name, selection_id, target_identifier)
-    cached_evidence = _cache_get(CANYON_EVIDENCE_CACHE, cache_key, CANYON_EVIDENCE_CACHE_TTL_S)
+    cached_evidence = CANYON_EVIDENCE_CACHE.get_fresh(cache_key)
     if cached_evidence:
         return cached_evidence
 
-    bridge_evidence = await fetch_official_gis_bridge_canyon_evidence(
-        lat,
-        lon,
-        road_name=road_name,
-        selection_id=selection_id,
-        target_identifier=target_identifier,
-    )
-    if _bridge_canyon_evidence_is_verified(bridge_evidence, selection_id, target_identifier):
-        return _cache_set(CANYON_EVIDENCE_CACHE, cache_key, _with_official_gis_bridge_provenance(bridge_evidence))
-    bridge_fallback_reason: Optional[str] = None
-    bridge_upstream_attempts: List[Dict[str, str]] = []
-    if _bridge_canyon_evidence_is_explicitly_unavailable(bridge_evidence):
-        if _bridge_vworld_upstream_failure_allows_direct_fallback(bridge_evidence):
-            bridge_fallback_reason = str(bridge_evidence["reason"])
-            bridge_upstream_attempts = _sanitize_bridge_upstream_attempts(bridge_evidence.get("upstream_attempts"))
-        else:
-            return _bind_unavailable_canyon_to_selection(
-                _with_official_gis_bridge_unavailable_provenance(bridge_evidence),
-                selection_id,
-            )
-    elif bridge_evidence is not None:
-        return _bind_unavailable_canyon_to_selection(
-            _with_official_gis_bridge_unavailable_provenance(
-                _unavailable_official_gis_bridge_evidence(
-                    _bridge_canyon_rejection_reason(bridge_evidence, target_identifier)
-                )
-            ),
-            selection_id,
+    async def bridge() -> Tuple[str, Optional[Dict[str, Any]]]:
+        return "bridge", await fetch_official_gis_bridge_canyon_evidence(
+            lat,
+            lon,
+            road_name=road_name,
+            selection_id=selection_id,
+            target_identifier=target_identifier,
         )
 
+    async def direct() -> Tuple[str, Dict[str, Any]]:
+        return "direct", await _fetch_direct_canyon_evidence(lat, lon, road_name, selection_id, target_identifier)
+
+    bridge_evidence: Optional[Dict[str, Any]] = None
+    direct_evidence: Optional[Dict[str, Any]] = None
+    if OFFICIAL_GIS_BRIDGE_HEDGE_S is not None and OFFICIAL_GIS_BRIDGE_URL and OFFICIAL_GIS_BRIDGE_TOKEN:
+
+        def settles_the_race(outcome: Tuple[str, Optional[Dict[str, Any]]]) -> bool:
+            supplier, evidence = outcome
+            if supplier == "bridge":
+                # Any authoritative bridge verdict, HOLD included, ends the
+                # race, so hedging never overrides a bridge HOLD.
+                return _bridge_canyon_verdict(evidence, selection_id, target_identifier)[0] is not None
+            return _canyon_receipt_set_is_verified(
+                evidence, "direct_vworld_official_receipt", selection_id, target_identifier
+            )
+
+        # A failing attempt is simply not accepted: the speculative direct
+        # path must not abort a bridge call that would still succeed.
+        try:
+            _index, (supplier, winner) = await first_accepted(
+                [bridge, direct],
+                hedge_s=OFFICIAL_GIS_BRIDGE_HEDGE_S,
+                accept=settles_the_race,
+            )
+        except NoAcceptedResult as exhausted:
+            bridge_outcome, direct_outcome = exhausted.outcomes
+            for outcome in (bridge_outcome, direct_outcome):
+                if isinstance(outcome, Exception):
+                    raise outcome
+            (_bridge, bridge_evidence), (_direct, direct_evidence) = bridge_outcome, direct_outcome
+        else:
+            if supplier == "direct":
+                return winner
+            bridge_evidence = winner
+    else:
+        _bridge, bridge_evidence = await bridge()
+
+    bridge_verdict, bridge_fallback_reason, bridge_upstream_attempts = _bridge_canyon_verdict(
+        bridge_evidence, selection_id, target_identifier
+    )
+    if bridge_verdict is not None:
+        if bridge_verdict.get("available"):
+            return CANYON_EVIDENCE_CACHE.set(cache_key, bridge_verdict)
+        return bridge_verdict
+    if direct_evidence is None:
+        _direct, direct_evidence = await direct()
+    return _with_official_gis_bridge_fallback_provenance(
+        direct_evidence,
+        bridge_fallback_reason,
+        bridge_upstream_attempts,
+    )
+
+
+async def _fetch_direct_canyon_evidence(
+    lat: float,
+    lon: float,
+    road_name: Optional[str],
+    selection_id: str,
+    target_identifier: Dict[str, str],
+) -> Dict[str, Any]:
+    """Measure the canyon from official VWorld road and building geometry on this server."""
     road_evidence, collection = await asyncio.gather(
         fetch_road_width_evidence(lat, lon, road_name=road_name),
         lookup_official_building_collection(lat, lon),
@@ -1967,27 +2561,28 @@ async def fetch_canyon_width_evidence(
     road_paths = road_evidence.get("geometry_paths") or []
     if not road_evidence.get("official_available") or not road_evidence.get("geometry_receipt") or not road_paths:
         return _bind_unavailable_canyon_to_selection(
-            _with_official_gis_bridge_fallback_provenance(
-                _with_direct_vworld_provenance(
-                    _unavailable_canyon_evidence(road_evidence, road_evidence.get("reason") or "official_road_geometry_not_matched")
-                ),
-                bridge_fallback_reason,
-                bridge_upstream_attempts,
+            _with_direct_vworld_provenance(
+                _unavailable_canyon_evidence(road_evidence, road_evidence.get("reason") or "official_road_geometry_not_matched")
             ),
             selection_id,
         )
 
     if not collection.get("official_available"):
         return _bind_unavailable_canyon_to_selection(
-            _with_official_gis_bridge_fallback_provenance(
-                _with_direct_vworld_provenance(
-                    _unavailable_canyon_evidence(
-                        road_evidence,
-                        collection.get("reason") or "official_building_collection_not_matched",
-                    )
-                ),
-                bridge_fallback_reason,
-                bridge_upstream_attempts,
+            _with_direct_vworld_provenance(
+                _unavailable_canyon_evidence(
+                    road_evidence,
+                    collection.get("reason") or "official_building_collection_not_matched",
+                )
+            ),
+            selection_id,
+        )
+    if collection.get("truncated"):
+        # Walls missing from a tile cut short by MAXFEATURES would widen the
+        # measured canyon, so the direct path does not measure it.
+        return _bind_unavailable_canyon_to_selection(
+            _with_direct_vworld_provenance(
+                _unavailable_canyon_evidence(road_evidence, "official_building_collection_truncated")
             ),
             selection_id,
         )
@@ -2004,12 +2599,8 @@ async def fetch_canyon_width_evidence(
     target_geometry = target.get("ring") if target else None
     if not isinstance(target_geometry, list) or len(target_geometry) < 4:
         return _bind_unavailable_canyon_to_selection(
-            _with_official_gis_bridge_fallback_provenance(
-                _with_direct_vworld_provenance(
-                    _unavailable_canyon_evidence(road_evidence, "target_official_building_not_selected", target_building)
-                ),
-                bridge_fallback_reason,
-                bridge_upstream_attempts,
+            _with_direct_vworld_provenance(
+                _unavailable_canyon_evidence(road_evidence, "target_official_building_not_selected", target_building)
             ),
             selection_id,
         )
@@ -2024,12 +2615,8 @@ async def fetch_canyon_width_evidence(
             else "canyon_target_identifier_mismatch"
         )
         return _bind_unavailable_canyon_to_selection(
-            _with_official_gis_bridge_fallback_provenance(
-                _with_direct_vworld_provenance(
-                    _unavailable_canyon_evidence(road_evidence, reason, target_building)
-                ),
-                bridge_fallback_reason,
-                bridge_upstream_attempts,
+            _with_direct_vworld_provenance(
+                _unavailable_canyon_evidence(road_evidence, reason, target_building)
             ),
             selection_id,
         )
@@ -2046,10 +2633,10 @@ async def fetch_canyon_width_evidence(
             "id": stable_id,
             "stable_id": stable_id,
             "name": feature.get("name"),
-            "ring": _project_lonlat_ring(ring),
+            "ring": _feature_mercator_ring(feature),
         })
 
-    projected_target_geometry = _project_lonlat_ring(target_geometry)
+    projected_target_geometry = target["mercator_ring"]
     measurement = measure_facade_gap(
         projected_target_geometry,
         road_paths[0],
@@ -2066,11 +2653,7 @@ async def fetch_canyon_width_evidence(
         unavailable["receipt"]["source_chain"] = source_chain
         unavailable["receipt"]["target_geometry_receipt"] = True
         return _bind_unavailable_canyon_to_selection(
-            _with_official_gis_bridge_fallback_provenance(
-                _with_direct_vworld_provenance(unavailable),
-                bridge_fallback_reason,
-                bridge_upstream_attempts,
-            ),
+            _with_direct_vworld_provenance(unavailable),
             selection_id,
         )
 
@@ -2091,40 +2674,35 @@ async def fetch_canyon_width_evidence(
         ),
         None,
     )
+    receipt_values = {
+        "target_geometry": {
+            "identifier": {
+                "requested": target_identifier,
+                "native_feature_id": target_building.get("native_feature_id"),
+                "bd_mgt_sn": target_building.get("bd_mgt_sn"),
+            },
+            "ring": [list(point) for point in projected_target_geometry],
+        },
+        "opposing_geometry": {
+            "id": opposing_building.get("id"),
+            "ring": [list(point) for point in opposing_geometry] if opposing_geometry is not None else None,
+        },
+        "road_geometry": road_paths[0],
+        "road_crossing": {
+            "normal_alignment": measurement.get("normal_alignment"),
+            "opposing_point": measurement.get("opposing_point"),
+            "target_point": measurement.get("target_point"),
+        },
+        "facade_gap": measurement["facade_gap_m"],
+    }
     receipt = {
         "kind": "official_canyon_width",
-        "selection_id": selection_id,
         **_canyon_target_receipt_fields(target_building),
         "target_geometry_receipt": True,
         "opposing_geometry_receipt": True,
         "road_geometry_receipt": True,
         "road_crossing_verified": True,
         "source_chain": direct_source_chain,
-        **_canyon_receipt_bundle(
-            selection_id,
-            "direct_vworld_official_receipt",
-            {
-                "target_geometry": {
-                    "identifier": {
-                        "requested": target_identifier,
-                        "native_feature_id": target_building.get("native_feature_id"),
-                        "bd_mgt_sn": target_building.get("bd_mgt_sn"),
-                    },
-                    "ring": projected_target_geometry,
-                },
-                "opposing_geometry": {
-                    "id": opposing_building.get("id"),
-                    "ring": opposing_geometry,
-                },
-                "road_geometry": road_paths[0],
-                "road_crossing": {
-                    "normal_alignment": measurement.get("normal_alignment"),
-                    "opposing_point": measurement.get("opposing_point"),
-                    "target_point": measurement.get("target_point"),
-                },
-                "facade_gap": measurement["facade_gap_m"],
-            },
-        ),
     }
     result = {
         "available": True,
@@ -2143,13 +2721,17 @@ async def fetch_canyon_width_evidence(
         "source_chain": direct_source_chain,
         "reason": None,
         "receipt": receipt,
-        "selection_id": selection_id,
     }
-    return _cache_set(
-        CANYON_EVIDENCE_CACHE,
-        cache_key,
-        _with_official_gis_bridge_fallback_provenance(result, bridge_fallback_reason, bridge_upstream_attempts),
+    geometry_key = _canyon_geometry_cache_key(target_identifier, road_name)
+    geometry = {
+        "evidence": result,
+        "receipt_values": receipt_values,
+    }
+    CANYON_EVIDENCE_CACHE.set(
+        geometry_key,
+        {**(CANYON_EVIDENCE_CACHE.get_fresh(geometry_key) or {}), _canyon_road_identity(road_evidence): geometry},
     )
+    return _bind_canyon_geometry_to_selection(geometry, selection_id)
 
 
 def _normalize_canyon_evidence(payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
@@ -2275,7 +2857,7 @@ def _resolve_building_canyon_weight(
 
 async def fetch_kp_index_safe() -> float:
     try:
-        return await asyncio.wait_for(fetch_kp_index(), timeout=KP_REQUEST_TIMEOUT_S)
+        return await deadline_wait_for(fetch_kp_index(), KP_REQUEST_TIMEOUT_S)
     except Exception:
         return 3.0
 
@@ -2287,6 +2869,7 @@ async def fetch_weather_safe(lat: float, lon: float, selection_id: Optional[str]
         SURFACE_WEATHER_REASON_HTTP,
         SURFACE_WEATHER_REASON_AUTH,
         SURFACE_WEATHER_REASON_QUOTA,
+        SURFACE_WEATHER_REASON_RATE_LIMITED,
         SURFACE_WEATHER_REASON_UPSTREAM,
         SURFACE_WEATHER_REASON_PARSE,
         SURFACE_WEATHER_REASON_UNCONFIGURED,
@@ -2295,7 +2878,7 @@ async def fetch_weather_safe(lat: float, lon: float, selection_id: Optional[str]
     }
     try:
         weather = _attach_weather_provenance(
-            await asyncio.wait_for(fetch_weather(lat, lon), timeout=SURFACE_WEATHER_REQUEST_TIMEOUT_S)
+            await deadline_wait_for(fetch_weather(lat, lon), SURFACE_WEATHER_REQUEST_TIMEOUT_S)
         )
     except asyncio.TimeoutError:
         reason = SURFACE_WEATHER_REASON_TIMEOUT
@@ -2346,24 +2929,24 @@ async def fetch_weather_safe(lat: float, lon: float, selection_id: Optional[str]
     )
     if cached:
         return cached
-    stale = _cache_get_stale(WEATHER_LAST_GOOD_CACHE, cache_key, WEATHER_STALE_TTL_S)
+    stale = WEATHER_LAST_GOOD_CACHE.get_stale(cache_key)
     return _attach_weather_provenance(_make_weather_unavailable(reason, fallback=stale))
 
 
 async def fetch_kma_upper_air_profile_safe(lat: float, lon: float) -> Optional[Dict]:
     cache_key = _cache_key_for_latlon(lat, lon)
     try:
-        return await asyncio.wait_for(
+        return await deadline_wait_for(
             fetch_kma_upper_air_profile(lat, lon),
-            timeout=KMA_UPPER_AIR_REQUEST_TIMEOUT_S
+            KMA_UPPER_AIR_REQUEST_TIMEOUT_S,
         )
     except Exception:
-        stale = _cache_get_stale(UPPER_AIR_LAST_GOOD_CACHE, cache_key, UPPER_AIR_STALE_TTL_S)
+        stale = UPPER_AIR_LAST_GOOD_CACHE.get_stale(cache_key)
         if stale:
             marked = dict(stale)
             marked["stale_cache"] = True
             return marked
-        cached = _cache_get(UPPER_AIR_CACHE, cache_key, UPPER_AIR_CACHE_TTL_S)
+        cached = UPPER_AIR_CACHE.get_fresh(cache_key)
         if cached:
             marked = dict(cached)
             marked["stale_cache"] = True
@@ -2374,17 +2957,17 @@ async def fetch_kma_upper_air_profile_safe(lat: float, lon: float) -> Optional[D
 async def fetch_kma_wind_profiler_profile_safe(lat: float, lon: float, mode: str = WIND_PROFILER_MODE) -> Optional[Dict]:
     cache_key = f"{mode}:{_cache_key_for_latlon(lat, lon)}"
     try:
-        return await asyncio.wait_for(
+        return await deadline_wait_for(
             fetch_kma_wind_profiler_profile(lat, lon, mode),
-            timeout=KMA_WIND_PROFILER_REQUEST_TIMEOUT_S
+            KMA_WIND_PROFILER_REQUEST_TIMEOUT_S,
         )
     except Exception:
-        stale = _cache_get_stale(WIND_PROFILER_LAST_GOOD_CACHE, cache_key, WIND_PROFILER_STALE_TTL_S)
+        stale = WIND_PROFILER_LAST_GOOD_CACHE.get_stale(cache_key)
         if stale:
             marked = dict(stale)
             marked["stale_cache"] = True
             return marked
-        cached = _cache_get(WIND_PROFILER_CACHE, cache_key, WIND_PROFILER_CACHE_TTL_S)
+        cached = WIND_PROFILER_CACHE.get_fresh(cache_key)
         if cached:
             marked = dict(cached)
             marked["stale_cache"] = True
@@ -2396,22 +2979,75 @@ async def fetch_kma_wind_profiler_profile_safe(lat: float, lon: float, mode: str
 # ============================================
 
 async def fetch_kp_index() -> float:
+    cached = KP_INDEX_CACHE.get_fresh(KP_CACHE_KEY)
+    if cached is not None:
+        return cached
+    stale = KP_INDEX_CACHE.get_stale(KP_CACHE_KEY)
+    if stale is not None:
+        KP_SINGLE_FLIGHT.revalidate(KP_CACHE_KEY, _fetch_kp_index_upstream)
+        return stale
+    return await KP_SINGLE_FLIGHT.run(KP_CACHE_KEY, _fetch_kp_index_upstream)
+
+
+async def _fetch_kp_index_upstream() -> float:
     url = "https://services.swpc.noaa.gov/json/planetary_k_index_1m.json"
     try:
-        async with httpx.AsyncClient(timeout=5) as client:
+        async with upstream_client("noaa_kp") as client:
             response = await client.get(url)
             if response.status_code == 200:
                 data = response.json()
-                if data: return float(data[-1].get("kp_index", 3))
+                if data: return KP_INDEX_CACHE.set(KP_CACHE_KEY, float(data[-1].get("kp_index", 3)))
     except Exception: pass
     return 3.0
 
+def _surface_weather_cache_expiry(weather: Dict[str, Any]) -> Optional[float]:
+    observed_at = _parse_surface_weather_datetime(weather.get("observed_at_utc"))
+    if observed_at is None:
+        return None
+    return cycle_cache_expiry(
+        observed_at,
+        interval=KMA_SURFACE_CYCLE_INTERVAL,
+        publication_lag=timedelta(seconds=KMA_SURFACE_PUBLICATION_LAG_S),
+        retry_after_s=WEATHER_CACHE_TTL_S,
+        not_after=observed_at + SURFACE_WEATHER_RECEIPT_TTL,
+    )
+
+
+def _kma_cycle_cache_expiry(
+    cycle: str,
+    *,
+    interval: timedelta,
+    publication_lag_s: float,
+    retry_after_s: float,
+) -> Optional[float]:
+    observed_at = parse_cycle(cycle)
+    if observed_at is None:
+        return None
+    return cycle_cache_expiry(
+        observed_at,
+        interval=interval,
+        publication_lag=timedelta(seconds=publication_lag_s),
+        retry_after_s=retry_after_s,
+    )
+
+
 async def fetch_weather(lat: float, lon: float) -> Dict:
     cache_key = _cache_key_for_latlon(lat, lon)
-    cached = _cache_get(WEATHER_CACHE, cache_key, WEATHER_CACHE_TTL_S)
+    cached = WEATHER_CACHE.get_fresh(cache_key)
     if cached:
         return _attach_weather_provenance(dict(cached))
 
+    refresh = partial(_fetch_weather_upstream, lat, lon, cache_key)
+    stale = WEATHER_CACHE.get_stale(cache_key)
+    if stale and _surface_weather_authority_reason(stale) is None:
+        WEATHER_SINGLE_FLIGHT.revalidate(cache_key, refresh)
+        return _attach_weather_provenance(dict(stale))
+
+    weather = await WEATHER_SINGLE_FLIGHT.run(cache_key, refresh)
+    return dict(weather)
+
+
+async def _fetch_weather_upstream(lat: float, lon: float, cache_key: str) -> Dict:
     kma_error: Optional[SurfaceWeatherFetchError] = None
     try:
         surface_weather = await fetch_kma_surface_observation(lat, lon)
@@ -2426,8 +3062,10 @@ async def fetch_weather(lat: float, lon: float) -> Dict:
             merged["sunrise"] = open_meteo.get("sunrise", merged.get("sunrise", "06:00"))
             merged["sunset"] = open_meteo.get("sunset", merged.get("sunset", "18:00"))
             merged["cloud_cover"] = open_meteo.get("cloud_cover", merged.get("cloud_cover", 0))
-        _cache_set(WEATHER_LAST_GOOD_CACHE, cache_key, merged)
-        return _attach_weather_provenance(_cache_set(WEATHER_CACHE, cache_key, merged))
+        WEATHER_LAST_GOOD_CACHE.set(cache_key, merged)
+        return _attach_weather_provenance(
+            WEATHER_CACHE.set(cache_key, merged, expires_at=_surface_weather_cache_expiry(merged))
+        )
 
     if open_meteo is not None:
         open_meteo["reason"] = kma_error.reason if kma_error is not None else SURFACE_WEATHER_REASON_PARSE
@@ -2461,7 +3099,7 @@ def latest_kma_surface_cycles(now_kst: Optional[datetime] = None, limit: int = 4
     return cycles
 
 
-def _parse_kma_surface_row(text: str) -> Optional[Dict[str, str]]:
+def _iter_kma_surface_rows(text: str):
     header: Optional[List[str]] = None
     for raw_line in text.splitlines():
         line = raw_line.strip()
@@ -2477,8 +3115,24 @@ def _parse_kma_surface_row(text: str) -> Optional[Dict[str, str]]:
         if header is None or len(tokens) < len(header):
             continue
         values = tokens[: len(header) - 1] + [" ".join(tokens[len(header) - 1 :])]
-        return dict(zip(header, values))
-    return None
+        yield dict(zip(header, values))
+
+
+def _parse_kma_surface_row(text: str) -> Optional[Dict[str, str]]:
+    return next(_iter_kma_surface_rows(text), None)
+
+
+def _parse_kma_surface_snapshot(text: str) -> Dict[int, Dict[str, str]]:
+    """Index an all-station ``kma_sfctm2.php`` body by the stations we serve."""
+    snapshot: Dict[int, Dict[str, str]] = {}
+    for row in _iter_kma_surface_rows(text):
+        try:
+            station_id = int(str(row.get("STN") or "").strip())
+        except ValueError:
+            continue
+        if station_id in KMA_SURFACE_STATION_IDS and station_id not in snapshot:
+            snapshot[station_id] = row
+    return snapshot
 
 
 def _surface_float(value: Any) -> Optional[float]:
@@ -2521,7 +3175,7 @@ async def fetch_open_meteo_surface_display(lat: float, lon: float) -> Optional[D
         "timezone": "Asia/Seoul",
     }
     try:
-        async with httpx.AsyncClient(timeout=OPEN_METEO_DISPLAY_REQUEST_TIMEOUT_S) as client:
+        async with upstream_client("open_meteo") as client:
             response = await client.get(url, params=params)
     except Exception:
         return None
@@ -2558,44 +3212,100 @@ async def fetch_open_meteo_surface_display(lat: float, lon: float) -> Optional[D
     }
 
 
+async def _fetch_kma_surface_snapshot_response(cycle: str, api_key: str) -> httpx.Response:
+    # stn=0 returns every ASOS station for the cycle, so one request serves all
+    # grid cells instead of one request per nearest station.
+    try:
+        await _acquire_kma_quota("surface", api_key)
+    except QuotaExhausted as error:
+        # A local per-second shed clears within a second; only a spent daily
+        # quota is reported as quota exceeded.
+        if error.reason.endswith("_rate_limited"):
+            raise SurfaceWeatherFetchError(SURFACE_WEATHER_REASON_RATE_LIMITED) from error
+        raise SurfaceWeatherFetchError(SURFACE_WEATHER_REASON_QUOTA) from error
+    try:
+        with provider_breaker("kma_surface").call() as outcome:
+            try:
+                async with upstream_client("kma_surface") as client:
+                    response = await client.get(
+                        "https://apihub.kma.go.kr/api/typ01/url/kma_sfctm2.php",
+                        params={
+                            "tm": cycle,
+                            "stn": 0,
+                            "help": 1,
+                            "authKey": api_key,
+                        },
+                    )
+            except httpx.TimeoutException as error:
+                raise SurfaceWeatherFetchError(SURFACE_WEATHER_REASON_TIMEOUT) from error
+            except Exception as error:
+                raise SurfaceWeatherFetchError(SURFACE_WEATHER_REASON_HTTP) from error
+            _record_kma_quota_response("surface", api_key, response)
+            if upstream_status_failed(response.status_code):
+                outcome.fail(_surface_weather_http_reason(response.status_code, response.text))
+            return response
+    except CircuitOpenError as error:
+        raise SurfaceWeatherFetchError(error.reason) from error
+
+
+def _raise_kma_surface_failure(status_code: int, reason: Optional[str]) -> None:
+    reason = reason or SURFACE_WEATHER_REASON_HTTP
+    LOGGER.warning(
+        "official_provider_failure provider=kma_surface status=%s reason=%s",
+        status_code,
+        reason,
+    )
+    raise SurfaceWeatherFetchError(reason)
+
+
+async def _probe_kma_surface_cycle(
+    api_key: str,
+    station_id: int,
+    failures: Dict[str, Tuple[int, str]],
+    cycle: str,
+) -> Optional[Dict[str, str]]:
+    """Return the station row for ``cycle``, or ``None`` when it is not published yet."""
+    snapshot = KMA_SURFACE_SNAPSHOT_CACHE.get_fresh(cycle)
+    if snapshot is None:
+        response = await KMA_SURFACE_SNAPSHOT_SINGLE_FLIGHT.run(
+            cycle,
+            partial(_fetch_kma_surface_snapshot_response, cycle, api_key),
+        )
+        if response.status_code != 200:
+            reason = _surface_weather_http_reason(response.status_code, response.text)
+            if reason in {SURFACE_WEATHER_REASON_AUTH, SURFACE_WEATHER_REASON_QUOTA}:
+                _raise_kma_surface_failure(response.status_code, reason)
+            failures[cycle] = (response.status_code, reason)
+            return None
+        snapshot = _parse_kma_surface_snapshot(response.text)
+        if not snapshot:
+            body_reason = _surface_weather_http_reason(response.status_code, response.text)
+            if body_reason in {SURFACE_WEATHER_REASON_AUTH, SURFACE_WEATHER_REASON_QUOTA}:
+                _raise_kma_surface_failure(response.status_code, body_reason)
+            return None
+        expires_at = None
+        if cycle_is_past(cycle, KMA_SURFACE_CYCLE_INTERVAL, KST):
+            expires_at = time.time() + KMA_CYCLE_PAYLOAD_TTL_S
+        KMA_SURFACE_SNAPSHOT_CACHE.set(cycle, snapshot, expires_at=expires_at)
+    return snapshot.get(station_id)
+
+
 async def fetch_kma_surface_observation(lat: float, lon: float) -> Dict[str, Any]:
     api_key = _kma_api_key_for("surface")
     if not api_key:
         raise SurfaceWeatherFetchError(SURFACE_WEATHER_REASON_UNCONFIGURED)
 
     station = nearest_kma_surface_station(lat, lon)
-    last_http_status: Optional[int] = None
-    last_http_reason: Optional[str] = None
-    for cycle in latest_kma_surface_cycles():
-        try:
-            async with httpx.AsyncClient(timeout=KMA_SURFACE_REQUEST_TIMEOUT_S) as client:
-                response = await client.get(
-                    "https://apihub.kma.go.kr/api/typ01/url/kma_sfctm2.php",
-                    params={
-                        "tm": cycle,
-                        "stn": station["id"],
-                        "help": 1,
-                        "authKey": api_key,
-                    },
-                )
-        except httpx.TimeoutException as error:
-            raise SurfaceWeatherFetchError(SURFACE_WEATHER_REASON_TIMEOUT) from error
-        except Exception as error:
-            raise SurfaceWeatherFetchError(SURFACE_WEATHER_REASON_HTTP) from error
-        if response.status_code != 200:
-            last_http_status = response.status_code
-            last_http_reason = _surface_weather_http_reason(response.status_code, response.text)
-            if last_http_reason in {SURFACE_WEATHER_REASON_AUTH, SURFACE_WEATHER_REASON_QUOTA}:
-                break
-            continue
-        row = _parse_kma_surface_row(response.text)
-        if row is None:
-            body_reason = _surface_weather_http_reason(response.status_code, response.text)
-            if body_reason in {SURFACE_WEATHER_REASON_AUTH, SURFACE_WEATHER_REASON_QUOTA}:
-                last_http_status = response.status_code
-                last_http_reason = body_reason
-                break
-            continue
+    cycles = latest_kma_surface_cycles()
+    failures: Dict[str, Tuple[int, str]] = {}
+    probed = await PUBLISHED_CYCLES.probe(
+        "kma_surface",
+        cycles,
+        partial(_probe_kma_surface_cycle, api_key, station["id"], failures),
+        window=KMA_SURFACE_CYCLE_PROBE_WINDOW,
+    )
+    if probed is not None:
+        _cycle, row = probed
         observed_at_utc = _parse_surface_weather_datetime(row.get("TM"))
         if observed_at_utc is None:
             raise SurfaceWeatherFetchError(SURFACE_WEATHER_REASON_PARSE)
@@ -2639,14 +3349,9 @@ async def fetch_kma_surface_observation(lat: float, lon: float) -> Dict[str, Any
             longitude=lon,
             selection_id=None,
         )
-    if last_http_status is not None:
-        reason = last_http_reason or SURFACE_WEATHER_REASON_HTTP
-        LOGGER.warning(
-            "official_provider_failure provider=kma_surface status=%s reason=%s",
-            last_http_status,
-            reason,
-        )
-        raise SurfaceWeatherFetchError(reason)
+    last_failure = next((failures[cycle] for cycle in reversed(cycles) if cycle in failures), None)
+    if last_failure is not None:
+        _raise_kma_surface_failure(*last_failure)
     raise SurfaceWeatherFetchError(SURFACE_WEATHER_REASON_PARSE)
 
 def latest_kma_cycles(now_utc: Optional[datetime] = None, limit: int = 4) -> List[str]:
@@ -2851,12 +3556,13 @@ def calculate_air_density(pressure_hpa: float, temperature_c: float) -> float:
 
 
 async def fetch_wis2_station_metadata(stn: int) -> Optional[Dict[str, Any]]:
-    if stn in WIS2_STATION_CACHE:
-        return WIS2_STATION_CACHE[stn]
+    cached = WIS2_STATION_CACHE.get_fresh(stn)
+    if cached is not None:
+        return cached
 
     url = WIS2_STATION_ENDPOINT.format(stn=stn)
     try:
-        async with httpx.AsyncClient(timeout=8) as client:
+        async with upstream_client("wis2_station") as client:
             response = await client.get(url)
             if response.status_code != 200:
                 return None
@@ -2876,8 +3582,7 @@ async def fetch_wis2_station_metadata(stn: int) -> Optional[Dict[str, Any]]:
         "lat": float(coords[1]),
         "lon": float(coords[0]),
     }
-    WIS2_STATION_CACHE[stn] = station
-    return station
+    return WIS2_STATION_CACHE.set(stn, station)
 
 async def fetch_kma_upper_air_profile(lat: float, lon: float) -> Optional[Dict]:
     api_key = _kma_api_key_for("upper_air")
@@ -2885,48 +3590,79 @@ async def fetch_kma_upper_air_profile(lat: float, lon: float) -> Optional[Dict]:
         return None
 
     cache_key = f"{_round_coord(lat)},{_round_coord(lon)}"
-    cached = _cache_get(UPPER_AIR_CACHE, cache_key, UPPER_AIR_CACHE_TTL_S)
+    cached = UPPER_AIR_CACHE.get_fresh(cache_key)
     if cached is not None:
         return cached
 
+    refresh = partial(_fetch_kma_upper_air_profile_upstream, lat, lon, api_key, cache_key)
+    stale = UPPER_AIR_CACHE.get_stale(cache_key)
+    if stale is not None:
+        UPPER_AIR_SINGLE_FLIGHT.revalidate(cache_key, refresh)
+        return stale
+
+    return await UPPER_AIR_SINGLE_FLIGHT.run(cache_key, refresh)
+
+
+async def _fetch_kma_upper_air_profile_upstream(lat: float, lon: float, api_key: str, cache_key: str) -> Optional[Dict]:
     stations = sorted(
         KMA_DEFAULT_STATIONS,
         key=lambda station: math.sqrt((station["lat"] - lat) ** 2 + (station["lon"] - lon) ** 2)
     )
-    async with httpx.AsyncClient(timeout=8) as client:
+    async with upstream_client("kma_upper_air") as client:
         for station in stations:
             for cycle in latest_kma_cycles():
-                url = "https://apihub.kma.go.kr/api/typ01/url/upp_temp.php"
-                params = {
-                    "tm": cycle,
-                    "stn": station["id"],
-                    "pa": 0,
-                    "help": 0,
-                    "authKey": api_key
-                }
-                try:
-                    response = await client.get(url, params=params)
-                    if response.status_code != 200:
+                cycle_key = (station["id"], cycle)
+                rows = UPPER_AIR_CYCLE_CACHE.get_fresh(cycle_key)
+                if rows is None:
+                    url = "https://apihub.kma.go.kr/api/typ01/url/upp_temp.php"
+                    params = {
+                        "tm": cycle,
+                        "stn": station["id"],
+                        "pa": 0,
+                        "help": 0,
+                        "authKey": api_key
+                    }
+                    try:
+                        await _acquire_kma_quota("upper_air", api_key)
+                        with provider_breaker("kma_upper_air").call() as outcome:
+                            response = await client.get(url, params=params)
+                            _record_kma_quota_response("upper_air", api_key, response)
+                            if upstream_status_failed(response.status_code):
+                                outcome.fail(f"kma_upper_air_http_{response.status_code}")
+                        if response.status_code != 200:
+                            continue
+                        rows = parse_kma_upper_air_text(response.text)
+                    except (CircuitOpenError, QuotaExhausted):
+                        break
+                    except Exception:
                         continue
-                    rows = parse_kma_upper_air_text(response.text)
-                    if rows:
-                        result = {
-                            "station_id": station["id"],
-                            "station_name": station["name"],
-                            "observed_at_utc": cycle,
-                            "layers": rows,
-                            "stale_cache": False
-                        }
-                        _cache_set(UPPER_AIR_LAST_GOOD_CACHE, cache_key, result)
-                        return _cache_set(UPPER_AIR_CACHE, cache_key, result)
-                except Exception:
-                    continue
-
-    stale = _cache_get_stale(UPPER_AIR_LAST_GOOD_CACHE, cache_key, UPPER_AIR_STALE_TTL_S)
+                    if rows and cycle_is_past(cycle, KMA_UPPER_AIR_CYCLE_INTERVAL):
+                        UPPER_AIR_CYCLE_CACHE.set(cycle_key, rows)
+                if rows:
+                    result = {
+                        "station_id": station["id"],
+                        "station_name": station["name"],
+                        "observed_at_utc": cycle,
+                        "layers": rows,
+                        "stale_cache": False
+                    }
+                    UPPER_AIR_LAST_GOOD_CACHE.set(cache_key, result)
+                    return UPPER_AIR_CACHE.set(
+                        cache_key,
+                        result,
+                        expires_at=_kma_cycle_cache_expiry(
+                            cycle,
+                            interval=KMA_UPPER_AIR_CYCLE_INTERVAL,
+                            publication_lag_s=KMA_UPPER_AIR_PUBLICATION_LAG_S,
+                            retry_after_s=UPPER_AIR_CACHE_TTL_S,
+                        ),
+                    )
+
+    stale = UPPER_AIR_LAST_GOOD_CACHE.get_stale(cache_key)
     if stale:
         return _mark_stale_payload(stale)
 
-    return _cache_set(UPPER_AIR_CACHE, cache_key, None)
+    return UPPER_AIR_CACHE.set(cache_key, None)
 
 
 async def fetch_kma_wind_profiler_profile(lat: float, lon: float, mode: str = WIND_PROFILER_MODE) -> Optional[Dict]:
@@ -2935,63 +3671,194 @@ async def fetch_kma_wind_profiler_profile(lat: float, lon: float, mode: str = WI
         return None
 
     cache_key = f"{mode}:{_round_coord(lat)},{_round_coord(lon)}"
-    cached = _cache_get(WIND_PROFILER_CACHE, cache_key, WIND_PROFILER_CACHE_TTL_S)
+    cached = WIND_PROFILER_CACHE.get_fresh(cache_key)
     if cached is not None:
         return cached
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        for cycle in latest_wind_profiler_cycles():
-            url = "https://apihub.kma.go.kr/api/typ01/url/kma_wpf.php"
-            params = {
-                "tm": cycle,
-                "stn": 0,
-                "mode": mode,
-                "help": 0,
-                "authKey": api_key
-            }
-            try:
+    refresh = partial(_fetch_kma_wind_profiler_profile_upstream, lat, lon, mode, api_key, cache_key)
+    stale = WIND_PROFILER_CACHE.get_stale(cache_key)
+    if stale is not None:
+        WIND_PROFILER_SINGLE_FLIGHT.revalidate(cache_key, refresh)
+        return stale
+
+    return await WIND_PROFILER_SINGLE_FLIGHT.run(cache_key, refresh)
+
+
+async def _probe_kma_wind_profiler_cycle(
+    client: httpx.AsyncClient,
+    lat: float,
+    lon: float,
+    mode: str,
+    api_key: str,
+    cycle: str,
+) -> Optional[Dict[str, Any]]:
+    """Return the nearest-station profile for ``cycle``, or ``None`` if it has no usable data."""
+    cycle_key = (mode, cycle)
+    grouped_rows = WIND_PROFILER_CYCLE_CACHE.get_fresh(cycle_key)
+    if grouped_rows is None:
+        url = "https://apihub.kma.go.kr/api/typ01/url/kma_wpf.php"
+        params = {
+            "tm": cycle,
+            "stn": 0,
+            "mode": mode,
+            "help": 0,
+            "authKey": api_key
+        }
+        try:
+            await _acquire_kma_quota("wind_profiler", api_key)
+            with provider_breaker("kma_wind_profiler").call() as outcome:
                 response = await client.get(url, params=params)
-                if response.status_code != 200:
-                    continue
-                grouped_rows = parse_kma_wind_profiler_text(response.text)
-                if not grouped_rows:
-                    continue
-            except Exception:
-                continue
+                _record_kma_quota_response("wind_profiler", api_key, response)
+                if upstream_status_failed(response.status_code):
+                    outcome.fail(f"kma_wind_profiler_http_{response.status_code}")
+            if response.status_code != 200:
+                return None
+            grouped_rows = parse_kma_wind_profiler_text(response.text)
+            if not grouped_rows:
+                return None
+        except (CircuitOpenError, QuotaExhausted):
+            # Shed by this worker, which says nothing about publication: abort
+            # the probe instead of falling back to an older cycle.
+            raise
+        except Exception:
+            return None
+        if cycle_is_past(cycle, KMA_WIND_PROFILER_CYCLE_INTERVAL):
+            WIND_PROFILER_CYCLE_CACHE.set(cycle_key, grouped_rows)
+
+    station_candidates: List[Dict[str, Any]] = []
+    for stn, layers in grouped_rows.items():
+        metadata = await fetch_wis2_station_metadata(stn)
+        if not metadata:
+            continue
+        station_candidates.append({
+            "station": metadata,
+            "layers": layers
+        })
+
+    if not station_candidates:
+        return None
+
+    station_candidates.sort(
+        key=lambda item: math.sqrt((item["station"]["lat"] - lat) ** 2 + (item["station"]["lon"] - lon) ** 2)
+    )
+    selected = station_candidates[0]
+    return {
+        "station_id": selected["station"]["id"],
+        "station_name": selected["station"]["name"],
+        "observed_at_utc": cycle,
+        "mode": mode,
+        "layers": selected["layers"],
+        "stale_cache": False
+    }
 
-            station_candidates: List[Dict[str, Any]] = []
-            for stn, layers in grouped_rows.items():
-                metadata = await fetch_wis2_station_metadata(stn)
-                if not metadata:
-                    continue
-                station_candidates.append({
-                    "station": metadata,
-                    "layers": layers
-                })
-
-            if not station_candidates:
-                continue
 
-            station_candidates.sort(
-                key=lambda item: math.sqrt((item["station"]["lat"] - lat) ** 2 + (item["station"]["lon"] - lon) ** 2)
+async def _fetch_kma_wind_profiler_profile_upstream(
+    lat: float,
+    lon: float,
+    mode: str,
+    api_key: str,
+    cache_key: str,
+) -> Optional[Dict]:
+    try:
+        async with upstream_client("kma_wind_profiler") as client:
+            probed = await PUBLISHED_CYCLES.probe(
+                f"kma_wind_profiler:{mode}",
+                latest_wind_profiler_cycles(),
+                partial(_probe_kma_wind_profiler_cycle, client, lat, lon, mode, api_key),
+                window=KMA_WIND_PROFILER_CYCLE_PROBE_WINDOW,
             )
-            selected = station_candidates[0]
-            result = {
-                "station_id": selected["station"]["id"],
-                "station_name": selected["station"]["name"],
-                "observed_at_utc": cycle,
-                "mode": mode,
-                "layers": selected["layers"],
-                "stale_cache": False
-            }
-            _cache_set(WIND_PROFILER_LAST_GOOD_CACHE, cache_key, result)
-            return _cache_set(WIND_PROFILER_CACHE, cache_key, result)
+    except (CircuitOpenError, QuotaExhausted):
+        # Nothing is cached for a shed probe, so the next request probes again.
+        stale = WIND_PROFILER_LAST_GOOD_CACHE.get_stale(cache_key)
+        return _mark_stale_payload(stale) if stale else None
+    if probed is not None:
+        cycle, result = probed
+        WIND_PROFILER_LAST_GOOD_CACHE.set(cache_key, result)
+        return WIND_PROFILER_CACHE.set(
+            cache_key,
+            result,
+            expires_at=_kma_cycle_cache_expiry(
+                cycle,
+                interval=KMA_WIND_PROFILER_CYCLE_INTERVAL,
+                publication_lag_s=KMA_WIND_PROFILER_PUBLICATION_LAG_S,
+                retry_after_s=WIND_PROFILER_CACHE_TTL_S,
+            ),
+        )
 
-    stale = _cache_get_stale(WIND_PROFILER_LAST_GOOD_CACHE, cache_key, WIND_PROFILER_STALE_TTL_S)
+    stale = WIND_PROFILER_LAST_GOOD_CACHE.get_stale(cache_key)
     if stale:
         return _mark_stale_payload(stale)
 
-    return _cache_set(WIND_PROFILER_CACHE, cache_key, None)
+    return WIND_PROFILER_CACHE.set(cache_key, None)
+
+
+async def _refresh_operating_areas(refresh_area) -> None:
+    results = await asyncio.gather(
+        *(refresh_area(area["lat"], area["lon"]) for area in WEATHER_REFRESH_AREAS),
+        return_exceptions=True,
+    )
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        raise errors[0]
+
+
+async def _refresh_surface_weather_area(lat: float, lon: float) -> None:
+    cache_key = _cache_key_for_latlon(lat, lon)
+    await WEATHER_SINGLE_FLIGHT.run(cache_key, partial(_fetch_weather_upstream, lat, lon, cache_key))
+
+
+async def _refresh_upper_air_area(lat: float, lon: float) -> None:
+    api_key = _kma_api_key_for("upper_air")
+    if not api_key:
+        return
+    cache_key = _cache_key_for_latlon(lat, lon)
+    await UPPER_AIR_SINGLE_FLIGHT.run(
+        cache_key,
+        partial(_fetch_kma_upper_air_profile_upstream, lat, lon, api_key, cache_key),
+    )
+
+
+async def _refresh_wind_profiler_area(lat: float, lon: float) -> None:
+    api_key = _kma_api_key_for("wind_profiler")
+    if not api_key:
+        return
+    cache_key = f"{WIND_PROFILER_MODE}:{_cache_key_for_latlon(lat, lon)}"
+    await WIND_PROFILER_SINGLE_FLIGHT.run(
+        cache_key,
+        partial(_fetch_kma_wind_profiler_profile_upstream, lat, lon, WIND_PROFILER_MODE, api_key, cache_key),
+    )
+
+
+async def _refresh_surface_weather() -> None:
+    if not _kma_api_key_for("surface"):
+        return
+    await _refresh_operating_areas(_refresh_surface_weather_area)
+
+
+async def _refresh_kp_index() -> None:
+    await KP_SINGLE_FLIGHT.run(KP_CACHE_KEY, _fetch_kp_index_upstream)
+
+
+WEATHER_REFRESH_SCHEDULER = RefreshScheduler()
+WEATHER_REFRESH_SCHEDULER.register(
+    RefreshJob("kma_surface", KMA_SURFACE_REFRESH_INTERVAL_S, _refresh_surface_weather)
+)
+WEATHER_REFRESH_SCHEDULER.register(
+    RefreshJob(
+        "kma_wind_profiler",
+        KMA_WIND_PROFILER_REFRESH_INTERVAL_S,
+        partial(_refresh_operating_areas, _refresh_wind_profiler_area),
+    )
+)
+WEATHER_REFRESH_SCHEDULER.register(
+    RefreshJob(
+        "kma_upper_air",
+        KMA_UPPER_AIR_REFRESH_INTERVAL_S,
+        partial(_refresh_operating_areas, _refresh_upper_air_area),
+        offset_s=KMA_UPPER_AIR_REFRESH_OFFSET_S,
+    )
+)
+WEATHER_REFRESH_SCHEDULER.register(RefreshJob("noaa_kp", KP_REFRESH_INTERVAL_S, _refresh_kp_index))
 
 # ============================================
 # 게이트 계산 로직
@@ -3140,6 +4007,7 @@ async def health_check():
         "kma_upper_air_configured": kma_configuration["upper_air"],
         "kma_wind_profiler_configured": kma_configuration["wind_profiler"],
         "deployment_revision": deployment_revision,
+        "evidence_caches": [cache.stats() for cache in EVIDENCE_CACHES],
     }
 
 
@@ -3200,6 +4068,14 @@ async def get_kma_status(lat: float = 37.558056, lon: float = 126.708333):
             "observed_at_utc": wind_profiler.get("observed_at_utc") if wind_profiler_available else None,
             "layer_count": len(wind_profiler.get("layers") or []) if wind_profiler_available else 0,
         },
+        "last_published_cycles": PUBLISHED_CYCLES.snapshot(),
+        "provider_circuits": CIRCUIT_BREAKERS.snapshot(list(KMA_CIRCUIT_PROVIDERS)),
+        "provider_quotas": _kma_quota_snapshot(),
+        "background_refresh": {
+            "enabled": WEATHER_REFRESH_ENABLED,
+            "operating_area_count": len(WEATHER_REFRESH_AREAS),
+            "jobs": WEATHER_REFRESH_SCHEDULER.snapshot(),
+        },
     }
     return result
 
@@ -3289,8 +4165,115 @@ async def get_weather_api(
         status=weather_evidence.get("status"),
     )
 
+def _deadline_road_evidence(reason: str) -> Dict[str, Any]:
+    return {
+        "available": False,
+        "official_available": False,
+        "width_m": None,
+        "lane_count": None,
+        "road_name": None,
+        "source": "official_road_right_of_way_unavailable",
+        "source_chain": ["vworld_wfs", "official_road_right_of_way_unavailable"],
+        "reason": reason,
+        "query_meta": {"layer": VWORLD_ROAD_LAYER},
+    }
+
+
+def _deadline_building_selection(reason: str) -> Tuple[Dict[str, Any], None]:
+    return (
+        {
+            "source": "official_building_unavailable",
+            "source_chain": ["official_building_unavailable"],
+            "reason": reason,
+        },
+        None,
+    )
+
+
+async def _evaluation_building_selection(
+    lat: float,
+    lon: float,
+    selection_id: Optional[str],
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Resolve the server-side footprint and its request-bound selection copy."""
+    if selection_id is None:
+        return None, None
+    server_footprint = await _lookup_building_selection(lat, lon, selection_id)
+    building_selection = server_footprint.get("building_selection")
+    if isinstance(building_selection, dict):
+        building_selection = dict(building_selection)
+        for receipt_name in ("official_footprint_receipt", "official_registry_receipt"):
+            selection_receipt = building_selection.get(receipt_name)
+            if isinstance(selection_receipt, dict):
+                selection_receipt = dict(selection_receipt)
+                selection_receipt["selection_id"] = selection_id
+                building_selection[receipt_name] = selection_receipt
+    return server_footprint, building_selection
+
+
+async def _run_evaluation_evidence_graph(request: "EvaluationRequest") -> EvidenceGraphResult:
+    """Fetch every independent evaluation input concurrently.
+
+    Only canyon evidence waits on another node: it binds to the official
+    target building identity resolved by the building selection node.
+    """
+    lat, lon = request.latitude, request.longitude
+
+    async def canyon(building_selection):
+        _server_footprint, selection = building_selection
+        return await fetch_canyon_width_evidence(
+            lat,
+            lon,
+            selection_id=request.selection_id,
+            target_identifier=_canyon_target_identifier(selection),
+        )
+
+    nodes = [
+        EvidenceNode(
+            "building_selection",
+            partial(_evaluation_building_selection, lat, lon, request.selection_id),
+            fallback=_deadline_building_selection,
+        ),
+        EvidenceNode(
+            "upper_air",
+            partial(fetch_kma_upper_air_profile_safe, lat, lon),
+            fallback=lambda _reason: None,
+        ),
+        EvidenceNode(
+            "wind_profiler",
+            partial(fetch_kma_wind_profiler_profile_safe, lat, lon),
+            fallback=lambda _reason: None,
+        ),
+        EvidenceNode(
+            "road",
+            partial(fetch_road_width_evidence, lat, lon),
+            fallback=_deadline_road_evidence,
+        ),
+        EvidenceNode(
+            "canyon",
+            canyon,
+            depends_on=("building_selection",),
+            fallback=lambda reason: _unavailable_canyon_evidence({}, reason),
+        ),
+    ]
+    if request.wind_speed is None:
+        nodes.extend([
+            EvidenceNode(
+                "weather",
+                partial(fetch_weather_safe, lat, lon, selection_id=request.selection_id),
+                fallback=lambda _reason: _attach_weather_provenance(
+                    _make_weather_unavailable(SURFACE_WEATHER_REASON_TIMEOUT)
+                ),
+            ),
+            EvidenceNode("kp", fetch_kp_index_safe, fallback=lambda _reason: 3.0),
+        ])
+    remaining = remaining_s()
+    deadline_s = None if remaining is None else max(0.0, remaining - EVALUATE_RESPONSE_RESERVE_S)
+    return await EvidenceGraph(nodes).run(deadline_s=deadline_s)
+
+
 @app.post("/api/evaluate", response_model=EvaluationResponse)
-async def evaluate_flight(request: EvaluationRequest):
+async def evaluate_flight(request: EvaluationRequest, response: Response):
     if request.correlation_id is not None:
         return JSONResponse(
             status_code=422,
@@ -3302,22 +4285,12 @@ async def evaluate_flight(request: EvaluationRequest):
                 "selection_id": request.selection_id,
             },
         )
-    building_selection = None
+    evidence = await _run_evaluation_evidence_graph(request)
+    if evidence.timings:
+        LOGGER.info("evaluate_evidence_timing %s", evidence.server_timing())
+        response.headers["Server-Timing"] = evidence.server_timing()
+    server_footprint, building_selection = evidence["building_selection"]
     if request.selection_id is not None:
-        server_footprint = await _lookup_building_selection(
-            request.latitude,
-            request.longitude,
-            request.selection_id,
-        )
-        building_selection = server_footprint.get("building_selection")
-        if isinstance(building_selection, dict):
-            building_selection = dict(building_selection)
-            for receipt_name in ("official_footprint_receipt", "official_registry_receipt"):
-                selection_receipt = building_selection.get(receipt_name)
-                if isinstance(selection_receipt, dict):
-                    selection_receipt = dict(selection_receipt)
-                    selection_receipt["selection_id"] = request.selection_id
-                    building_selection[receipt_name] = selection_receipt
         official_height = _build_official_building_height_evidence(server_footprint)
         selection_verified = bool(
             isinstance(building_selection, dict)
@@ -3384,18 +4357,12 @@ async def evaluate_flight(request: EvaluationRequest):
         }
         kp = request.kp_index or 3.0
     else:
-        weather = await fetch_weather_safe(
-            request.latitude,
-            request.longitude,
-            selection_id=request.selection_id,
-        )
-        kp = await fetch_kp_index_safe()
+        weather = evidence["weather"]
+        kp = evidence["kp"]
     
     weather["kp_index"] = kp
-    upper_air, wind_profiler = await asyncio.gather(
-        fetch_kma_upper_air_profile_safe(request.latitude, request.longitude),
-        fetch_kma_wind_profiler_profile_safe(request.latitude, request.longitude)
-    )
+    upper_air = evidence["upper_air"]
+    wind_profiler = evidence["wind_profiler"]
     selected_layer = None
     wind_profiler_layer = None
     source_suffixes = []
@@ -3461,14 +4428,8 @@ async def evaluate_flight(request: EvaluationRequest):
     building_source = request.building_source or building_source_chain[0]
     building_profile_source = request.building_profile_source or "manual_input"
     building_confidence = float(building_evidence["confidence"])
-    raw_road_evidence = await fetch_road_width_evidence(request.latitude, request.longitude)
-    road_evidence = _normalize_road_evidence(raw_road_evidence)
-    raw_canyon_evidence = await fetch_canyon_width_evidence(
-        request.latitude,
-        request.longitude,
-        selection_id=request.selection_id,
-        target_identifier=_canyon_target_identifier(building_selection),
-    )
+    road_evidence = _normalize_road_evidence(evidence["road"])
+    raw_canyon_evidence = evidence["canyon"]
     if request.selection_id is not None:
         raw_canyon_evidence = _bind_canyon_evidence_to_selection(
             raw_canyon_evidence,
@@ -3974,7 +4935,16 @@ except ImportError:
 
 # Building Footprint API
 try:
-    from building_footprint import _point_in_polygon, cache_building_footprint, lookup_building_footprint, lookup_official_building_collection
+    from building_footprint import (
+        BUILDING_TILE_CACHE,
+        FOOTPRINT_WRITE_BEHIND,
+        _point_in_polygon,
+        cache_building_footprint,
+        lookup_building_footprint,
+        lookup_official_building_collection,
+    )
+
+    EVIDENCE_CACHES = (*EVIDENCE_CACHES, BUILDING_TILE_CACHE)
 
     @app.get("/api/building-footprint")
     async def get_building_footprint(lat: float, lon: float, selection_id: Optional[SelectionId] = None):
@@ -3985,7 +4955,8 @@ try:
     async def seed_building_footprint(payload: FootprintCacheRequest):
         if _contains_credential_shaped_data(payload.properties):
             return _cache_write_rejection(400, "credential_shaped_data_rejected")
-        cached = cache_building_footprint(
+        cached = await asyncio.to_thread(
+            cache_building_footprint,
             payload.lat,
             payload.lon,
             payload.geometry,
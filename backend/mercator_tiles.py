@@ -0,0 +1,86 @@
+"""Web-Mercator (EPSG:3857) tiles for tile-keyed WFS caches.
+
+VWorld layers are queried per slippy-map tile instead of per click, so any
+query box can be answered by assembling the tiles it touches and filtering
+their features locally. Tiles are cached in an ``EvidenceCache`` and fetched
+through a ``SingleFlight``, so concurrent lookups touching the same tile share
+one upstream request.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Awaitable, Callable, Hashable, List, Tuple, Type
+
+from provider_cache import EvidenceCache, SingleFlight
+from request_deadline import deadline_wait_for, remaining_s
+from spatial_index import BBox
+
+
+WEB_MERCATOR_ORIGIN_SHIFT = 20_037_508.34
+Tile = Tuple[int, int, int]  # (zoom, x, y), y grows southwards
+
+
+def tile_size_m(zoom: int) -> float:
+    return 2.0 * WEB_MERCATOR_ORIGIN_SHIFT / (1 << zoom)
+
+
+def tile_bounds(tile: Tile) -> BBox:
+    zoom, x, y = tile
+    size = tile_size_m(zoom)
+    min_x = -WEB_MERCATOR_ORIGIN_SHIFT + x * size
+    max_y = WEB_MERCATOR_ORIGIN_SHIFT - y * size
+    return (min_x, max_y - size, min_x + size, max_y)
+
+
+def tiles_for_bbox(bbox: BBox, zoom: int) -> List[Tile]:
+    """Tiles at ``zoom`` that an EPSG:3857 ``bbox`` touches, row by row."""
+    size = tile_size_m(zoom)
+    last = (1 << zoom) - 1
+    min_x = max(0, math.floor((bbox[0] + WEB_MERCATOR_ORIGIN_SHIFT) / size))
+    max_x = min(last, math.floor((bbox[2] + WEB_MERCATOR_ORIGIN_SHIFT) / size))
+    min_y = max(0, math.floor((WEB_MERCATOR_ORIGIN_SHIFT - bbox[3]) / size))
+    max_y = min(last, math.floor((WEB_MERCATOR_ORIGIN_SHIFT - bbox[1]) / size))
+    return [(zoom, x, y) for y in range(min_y, max_y + 1) for x in range(min_x, max_x + 1)]
+
+
+def child_tiles(tile: Tile) -> List[Tile]:
+    zoom, x, y = tile
+    return [(zoom + 1, 2 * x + dx, 2 * y + dy) for dy in (0, 1) for dx in (0, 1)]
+
+
+def bbox_param(bbox: BBox) -> str:
+    return ",".join(str(value) for value in bbox)
+
+
+async def cached_tile(
+    cache: EvidenceCache,
+    flights: SingleFlight,
+    key: Hashable,
+    fetch: Callable[[], Awaitable[Any]],
+    *,
+    stale_on: Tuple[Type[BaseException], ...] = (Exception,),
+) -> Any:
+    """Fresh cached tile, else one shared fetch; a failed fetch falls back to the stale tile.
+
+    The shared fetch runs without any request deadline, so each caller bounds
+    its own wait by what is left of its request budget; a caller that runs
+    out falls back to the stale tile too, or raises the timeout.
+    """
+    cached = cache.get_fresh(key)
+    if cached is not None:
+        return cached
+
+    async def fetch_and_store() -> Any:
+        return cache.set(key, await fetch())
+
+    try:
+        remaining = remaining_s()
+        if remaining is None:
+            return await flights.run(key, fetch_and_store)
+        return await deadline_wait_for(flights.run(key, fetch_and_store), remaining)
+    except (*stale_on, TimeoutError):
+        stale = cache.get_stale(key)
+        if stale is not None:
+            return stale
+        raise
@@ -5,11 +5,16 @@ from __future__ import annotations
 import logging
 import os
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from urllib.parse import unquote
 
 import httpx
 
+from circuit_breaker import CircuitOpenError, provider_breaker
+from credential_health import CREDENTIAL_HEALTH
+from provider_quota import PROVIDER_QUOTAS, register_quota
+from upstream_clients import register_provider, upstream_client
+
 
 LOGGER = logging.getLogger(__name__)
 
@@ -33,6 +38,22 @@ _SEMANTIC_BUILDING_HUB_ENV_KEY = re.compile(
     r"^(?:MOLIT|DATA_GO_KR)_[A-Z0-9_]*(?:BUILDING|BLDG|REGISTRY)[A-Z0-9_]*(?:SERVICE_)?KEY$"
 )
 BUILDING_HUB_TIMEOUT_S = float(os.getenv("MOLIT_BUILDING_HUB_TIMEOUT_S", "6.0"))
+register_provider(
+    "molit_building_hub",
+    BUILDING_HUB_TIMEOUT_S,
+    connect_timeout_s=3.0,
+    max_connections=int(os.getenv("MOLIT_BUILDING_HUB_MAX_CONNECTIONS", "10")),
+    max_keepalive_connections=int(os.getenv("MOLIT_BUILDING_HUB_MAX_KEEPALIVE_CONNECTIONS", "5")),
+    follow_redirects=True,
+)
+# Defaults match a data.go.kr development account; raise them for an
+# operating account's approved traffic.
+register_quota(
+    "molit_building_hub",
+    rate_per_s=float(os.getenv("MOLIT_BUILDING_HUB_RATE_PER_S", "10")),
+    burst=int(os.getenv("MOLIT_BUILDING_HUB_BURST", "10")),
+    daily_limit=int(os.getenv("MOLIT_BUILDING_HUB_DAILY_LIMIT", "10000")),
+)
 BUILDING_HUB_CREDENTIAL_FAILURES = {
     "molit_building_hub_access_denied",
     "molit_building_hub_key_expired",
@@ -41,6 +62,10 @@ BUILDING_HUB_CREDENTIAL_FAILURES = {
     "molit_building_hub_upstream_http_401",
     "molit_building_hub_upstream_http_403",
 }
+BUILDING_HUB_QUOTA_FAILURES = {
+    "molit_building_hub_quota_exceeded",
+    "molit_building_hub_rate_limited",
+}
 _BUILDING_HUB_GATEWAY_REASONS = {
     "SERVICE_ACCESS_DENIED_ERROR": "molit_building_hub_access_denied",
     "PERMISSION_DENIED": "molit_building_hub_access_denied",
@@ -93,17 +118,36 @@ def _normalize_service_key(value: str) -> Optional[str]:
     return normalized if normalized and not any(char.isspace() for char in normalized) else None
 
 
+_SERVICE_KEY_CANDIDATES: Dict[str, Optional[List[Tuple[str, str]]]] = {"candidates": None}
+
+
 def _service_key_candidates() -> List[Tuple[str, str]]:
+    # Keys are read from the environment once per process; a deploy that
+    # rotates them restarts the worker, and tests call
+    # ``reset_service_key_candidates`` after changing the environment.
+    candidates = _SERVICE_KEY_CANDIDATES["candidates"]
+    if candidates is None:
+        candidates = _scan_service_key_candidates(os.environ)
+        _SERVICE_KEY_CANDIDATES["candidates"] = candidates
+    return list(candidates)
+
+
+def reset_service_key_candidates() -> None:
+    """Forget the resolved keys so the next lookup reads the environment again."""
+    _SERVICE_KEY_CANDIDATES["candidates"] = None
+
+
+def _scan_service_key_candidates(environ: Mapping[str, str]) -> List[Tuple[str, str]]:
     semantic_aliases = sorted(
         env_key
-        for env_key in os.environ
+        for env_key in environ
         if env_key not in BUILDING_HUB_ENV_KEYS
         and _SEMANTIC_BUILDING_HUB_ENV_KEY.fullmatch(env_key)
     )
     candidates = []
     seen_values = set()
     for env_key in (*BUILDING_HUB_ENV_KEYS, *semantic_aliases):
-        value = (os.getenv(env_key) or "").strip()
+        value = (environ.get(env_key) or "").strip()
         if value:
             normalized = _normalize_service_key(value)
             if normalized and normalized not in seen_values:
@@ -121,6 +165,19 @@ def service_key_configured() -> bool:
     return bool(_service_key_candidates())
 
 
+def service_key_quota_snapshot() -> List[Dict[str, Any]]:
+    """Request budget left on each configured key, labelled by env var name only."""
+    return [
+        PROVIDER_QUOTAS.budget("molit_building_hub", env_key, service_key).snapshot()
+        for env_key, service_key in _service_key_candidates()
+    ]
+
+
+def service_key_health_snapshot() -> List[Dict[str, Any]]:
+    """Failover state of each configured key, labelled by env var name only."""
+    return CREDENTIAL_HEALTH.snapshot("molit_building_hub", _service_key_candidates())
+
+
 def _as_records(payload: Any) -> List[Dict[str, Any]]:
     if not isinstance(payload, dict):
         raise OfficialBuildingRegistryError("molit_building_hub_invalid_response")
@@ -155,10 +212,15 @@ async def _fetch_title_records(query: Dict[str, str], service_key: str) -> List[
         "numOfRows": "100",
         "pageNo": "1",
     }
-    timeout = httpx.Timeout(BUILDING_HUB_TIMEOUT_S, connect=min(BUILDING_HUB_TIMEOUT_S, 3.0))
     try:
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-            response = await client.get(BUILDING_HUB_TITLE_URL, params=params)
+        with provider_breaker("molit_building_hub").call() as outcome:
+            async with upstream_client("molit_building_hub") as client:
+                response = await client.get(BUILDING_HUB_TITLE_URL, params=params)
+            # Quota and credential rejections are per key, not provider health.
+            if response.status_code >= 500:
+                outcome.fail(_building_hub_failure_reason(response.status_code, response.text))
+    except CircuitOpenError as error:
+        raise OfficialBuildingRegistryError(error.reason) from error
     except httpx.TimeoutException as error:
         raise OfficialBuildingRegistryError("molit_building_hub_timeout") from error
     except httpx.HTTPError as error:
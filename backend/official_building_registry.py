@@ -2,23 +2,56 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 import re
+import sqlite3
+import threading
+import time
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from building_hub_record_store import TitleRecordStore
+from credential_health import CREDENTIAL_HEALTH
 from official_building_hub_client import (
     BUILDING_HUB_CREDENTIAL_FAILURES as _BUILDING_HUB_CREDENTIAL_FAILURES,
+    BUILDING_HUB_QUOTA_FAILURES as _BUILDING_HUB_QUOTA_FAILURES,
+    BUILDING_HUB_TIMEOUT_S,
     OfficialBuildingRegistryError,
     _fetch_title_records,
     _service_key_candidates,
     service_key_configured,
+    service_key_health_snapshot,
+    service_key_quota_snapshot,
 )
+from provider_cache import EvidenceCache, SingleFlight
+from provider_quota import PROVIDER_QUOTAS, QuotaExhausted
+from request_deadline import deadline_wait_for
 
 
 LOGGER = logging.getLogger(__name__)
 
 _PNU_PLAT_TO_HUB_PLAT = {"1": "0", "2": "1", "3": "2"}
 
+# Title records for a management number barely change, so they are cached
+# for weeks; a confirmed empty answer is cached for a day. Both survive
+# restarts in the SQLite store, and failures are never cached.
+BUILDING_HUB_RECORD_TTL_S = float(os.getenv("MOLIT_BUILDING_HUB_RECORD_TTL_S", str(30 * 24 * 3600)))
+BUILDING_HUB_NOT_FOUND_TTL_S = float(os.getenv("MOLIT_BUILDING_HUB_NOT_FOUND_TTL_S", str(24 * 3600)))
+BUILDING_HUB_RECORD_CACHE_MAX = int(os.getenv("MOLIT_BUILDING_HUB_RECORD_CACHE_MAX", "4096"))
+BUILDING_HUB_RECORD_STORE_PATH = os.getenv(
+    "MOLIT_BUILDING_HUB_RECORD_STORE_PATH",
+    os.path.join(os.path.dirname(__file__), "var", "building_hub_records.sqlite3"),
+)
+TITLE_RECORD_CACHE = EvidenceCache(
+    "molit_building_hub_titles",
+    ttl_s=BUILDING_HUB_RECORD_TTL_S,
+    max_entries=BUILDING_HUB_RECORD_CACHE_MAX,
+)
+TITLE_RECORD_FLIGHTS = SingleFlight("molit_building_hub_titles")
+_TITLE_RECORD_STORE_LOCK = threading.Lock()
+_TITLE_RECORD_STORE: Dict[str, Optional[TitleRecordStore]] = {"store": None}
+
 
 def building_hub_query_from_management_number(value: Any) -> Optional[Dict[str, str]]:
     """Convert BD_MGT_SN (PNU 19 digits plus a six digit serial) to HUB input."""
@@ -61,13 +94,33 @@ def _meaningful(value: Any) -> bool:
 async def _fetch_title_records_with_failover(
     query: Dict[str, str], candidates: List[Tuple[str, str]]
 ) -> List[Dict[str, Any]]:
-    for index, (_, service_key) in enumerate(candidates):
+    """Fetch with the first candidate key that has request budget left.
+
+    Keys are tried last known-good first, with keys recently rejected as
+    invalid demoted to the end (see ``credential_health``). A credential or
+    quota rejection moves on to the next untried key. Keys whose per-second
+    or daily budget is spent are skipped up front, so a burst spills over
+    onto the failover keys instead of tripping the gateway.
+    """
+    untried = list(enumerate(CREDENTIAL_HEALTH.order("molit_building_hub", candidates)))
+    while untried:
         try:
-            return await _fetch_title_records(query, service_key)
+            position = await PROVIDER_QUOTAS.acquire("molit_building_hub", [candidate for _, candidate in untried])
+        except QuotaExhausted as error:
+            raise OfficialBuildingRegistryError(error.reason) from error
+        index, (env_key, service_key) = untried.pop(position)
+        try:
+            records = await _fetch_title_records(query, service_key)
         except OfficialBuildingRegistryError as error:
             reason = str(error)
-            has_next = index + 1 < len(candidates)
-            if reason not in _BUILDING_HUB_CREDENTIAL_FAILURES or not has_next:
+            budget = PROVIDER_QUOTAS.budget("molit_building_hub", env_key, service_key)
+            if reason in _BUILDING_HUB_CREDENTIAL_FAILURES:
+                CREDENTIAL_HEALTH.record_failure("molit_building_hub", env_key, service_key, reason)
+            elif reason == "molit_building_hub_quota_exceeded":
+                budget.exhaust()
+            elif reason == "molit_building_hub_rate_limited":
+                budget.throttle()
+            if reason not in _BUILDING_HUB_CREDENTIAL_FAILURES | _BUILDING_HUB_QUOTA_FAILURES or not untried:
                 raise
             LOGGER.warning(
                 "official_provider_credential_retry provider=molit_building_hub candidate=%s total=%s reason=%s",
@@ -75,9 +128,71 @@ async def _fetch_title_records_with_failover(
                 len(candidates),
                 reason,
             )
+        else:
+            CREDENTIAL_HEALTH.record_success("molit_building_hub", service_key)
+            return records
     raise OfficialBuildingRegistryError("molit_building_hub_key_not_configured")
 
 
+def _title_record_query_key(query: Dict[str, str]) -> str:
+    return "-".join(query[field] for field in ("sigunguCd", "bjdongCd", "platGbCd", "bun", "ji"))
+
+
+def _title_record_store() -> TitleRecordStore:
+    with _TITLE_RECORD_STORE_LOCK:
+        store = _TITLE_RECORD_STORE["store"]
+        if store is None or store.path != BUILDING_HUB_RECORD_STORE_PATH:
+            store = TitleRecordStore(BUILDING_HUB_RECORD_STORE_PATH)
+            _TITLE_RECORD_STORE["store"] = store
+        return store
+
+
+def _read_stored_title_records(query_key: str) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+    try:
+        return _title_record_store().get(query_key)
+    except sqlite3.Error as error:
+        LOGGER.warning("building_hub_record_store_unavailable error=%s", type(error).__name__)
+        return None
+
+
+def _write_stored_title_records(query_key: str, records: List[Dict[str, Any]], expires_at: float) -> None:
+    try:
+        _title_record_store().put(query_key, records, expires_at)
+    except sqlite3.Error as error:
+        LOGGER.warning("building_hub_record_store_unavailable error=%s", type(error).__name__)
+
+
+async def _cached_title_records(
+    query: Dict[str, str], candidates: List[Tuple[str, str]]
+) -> List[Dict[str, Any]]:
+    """Title records from memory, then the persistent store, then Building HUB.
+
+    Concurrent misses for one query share a single upstream fetch. An empty
+    list (``molit_building_hub_not_found``) is cached with its shorter TTL.
+    """
+    query_key = _title_record_query_key(query)
+    cached = TITLE_RECORD_CACHE.get_fresh(query_key)
+    if cached is not None:
+        return cached
+
+    async def load() -> List[Dict[str, Any]]:
+        stored = await asyncio.to_thread(_read_stored_title_records, query_key)
+        if stored is not None:
+            records, expires_at = stored
+            return TITLE_RECORD_CACHE.set(query_key, records, expires_at=expires_at)
+        records = await _fetch_title_records_with_failover(query, candidates)
+        expires_at = time.time() + (BUILDING_HUB_RECORD_TTL_S if records else BUILDING_HUB_NOT_FOUND_TTL_S)
+        await asyncio.to_thread(_write_stored_title_records, query_key, records, expires_at)
+        return TITLE_RECORD_CACHE.set(query_key, records, expires_at=expires_at)
+
+    # The shared fetch runs without a request deadline, so each caller bounds
+    # its own wait the way the upstream client would have.
+    try:
+        return await deadline_wait_for(TITLE_RECORD_FLIGHTS.run(query_key, load), BUILDING_HUB_TIMEOUT_S)
+    except asyncio.TimeoutError as error:
+        raise OfficialBuildingRegistryError("molit_building_hub_timeout") from error
+
+
 def _selection_names(footprint: Dict[str, Any]) -> List[str]:
     verified = footprint.get("verified_properties")
     properties = verified if isinstance(verified, dict) else (
@@ -181,7 +296,7 @@ async def enrich_verified_footprint(footprint: Optional[Dict[str, Any]]) -> Dict
         return _with_registry_unavailable(result, "molit_building_hub_key_not_configured")
 
     try:
-        records = await _fetch_title_records_with_failover(query, service_key_candidates)
+        records = await _cached_title_records(query, service_key_candidates)
     except OfficialBuildingRegistryError as error:
         return _with_registry_unavailable(result, str(error))
 
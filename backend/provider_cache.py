@@ -0,0 +1,196 @@
+"""Shared caching primitives for upstream provider evidence."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, Optional
+
+from request_deadline import detached_context
+
+
+class EvidenceCache:
+    """Bounded TTL/LRU store for provider evidence.
+
+    Entries keep the ``{"ts", "value"}`` shape the module-level dicts used, so
+    tests and diagnostics can still seed or inspect them by key. ``get_fresh``
+    honours ``ttl_s`` (or a per-entry ``expires_at``); ``get_stale``
+    additionally serves entries for ``stale_ttl_s - ttl_s`` beyond that.
+    Anything past the stale tier is dropped, and the least recently used
+    entry is evicted once ``max_entries`` is exceeded.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        ttl_s: float,
+        max_entries: int,
+        stale_ttl_s: Optional[float] = None,
+    ) -> None:
+        self.name = name
+        self.ttl_s = float(ttl_s)
+        self.stale_ttl_s = max(self.ttl_s, float(stale_ttl_s if stale_ttl_s is not None else ttl_s))
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __getitem__(self, key: Hashable) -> Dict[str, Any]:
+        return self._entries[key]
+
+    def __setitem__(self, key: Hashable, entry: Dict[str, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._entries))
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        return self._entries.pop(key, default)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def age_s(self, key: Hashable) -> Optional[float]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return time.time() - entry["ts"]
+
+    def get_fresh(self, key: Hashable) -> Any:
+        """Return the value until its expiry (``ttl_s`` by default); otherwise ``None``."""
+        return self._lookup(key, allow_stale=False)
+
+    def get_stale(self, key: Hashable) -> Any:
+        """Return the value while it is within the stale tier; otherwise ``None``."""
+        return self._lookup(key, allow_stale=True)
+
+    def set(self, key: Hashable, value: Any, *, expires_at: Optional[float] = None) -> Any:
+        """Store ``value``; ``expires_at`` (epoch seconds) overrides ``ttl_s`` for this entry."""
+        self._expire_oldest()
+        entry: Dict[str, Any] = {"ts": time.time(), "value": value}
+        if expires_at is not None:
+            entry["expires_at"] = float(expires_at)
+        self[key] = entry
+        return value
+
+    def _fresh_until(self, entry: Dict[str, Any]) -> float:
+        expires_at = entry.get("expires_at")
+        if expires_at is None:
+            return entry["ts"] + self.ttl_s
+        return float(expires_at)
+
+    def _stale_until(self, entry: Dict[str, Any]) -> float:
+        return max(entry["ts"] + self.stale_ttl_s, self._fresh_until(entry) + self.stale_ttl_s - self.ttl_s)
+
+    def _lookup(self, key: Hashable, allow_stale: bool) -> Any:
+        entry = self._entries.get(key)
+        if not entry:
+            self.misses += 1
+            return None
+        now = time.time()
+        if now > self._stale_until(entry):
+            self._entries.pop(key, None)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        fresh = now <= self._fresh_until(entry)
+        if not fresh and not allow_stale:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        if fresh:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        return entry["value"]
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _expire_oldest(self) -> None:
+        now = time.time()
+        while self._entries:
+            oldest_key, oldest = next(iter(self._entries.items()))
+            if now <= self._stale_until(oldest):
+                break
+            self._entries.pop(oldest_key, None)
+            self.expirations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_s": self.ttl_s,
+            "stale_ttl_s": self.stale_ttl_s,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class SingleFlight:
+    """Coalesce concurrent cache misses for the same key into one upstream fetch.
+
+    The first caller starts the fetch as a task; concurrent callers await the
+    same task and receive its result or its exception. Callers are shielded,
+    so a caller-side ``asyncio.wait_for`` timeout never cancels the fetch the
+    other waiters are sharing, and the task runs without the first caller's
+    request deadline.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    def inflight(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        return await asyncio.shield(self._join(key, factory))
+
+    def _join(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> asyncio.Future:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(factory(), context=detached_context())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        return task
+
+    def revalidate(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> None:
+        """Start (or join) a fetch for ``key`` without waiting for it.
+
+        Used for stale-while-revalidate: the caller serves its stale value and
+        the refreshed value lands in the cache when the fetch completes.
+        """
+        self._join(key, factory)
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception retrieved when every waiter has already gone.
+            task.exception()
+
+    def clear(self) -> None:
+        self._inflight.clear()
@@ -0,0 +1,206 @@
+"""Per-credential request budgets for quota-limited providers.
+
+data.go.kr and the KMA API hub limit each service key both per second and
+per day, and only say so by rejecting the request. Each credential therefore
+gets a token bucket (``rate_per_s`` refill, ``burst`` capacity) and a daily
+ledger that resets at midnight KST, when the gateways reset their counters.
+``acquire`` spends from the first candidate credential that has a token,
+waits briefly for the next refill when none has, and sheds the request with
+a typed ``QuotaExhausted`` reason rather than letting it reach the gateway.
+
+Gateway rejections still happen (other workers share the keys), so
+``throttle`` drains a bucket after a per-second rejection and ``exhaust``
+closes a credential for the rest of the day after a daily one. The ledger
+is per worker process. Credentials are keyed by a digest and reported by
+label only, so snapshots never contain a credential.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from request_deadline import remaining_s
+
+
+LOGGER = logging.getLogger(__name__)
+
+PROVIDER_QUOTA_MAX_WAIT_S = float(os.getenv("PROVIDER_QUOTA_MAX_WAIT_S", "1.0"))
+_QUOTA_DAY_TZ = timezone(timedelta(hours=9))
+
+
+def _quota_day() -> date:
+    return datetime.now(_QUOTA_DAY_TZ).date()
+
+
+class QuotaExhausted(Exception):
+    def __init__(self, provider: str, reason: str):
+        super().__init__(f"quota_exhausted:{provider}:{reason}")
+        self.provider = provider
+        self.reason = reason
+
+
+class CredentialBudget:
+    def __init__(
+        self,
+        provider: str,
+        label: str,
+        *,
+        rate_per_s: float,
+        burst: int,
+        daily_limit: int,
+        clock: Callable[[], float] = time.monotonic,
+        day: Callable[[], date] = _quota_day,
+    ) -> None:
+        self.provider = provider
+        self.label = label
+        self.rate_per_s = max(0.001, float(rate_per_s))
+        self.burst = max(1, int(burst))
+        # 0 disables the daily ledger for providers without a daily cap.
+        self.daily_limit = max(0, int(daily_limit))
+        self._clock = clock
+        self._day = day
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._ledger_day = day()
+        self._used_today = 0
+        self._exhausted = False
+        self.shed = 0
+        self.rejections = 0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate_per_s)
+        self._updated = now
+        today = self._day()
+        if today != self._ledger_day:
+            self._ledger_day = today
+            self._used_today = 0
+            self._exhausted = False
+
+    def _closed_for_today(self) -> bool:
+        return self._exhausted or (self.daily_limit > 0 and self._used_today >= self.daily_limit)
+
+    def wait_s(self) -> Optional[float]:
+        """Seconds until a token is available, or ``None`` once today's quota is spent."""
+        with self._lock:
+            self._refill()
+            if self._closed_for_today():
+                return None
+            return max(0.0, (1.0 - self._tokens) / self.rate_per_s)
+
+    def try_take(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self._closed_for_today() or self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            self._used_today += 1
+            return True
+
+    def throttle(self) -> None:
+        """The gateway rejected a request as over its per-second limit."""
+        with self._lock:
+            self._refill()
+            self._tokens = 0.0
+            self.rejections += 1
+
+    def exhaust(self) -> None:
+        """The gateway rejected a request as over its daily quota."""
+        with self._lock:
+            self._refill()
+            if not self._exhausted:
+                LOGGER.warning("provider_quota_exhausted provider=%s credential=%s", self.provider, self.label)
+            self._exhausted = True
+            self.rejections += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refill()
+            remaining_today = None
+            if self._exhausted:
+                remaining_today = 0
+            elif self.daily_limit:
+                remaining_today = max(0, self.daily_limit - self._used_today)
+            return {
+                "credential": self.label,
+                "rate_per_s": self.rate_per_s,
+                "burst": self.burst,
+                "tokens": round(self._tokens, 2),
+                "daily_limit": self.daily_limit or None,
+                "used_today": self._used_today,
+                "remaining_today": remaining_today,
+                "exhausted_today": self._closed_for_today(),
+                "shed": self.shed,
+                "gateway_rejections": self.rejections,
+            }
+
+
+class ProviderQuotaRegistry:
+    def __init__(self) -> None:
+        self._limits: Dict[str, Dict[str, Any]] = {}
+        self._budgets: Dict[Tuple[str, str], CredentialBudget] = {}
+        self._lock = threading.Lock()
+
+    def register(self, provider: str, *, rate_per_s: float, burst: int, daily_limit: int) -> None:
+        with self._lock:
+            self._limits[provider] = {"rate_per_s": rate_per_s, "burst": burst, "daily_limit": daily_limit}
+
+    def budget(self, provider: str, label: str, credential: str) -> CredentialBudget:
+        key = (provider, hashlib.sha256(credential.encode("utf-8")).hexdigest())
+        with self._lock:
+            budget = self._budgets.get(key)
+            if budget is None:
+                budget = CredentialBudget(provider, label, **self._limits[provider])
+                self._budgets[key] = budget
+            return budget
+
+    async def acquire(self, provider: str, credentials: Sequence[Tuple[str, str]]) -> int:
+        """Spend one request from the first ``(label, credential)`` with a token; returns its index.
+
+        Waits up to ``PROVIDER_QUOTA_MAX_WAIT_S`` (capped by the request
+        deadline) for a refill, then raises ``QuotaExhausted`` with
+        ``<provider>_rate_limited``, or ``<provider>_quota_exceeded`` when
+        every candidate has spent today's quota.
+        """
+        budgets = [self.budget(provider, label, credential) for label, credential in credentials]
+        waited_s = 0.0
+        while True:
+            for index, budget in enumerate(budgets):
+                if budget.try_take():
+                    return index
+            waits = [wait for wait in (budget.wait_s() for budget in budgets) if wait is not None]
+            if not waits:
+                reason = f"{provider}_quota_exceeded"
+                break
+            deadline_left = remaining_s()
+            wait_budget_s = PROVIDER_QUOTA_MAX_WAIT_S - waited_s
+            if deadline_left is not None:
+                wait_budget_s = min(wait_budget_s, deadline_left)
+            wait_s = max(min(waits), 0.001)
+            if wait_s > wait_budget_s:
+                reason = f"{provider}_rate_limited"
+                break
+            await asyncio.sleep(wait_s)
+            waited_s += wait_s
+        for budget in budgets:
+            budget.shed += 1
+        raise QuotaExhausted(provider, reason)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._budgets.clear()
+
+
+PROVIDER_QUOTAS = ProviderQuotaRegistry()
+
+
+def register_quota(provider: str, *, rate_per_s: float, burst: int, daily_limit: int) -> None:
+    PROVIDER_QUOTAS.register(provider, rate_per_s=rate_per_s, burst=burst, daily_limit=daily_limit)
@@ -0,0 +1,111 @@
+"""Background refresh loop that keeps provider caches warm.
+
+Jobs run once at startup, then on a wall-clock cadence aligned to the
+provider's publication cycle (``interval_s`` boundaries since the Unix epoch,
+plus ``offset_s`` for publication lag). Failures are recorded and retried on
+the next cycle; the foreground path never waits on this loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RefreshJob:
+    name: str
+    interval_s: float
+    run: Callable[[], Awaitable[Any]]
+    offset_s: float = 0.0
+
+    def next_delay_s(self, now: float) -> float:
+        interval_s = max(1.0, self.interval_s)
+        next_boundary = (((now - self.offset_s) // interval_s) + 1) * interval_s + self.offset_s
+        return max(0.0, next_boundary - now)
+
+
+class RefreshScheduler:
+    """Run registered refresh jobs as lifespan-scoped asyncio tasks."""
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._jobs: Dict[str, RefreshJob] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._status: Dict[str, Dict[str, Any]] = {}
+        self._clock = clock
+
+    def register(self, job: RefreshJob) -> RefreshJob:
+        self._jobs[job.name] = job
+        self._status[job.name] = {"runs": 0, "failures": 0, "last_run_at": None, "last_error": None}
+        return job
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks.values())
+
+    async def start(self) -> None:
+        for name, job in self._jobs.items():
+            task = self._tasks.get(name)
+            if task is None or task.done():
+                self._tasks[name] = asyncio.create_task(self._loop(job), name=f"refresh:{name}")
+
+    async def aclose(self) -> None:
+        tasks, self._tasks = self._tasks, {}
+        for task in tasks.values():
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    async def run_once(self, name: str) -> None:
+        job = self._jobs[name]
+        status = self._status[name]
+        try:
+            await job.run()
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            status["failures"] += 1
+            status["last_error"] = type(error).__name__
+            LOGGER.warning("provider_refresh_failure job=%s error=%s", name, type(error).__name__)
+        else:
+            status["last_error"] = None
+        status["runs"] += 1
+        status["last_run_at"] = self._clock()
+
+    async def _loop(self, job: RefreshJob) -> None:
+        while True:
+            await self.run_once(job.name)
+            await asyncio.sleep(job.next_delay_s(self._clock()))
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "job": name,
+                "interval_s": job.interval_s,
+                "running": name in self._tasks and not self._tasks[name].done(),
+                **self._status[name],
+            }
+            for name, job in sorted(self._jobs.items())
+        ]
+
+
+def parse_operating_areas(raw: Optional[str]) -> List[Dict[str, float]]:
+    """Parse ``"lat,lon;lat,lon"`` into coordinate dicts, skipping bad pairs."""
+    areas: List[Dict[str, float]] = []
+    for chunk in str(raw or "").split(";"):
+        parts = [part.strip() for part in chunk.split(",")]
+        if len(parts) != 2:
+            continue
+        try:
+            lat, lon = float(parts[0]), float(parts[1])
+        except ValueError:
+            continue
+        if -90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0:
+            areas.append({"lat": lat, "lon": lon})
+    return areas
@@ -0,0 +1,112 @@
+"""Request-scoped deadline shared by every upstream call of one API request.
+
+Each provider keeps its own timeout, but a request that fans out to several
+providers (or retries one) could otherwise run for the sum of them. The HTTP
+middleware opens a ``request_deadline`` for the endpoint's budget; upstream
+calls then cap their own timeout at whatever budget is left and fail with a
+``RequestDeadlineExceeded`` timeout once it is spent, which the existing
+timeout handlers turn into typed unavailable evidence.
+
+The deadline lives in a ``ContextVar``, so it follows the request into tasks
+and ``asyncio.to_thread`` workers. Work shared beyond one request (coalesced
+fetches, stale-while-revalidate refreshes) starts from ``detached_context``
+so it is not cut off by whichever request happened to start it; each waiter
+still bounds its own wait with ``deadline_wait_for``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+from typing import Any, Awaitable, Iterator, Optional, TypeVar
+
+
+T = TypeVar("T")
+REQUEST_DEADLINE_REASON = "request_deadline_exceeded"
+
+_REQUEST_DEADLINE: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+class RequestDeadlineExceeded(TimeoutError):
+    """Raised instead of starting an upstream call once the budget is spent.
+
+    Subclasses ``TimeoutError`` so ``asyncio.TimeoutError`` and
+    ``socket.timeout`` handlers treat it like any other upstream timeout.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(REQUEST_DEADLINE_REASON)
+
+
+@contextmanager
+def request_deadline(budget_s: Optional[float]) -> Iterator[Optional[float]]:
+    """Bound the enclosed work to ``budget_s`` seconds (``None`` leaves it unbounded).
+
+    A nested deadline can only tighten the enclosing one.
+    """
+    deadline = _REQUEST_DEADLINE.get()
+    if budget_s is not None:
+        candidate = time.monotonic() + max(0.0, float(budget_s))
+        deadline = candidate if deadline is None else min(deadline, candidate)
+    token = _REQUEST_DEADLINE.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _REQUEST_DEADLINE.reset(token)
+
+
+def detached_context() -> Context:
+    """A copy of the current context with no request deadline."""
+    context = copy_context()
+    context.run(_REQUEST_DEADLINE.set, None)
+    return context
+
+
+def remaining_s() -> Optional[float]:
+    """Seconds left in the current request budget, or ``None`` outside a request."""
+    deadline = _REQUEST_DEADLINE.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def within_deadline(timeout_s: float) -> float:
+    """Cap ``timeout_s`` at the remaining budget (possibly ``0.0``)."""
+    remaining = remaining_s()
+    if remaining is None:
+        return timeout_s
+    return min(timeout_s, remaining)
+
+
+def bounded_timeout(timeout_s: float) -> float:
+    """Like ``within_deadline`` but raises once no budget is left to spend."""
+    timeout = within_deadline(timeout_s)
+    if timeout <= 0.0:
+        raise RequestDeadlineExceeded()
+    return timeout
+
+
+async def deadline_wait_for(awaitable: Awaitable[T], timeout_s: float) -> T:
+    """``asyncio.wait_for`` with ``timeout_s`` capped at the request deadline."""
+    try:
+        timeout = bounded_timeout(timeout_s)
+    except RequestDeadlineExceeded:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise
+    return await asyncio.wait_for(awaitable, timeout=timeout)
+
+
+def cap_httpx_timeouts(timeouts: Any) -> Any:
+    """Cap an httpx ``request.extensions["timeout"]`` mapping at the remaining budget."""
+    remaining = remaining_s()
+    if remaining is None or not isinstance(timeouts, dict):
+        return timeouts
+    if remaining <= 0.0:
+        raise RequestDeadlineExceeded()
+    return {
+        name: remaining if value is None else min(float(value), remaining)
+        for name, value in timeouts.items()
+    }
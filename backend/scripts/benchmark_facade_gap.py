@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark measure_facade_gap on dense downtown building collections.
+
+Each collection is a street canyon: a target building on one side of an
+east-west road and up to 200 official footprints (simple boxes and detailed
+many-vertex rings) packed along both sides, like a downtown /api/canyon-width
+query. The pruned engine is timed against an exhaustive scan of every
+opposing building and segment pair, and both must select the same result.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from math import cos, pi, sin
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import urban_canyon  # noqa: E402
+from urban_canyon import measure_facade_gap  # noqa: E402
+
+
+ROAD_PATH = [[-600.0, 0.0], [600.0, 0.0]]
+
+
+def _ring(center_x: float, center_y: float, half_w: float, half_h: float, vertices: int) -> List[List[float]]:
+    if vertices <= 4:
+        ring = [
+            [center_x - half_w, center_y - half_h],
+            [center_x + half_w, center_y - half_h],
+            [center_x + half_w, center_y + half_h],
+            [center_x - half_w, center_y + half_h],
+        ]
+    else:
+        # Detailed footprint: an ellipse-like outline with many facade breaks.
+        ring = [
+            [center_x + half_w * cos(2 * pi * index / vertices), center_y + half_h * sin(2 * pi * index / vertices)]
+            for index in range(vertices)
+        ]
+    return ring + [ring[0]]
+
+
+def build_collection(rng: random.Random, features: int) -> Tuple[List[List[float]], List[Dict[str, Any]]]:
+    road_half_width = rng.uniform(10.0, 25.0)
+    target = _ring(0.0, -(road_half_width + 15.0), 14.0, 15.0, rng.choice([4, 24, 96]))
+    buildings = []
+    for index in range(features):
+        side = 1.0 if index % 2 else -1.0
+        depth_row = (index // 80) % 3
+        buildings.append(
+            {
+                "id": f"lt_c_spbd.{index}",
+                "name": f"building {index}",
+                "ring": _ring(
+                    rng.uniform(-500.0, 500.0),
+                    side * (road_half_width + 12.0 + depth_row * 35.0 + rng.uniform(0.0, 6.0)),
+                    rng.uniform(6.0, 15.0),
+                    rng.uniform(6.0, 12.0),
+                    rng.choice([4, 4, 6, 12, 48, 96]),
+                ),
+            }
+        )
+    return target, buildings
+
+
+def exhaustive_facade_gap(target_ring, road_path, buildings) -> Tuple[float, str] | None:
+    """Baseline: closest pair for every opposing building, no pruning."""
+    target_points = urban_canyon._points(target_ring)
+    road_segments = urban_canyon._segments(urban_canyon._points(road_path))
+    target_center = urban_canyon._centroid(target_points[:-1])
+    road_segment = urban_canyon._closest_road_segment(target_center, road_segments)
+    target_side = urban_canyon._signed_road_side(target_center, road_segment)
+    measurements = []
+    for building in buildings:
+        points = urban_canyon._points(building["ring"])
+        tie_break_key = urban_canyon._official_building_tie_break_key(building, points)
+        side = urban_canyon._signed_road_side(urban_canyon._centroid(points[:-1]), road_segment)
+        if tie_break_key is None or side == 0.0 or (side > 0.0) == (target_side > 0.0):
+            continue
+        gap_m, target_point, opposing_point = min(
+            (
+                urban_canyon._closest_segment_pair(*first, *second)
+                for first in urban_canyon._segments(target_points)
+                for second in urban_canyon._segments(points)
+            ),
+            key=lambda candidate: candidate[0],
+        )
+        verified, _alignment = urban_canyon._road_crossing_is_normal(target_point, opposing_point, road_segments)
+        if verified:
+            measurements.append((gap_m, *tie_break_key, building["id"]))
+    if not measurements:
+        return None
+    best = min(measurements, key=lambda measurement: measurement[:3])
+    return (round(best[0], 1), best[3])
+
+
+def _timed(function, *args) -> Tuple[Any, float]:
+    started = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - started) * 1000.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--collections", type=int, default=20)
+    parser.add_argument("--features", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    pruned_ms: List[float] = []
+    exhaustive_ms: List[float] = []
+    mismatches = []
+    for index in range(args.collections):
+        target, buildings = build_collection(rng, args.features)
+        measurement, elapsed_pruned = _timed(measure_facade_gap, target, ROAD_PATH, buildings)
+        expected, elapsed_exhaustive = _timed(exhaustive_facade_gap, target, ROAD_PATH, buildings)
+        pruned_ms.append(elapsed_pruned)
+        exhaustive_ms.append(elapsed_exhaustive)
+        actual = (measurement["facade_gap_m"], measurement["opposing_building_id"]) if measurement["available"] else None
+        if actual != expected:
+            mismatches.append({"collection": index, "pruned": actual, "exhaustive": expected})
+
+    pruned_ms.sort()
+    exhaustive_ms.sort()
+    print(json.dumps(
+        {
+            "collections": args.collections,
+            "features": args.features,
+            "kernel": "numpy" if urban_canyon._vectorized is not None else "python",
+            "pruned_ms_p50": round(pruned_ms[len(pruned_ms) // 2], 2),
+            "pruned_ms_max": round(pruned_ms[-1], 2),
+            "exhaustive_ms_p50": round(exhaustive_ms[len(exhaustive_ms) // 2], 2),
+            "exhaustive_ms_max": round(exhaustive_ms[-1], 2),
+            "speedup_p50": round(exhaustive_ms[len(exhaustive_ms) // 2] / max(pruned_ms[len(pruned_ms) // 2], 1e-9), 1),
+            "mismatches": mismatches,
+        },
+        indent=2,
+    ))
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """
-Seed the runtime footprint cache with practical operating locations.
+Seed the footprint cache with practical operating locations.
+
+Seeds are merged into the tracked backend/static/footprint_cache.json, so they
+ship with the repository; commit the updated file. Each worker merges a new
+version of that file into its footprint store on its next start.
 
 Harness principle:
 - keep VWorld as primary source
@@ -21,7 +25,7 @@ BACKEND_DIR = Path(__file__).resolve().parents[1]
 if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
-from building_footprint import cache_building_footprint, _lookup_osm_fallback_sync  # noqa: E402
+from building_footprint import _lookup_osm_fallback, write_footprint_seed  # noqa: E402
 
 
 SEED_TARGETS_PATH = Path(__file__).with_name("seed_targets.json")
@@ -66,11 +70,11 @@ def lookup_with_radius(point: Dict[str, Any]) -> Dict[str, Any] | None:
     ]
 
     for candidate in candidates:
-        result = _lookup_osm_fallback_sync(
+        result = asyncio.run(_lookup_osm_fallback(
             float(candidate["lat"]),
             float(candidate["lon"]),
             radius_m=float(point.get("radius_m", 60)),
-        )
+        ))
         if result and result.get("available"):
             return {
                 "result": result,
@@ -98,7 +102,7 @@ def main() -> int:
         if not properties.get("name"):
             properties["name"] = lookup["seed_label"]
 
-        cache_building_footprint(
+        write_footprint_seed(
             lookup["seed_lat"],
             lookup["seed_lon"],
             result.get("geometry") or [],
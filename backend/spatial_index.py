@@ -0,0 +1,106 @@
+"""Uniform lon/lat grid index for bounding-box candidate lookup.
+
+Items are registered in every grid cell their bounding box overlaps, so a
+query only visits the cells around the requested box instead of scanning
+every item. Items whose box would span more than ``max_cells_per_item``
+cells (bad data, continental extents) are kept aside and returned by every
+query rather than flooding the grid.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, Generic, Hashable, Iterator, List, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T")
+BBox = Tuple[float, float, float, float]  # (min_lon, min_lat, max_lon, max_lat)
+
+
+def point_bbox(lon: float, lat: float, radius_deg: float = 0.0) -> BBox:
+    return (lon - radius_deg, lat - radius_deg, lon + radius_deg, lat + radius_deg)
+
+
+def ring_bbox(ring) -> BBox:
+    lons = [float(point[0]) for point in ring]
+    lats = [float(point[1]) for point in ring]
+    return (min(lons), min(lats), max(lons), max(lats))
+
+
+def bboxes_intersect(first: BBox, second: BBox) -> bool:
+    return not (first[2] < second[0] or second[2] < first[0] or first[3] < second[1] or second[3] < first[1])
+
+
+class GridIndex(Generic[T]):
+    def __init__(self, cell_deg: float, *, max_cells_per_item: int = 64) -> None:
+        self.cell_deg = float(cell_deg)
+        self.max_cells_per_item = max(1, int(max_cells_per_item))
+        self._cells: Dict[Tuple[int, int], List[Tuple[int, T]]] = {}
+        self._oversized: List[Tuple[int, T]] = []
+        self._placements: Dict[Hashable, Tuple[int, Optional[List[Tuple[int, int]]]]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _cell_range(self, bbox: BBox) -> Tuple[int, int, int, int]:
+        return (
+            math.floor(bbox[0] / self.cell_deg),
+            math.floor(bbox[1] / self.cell_deg),
+            math.floor(bbox[2] / self.cell_deg),
+            math.floor(bbox[3] / self.cell_deg),
+        )
+
+    def _cells_in(self, bbox: BBox) -> Iterator[Tuple[int, int]]:
+        min_x, min_y, max_x, max_y = self._cell_range(bbox)
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                yield (x, y)
+
+    def insert(self, item: T, bbox: BBox, key: Optional[Hashable] = None) -> None:
+        """Add ``item``; re-inserting an existing ``key`` replaces it in place.
+
+        A replaced item keeps its original position in query order.
+        """
+        placement = self._placements.pop(key, None) if key is not None else None
+        if placement is not None:
+            ordinal = placement[0]
+            self._remove(ordinal, placement[1])
+        else:
+            ordinal = self._count
+            self._count += 1
+        min_x, min_y, max_x, max_y = self._cell_range(bbox)
+        cells: Optional[List[Tuple[int, int]]] = None
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > self.max_cells_per_item:
+            self._oversized.append((ordinal, item))
+        else:
+            cells = list(self._cells_in(bbox))
+            for cell in cells:
+                self._cells.setdefault(cell, []).append((ordinal, item))
+        if key is not None:
+            self._placements[key] = (ordinal, cells)
+
+    def _remove(self, ordinal: int, cells: Optional[List[Tuple[int, int]]]) -> None:
+        if cells is None:
+            self._oversized = [placed for placed in self._oversized if placed[0] != ordinal]
+            return
+        for cell in cells:
+            remaining = [placed for placed in self._cells.get(cell, ()) if placed[0] != ordinal]
+            if remaining:
+                self._cells[cell] = remaining
+            else:
+                self._cells.pop(cell, None)
+
+    def query(self, bbox: BBox) -> List[T]:
+        """Items whose cells overlap ``bbox``, in insertion order.
+
+        This is a superset filter: callers still apply their exact distance
+        or containment test to the returned candidates.
+        """
+        found: Dict[int, T] = {}
+        for cell in self._cells_in(bbox):
+            for ordinal, item in self._cells.get(cell, ()):
+                found[ordinal] = item
+        for ordinal, item in self._oversized:
+            found[ordinal] = item
+        return [found[ordinal] for ordinal in sorted(found)]
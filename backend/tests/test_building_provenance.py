@@ -14,6 +14,9 @@ import building_height  # noqa: E402
 
 
 class BuildingFootprintProvenanceTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        building_footprint.BUILDING_TILE_CACHE.clear()
+
     async def test_frontend_seeded_vworld_cache_stays_unverified(self) -> None:
         cache_entry = {
             "center": {"lat": 37.5665, "lon": 126.9780},
@@ -31,7 +34,7 @@ class BuildingFootprintProvenanceTests(unittest.IsolatedAsyncioTestCase):
         with (
             patch.dict(building_footprint.os.environ, {}, clear=True),
             patch.object(building_footprint, "_load_footprint_cache", return_value=[cache_entry]),
-            patch.object(building_footprint, "_lookup_osm_fallback_sync", return_value=None),
+            patch.object(building_footprint, "_lookup_osm_fallback", return_value=None),
             patch.object(building_footprint, "_resolve_vworld_api_key", return_value=None),
         ):
             result = await building_footprint.lookup_building_footprint(37.5665, 126.9780)
@@ -64,7 +67,7 @@ class BuildingFootprintProvenanceTests(unittest.IsolatedAsyncioTestCase):
         with (
             patch.dict(building_footprint.os.environ, {}, clear=True),
             patch.object(building_footprint, "_load_footprint_cache", return_value=[cache_entry]),
-            patch.object(building_footprint, "_lookup_osm_fallback_sync", return_value=None),
+            patch.object(building_footprint, "_lookup_osm_fallback", return_value=None),
             patch.object(building_footprint, "_resolve_vworld_api_key", return_value=None),
         ):
             result = await building_footprint.lookup_building_footprint(37.5665, 126.9780)
@@ -94,7 +97,7 @@ class BuildingFootprintProvenanceTests(unittest.IsolatedAsyncioTestCase):
         with (
             patch.dict(building_footprint.os.environ, {}, clear=True),
             patch.object(building_footprint, "_load_footprint_cache", return_value=[cache_entry]),
-            patch.object(building_footprint, "_lookup_osm_fallback_sync", return_value=None),
+            patch.object(building_footprint, "_lookup_osm_fallback", return_value=None),
             patch.object(building_footprint, "_resolve_vworld_api_key", return_value=None),
         ):
             result = await building_footprint.lookup_building_footprint(37.5664, 126.9782)
@@ -146,11 +149,11 @@ class BuildingFootprintProvenanceTests(unittest.IsolatedAsyncioTestCase):
 
         with (
             patch.object(building_footprint, "_load_footprint_cache", return_value=[cache_entry]),
-            patch.object(building_footprint, "_lookup_osm_fallback_sync", return_value=None) as osm_lookup,
+            patch.object(building_footprint, "_lookup_osm_fallback", return_value=None) as osm_lookup,
             patch.object(building_footprint, "_resolve_vworld_api_key", return_value="test-key"),
             patch.object(
                 building_footprint,
-                "_fetch_text_with_retries_sync",
+                "_fetch_text_with_retries",
                 return_value=json.dumps(feature_payload),
             ),
             patch.object(building_footprint, "_store_footprint_cache_entry", return_value={}),
@@ -181,7 +184,7 @@ class BuildingFootprintProvenanceTests(unittest.IsolatedAsyncioTestCase):
         with (
             patch.dict(building_footprint.os.environ, {}, clear=True),
             patch.object(building_footprint, "_load_footprint_cache", return_value=[]),
-            patch.object(building_footprint, "_lookup_osm_fallback_sync", return_value=mock_osm),
+            patch.object(building_footprint, "_lookup_osm_fallback", return_value=mock_osm),
             patch.object(building_footprint, "_resolve_vworld_api_key", return_value=None),
         ):
             result = await building_footprint.lookup_building_footprint(37.5665, 126.9780)
@@ -0,0 +1,183 @@
+import asyncio
+from pathlib import Path
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import building_footprint  # noqa: E402
+import main  # noqa: E402
+from mercator_tiles import tiles_for_bbox  # noqa: E402
+from request_deadline import request_deadline  # noqa: E402
+from spatial_index import bboxes_intersect, ring_bbox  # noqa: E402
+
+
+CLICK = (37.5663, 126.9780)
+
+
+def _building(feature_id, lon, lat, half_m=8.0):
+    x, y = building_footprint._lonlat_to_web_mercator(lon, lat)
+    ring = [[x - half_m, y - half_m], [x + half_m, y - half_m], [x + half_m, y + half_m], [x - half_m, y + half_m], [x - half_m, y - half_m]]
+    return {
+        "id": f"lt_c_spbd.{feature_id}",
+        "properties": {"bd_mgt_sn": feature_id, "buld_nm": f"building {feature_id}"},
+        "geometry": {"type": "Polygon", "coordinates": [ring]},
+    }
+
+
+class FakeWfs:
+    """Answers GetFeature like VWorld: features whose box meets the BBOX, up to MAXFEATURES."""
+
+    def __init__(self, features, fail=False, delay_s=0.0):
+        self.features = features
+        self.fail = fail
+        self.delay_s = delay_s
+        self.bboxes = []
+
+    async def __call__(self, api_key, type_name, bbox, max_features):
+        self.bboxes.append(bbox)
+        await asyncio.sleep(self.delay_s)
+        if self.fail:
+            raise RuntimeError("official_building_collection_request_failed")
+        query = tuple(float(value) for value in bbox.split(","))
+        matching = [
+            feature for feature in self.features
+            if bboxes_intersect(ring_bbox(feature["geometry"]["coordinates"][0]), query)
+        ]
+        return {"type": "FeatureCollection", "features": matching[:max_features]}, "vworld_map_wfs"
+
+
+class BuildingTileCacheTests(unittest.TestCase):
+    def setUp(self):
+        building_footprint.BUILDING_TILE_CACHE.clear()
+        patcher = patch.object(building_footprint, "_resolve_vworld_api_key", return_value="server-only-key")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(building_footprint.BUILDING_TILE_CACHE.clear)
+
+    def _lookup(self, wfs, *queries, budget_s=None):
+        async def run():
+            with (
+                patch.object(building_footprint, "_fetch_official_building_collection_payload", new=wfs),
+                request_deadline(budget_s),
+            ):
+                return await asyncio.gather(*(
+                    building_footprint.lookup_official_building_collection(lat, lon, radius_m=radius_m)
+                    for lat, lon, radius_m in queries
+                ))
+
+        return asyncio.run(run())
+
+    def test_footprint_and_canyon_radii_share_one_fetch_per_tile(self):
+        wfs = FakeWfs([_building("near", 126.9780, 37.5663), _building("block", 126.9795, 37.5663)])
+        tiles = tiles_for_bbox(
+            building_footprint._mercator_bbox(CLICK[0], CLICK[1], 180.0),
+            building_footprint.VWORLD_BUILDING_TILE_ZOOM,
+        )
+
+        footprint, canyon = self._lookup(wfs, (*CLICK, 40.0), (*CLICK, 180.0))
+
+        self.assertEqual(len(wfs.bboxes), len(tiles))
+        self.assertEqual([feature["id"] for feature in footprint["features"]], ["near"])
+        self.assertEqual(sorted(feature["id"] for feature in canyon["features"]), ["block", "near"])
+        self.assertTrue(all(120.0 < point[0] < 130.0 for point in canyon["features"][0]["ring"]))
+
+    def test_features_carry_the_projected_ring_the_canyon_engine_measures(self):
+        wfs = FakeWfs([_building("near", 126.9780, 37.5663), _building("block", 126.9795, 37.5663)])
+
+        first, again = self._lookup(wfs, (*CLICK, 180.0), (*CLICK, 180.0))
+
+        for feature in first["features"]:
+            self.assertEqual([list(point) for point in feature["mercator_ring"]], main._project_lonlat_ring(feature["ring"]))
+        # Projected once per cached tile, not per lookup.
+        self.assertIs(first["features"][0]["mercator_ring"], again["features"][0]["mercator_ring"])
+
+    def test_neighbouring_click_is_served_from_warm_tiles(self):
+        wfs = FakeWfs([_building("near", 126.9780, 37.5663)])
+        self._lookup(wfs, (*CLICK, 40.0))
+        fetched = len(wfs.bboxes)
+
+        (again,) = self._lookup(wfs, (CLICK[0] + 0.0001, CLICK[1] + 0.0001, 40.0))
+
+        self.assertEqual(len(wfs.bboxes), fetched)
+        self.assertEqual([feature["id"] for feature in again["features"]], ["near"])
+
+    def test_tile_cut_short_by_max_features_is_refetched_as_children(self):
+        wfs = FakeWfs([_building(f"b{index}", 126.9780 + (index - 2) * 0.0006, 37.5663) for index in range(5)])
+
+        with (
+            patch.object(building_footprint, "VWORLD_BUILDING_TILE_MAX_FEATURES", 3),
+            patch.object(building_footprint, "VWORLD_BUILDING_TILE_MAX_ZOOM", building_footprint.VWORLD_BUILDING_TILE_ZOOM + 2),
+        ):
+            (collection,) = self._lookup(wfs, (*CLICK, 180.0))
+
+        self.assertEqual(sorted(feature["id"] for feature in collection["features"]), [f"b{index}" for index in range(5)])
+        self.assertGreater(len(wfs.bboxes), 4)
+
+    def test_tile_still_cut_short_at_max_zoom_marks_the_collection_truncated(self):
+        wfs = FakeWfs([_building(f"b{index}", 126.9780 + index * 0.00003, 37.5663, half_m=1.0) for index in range(5)])
+
+        with (
+            patch.object(building_footprint, "VWORLD_BUILDING_TILE_MAX_FEATURES", 3),
+            patch.object(building_footprint, "VWORLD_BUILDING_TILE_MAX_ZOOM", building_footprint.VWORLD_BUILDING_TILE_ZOOM),
+        ):
+            (dense,) = self._lookup(wfs, (*CLICK, 40.0))
+        building_footprint.BUILDING_TILE_CACHE.clear()
+        (complete,) = self._lookup(FakeWfs([_building("near", 126.9780, 37.5663)]), (*CLICK, 40.0))
+
+        self.assertTrue(dense["truncated"])
+        self.assertFalse(complete["truncated"])
+
+    def test_click_missed_by_a_truncated_collection_falls_back_instead_of_reporting_no_building(self):
+        truncated = {
+            "available": True,
+            "official_available": True,
+            "features": [{"id": "elsewhere", "ring": [[127.0, 37.6], [127.001, 37.6], [127.001, 37.601], [127.0, 37.6]]}],
+            "source_chain": ["vworld_wfs"],
+            "truncated": True,
+        }
+        fallback = {"available": True, "source": "osm_fallback", "geometry": [[126.978, 37.5663]] * 4}
+
+        async def lookup():
+            with (
+                patch.object(building_footprint, "_match_cached_footprint", return_value=None),
+                patch.object(building_footprint, "lookup_official_building_collection", return_value=truncated),
+                patch.object(building_footprint, "_lookup_osm_fallback", return_value=fallback),
+                patch.object(building_footprint, "_store_footprint_cache_entry"),
+            ):
+                return await building_footprint.lookup_building_footprint(*CLICK)
+
+        result = asyncio.run(lookup())
+
+        self.assertEqual(result["source"], "osm_fallback")
+        self.assertNotEqual(result.get("reason"), "no_official_building_at_click")
+
+    def test_a_cold_tile_cannot_outlive_the_request_budget(self):
+        wfs = FakeWfs([_building("near", 126.9780, 37.5663)], delay_s=2.0)
+        started = time.monotonic()
+
+        (collection,) = self._lookup(wfs, (*CLICK, 40.0), budget_s=0.3)
+
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertFalse(collection["official_available"])
+        self.assertEqual(collection["reason"], "official_building_footprint_timeout")
+
+    def test_failed_refresh_serves_the_stale_tile(self):
+        self._lookup(FakeWfs([_building("near", 126.9780, 37.5663)]), (*CLICK, 40.0))
+        for key in building_footprint.BUILDING_TILE_CACHE:
+            building_footprint.BUILDING_TILE_CACHE[key]["ts"] = time.time() - building_footprint.VWORLD_BUILDING_TILE_TTL_S - 1
+
+        failing = FakeWfs([], fail=True)
+        (collection,) = self._lookup(failing, (*CLICK, 40.0))
+
+        self.assertTrue(failing.bboxes)
+        self.assertEqual([feature["id"] for feature in collection["features"]], ["near"])
+
+
+if __name__ == "__main__":
+    unittest.main()
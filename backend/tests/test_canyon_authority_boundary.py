@@ -158,7 +158,7 @@ class CanyonAuthorityBoundaryTests(unittest.TestCase):
             official_canyon(SELECTION_ID, SELECTION_ID)
         )
         with stack:
-            response = asyncio.run(main.evaluate_flight(request))
+            response = asyncio.run(main.evaluate_flight(request, main.Response()))
 
         canyon_fetch.assert_awaited_once_with(
             37.5662952,
@@ -1,15 +1,64 @@
+import json
+from math import cos, pi, sin
 from pathlib import Path
+import random
+import shutil
+import subprocess
 import sys
 import unittest
+from unittest.mock import patch
 
 
 BACKEND_ROOT = Path(__file__).resolve().parents[1]
+BRIDGE_GEOMETRY = BACKEND_ROOT.parent / "cloudflare" / "official-gis-bridge" / "src" / "geometry.mjs"
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
+import urban_canyon  # noqa: E402
 from urban_canyon import measure_facade_gap  # noqa: E402
 
 
+def _exhaustive_facade_gap(target_ring, road_path, buildings):
+    """Reference: every opposing building, every segment pair, no pruning."""
+    target_points = urban_canyon._points(target_ring)
+    road_segments = urban_canyon._segments(urban_canyon._points(road_path))
+    closed = target_points[:-1] if target_points[0] == target_points[-1] else target_points
+    road_segment = urban_canyon._closest_road_segment(urban_canyon._centroid(closed), road_segments)
+    target_side = urban_canyon._signed_road_side(urban_canyon._centroid(closed), road_segment)
+    measurements = []
+    for building in buildings:
+        points = urban_canyon._points(building["ring"])
+        tie_break_key = urban_canyon._official_building_tie_break_key(building, points)
+        if len(points) < 4 or tie_break_key is None:
+            continue
+        side = urban_canyon._signed_road_side(urban_canyon._centroid(points[:-1]), road_segment)
+        if side == 0.0 or (side > 0.0) == (target_side > 0.0):
+            continue
+        gap_m, target_point, opposing_point = min(
+            (
+                urban_canyon._closest_segment_pair(first_start, first_end, second_start, second_end)
+                for first_start, first_end in urban_canyon._segments(target_points)
+                for second_start, second_end in urban_canyon._segments(points)
+            ),
+            key=lambda candidate: candidate[0],
+        )
+        verified, _alignment = urban_canyon._road_crossing_is_normal(target_point, opposing_point, road_segments)
+        if verified:
+            measurements.append((gap_m, *tie_break_key, building["id"], target_point, opposing_point))
+    if not measurements:
+        return None
+    best = min(measurements, key=lambda measurement: measurement[:3])
+    return (round(best[0], 1), best[3], [round(value, 3) for value in best[4]], [round(value, 3) for value in best[5]])
+
+
+def _polygon(center_x, center_y, radius_m, vertices, phase=0.0):
+    ring = [
+        [center_x + radius_m * cos(phase + 2 * pi * index / vertices), center_y + radius_m * sin(phase + 2 * pi * index / vertices)]
+        for index in range(vertices)
+    ]
+    return ring + [ring[0]]
+
+
 class UrbanCanyonGeometryTests(unittest.TestCase):
     def test_measurement_uses_opposing_building_facades_not_official_road_inventory_width(self):
         target_ring = [[0.0, -42.0], [20.0, -42.0], [20.0, -12.0], [0.0, -12.0], [0.0, -42.0]]
@@ -70,5 +119,166 @@ class UrbanCanyonGeometryTests(unittest.TestCase):
         self.assertEqual(forward["opposing_point"], reversed_order["opposing_point"])
 
 
+class FacadeGapPruningParityTests(unittest.TestCase):
+    def test_pruned_search_matches_exhaustive_search_on_dense_blocks(self):
+        rng = random.Random(20261017)
+        road_path = [[-400.0, 0.0], [400.0, 0.0]]
+        for _trial in range(12):
+            target_ring = _polygon(rng.uniform(-20, 20), -rng.uniform(20, 40), rng.uniform(8, 15), rng.choice([4, 12, 80]))
+            buildings = []
+            for index in range(rng.randint(20, 120)):
+                side = rng.choice([-1.0, 1.0])
+                buildings.append(
+                    {
+                        "id": f"building-{index}",
+                        "ring": _polygon(
+                            rng.uniform(-300, 300),
+                            side * rng.uniform(18, 300),
+                            rng.uniform(4, 16),
+                            rng.choice([4, 5, 8, 64]),
+                            rng.uniform(0, pi),
+                        ),
+                    }
+                )
+            winner = _exhaustive_facade_gap(target_ring, road_path, buildings)
+            if winner is not None:
+                # Exact ties with the winner: the same footprint under an id
+                # that sorts first, twice, once with reversed winding.
+                ring = next(building["ring"] for building in buildings if building["id"] == winner[1])
+                buildings.append({"id": "a-tie", "ring": list(ring)})
+                buildings.append({"id": "a-tie", "ring": list(reversed(ring))})
+            rng.shuffle(buildings)
+
+            measurement = measure_facade_gap(target_ring, road_path, buildings)
+            expected = _exhaustive_facade_gap(target_ring, road_path, buildings)
+
+            if expected is None:
+                self.assertFalse(measurement["available"])
+                continue
+            self.assertEqual(expected[1], "a-tie")
+            self.assertEqual(
+                (
+                    measurement["facade_gap_m"],
+                    measurement["opposing_building_id"],
+                    measurement["target_point"],
+                    measurement["opposing_point"],
+                ),
+                expected,
+            )
+
+    def test_large_rings_use_a_segment_index_without_changing_the_closest_pair(self):
+        target = urban_canyon._IndexedRing(urban_canyon._points(_polygon(0.0, -30.0, 12.0, 200)))
+        opposing_points = urban_canyon._points(_polygon(3.0, 30.0, 12.0, 180, 0.1))
+
+        self.assertIsNotNone(target.index)
+        pruned = urban_canyon._closest_rings(target, urban_canyon._IndexedRing(opposing_points))
+        exhaustive = min(
+            (
+                urban_canyon._closest_segment_pair(*first, *second)
+                for first in target.segments
+                for second in urban_canyon._segments(opposing_points)
+            ),
+            key=lambda candidate: candidate[0],
+        )
+        self.assertEqual(pruned, exhaustive)
+        self.assertIsNone(urban_canyon._closest_rings(target, urban_canyon._IndexedRing(opposing_points), exhaustive[0] / 2))
+
+
+def _random_canyons(seed, count):
+    rng = random.Random(seed)
+    for _case in range(count):
+        road_path = [[-400.0, rng.uniform(-3, 3)], [0.0, rng.uniform(-3, 3)], [400.0, rng.uniform(-3, 3)]]
+        target_ring = _polygon(rng.uniform(-20, 20), -rng.uniform(25, 40), rng.uniform(8, 15), rng.choice([4, 40, 96]))
+        buildings = [
+            {
+                "id": f"building-{index}",
+                "name": f"building {index}",
+                "ring": _polygon(
+                    rng.uniform(-200, 200),
+                    rng.choice([-1.0, 1.0]) * rng.uniform(18, 200),
+                    rng.uniform(4, 16),
+                    rng.choice([4, 5, 40, 64]),
+                    rng.uniform(0, pi),
+                ),
+            }
+            for index in range(rng.randint(10, 60))
+        ]
+        yield target_ring, road_path, buildings
+
+
+@unittest.skipIf(urban_canyon._vectorized is None, "NumPy is not installed")
+class FacadeGapNumpyKernelParityTests(unittest.TestCase):
+    def test_numpy_kernel_matches_the_python_geometry(self):
+        for target_ring, road_path, buildings in _random_canyons(19, 15):
+            with (
+                patch.object(urban_canyon, "_VECTORIZED_MIN_PAIRS", 1),
+                patch.object(urban_canyon, "_VECTORIZED_MIN_ROAD_SEGMENTS", 1),
+            ):
+                vectorized = measure_facade_gap(target_ring, road_path, buildings)
+            with patch.object(urban_canyon, "_vectorized", None):
+                scalar = measure_facade_gap(target_ring, road_path, buildings)
+
+            self.assertEqual(vectorized, scalar)
+
+    def test_segment_pair_kernel_matches_scalar_pairs_including_touching_and_degenerate_segments(self):
+        rng = random.Random(5)
+        kernel = urban_canyon._vectorized
+        for _case in range(40):
+            first = [(float(rng.randint(-5, 5)), float(rng.randint(-5, 5))) for _point in range(rng.randint(2, 12))]
+            second = [(float(rng.randint(-5, 5)), float(rng.randint(-5, 5))) for _point in range(rng.randint(2, 12))]
+            second.insert(1, second[0])  # a zero-length segment
+
+            closest = kernel.closest_segment_pair(kernel.segment_arrays(first), kernel.segment_arrays(second))
+            expected = min(
+                (
+                    (*urban_canyon._closest_segment_pair(*first_segment, *second_segment), first_position, second_position)
+                    for first_position, first_segment in enumerate(urban_canyon._segments(first))
+                    for second_position, second_segment in enumerate(urban_canyon._segments(second))
+                ),
+                key=lambda candidate: (candidate[0], candidate[3], candidate[4]),
+            )
+
+            self.assertEqual(closest, expected)
+
+
+@unittest.skipIf(shutil.which("node") is None, "node is not installed")
+class FacadeGapBridgeParityTests(unittest.TestCase):
+    def test_python_geometry_matches_the_official_gis_bridge(self):
+        cases = [
+            {"targetRing": target_ring, "roadPath": road_path, "buildings": buildings}
+            for target_ring, road_path, buildings in _random_canyons(23, 15)
+        ]
+        script = (
+            f"import {{ measureFacadeGap }} from {json.dumps(BRIDGE_GEOMETRY.as_uri())};\n"
+            "let input = '';\n"
+            "for await (const chunk of process.stdin) input += chunk;\n"
+            "process.stdout.write(JSON.stringify(JSON.parse(input).map(measureFacadeGap)));\n"
+        )
+        completed = subprocess.run(
+            ["node", "--input-type=module", "-e", script],
+            input=json.dumps(cases),
+            capture_output=True,
+            text=True,
+            timeout=60,
+            check=True,
+        )
+        bridge_results = json.loads(completed.stdout)
+
+        for case, bridge in zip(cases, bridge_results):
+            measurement = measure_facade_gap(case["targetRing"], case["roadPath"], case["buildings"])
+            self.assertEqual(
+                {
+                    "available": measurement["available"],
+                    "facadeGapM": measurement["facade_gap_m"],
+                    "opposingBuildingId": measurement["opposing_building_id"],
+                    "normalAlignment": measurement["normal_alignment"],
+                    "targetPoint": measurement["target_point"],
+                    "opposingPoint": measurement["opposing_point"],
+                    "reason": measurement["reason"],
+                },
+                {key: bridge[key] for key in ("available", "facadeGapM", "opposingBuildingId", "normalAlignment", "targetPoint", "opposingPoint", "reason")},
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
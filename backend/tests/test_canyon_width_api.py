@@ -1,6 +1,7 @@
 import asyncio
 from pathlib import Path
 import sys
+import time
 import unittest
 from unittest.mock import AsyncMock, patch
 from uuid import UUID
@@ -108,6 +109,8 @@ class CanyonWidthRouteTests(unittest.TestCase):
     def setUp(self):
         self.client = TestClient(main.app)
         main.CANYON_EVIDENCE_CACHE.clear()
+        main.ROAD_TILE_CACHE.clear()
+        main.CIRCUIT_BREAKERS.reset()
         self.target_ring = _lonlat_ring(
             [[0.0, -42.0], [20.0, -42.0], [20.0, -12.0], [0.0, -12.0], [0.0, -42.0]]
         )
@@ -217,6 +220,37 @@ class CanyonWidthRouteTests(unittest.TestCase):
         for receipt_id in payload["receipt"]["receipt_ids"].values():
             UUID(receipt_id)
 
+    def test_route_measures_carried_mercator_rings_with_identical_receipts(self):
+        features = [
+            {"id": "target", "name": "대상건물", "ring": self.target_ring},
+            {"id": "opposite-side", "name": "맞은편", "ring": self.opposing_ring},
+        ]
+        payloads = []
+        for carried in (False, True):
+            main.CANYON_EVIDENCE_CACHE.clear()
+            collection = {
+                "available": True,
+                "official_available": True,
+                "source_chain": ["vworld_wfs"],
+                "features": [
+                    {**feature, "mercator_ring": tuple(tuple(point) for point in main._project_lonlat_ring(feature["ring"]))}
+                    if carried else feature
+                    for feature in features
+                ],
+            }
+            with (
+                patch.object(main, "fetch_road_width_evidence", AsyncMock(return_value=self.road)),
+                patch.object(main, "lookup_official_building_collection", AsyncMock(return_value=collection)),
+                patch.object(main, "_project_lonlat_ring", wraps=main._project_lonlat_ring) as project,
+            ):
+                payloads.append(self.client.get("/api/canyon-width", params=self._params()).json())
+            if carried:
+                project.assert_not_called()
+
+        self.assertTrue(payloads[1]["available"])
+        self.assertEqual(payloads[1]["facade_gap_m"], payloads[0]["facade_gap_m"])
+        self.assertEqual(payloads[1]["receipt"]["receipt_ids"], payloads[0]["receipt"]["receipt_ids"])
+
     def test_route_uses_only_a_fully_receipted_official_gis_bridge_result(self):
         bridge_result = {
             "available": True,
@@ -767,6 +801,25 @@ class CanyonWidthRouteTests(unittest.TestCase):
         self.assertEqual(payload["reason"], "official_building_collection_not_matched")
         self.assertNotEqual(payload["facade_gap_m"], 49.7)
 
+    def test_truncated_building_collection_is_not_measured(self):
+        truncated_collection = {
+            "available": True,
+            "official_available": True,
+            "source_chain": ["vworld_wfs"],
+            "features": [{"id": "target", "name": "대상건물", "ring": self.target_ring}],
+            "truncated": True,
+        }
+        with (
+            patch.object(main, "fetch_road_width_evidence", AsyncMock(return_value=self.road)),
+            patch.object(main, "lookup_official_building_collection", AsyncMock(return_value=truncated_collection)),
+        ):
+            response = self.client.get("/api/canyon-width", params=self._params())
+
+        payload = response.json()
+        self._assert_unavailable_receipt_bound_to_selection(payload)
+        self.assertEqual(payload["reason"], "official_building_collection_truncated")
+        self.assertIsNone(payload["facade_gap_m"])
+
     def test_route_caches_only_the_verified_official_facade_gap(self):
         collection = {
             "available": True,
@@ -789,9 +842,179 @@ class CanyonWidthRouteTests(unittest.TestCase):
 
         self.assertTrue(first.json()["official_available"])
         self.assertEqual(second.json()["facade_gap_m"], 27.0)
-        self.assertEqual(road_lookup.await_count, 1)
+        # The repeat click only resolves its road (from cached road tiles).
+        self.assertEqual(road_lookup.await_count, 2)
         self.assertEqual(building_lookup.await_count, 1)
 
+    def test_clicks_on_one_building_resolving_different_roads_are_measured_per_road(self):
+        collection = {
+            "available": True,
+            "official_available": True,
+            "source_chain": ["vworld_wfs"],
+            "features": [
+                {"id": "target", "name": "대상건물", "ring": self.target_ring},
+                {"id": "opposite-side", "name": "맞은편", "ring": self.opposing_ring},
+            ],
+        }
+        side_road = {**self.road, "road_name": "세종대로 측도", "geometry_paths": [[[-40.0, 2.0], [80.0, 2.0]]]}
+        other_lon, other_lat = main._mercator_to_lonlat(12.0, -25.0)
+        identifier = {"kind": "native_feature_id", "value": "target"}
+
+        async def nearest_road(lat, lon, road_name=None):
+            return side_road if (lat, lon) == (other_lat, other_lon) else self.road
+
+        building_lookup = AsyncMock(return_value=collection)
+
+        def fetch(lat, lon, selection_id):
+            return asyncio.run(main.fetch_canyon_width_evidence(lat, lon, selection_id=selection_id, target_identifier=identifier))
+
+        with (
+            patch.object(main, "fetch_road_width_evidence", AsyncMock(side_effect=nearest_road)),
+            patch.object(main, "lookup_official_building_collection", building_lookup),
+        ):
+            first = fetch(self.target_lat, self.target_lon, self.selection_id)
+            second = fetch(other_lat, other_lon, "4f1c2b7e-8a35-4d0e-9b6a-2c7d1e5f9a10")
+            again = fetch(self.target_lat, self.target_lon, self.selection_id)
+
+        self.assertEqual(first["road_name"], "세종대로")
+        self.assertEqual(second["road_name"], "세종대로 측도")
+        self.assertEqual(again, first)
+        self.assertEqual(building_lookup.await_count, 2)
+
+    def test_reselecting_the_target_rebinds_cached_geometry_without_upstream_work(self):
+        collection = {
+            "available": True,
+            "official_available": True,
+            "source_chain": ["vworld_wfs"],
+            "features": [
+                {"id": "target", "name": "대상건물", "ring": self.target_ring},
+                {"id": "opposite-side", "name": "맞은편", "ring": self.opposing_ring},
+            ],
+        }
+        road_lookup = AsyncMock(return_value=self.road)
+        building_lookup = AsyncMock(return_value=collection)
+        identifier = {"kind": "native_feature_id", "value": "target"}
+        other_selection_id = "4f1c2b7e-8a35-4d0e-9b6a-2c7d1e5f9a10"
+        other_lon, other_lat = main._mercator_to_lonlat(12.0, -25.0)
+
+        def fetch(lat, lon, selection_id):
+            return asyncio.run(main.fetch_canyon_width_evidence(lat, lon, selection_id=selection_id, target_identifier=identifier))
+
+        with (
+            patch.object(main, "fetch_road_width_evidence", road_lookup),
+            patch.object(main, "lookup_official_building_collection", building_lookup),
+        ):
+            first = fetch(self.target_lat, self.target_lon, self.selection_id)
+            reselected = fetch(other_lat, other_lon, other_selection_id)
+            self.assertEqual(road_lookup.await_count, 2)
+            self.assertEqual(building_lookup.await_count, 1)
+
+            main.CANYON_EVIDENCE_CACHE.clear()
+            fresh = fetch(other_lat, other_lon, other_selection_id)
+            with patch.object(main, "VWORLD_ROAD_LAYER_VERSION", "next"):
+                fetch(self.target_lat, self.target_lon, self.selection_id)
+            self.assertEqual(road_lookup.await_count, 4)
+            self.assertEqual(building_lookup.await_count, 3)
+
+        self.assertEqual(reselected, fresh)
+        self.assertEqual(reselected["selection_id"], other_selection_id)
+        self.assertEqual(reselected["receipt"]["selection_id"], other_selection_id)
+        self.assertNotEqual(reselected["receipt"]["receipt_ids"], first["receipt"]["receipt_ids"])
+        self.assertEqual(first["selection_id"], self.selection_id)
+        self.assertTrue(main._canyon_receipt_set_is_verified(reselected, "direct_vworld_official_receipt", other_selection_id, identifier))
+
+
+class HedgedBridgeCanyonTests(unittest.TestCase):
+    def setUp(self):
+        main.CANYON_EVIDENCE_CACHE.clear()
+        self.addCleanup(main.CANYON_EVIDENCE_CACHE.clear)
+        self.selection_id = "9d88e3aa-17c7-4b75-b7a0-a6db69498ca4"
+        self.identifier = {"kind": "native_feature_id", "value": "target"}
+        self.target_lon, self.target_lat = main._mercator_to_lonlat(10.0, -20.0)
+        self.collection = {
+            "available": True,
+            "official_available": True,
+            "source_chain": ["vworld_wfs"],
+            "features": [
+                {"id": "target", "name": "대상건물", "ring": _lonlat_ring([[0.0, -42.0], [20.0, -42.0], [20.0, -12.0], [0.0, -12.0], [0.0, -42.0]])},
+                {"id": "opposite-side", "name": "맞은편", "ring": _lonlat_ring([[2.0, 15.0], [22.0, 15.0], [22.0, 44.0], [2.0, 44.0], [2.0, 15.0]])},
+            ],
+        }
+        self.road = {
+            "available": True,
+            "official_available": True,
+            "width_m": 49.7,
+            "road_name": "세종대로",
+            "source_chain": ["vworld_wfs", "official_road_right_of_way", "lt_l_n3a0020000"],
+            "geometry_paths": [[[-40.0, 0.0], [80.0, 0.0]]],
+            "geometry_receipt": True,
+        }
+        self.bridge_cancelled = False
+
+    def _fetch(self, bridge_payload, bridge_delay_s, hedge_s=0.05):
+        async def bridge(*args, **kwargs):
+            try:
+                await asyncio.sleep(bridge_delay_s)
+            except asyncio.CancelledError:
+                self.bridge_cancelled = True
+                raise
+            return bridge_payload
+
+        self.direct_lookup = AsyncMock(return_value=self.road)
+        with (
+            patch.object(main, "OFFICIAL_GIS_BRIDGE_URL", "https://bridge.example/api/canyon-width"),
+            patch.object(main, "OFFICIAL_GIS_BRIDGE_TOKEN", "bridge-token"),
+            patch.object(main, "OFFICIAL_GIS_BRIDGE_HEDGE_S", hedge_s),
+            patch.object(main, "fetch_official_gis_bridge_canyon_evidence", bridge),
+            patch.object(main, "fetch_road_width_evidence", self.direct_lookup),
+            patch.object(main, "lookup_official_building_collection", AsyncMock(return_value=self.collection)),
+        ):
+            return asyncio.run(main.fetch_canyon_width_evidence(
+                self.target_lat,
+                self.target_lon,
+                selection_id=self.selection_id,
+                target_identifier=self.identifier,
+            ))
+
+    def test_direct_receipt_wins_over_a_slow_bridge_and_the_bridge_is_cancelled(self):
+        started = time.monotonic()
+
+        evidence = self._fetch(_verified_bridge_receipt(self.selection_id, "target", None), bridge_delay_s=5.0)
+
+        self.assertLess(time.monotonic() - started, 2.0)
+        self.assertEqual(evidence["source"], "direct_vworld_official_receipt")
+        self.assertEqual(evidence["facade_gap_m"], 27.0)
+        self.assertNotIn("bridge_fallback_reason", evidence)
+        self.assertTrue(self.bridge_cancelled)
+
+    def test_prompt_bridge_receipt_wins_before_the_direct_path_starts(self):
+        evidence = self._fetch(_verified_bridge_receipt(self.selection_id, "target", None), bridge_delay_s=0.0, hedge_s=1.0)
+
+        self.assertEqual(evidence["source"], "official_gis_bridge_receipt")
+        self.assertEqual(evidence["bridge_provider"], "official_gis_bridge")
+        self.direct_lookup.assert_not_awaited()
+
+    def test_bridge_hold_ends_the_race_even_when_the_direct_path_would_verify(self):
+        bridge_hold = main._unavailable_official_gis_bridge_evidence("official_gis_bridge_http_401")
+
+        hedged = self._fetch(bridge_hold, bridge_delay_s=0.0)
+        unhedged = self._fetch(bridge_hold, bridge_delay_s=0.0, hedge_s=None)
+
+        self.assertEqual(hedged, unhedged)
+        self.assertFalse(hedged["official_available"])
+        self.assertEqual(hedged["reason"], "official_gis_bridge_http_401")
+        self.assertEqual(hedged["selection_id"], self.selection_id)
+        self.direct_lookup.assert_not_awaited()
+
+    def test_failing_direct_path_does_not_abort_a_slow_bridge(self):
+        bridge_receipt = _verified_bridge_receipt(self.selection_id, "target", None)
+
+        with patch.object(main, "_fetch_direct_canyon_evidence", AsyncMock(side_effect=RuntimeError("direct_path_failed"))):
+            evidence = self._fetch(bridge_receipt, bridge_delay_s=0.2)
+
+        self.assertEqual(evidence["source"], "official_gis_bridge_receipt")
+        self.assertFalse(self.bridge_cancelled)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,141 @@
+import asyncio
+from pathlib import Path
+import sys
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import main  # noqa: E402
+from circuit_breaker import CIRCUIT_BREAKER_MIN_CALLS, CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError  # noqa: E402
+from request_deadline import request_deadline  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _fail(breaker, reason="upstream_status_503"):
+    with breaker.call() as outcome:
+        outcome.fail(reason)
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+        self.breaker = CircuitBreaker(
+            "vworld_api_wfs",
+            window=10,
+            minimum_calls=4,
+            failure_rate_threshold=0.5,
+            open_s=30.0,
+            clock=self.clock,
+        )
+
+    def test_opens_once_the_failure_rate_crosses_the_threshold_and_fails_fast_with_the_last_reason(self):
+        with self.breaker.call():
+            pass
+        _fail(self.breaker)
+        with self.breaker.call():
+            pass
+        self.assertEqual(self.breaker.state, CLOSED)
+
+        _fail(self.breaker, "upstream_status_502")
+
+        self.assertEqual(self.breaker.state, OPEN)
+        with self.assertRaises(CircuitOpenError) as raised:
+            with self.breaker.call():
+                self.fail("an open breaker must not reach upstream")
+        self.assertEqual(raised.exception.reason, "upstream_status_502")
+        snapshot = self.breaker.snapshot()
+        self.assertEqual(snapshot["failure_rate"], 0.5)
+        self.assertEqual(snapshot["rejected"], 1)
+        self.assertEqual(snapshot["retry_in_s"], 30.0)
+
+    def test_half_open_admits_one_probe_and_closes_on_success(self):
+        for _ in range(4):
+            _fail(self.breaker)
+        self.clock.now += 30.0
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+
+        with self.breaker.call():
+            with self.assertRaises(CircuitOpenError):
+                self.breaker.before_call()
+
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertEqual(self.breaker.snapshot()["recent_calls"], 1)
+
+    def test_failed_probe_reopens_and_cancelled_probe_frees_the_slot(self):
+        for _ in range(4):
+            _fail(self.breaker)
+        self.clock.now += 30.0
+        with self.assertRaises(asyncio.CancelledError):
+            with self.breaker.call():
+                raise asyncio.CancelledError()
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+
+        with self.assertRaises(httpx.ConnectTimeout):
+            with self.breaker.call():
+                raise httpx.ConnectTimeout("slow")
+
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertEqual(self.breaker.snapshot()["last_failure_reason"], "vworld_api_wfs_timeout")
+
+    def test_failures_after_the_request_deadline_do_not_count_against_the_provider(self):
+        for _ in range(4):
+            with request_deadline(0.0):
+                with self.assertRaises(TimeoutError):
+                    with self.breaker.call():
+                        raise TimeoutError()
+
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertEqual(self.breaker.snapshot()["recent_calls"], 0)
+
+
+class ProviderCircuitRouteTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        main.ROAD_TILE_CACHE.clear()
+        main.CIRCUIT_BREAKERS.reset()
+
+    def tearDown(self):
+        main.CIRCUIT_BREAKERS.reset()
+
+    async def test_degraded_vworld_stops_receiving_road_queries_until_it_recovers(self):
+        requests = []
+        real_async_client = httpx.AsyncClient
+
+        def handler(request):
+            requests.append(str(request.url))
+            return httpx.Response(503, text="maintenance")
+
+        def client_factory(*args, **kwargs):
+            return real_async_client(*args, transport=httpx.MockTransport(handler), **kwargs)
+
+        with (
+            patch.object(main, "_vworld_api_key", return_value="server-key"),
+            patch.object(main.httpx, "AsyncClient", side_effect=client_factory),
+        ):
+            lookups = CIRCUIT_BREAKER_MIN_CALLS + 2
+            results = [await main.fetch_road_width_evidence(37.5665, 126.9780) for _ in range(lookups)]
+
+        # Each endpoint's breaker opens after CIRCUIT_BREAKER_MIN_CALLS failures;
+        # later lookups fail fast with the same typed reason.
+        self.assertEqual(len(requests), CIRCUIT_BREAKER_MIN_CALLS * len(main.VWORLD_WFS_API_ENDPOINTS))
+        self.assertEqual([result["reason"] for result in results], ["upstream_status_503"] * lookups)
+        circuits = {item["provider"]: item for item in main._official_gis_readiness()["provider_circuits"]}
+        self.assertEqual(circuits["vworld_api_wfs"]["state"], OPEN)
+        self.assertEqual(circuits["vworld_map_wfs"]["state"], OPEN)
+        self.assertEqual(circuits["official_gis_bridge"]["state"], CLOSED)
+
+
+if __name__ == "__main__":
+    unittest.main()
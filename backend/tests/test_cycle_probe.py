@@ -0,0 +1,120 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import sys
+import unittest
+
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from cycle_probe import MAX_FIRST_BATCH, PublishedCycleTracker, cycle_cache_expiry, cycle_is_past  # noqa: E402
+
+
+CYCLES = ["202608081250", "202608081240", "202608081230", "202608081220", "202608081210"]
+
+
+class PublishedCycleTrackerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_newest_published_cycle_wins_and_older_probes_are_cancelled(self):
+        started = []
+        cancelled = []
+
+        async def fetch(cycle):
+            started.append(cycle)
+            try:
+                if cycle == CYCLES[0]:
+                    await asyncio.sleep(0.01)
+                    return None
+                if cycle == CYCLES[1]:
+                    await asyncio.sleep(0.02)
+                    return {"cycle": cycle}
+                await asyncio.sleep(10)
+                return {"cycle": cycle}
+            except asyncio.CancelledError:
+                cancelled.append(cycle)
+                raise
+
+        tracker = PublishedCycleTracker()
+        probed = await asyncio.wait_for(tracker.probe("kma_wind_profiler", CYCLES, fetch, window=3), timeout=1)
+
+        self.assertEqual(probed, (CYCLES[1], {"cycle": CYCLES[1]}))
+        self.assertEqual(started, CYCLES[:3])
+        self.assertEqual(cancelled, [CYCLES[2]])
+        self.assertEqual(tracker.last("kma_wind_profiler"), CYCLES[1])
+
+    async def test_known_cycle_bounds_the_first_batch(self):
+        tracker = PublishedCycleTracker()
+        tracker.remember("kma_surface", CYCLES[3])
+
+        self.assertEqual(
+            tracker.plan("kma_surface", CYCLES, window=2),
+            [CYCLES[:4], CYCLES[4:]],
+        )
+        tracker.remember("kma_surface", CYCLES[0])
+        self.assertEqual(tracker.plan("kma_surface", CYCLES, window=2)[0], CYCLES[:1])
+
+    def test_a_long_stale_memory_does_not_stretch_the_first_batch_without_bound(self):
+        tracker = PublishedCycleTracker()
+        cycles = [f"2026080812{minute:02d}" for minute in range(59, 1, -3)]
+        tracker.remember("kma_wind_profiler", cycles[-1])
+
+        batches = tracker.plan("kma_wind_profiler", cycles, window=3)
+
+        self.assertEqual(len(batches[0]), MAX_FIRST_BATCH)
+        self.assertTrue(all(len(batch) <= 3 for batch in batches[1:]))
+        self.assertEqual([cycle for batch in batches for cycle in batch], cycles)
+
+    async def test_error_on_newer_cycle_aborts_like_a_sequential_walk(self):
+        async def fetch(cycle):
+            if cycle == CYCLES[0]:
+                raise PermissionError("auth")
+            return {"cycle": cycle}
+
+        tracker = PublishedCycleTracker()
+        with self.assertRaises(PermissionError):
+            await tracker.probe("kma_surface", CYCLES, fetch, window=2)
+        self.assertIsNone(tracker.last("kma_surface"))
+
+    async def test_later_batches_run_when_no_cycle_in_the_first_batch_is_published(self):
+        async def fetch(cycle):
+            return {"cycle": cycle} if cycle == CYCLES[4] else None
+
+        tracker = PublishedCycleTracker()
+        probed = await tracker.probe("kma_surface", CYCLES, fetch, window=2)
+
+        self.assertEqual(probed[0], CYCLES[4])
+
+
+class CycleExpiryTests(unittest.TestCase):
+    def test_entry_lives_until_the_next_cycle_is_expected(self):
+        observed_at = datetime(2026, 8, 8, 12, 0, tzinfo=timezone.utc)
+        now = datetime(2026, 8, 8, 13, 40, tzinfo=timezone.utc)
+
+        expires_at = cycle_cache_expiry(
+            observed_at,
+            interval=timedelta(hours=12),
+            publication_lag=timedelta(minutes=90),
+            retry_after_s=900,
+            now=now,
+        )
+
+        self.assertEqual(expires_at, datetime(2026, 8, 9, 1, 30, tzinfo=timezone.utc).timestamp())
+
+    def test_late_cycle_falls_back_to_retry_interval_and_respects_cap(self):
+        observed_at = datetime(2026, 8, 8, 0, 0, tzinfo=timezone.utc)
+        now = datetime(2026, 8, 8, 14, 0, tzinfo=timezone.utc)
+        kwargs = {"interval": timedelta(hours=12), "publication_lag": timedelta(minutes=90), "retry_after_s": 900, "now": now}
+
+        self.assertEqual(cycle_cache_expiry(observed_at, **kwargs), (now + timedelta(seconds=900)).timestamp())
+        cap = now + timedelta(seconds=60)
+        self.assertEqual(cycle_cache_expiry(observed_at, not_after=cap, **kwargs), cap.timestamp())
+
+    def test_cycle_is_final_once_its_successor_has_started(self):
+        now = datetime(2026, 8, 8, 12, 5, tzinfo=timezone.utc)
+        self.assertTrue(cycle_is_past("202608080000", timedelta(hours=12), now=now))
+        self.assertFalse(cycle_is_past("202608081200", timedelta(hours=12), now=now))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -129,7 +129,7 @@ class DataPipelineTests(unittest.IsolatedAsyncioTestCase):
                 ),
             ),
         ):
-            response = await main.evaluate_flight(request)
+            response = await main.evaluate_flight(request, main.Response())
 
         self.assertEqual(response.profile_source, "surface_only")
         self.assertEqual(response.building_source, "official_building_unavailable")
@@ -211,7 +211,7 @@ class DataPipelineTests(unittest.IsolatedAsyncioTestCase):
         with (
             patch.dict(building_footprint.os.environ, {}, clear=True),
             patch.object(building_footprint, "_match_cached_footprint", return_value=None),
-            patch.object(building_footprint, "_lookup_osm_fallback_sync", return_value=mock_osm),
+            patch.object(building_footprint, "_lookup_osm_fallback", return_value=mock_osm),
             patch.object(building_footprint, "_resolve_vworld_api_key", return_value=None),
         ):
             result = await building_footprint.lookup_building_footprint(37.5665, 126.9780)
@@ -0,0 +1,162 @@
+import asyncio
+from pathlib import Path
+import sys
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import main  # noqa: E402
+from evidence_graph import EVIDENCE_DEADLINE_REASON, EvidenceDeadlineExceeded, EvidenceGraph, EvidenceNode  # noqa: E402
+from tests.task7_evaluation_fixtures import (  # noqa: E402
+    SELECTION_ID,
+    authoritative_weather,
+    official_canyon,
+    server_building,
+)
+
+
+class EvidenceGraphTests(unittest.IsolatedAsyncioTestCase):
+    async def test_independent_nodes_overlap_and_dependents_receive_results(self):
+        events = []
+
+        async def slow(name, value):
+            events.append(f"{name}:start")
+            await asyncio.sleep(0.02)
+            events.append(f"{name}:end")
+            return value
+
+        async def canyon(building):
+            events.append("canyon:start")
+            return f"canyon-for-{building}"
+
+        graph = EvidenceGraph([
+            EvidenceNode("building", lambda: slow("building", "b1")),
+            EvidenceNode("road", lambda: slow("road", "r1")),
+            EvidenceNode("canyon", canyon, depends_on=("building",)),
+        ])
+
+        result = await graph.run(deadline_s=1.0)
+
+        self.assertEqual(result["canyon"], "canyon-for-b1")
+        self.assertLess(events.index("road:start"), events.index("building:end"))
+        self.assertGreater(events.index("canyon:start"), events.index("building:end"))
+        self.assertEqual({timing["status"] for timing in result.timings.values()}, {"ok"})
+        self.assertIn("evidence_total;dur=", result.server_timing())
+
+    async def test_deadline_replaces_unfinished_nodes_with_fallbacks(self):
+        async def never():
+            await asyncio.sleep(10)
+
+        graph = EvidenceGraph([
+            EvidenceNode("fast", AsyncMock(return_value="ok")),
+            EvidenceNode("slow", never, fallback=lambda reason: {"reason": reason}),
+            EvidenceNode("dependent", AsyncMock(return_value="late"), depends_on=("slow",), fallback=lambda reason: None),
+        ])
+
+        result = await graph.run(deadline_s=0.05)
+
+        self.assertEqual(result["fast"], "ok")
+        self.assertEqual(result["slow"], {"reason": EVIDENCE_DEADLINE_REASON})
+        self.assertIsNone(result["dependent"])
+        self.assertEqual(result.timings["slow"]["status"], "deadline_exceeded")
+
+    async def test_node_without_fallback_fails_the_graph_on_deadline(self):
+        graph = EvidenceGraph([EvidenceNode("required", lambda: asyncio.sleep(10))])
+
+        with self.assertRaises(EvidenceDeadlineExceeded) as raised:
+            await graph.run(deadline_s=0.01)
+        self.assertEqual(raised.exception.nodes, ["required"])
+
+    async def test_a_failing_node_fails_the_graph_without_waiting_for_the_rest(self):
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("slow")
+                raise
+
+        async def broken():
+            raise RuntimeError("node_failed")
+
+        graph = EvidenceGraph([EvidenceNode("slow", slow), EvidenceNode("broken", broken)])
+
+        with self.assertRaises(RuntimeError):
+            await asyncio.wait_for(graph.run(deadline_s=5.0), timeout=1.0)
+        self.assertEqual(cancelled, ["slow"])
+
+    def test_graph_rejects_unknown_and_cyclic_dependencies(self):
+        with self.assertRaises(ValueError):
+            EvidenceGraph([EvidenceNode("a", AsyncMock(), depends_on=("missing",))])
+        with self.assertRaises(ValueError):
+            EvidenceGraph([
+                EvidenceNode("a", AsyncMock(), depends_on=("b",)),
+                EvidenceNode("b", AsyncMock(), depends_on=("a",)),
+            ])
+
+
+class EvaluateEvidenceGraphTests(unittest.TestCase):
+    def test_evaluate_fetches_independent_evidence_concurrently_and_reports_server_timing(self):
+        # Given: building lookup and road lookup that each take a measurable time.
+        road_started_during_building = []
+        building_in_flight = []
+
+        async def slow_building(lat, lon, selection_id=None):
+            building_in_flight.append(True)
+            await asyncio.sleep(0.05)
+            building_in_flight.pop()
+            return server_building()
+
+        async def road(lat, lon, road_name=None):
+            road_started_during_building.append(bool(building_in_flight))
+            return {
+                "available": True,
+                "official_available": True,
+                "width_m": 49.7,
+                "source": "official_road_right_of_way",
+                "source_chain": ["vworld_wfs", "official_road_right_of_way"],
+            }
+
+        request_payload = {
+            "latitude": 37.5665,
+            "longitude": 126.9780,
+            "selection_id": SELECTION_ID,
+            "building_height": 20.0,
+            "street_width": 10.0,
+            "wind_alignment": "직각",
+            "mission_altitude": 30,
+            "no_fly_zone": False,
+            "crowd_area": False,
+            "gps_locked": 12,
+            "glonass_locked": 6,
+            "drone_model": main.DroneModel.MAVIC_3.value,
+        }
+        with (
+            patch.object(main, "_lookup_building_selection", side_effect=slow_building),
+            patch.object(main, "fetch_road_width_evidence", side_effect=road),
+            patch.object(main, "fetch_canyon_width_evidence", AsyncMock(return_value=official_canyon(SELECTION_ID, SELECTION_ID))),
+            patch.object(main, "fetch_weather_safe", AsyncMock(return_value=authoritative_weather())),
+            patch.object(main, "fetch_kp_index_safe", AsyncMock(return_value=3.0)),
+            patch.object(main, "fetch_kma_upper_air_profile_safe", AsyncMock(return_value=None)),
+            patch.object(main, "fetch_kma_wind_profiler_profile_safe", AsyncMock(return_value=None)),
+        ):
+            # When: the evaluation runs.
+            response = TestClient(main.app).post("/api/evaluate", json=request_payload)
+
+        # Then: the road lookup overlapped the building lookup and timings are reported.
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(road_started_during_building, [True])
+        server_timing = response.headers["server-timing"]
+        for node in ("building_selection", "weather", "kp", "upper_air", "wind_profiler", "road", "canyon"):
+            self.assertIn(f"{node};dur=", server_timing)
+
+
+if __name__ == "__main__":
+    unittest.main()
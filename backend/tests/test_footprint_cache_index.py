@@ -0,0 +1,236 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import building_footprint  # noqa: E402
+from footprint_store import FootprintStore  # noqa: E402
+from spatial_index import GridIndex, point_bbox  # noqa: E402
+
+
+def _square(lon: float, lat: float, half_deg: float = 0.0001):
+    return [
+        [lon - half_deg, lat - half_deg],
+        [lon + half_deg, lat - half_deg],
+        [lon + half_deg, lat + half_deg],
+        [lon - half_deg, lat + half_deg],
+        [lon - half_deg, lat - half_deg],
+    ]
+
+
+def _entry(lon: float, lat: float, name: str, source: str = "vworld_wfs"):
+    return {
+        "center": {"lat": lat, "lon": lon},
+        "geometry": _square(lon, lat),
+        "properties": {"buld_nm": name, "gro_flo_co": 5},
+        "source": source,
+        "source_origin": source,
+    }
+
+
+class GridIndexTests(unittest.TestCase):
+    def test_query_returns_only_nearby_items_in_insertion_order(self):
+        index = GridIndex(0.01)
+        index.insert("far", point_bbox(127.5, 37.5))
+        index.insert("near-b", point_bbox(126.9781, 37.5666))
+        index.insert("near-a", point_bbox(126.9779, 37.5664))
+        index.insert("world", (-180.0, -90.0, 180.0, 90.0))
+
+        self.assertEqual(index.query(point_bbox(126.978, 37.5665, 0.001)), ["near-b", "near-a", "world"])
+        self.assertEqual(len(index), 4)
+
+
+class FootprintCacheIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmpdir.name, "footprint_cache.json")
+        self.store_path = os.path.join(self.tmpdir.name, "footprint_store.sqlite3")
+        patches = [
+            patch.object(building_footprint, "FOOTPRINT_CACHE_PATH", self.cache_path),
+            patch.object(building_footprint, "FOOTPRINT_STORE_PATH", self.store_path),
+            patch.dict(building_footprint._FOOTPRINT_CACHE_STATE, {"store": None}),
+        ]
+        for active in patches:
+            active.start()
+            self.addCleanup(active.stop)
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _write(self, entries):
+        with open(self.cache_path, "w", encoding="utf-8") as fp:
+            json.dump(entries, fp)
+
+    def test_legacy_json_is_imported_once_and_other_writers_sync_incrementally(self):
+        self._write([_entry(126.978, 37.5665, "시청")])
+
+        with patch.object(
+            building_footprint,
+            "_read_footprint_cache_bytes",
+            wraps=building_footprint._read_footprint_cache_bytes,
+        ) as reader:
+            first = building_footprint._match_cached_footprint(37.5665, 126.978)
+            building_footprint._match_cached_footprint(37.5665, 126.978)
+            self.assertEqual(reader.call_count, 1)
+
+        # Another worker process writes through its own connection.
+        other_worker = FootprintStore(self.store_path)
+        other_worker.upsert_near(
+            37.5665,
+            126.978,
+            0.00025,
+            lambda existing: {**existing, "properties": {"buld_nm": "서울특별시청 본관", "gro_flo_co": 5}},
+        )
+        other_worker.close()
+        second = building_footprint._match_cached_footprint(37.5665, 126.978)
+
+        self.assertEqual(first["properties"]["buld_nm"], "시청")
+        self.assertEqual(second["properties"]["buld_nm"], "서울특별시청 본관")
+        self.assertEqual(len(building_footprint._load_footprint_cache()), 1)
+
+    def test_an_edited_seed_file_is_merged_on_the_next_start(self):
+        self._write([_entry(126.978, 37.5665, "시청")])
+        building_footprint._match_cached_footprint(37.5665, 126.978)
+
+        building_footprint.write_footprint_seed(37.5665, 126.978, _square(126.978, 37.5665), {"buld_nm": "서울특별시청", "gro_flo_co": 5})
+        building_footprint.write_footprint_seed(37.6, 127.0, _square(127.0, 37.6), {"buld_nm": "신규"})
+        # A restarted worker opens the same database with the edited file.
+        building_footprint._FOOTPRINT_CACHE_STATE["store"] = None
+
+        merged = building_footprint._match_cached_footprint(37.5665, 126.978)
+        added = building_footprint._match_cached_footprint(37.6, 127.0)
+
+        self.assertEqual(len(building_footprint._read_footprint_cache_file()), 2)
+        self.assertEqual(merged["properties"]["buld_nm"], "서울특별시청")
+        self.assertEqual(added["properties"]["buld_nm"], "신규")
+        self.assertEqual(building_footprint._footprint_store().count(), 2)
+
+    def test_cache_writes_are_visible_to_the_next_lookup(self):
+        self._write([])
+
+        self.assertIsNone(building_footprint._match_cached_footprint(37.5665, 126.978))
+        building_footprint.cache_building_footprint(
+            37.5665,
+            126.978,
+            _square(126.978, 37.5665),
+            {"buld_nm": "시청"},
+            source="footprint_cache",
+        )
+
+        match = building_footprint._match_cached_footprint(37.5665, 126.978)
+        self.assertTrue(match["cache_point_inside"])
+
+    def test_queued_writes_are_visible_before_they_are_flushed(self):
+        self._write([_entry(126.978, 37.5665, "시청")])
+        building_footprint._match_cached_footprint(37.5665, 126.978)
+        store = building_footprint._footprint_store()
+        queue = building_footprint.FOOTPRINT_WRITE_BEHIND
+
+        async def scenario():
+            with patch.object(queue, "interval_s", 60):
+                await queue.start()
+                try:
+                    for name in ("서울특별시청", "서울특별시청 본관"):
+                        building_footprint.cache_building_footprint(
+                            37.5665, 126.978, _square(126.978, 37.5665), {"buld_nm": name, "gro_flo_co": 5}, source="footprint_cache"
+                        )
+                    building_footprint.cache_building_footprint(
+                        37.6, 127.0, _square(127.0, 37.6), {"buld_nm": "신규"}, source="footprint_cache"
+                    )
+                    pending = (
+                        building_footprint._match_cached_footprint(37.5665, 126.978),
+                        building_footprint._match_cached_footprint(37.6, 127.0),
+                        store.changes_since(0)[0],
+                        len(queue.pending()),
+                    )
+                finally:
+                    await queue.aclose()
+            return pending
+
+        merged, added, revision_before_flush, pending_count = asyncio.run(scenario())
+
+        self.assertEqual(merged["properties"]["buld_nm"], "서울특별시청 본관")
+        self.assertEqual(added["properties"]["buld_nm"], "신규")
+        self.assertEqual(revision_before_flush, 1)
+        self.assertEqual(pending_count, 2)
+        self.assertEqual(queue.pending(), [])
+        _revision, rows = store.changes_since(0)
+        self.assertEqual(sorted(row["properties"]["buld_nm"] for row in rows), ["서울특별시청 본관", "신규"])
+        again = building_footprint._match_cached_footprint(37.5665, 126.978)
+        self.assertEqual(again["properties"]["buld_nm"], "서울특별시청 본관")
+
+    def test_lookup_cost_stays_flat_as_the_cache_grows(self):
+        entries = [
+            _entry(126.0 + (index % 200) * 0.01, 36.0 + (index // 200) * 0.01, f"bldg-{index}")
+            for index in range(20000)
+        ]
+        entries.append(_entry(126.9781, 37.5667, "target"))
+        self._write(entries)
+        building_footprint._footprint_cache_index()
+        building_footprint.cache_building_footprint(
+            36.505,
+            126.505,
+            _square(126.505, 36.505),
+            {"buld_nm": "late-write"},
+            source="footprint_cache",
+        )
+
+        with patch.object(
+            building_footprint,
+            "_point_in_polygon",
+            wraps=building_footprint._point_in_polygon,
+        ) as point_in_polygon:
+            match = building_footprint._match_cached_footprint(37.5667, 126.9781)
+
+        self.assertEqual(match["properties"]["buld_nm"], "target")
+        self.assertLess(point_in_polygon.call_count, 10)
+        candidate = building_footprint._find_display_name_candidate(37.5667, 126.9781)
+        self.assertEqual(candidate["display_name"], "target")
+        late = building_footprint._match_cached_footprint(36.505, 126.505)
+        self.assertEqual(late["properties"]["buld_nm"], "late-write")
+
+    def test_a_far_rich_entry_that_outscores_the_nearby_ones_still_rejects_the_match(self):
+        # The click sits just west of a grid cell edge (126.98); the far entry
+        # lies beyond it, outside the cells a nearby lookup visits.
+        click_lon = 126.97755
+        near = {**_entry(click_lon + 0.001, 37.5665, "near", source="osm_fallback"), "properties": {"building": "yes"}}
+        far = _entry(click_lon + 0.003, 37.5665, "far")
+        far["properties"] = {
+            "buld_nm": "far",
+            "rd_nm": "세종대로",
+            "gro_flo_co": 12,
+            "usage": "업무시설",
+            "bd_mgt_sn": "1",
+            "sigungu": "중구",
+        }
+        self._write([near])
+        self.assertEqual(building_footprint._match_cached_footprint(37.5665, click_lon)["properties"]["building"], "yes")
+
+        # A full scan scores the far entry best and rejects it as too far;
+        # the grid lookup must not fall back to the weaker nearby entry.
+        self._write([near, far])
+        building_footprint._FOOTPRINT_CACHE_STATE["store"] = None
+
+        self.assertIsNone(building_footprint._match_cached_footprint(37.5665, click_lon))
+
+    def test_returned_match_does_not_alias_the_in_memory_index(self):
+        self._write([_entry(126.978, 37.5665, "시청")])
+
+        match = building_footprint._match_cached_footprint(37.5665, 126.978)
+        match["properties"]["buld_nm"] = "mutated"
+        match["geometry"][0][0] = 0.0
+
+        again = building_footprint._match_cached_footprint(37.5665, 126.978)
+        self.assertEqual(again["properties"]["buld_nm"], "시청")
+        self.assertNotEqual(again["geometry"][0][0], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import os
+from pathlib import Path
+import sys
+import tempfile
+import threading
+import unittest
+
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from footprint_store import FootprintStore  # noqa: E402
+
+
+def _entry(lon: float, lat: float, name: str):
+    return {
+        "center": {"lat": lat, "lon": lon},
+        "geometry": [[lon, lat], [lon + 0.0001, lat], [lon + 0.0001, lat + 0.0001], [lon, lat]],
+        "properties": {"buld_nm": name},
+        "source": "vworld_wfs",
+        "source_origin": "vworld_wfs",
+    }
+
+
+class FootprintStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "store", "footprints.sqlite3")
+        self.store = FootprintStore(self.path)
+        self.addCleanup(self.tmpdir.cleanup)
+        self.addCleanup(self.store.close)
+
+    def test_database_runs_in_wal_mode(self):
+        (mode,) = self.store._connection().execute("PRAGMA journal_mode").fetchone()
+
+        self.assertEqual(mode.lower(), "wal")
+
+    def test_upsert_merges_into_the_nearby_entry_and_bumps_its_revision(self):
+        first = self.store.upsert_near(37.5665, 126.978, 0.00025, lambda existing: _entry(126.978, 37.5665, "시청"))
+        seen = []
+
+        def rename(existing):
+            seen.append(existing)
+            return {**existing, "properties": {"buld_nm": "서울특별시청"}}
+
+        second = self.store.upsert_near(37.5666, 126.9781, 0.00025, rename)
+        third = self.store.upsert_near(37.6, 127.0, 0.00025, lambda existing: _entry(127.0, 37.6, "far"))
+
+        self.assertEqual(seen[0]["id"], first["id"])
+        self.assertEqual(second["id"], first["id"])
+        self.assertNotEqual(third["id"], first["id"])
+        self.assertLess(first["revision"], second["revision"])
+        self.assertEqual(self.store.count(), 2)
+
+    def test_changes_since_returns_only_newer_writes(self):
+        first = self.store.upsert_near(37.5665, 126.978, 0.00025, lambda existing: _entry(126.978, 37.5665, "a"))
+        second = self.store.upsert_near(37.6, 127.0, 0.00025, lambda existing: _entry(127.0, 37.6, "b"))
+
+        revision, changes = self.store.changes_since(first["revision"])
+        unchanged_revision, none = self.store.changes_since(revision)
+
+        self.assertEqual([entry["id"] for entry in changes], [second["id"]])
+        self.assertEqual(revision, second["revision"])
+        self.assertEqual((unchanged_revision, none), (revision, []))
+
+    def test_meta_guarded_batch_runs_once_per_value(self):
+        upserts = [(37.5665, 126.978, 0.00025, lambda existing: _entry(126.978, 37.5665, "a"))]
+
+        self.assertEqual(len(self.store.upsert_many(upserts, meta=("seed", "v1"))), 1)
+        self.assertEqual(FootprintStore(self.path).upsert_many(upserts, meta=("seed", "v1")), [])
+        self.assertEqual(len(self.store.upsert_many(upserts, meta=("seed", "v2"))), 1)
+        self.assertEqual(self.store.count(), 1)
+        self.assertEqual(self.store.meta("seed"), "v2")
+
+    def test_concurrent_writers_do_not_clobber_each_other(self):
+        self.store.upsert_near(37.5665, 126.978, 0.00025, lambda existing: _entry(126.978, 37.5665, "seed"))
+        writers = [FootprintStore(self.path) for _ in range(4)]
+        start = threading.Barrier(len(writers))
+
+        def add_tags(store, worker):
+            start.wait()
+            for index in range(10):
+                def merge(existing):
+                    tags = list(existing["properties"].get("tags") or [])
+                    return {**existing, "properties": {**existing["properties"], "tags": tags + [f"{worker}-{index}"]}}
+
+                store.upsert_near(37.5665, 126.978, 0.00025, merge)
+            store.close()
+
+        threads = [threading.Thread(target=add_tags, args=(store, worker)) for worker, store in enumerate(writers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        _revision, entries = self.store.changes_since(0)
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(len(entries[0]["properties"]["tags"]), 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
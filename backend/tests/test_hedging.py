@@ -0,0 +1,84 @@
+import asyncio
+from pathlib import Path
+import sys
+import unittest
+
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from hedging import NoAcceptedResult, first_accepted  # noqa: E402
+
+
+class _Attempt:
+    def __init__(self, name, delay_s, result=None, error=None):
+        self.name = name
+        self.delay_s = delay_s
+        self.result = result
+        self.error = error
+        self.started = False
+        self.cancelled = False
+
+    async def __call__(self):
+        self.started = True
+        try:
+            await asyncio.sleep(self.delay_s)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class FirstAcceptedTests(unittest.IsolatedAsyncioTestCase):
+    async def test_fast_hedge_wins_and_the_slow_attempt_is_cancelled(self):
+        slow = _Attempt("slow", 5.0, result="slow")
+        fast = _Attempt("fast", 0.0, result="fast")
+
+        index, result = await asyncio.wait_for(first_accepted([slow, fast], hedge_s=0.01), timeout=1.0)
+
+        self.assertEqual((index, result), (1, "fast"))
+        self.assertTrue(slow.cancelled)
+
+    async def test_hedge_is_not_started_when_the_first_attempt_answers_in_time(self):
+        first = _Attempt("first", 0.0, result="first")
+        second = _Attempt("second", 0.0, result="second")
+
+        self.assertEqual(await first_accepted([first, second], hedge_s=1.0), (0, "first"))
+        self.assertFalse(second.started)
+
+    async def test_failed_or_unaccepted_attempt_starts_the_next_one_at_once(self):
+        failing = _Attempt("failing", 0.0, error=RuntimeError("down"))
+        empty = _Attempt("empty", 0.0, result=[])
+        good = _Attempt("good", 0.0, result=["road"])
+
+        index, result = await asyncio.wait_for(
+            first_accepted([failing, empty, good], hedge_s=None, accept=bool),
+            timeout=1.0,
+        )
+
+        self.assertEqual((index, result), (2, ["road"]))
+
+    async def test_exhausted_race_reports_every_outcome_in_attempt_order(self):
+        error = RuntimeError("down")
+        attempts = [_Attempt("empty", 0.01, result=[]), _Attempt("failing", 0.0, error=error)]
+
+        with self.assertRaises(NoAcceptedResult) as raised:
+            await first_accepted(attempts, hedge_s=0.0, accept=bool)
+
+        self.assertEqual(raised.exception.outcomes, [[], error])
+
+    async def test_abort_on_error_cancels_the_race(self):
+        slow = _Attempt("slow", 5.0, result="slow")
+        aborting = _Attempt("aborting", 0.0, error=LookupError("provider_down"))
+
+        with self.assertRaises(LookupError):
+            await asyncio.wait_for(first_accepted([slow, aborting], hedge_s=0.0, abort_on=(LookupError,)), timeout=1.0)
+
+        self.assertTrue(slow.cancelled)
+
+
+if __name__ == "__main__":
+    unittest.main()
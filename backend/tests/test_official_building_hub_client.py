@@ -38,6 +38,10 @@ class FakeAsyncClient:
 
 
 class OfficialBuildingHubClientTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        official_building_hub_client.reset_service_key_candidates()
+        self.addCleanup(official_building_hub_client.reset_service_key_candidates)
+
     def test_existing_building_hub_key_alias_is_recognized(self):
         with patch.dict(
             official_building_hub_client.os.environ,
@@ -60,6 +64,35 @@ class OfficialBuildingHubClientTests(unittest.IsolatedAsyncioTestCase):
                 official_building_hub_client._resolve_service_key(), "server-only-key"
             )
 
+    def test_key_candidates_are_resolved_once_until_reset(self):
+        with (
+            patch.dict(
+                official_building_hub_client.os.environ,
+                {"MOLIT_BUILDING_HUB_API_KEY": "server-only-key"},
+                clear=True,
+            ),
+            patch.object(
+                official_building_hub_client,
+                "_scan_service_key_candidates",
+                wraps=official_building_hub_client._scan_service_key_candidates,
+            ) as scan,
+        ):
+            official_building_hub_client._service_key_candidates()
+            official_building_hub_client.os.environ["MOLIT_BUILDING_HUB_SERVICE_KEY"] = "rotated-key"
+            before_reset = official_building_hub_client._service_key_candidates()
+            official_building_hub_client.reset_service_key_candidates()
+            candidates = official_building_hub_client._service_key_candidates()
+
+        self.assertEqual(scan.call_count, 2)
+        self.assertEqual(before_reset, [("MOLIT_BUILDING_HUB_API_KEY", "server-only-key")])
+        self.assertEqual(
+            candidates,
+            [
+                ("MOLIT_BUILDING_HUB_SERVICE_KEY", "rotated-key"),
+                ("MOLIT_BUILDING_HUB_API_KEY", "server-only-key"),
+            ],
+        )
+
     def test_encoded_data_go_service_key_is_normalized_before_request(self):
         normalized_key = official_building_hub_client._normalize_service_key(
             "abc%2Bdef%2Fghi%3D"
@@ -1,13 +1,19 @@
 import asyncio
 import json
 import unittest
-import urllib.error
 from unittest.mock import patch
 
+import httpx
+
 import building_footprint
 
 
 class OfficialBuildingMapWfsTests(unittest.TestCase):
+    def setUp(self):
+        building_footprint.BUILDING_TILE_CACHE.clear()
+        building_footprint.provider_breaker("vworld_map_wfs").reset()
+        building_footprint.provider_breaker("vworld_api_wfs").reset()
+
     def test_map_wfs_collection_uses_mercator_and_returns_wgs84_rings(self):
         payload = {
             "type": "FeatureCollection",
@@ -16,7 +22,7 @@ class OfficialBuildingMapWfsTests(unittest.TestCase):
                 "properties": {"bd_mgt_sn": "building-1", "buld_nm": "Official Building"},
                 "geometry": {
                     "type": "Polygon",
-                    "coordinates": [[[14134600.0, 4518500.0], [14134620.0, 4518500.0], [14134620.0, 4518520.0], [14134600.0, 4518520.0], [14134600.0, 4518500.0]]],
+                    "coordinates": [[[14135100.0, 4518300.0], [14135120.0, 4518300.0], [14135120.0, 4518320.0], [14135100.0, 4518320.0], [14135100.0, 4518300.0]]],
                 },
             }],
         }
@@ -29,7 +35,7 @@ class OfficialBuildingMapWfsTests(unittest.TestCase):
 
         with (
             patch.object(building_footprint, "_resolve_vworld_api_key", return_value="server-only-key"),
-            patch.object(building_footprint, "_fetch_text_with_retries_sync", side_effect=fetch_collection),
+            patch.object(building_footprint, "_fetch_text_with_retries", side_effect=fetch_collection),
         ):
             result = asyncio.run(building_footprint.lookup_official_building_collection(37.5663, 126.9780))
 
@@ -50,7 +56,7 @@ class OfficialBuildingMapWfsTests(unittest.TestCase):
                 "properties": {"bd_mgt_sn": "building-2", "buld_nm": "API WFS Building"},
                 "geometry": {
                     "type": "Polygon",
-                    "coordinates": [[[14134600.0, 4518500.0], [14134620.0, 4518500.0], [14134620.0, 4518520.0], [14134600.0, 4518520.0], [14134600.0, 4518500.0]]],
+                    "coordinates": [[[14135100.0, 4518300.0], [14135120.0, 4518300.0], [14135120.0, 4518320.0], [14135100.0, 4518320.0], [14135100.0, 4518300.0]]],
                 },
             }],
         }
@@ -60,23 +66,33 @@ class OfficialBuildingMapWfsTests(unittest.TestCase):
             endpoint = kwargs["endpoint"]
             calls.append((endpoint, params))
             if endpoint == building_footprint.VWORLD_MAP_WFS_ENDPOINT:
-                raise urllib.error.HTTPError(endpoint, 502, "Bad Gateway", hdrs=None, fp=None)
+                raise httpx.HTTPStatusError(
+                    "Bad Gateway",
+                    request=httpx.Request("GET", endpoint),
+                    response=httpx.Response(502),
+                )
             return json.dumps(payload)
 
         with (
             patch.object(building_footprint, "_resolve_vworld_api_key", return_value="server-only-key"),
-            patch.object(building_footprint, "_fetch_text_with_retries_sync", side_effect=fetch_collection),
+            patch.object(building_footprint, "_fetch_text_with_retries", side_effect=fetch_collection),
         ):
             result = asyncio.run(building_footprint.lookup_official_building_collection(37.5663, 126.9780))
 
         self.assertTrue(result["official_available"])
         self.assertEqual(result["source_origin"], "vworld_api_wfs")
-        self.assertEqual(calls[1][0], building_footprint.VWORLD_WFS_ENDPOINT)
-        self.assertEqual(calls[1][1]["key"], "server-only-key")
-        self.assertNotIn("DOMAIN", calls[1][1])
+        api_calls = [params for endpoint, params in calls if endpoint == building_footprint.VWORLD_WFS_ENDPOINT]
+        self.assertTrue(api_calls)
+        self.assertTrue(all(params["key"] == "server-only-key" for params in api_calls))
+        self.assertTrue(all("DOMAIN" not in params for params in api_calls))
 
 
 class OfficialBuildingClickTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        building_footprint.BUILDING_TILE_CACHE.clear()
+        building_footprint.provider_breaker("vworld_map_wfs").reset()
+        building_footprint.provider_breaker("vworld_api_wfs").reset()
+
     async def test_click_lookup_uses_map_wfs_and_requires_the_clicked_building(self):
         southwest = building_footprint._lonlat_to_web_mercator(126.9778, 37.5662)
         northeast = building_footprint._lonlat_to_web_mercator(126.9782, 37.5666)
@@ -108,7 +124,7 @@ class OfficialBuildingClickTests(unittest.IsolatedAsyncioTestCase):
             patch.dict(building_footprint.os.environ, {}, clear=True),
             patch.object(building_footprint, "_match_cached_footprint", return_value=None),
             patch.object(building_footprint, "_resolve_vworld_api_key", return_value="server-only-key"),
-            patch.object(building_footprint, "_fetch_text_with_retries_sync", side_effect=fetch_collection),
+            patch.object(building_footprint, "_fetch_text_with_retries", side_effect=fetch_collection),
             patch.object(building_footprint, "_store_footprint_cache_entry", return_value={}),
         ):
             result = await building_footprint.lookup_building_footprint(37.5664, 126.9780)
@@ -123,8 +139,9 @@ class OfficialBuildingClickTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(captured["kwargs"]["endpoint"], building_footprint.VWORLD_MAP_WFS_ENDPOINT)
 
     async def test_road_click_does_not_become_the_nearest_building(self):
-        southwest = building_footprint._lonlat_to_web_mercator(126.9790, 37.5662)
-        northeast = building_footprint._lonlat_to_web_mercator(126.9794, 37.5666)
+        # Inside the 40 m query box, but east of the clicked road.
+        southwest = building_footprint._lonlat_to_web_mercator(126.9782, 37.5662)
+        northeast = building_footprint._lonlat_to_web_mercator(126.9786, 37.5666)
         payload = {
             "features": [{
                 "properties": {"buld_nm": "Nearby Official Building"},
@@ -145,8 +162,8 @@ class OfficialBuildingClickTests(unittest.IsolatedAsyncioTestCase):
             patch.dict(building_footprint.os.environ, {}, clear=True),
             patch.object(building_footprint, "_match_cached_footprint", return_value=None),
             patch.object(building_footprint, "_resolve_vworld_api_key", return_value="server-only-key"),
-            patch.object(building_footprint, "_fetch_text_with_retries_sync", return_value=json.dumps(payload)),
-            patch.object(building_footprint, "_lookup_osm_fallback_sync", side_effect=AssertionError("road clicks must not fall back to OSM buildings")),
+            patch.object(building_footprint, "_fetch_text_with_retries", return_value=json.dumps(payload)),
+            patch.object(building_footprint, "_lookup_osm_fallback", side_effect=AssertionError("road clicks must not fall back to OSM buildings")),
         ):
             result = await building_footprint.lookup_building_footprint(37.5664, 126.9780)
 
@@ -154,5 +171,36 @@ class OfficialBuildingClickTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result["reason"], "no_official_building_at_click")
 
 
+
+class FootprintTransportTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        building_footprint.provider_breaker("overpass").reset()
+
+    async def test_overpass_lookup_fails_over_to_the_next_endpoint_over_the_pooled_client(self):
+        requests = []
+        real_async_client = httpx.AsyncClient
+        ring = [[126.9779, 37.5664], [126.9781, 37.5664], [126.9781, 37.5666], [126.9779, 37.5666], [126.9779, 37.5664]]
+        payload = {"elements": [{"type": "way", "tags": {"building": "yes"}, "geometry": [{"lon": lon, "lat": lat} for lon, lat in ring]}]}
+
+        def handler(request):
+            requests.append((str(request.url), request.content.decode("utf-8")))
+            if len(requests) == 1:
+                return httpx.Response(504, text="gateway timeout")
+            return httpx.Response(200, json=payload)
+
+        def client_factory(*args, **kwargs):
+            return real_async_client(*args, transport=httpx.MockTransport(handler), **kwargs)
+
+        with (
+            patch.object(building_footprint, "OVERPASS_ENDPOINTS", ["https://overpass-a.test/api", "https://overpass-b.test/api"]),
+            patch.object(httpx, "AsyncClient", side_effect=client_factory),
+        ):
+            result = await building_footprint._lookup_osm_fallback(37.5665, 126.978)
+
+        self.assertTrue(result["available"])
+        self.assertEqual(result["source"], "osm_fallback")
+        self.assertEqual([url for url, _body in requests], ["https://overpass-a.test/api", "https://overpass-b.test/api"])
+        self.assertTrue(requests[0][1].startswith("data="))
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,8 @@
+import asyncio
 from pathlib import Path
 import sys
+import tempfile
+import time
 import unittest
 from unittest.mock import AsyncMock, patch
 
@@ -10,9 +13,29 @@ if str(BACKEND_ROOT) not in sys.path:
 
 import official_building_registry  # noqa: E402
 import official_building_hub_client  # noqa: E402
+from request_deadline import request_deadline  # noqa: E402
+
+
+def _isolate_title_record_cache(test):
+    store_dir = tempfile.TemporaryDirectory()
+    test.addCleanup(store_dir.cleanup)
+    patcher = patch.object(
+        official_building_registry,
+        "BUILDING_HUB_RECORD_STORE_PATH",
+        str(Path(store_dir.name) / "building_hub_records.sqlite3"),
+    )
+    patcher.start()
+    test.addCleanup(patcher.stop)
+    official_building_registry.TITLE_RECORD_CACHE.clear()
+    test.addCleanup(official_building_registry.TITLE_RECORD_CACHE.clear)
+    official_building_hub_client.reset_service_key_candidates()
+    test.addCleanup(official_building_hub_client.reset_service_key_candidates)
 
 
 class OfficialBuildingRegistryTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        _isolate_title_record_cache(self)
+
     def test_building_management_number_maps_to_building_hub_query(self):
         query = official_building_registry.building_hub_query_from_management_number(
             "1114010300100310000019224"
@@ -162,5 +185,96 @@ class OfficialBuildingRegistryTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result["registry_reason"], "official_geometry_identifier_mismatch")
 
 
+class TitleRecordCacheTests(unittest.IsolatedAsyncioTestCase):
+    footprint = {
+        "available": True,
+        "official_footprint_available": True,
+        "official_geometry_receipt": True,
+        "official_selection_match": True,
+        "source_chain": ["vworld_wfs"],
+        "properties": {"bd_mgt_sn": "1114010300100310000019224", "buld_nm": "서울특별시청"},
+    }
+
+    def setUp(self):
+        _isolate_title_record_cache(self)
+
+    async def _enrich(self, fetch, count=1):
+        with (
+            patch.dict(
+                official_building_hub_client.os.environ,
+                {"MOLIT_BUILDING_HUB_SERVICE_KEY": "server-only-key"},
+                clear=True,
+            ),
+            patch.object(official_building_registry, "_fetch_title_records", fetch),
+        ):
+            return await asyncio.gather(*(
+                official_building_registry.enrich_verified_footprint(self.footprint) for _ in range(count)
+            ))
+
+    async def test_warm_building_is_enriched_without_a_registry_call(self):
+        async def slow_fetch(_query, _service_key):
+            await asyncio.sleep(0.01)
+            return [{"bldNm": "서울특별시청", "heit": "41.65", "mgmBldrgstPk": "title"}]
+
+        fetch = AsyncMock(side_effect=slow_fetch)
+        concurrent = await self._enrich(fetch, count=3)
+        (warm,) = await self._enrich(fetch)
+
+        fetch.assert_awaited_once()
+        for result in (*concurrent, warm):
+            self.assertEqual(result["registry_status"], "official_verified")
+            self.assertEqual(result["properties"]["buld_hg"], 41.65)
+
+    async def test_records_survive_a_restart_through_the_persistent_store(self):
+        await self._enrich(AsyncMock(return_value=[{"bldNm": "서울특별시청", "heit": "41.65"}]))
+        official_building_registry.TITLE_RECORD_CACHE.clear()
+
+        fetch = AsyncMock(side_effect=AssertionError("warm store must not call Building HUB"))
+        (result,) = await self._enrich(fetch)
+
+        self.assertEqual(result["properties"]["buld_hg"], 41.65)
+
+    async def test_not_found_is_cached_for_its_shorter_ttl(self):
+        fetch = AsyncMock(return_value=[])
+        (first,) = await self._enrich(fetch)
+        (second,) = await self._enrich(fetch)
+
+        self.assertEqual(first["registry_reason"], "molit_building_hub_not_found")
+        self.assertEqual(second["registry_reason"], "molit_building_hub_not_found")
+        fetch.assert_awaited_once()
+        key = official_building_registry._title_record_query_key(
+            official_building_registry.building_hub_query_from_management_number("1114010300100310000019224")
+        )
+        self.assertLessEqual(
+            official_building_registry.TITLE_RECORD_CACHE[key]["expires_at"],
+            time.time() + official_building_registry.BUILDING_HUB_NOT_FOUND_TTL_S,
+        )
+
+        official_building_registry.TITLE_RECORD_CACHE[key]["expires_at"] = time.time() - 1
+        official_building_registry._title_record_store().put(key, [], time.time() - 1)
+        await self._enrich(fetch)
+        self.assertEqual(fetch.await_count, 2)
+
+    async def test_a_cold_record_fetch_cannot_outlive_the_request_budget(self):
+        async def slow_fetch(_query, _service_key):
+            await asyncio.sleep(2.0)
+            return [{"bldNm": "서울특별시청", "heit": "41.65"}]
+
+        started = time.monotonic()
+        with request_deadline(0.3):
+            (result,) = await self._enrich(AsyncMock(side_effect=slow_fetch))
+
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(result["registry_reason"], "molit_building_hub_timeout")
+
+    async def test_registry_failures_are_not_cached(self):
+        failing = AsyncMock(side_effect=official_building_registry.OfficialBuildingRegistryError("molit_building_hub_timeout"))
+        (failed,) = await self._enrich(failing)
+        (recovered,) = await self._enrich(AsyncMock(return_value=[{"bldNm": "서울특별시청", "heit": "41.65"}]))
+
+        self.assertEqual(failed["registry_reason"], "molit_building_hub_timeout")
+        self.assertEqual(recovered["registry_status"], "official_verified")
+
+
 if __name__ == "__main__":
     unittest.main()
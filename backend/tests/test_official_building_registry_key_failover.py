@@ -1,5 +1,6 @@
 from pathlib import Path
 import sys
+import tempfile
 import unittest
 from unittest.mock import AsyncMock, patch
 
@@ -10,38 +11,64 @@ if str(BACKEND_ROOT) not in sys.path:
 
 import official_building_registry  # noqa: E402
 import official_building_hub_client  # noqa: E402
+from credential_health import CREDENTIAL_HEALTH  # noqa: E402
+from provider_quota import PROVIDER_QUOTAS  # noqa: E402
+
+
+FOOTPRINT = {
+    "available": True,
+    "official_footprint_available": True,
+    "official_geometry_receipt": True,
+    "official_selection_match": True,
+    "source": "vworld_wfs",
+    "source_chain": ["vworld_wfs"],
+    "display_name": "서울특별시청",
+    "properties": {
+        "bd_mgt_sn": "1114010300100310000019224",
+        "buld_nm": "서울특별시청",
+    },
+}
+NEIGHBOUR_FOOTPRINT = {
+    **FOOTPRINT,
+    "properties": {**FOOTPRINT["properties"], "bd_mgt_sn": "1114010300100320000019225"},
+}
+REGISTRY_ROW = {
+    "bldNm": "서울특별시청",
+    "heit": "41.65",
+    "grndFlrCnt": "6",
+    "bcRat": "52.4",
+    "vlRat": "318.7",
+}
 
 
 class OfficialBuildingRegistryKeyFailoverTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        store_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(store_dir.cleanup)
+        patcher = patch.object(
+            official_building_registry,
+            "BUILDING_HUB_RECORD_STORE_PATH",
+            str(Path(store_dir.name) / "building_hub_records.sqlite3"),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        official_building_registry.TITLE_RECORD_CACHE.clear()
+        self.addCleanup(official_building_registry.TITLE_RECORD_CACHE.clear)
+        PROVIDER_QUOTAS.reset()
+        self.addCleanup(PROVIDER_QUOTAS.reset)
+        CREDENTIAL_HEALTH.reset()
+        self.addCleanup(CREDENTIAL_HEALTH.reset)
+        official_building_hub_client.reset_service_key_candidates()
+        self.addCleanup(official_building_hub_client.reset_service_key_candidates)
+
     async def test_verified_click_uses_an_approved_alias_when_the_primary_alias_is_stale(self):
         # Given: Render contains both a stale preferred alias and an older approved alias.
-        footprint = {
-            "available": True,
-            "official_footprint_available": True,
-            "official_geometry_receipt": True,
-            "official_selection_match": True,
-            "source": "vworld_wfs",
-            "source_chain": ["vworld_wfs"],
-            "display_name": "서울특별시청",
-            "properties": {
-                "bd_mgt_sn": "1114010300100310000019224",
-                "buld_nm": "서울특별시청",
-            },
-        }
-        registry_row = {
-            "bldNm": "서울특별시청",
-            "heit": "41.65",
-            "grndFlrCnt": "6",
-            "bcRat": "52.4",
-            "vlRat": "318.7",
-        }
-
         async def fetch_records(_query, service_key):
             if service_key == "stale-key":
                 raise official_building_registry.OfficialBuildingRegistryError(
                     "molit_building_hub_key_unregistered"
                 )
-            return [registry_row]
+            return [REGISTRY_ROW]
 
         with (
             patch.dict(
@@ -59,7 +86,7 @@ class OfficialBuildingRegistryKeyFailoverTests(unittest.IsolatedAsyncioTestCase)
             ) as fetch,
         ):
             # When: a verified building click is enriched.
-            result = await official_building_registry.enrich_verified_footprint(footprint)
+            result = await official_building_registry.enrich_verified_footprint(FOOTPRINT)
 
         # Then: the approved configured alias supplies the official registry values.
         self.assertEqual(result["registry_status"], "official_verified")
@@ -69,6 +96,136 @@ class OfficialBuildingRegistryKeyFailoverTests(unittest.IsolatedAsyncioTestCase)
             ["stale-key", "approved-key"],
         )
 
+    async def test_a_rejected_key_is_demoted_so_later_lookups_go_straight_to_the_working_key(self):
+        async def fetch_records(_query, service_key):
+            if service_key == "expired-key":
+                raise official_building_registry.OfficialBuildingRegistryError(
+                    "molit_building_hub_key_expired"
+                )
+            return [REGISTRY_ROW]
+
+        with (
+            patch.dict(
+                official_building_hub_client.os.environ,
+                {
+                    "MOLIT_BUILDING_HUB_SERVICE_KEY": "expired-key",
+                    "MOLIT_BUILDING_HUB_API_KEY": "approved-key",
+                },
+                clear=True,
+            ),
+            patch.object(
+                official_building_registry,
+                "_fetch_title_records",
+                AsyncMock(side_effect=fetch_records),
+            ) as fetch,
+            patch.object(CREDENTIAL_HEALTH, "demotion_s", 0.0),
+        ):
+            await official_building_registry.enrich_verified_footprint(FOOTPRINT)
+            # Even once the demotion has lapsed, the last known-good key leads.
+            second = await official_building_registry.enrich_verified_footprint(NEIGHBOUR_FOOTPRINT)
+            health = official_building_hub_client.service_key_health_snapshot()
+
+        self.assertEqual(second["registry_status"], "official_verified")
+        self.assertEqual(
+            [call.args[1] for call in fetch.await_args_list],
+            ["expired-key", "approved-key", "approved-key"],
+        )
+        self.assertEqual(
+            [(entry["credential"], entry["last_known_good"]) for entry in health],
+            [("MOLIT_BUILDING_HUB_SERVICE_KEY", False), ("MOLIT_BUILDING_HUB_API_KEY", True)],
+        )
+
+    async def test_a_demoted_key_is_tried_after_the_others_until_its_cool_down_ends(self):
+        async def fetch_records(_query, service_key):
+            raise official_building_registry.OfficialBuildingRegistryError(
+                "molit_building_hub_key_unregistered"
+                if service_key == "unregistered-key"
+                else "molit_building_hub_access_denied"
+            )
+
+        with (
+            patch.dict(
+                official_building_hub_client.os.environ,
+                {
+                    "MOLIT_BUILDING_HUB_SERVICE_KEY": "unregistered-key",
+                    "MOLIT_BUILDING_HUB_API_KEY": "denied-key",
+                },
+                clear=True,
+            ),
+            patch.object(
+                official_building_registry,
+                "_fetch_title_records",
+                AsyncMock(side_effect=fetch_records),
+            ) as fetch,
+        ):
+            await official_building_registry.enrich_verified_footprint(FOOTPRINT)
+            CREDENTIAL_HEALTH.record_success("molit_building_hub", "denied-key")
+            await official_building_registry.enrich_verified_footprint(NEIGHBOUR_FOOTPRINT)
+            health = official_building_hub_client.service_key_health_snapshot()
+
+        self.assertEqual(
+            [call.args[1] for call in fetch.await_args_list],
+            ["unregistered-key", "denied-key", "denied-key", "unregistered-key"],
+        )
+        self.assertEqual(
+            [(entry["demoted"], entry["demoted_reason"]) for entry in health],
+            [(True, "molit_building_hub_key_unregistered"), (True, "molit_building_hub_access_denied")],
+        )
+        self.assertNotIn("denied-key", repr(health))
+
+    async def test_a_key_over_its_daily_quota_is_skipped_until_the_quota_resets(self):
+        async def fetch_records(_query, service_key):
+            if service_key == "spent-key":
+                raise official_building_registry.OfficialBuildingRegistryError(
+                    "molit_building_hub_quota_exceeded"
+                )
+            return [REGISTRY_ROW]
+
+        with (
+            patch.dict(
+                official_building_hub_client.os.environ,
+                {
+                    "MOLIT_BUILDING_HUB_SERVICE_KEY": "spent-key",
+                    "MOLIT_BUILDING_HUB_API_KEY": "spare-key",
+                },
+                clear=True,
+            ),
+            patch.object(
+                official_building_registry,
+                "_fetch_title_records",
+                AsyncMock(side_effect=fetch_records),
+            ) as fetch,
+        ):
+            first = await official_building_registry.enrich_verified_footprint(FOOTPRINT)
+            second = await official_building_registry.enrich_verified_footprint(NEIGHBOUR_FOOTPRINT)
+            quota = official_building_hub_client.service_key_quota_snapshot()
+
+        self.assertEqual(first["registry_status"], "official_verified")
+        self.assertEqual(second["registry_status"], "official_verified")
+        # The spent key is tried once; afterwards its budget sheds it up front.
+        self.assertEqual(
+            [call.args[1] for call in fetch.await_args_list],
+            ["spent-key", "spare-key", "spare-key"],
+        )
+        self.assertEqual(
+            [(entry["credential"], entry["exhausted_today"]) for entry in quota],
+            [("MOLIT_BUILDING_HUB_SERVICE_KEY", True), ("MOLIT_BUILDING_HUB_API_KEY", False)],
+        )
+        self.assertNotIn("spent-key", repr(quota))
+
+    async def test_all_keys_out_of_quota_sheds_without_a_registry_call(self):
+        with patch.dict(
+            official_building_hub_client.os.environ,
+            {"MOLIT_BUILDING_HUB_SERVICE_KEY": "spent-key"},
+            clear=True,
+        ):
+            PROVIDER_QUOTAS.budget("molit_building_hub", "MOLIT_BUILDING_HUB_SERVICE_KEY", "spent-key").exhaust()
+            with patch.object(official_building_registry, "_fetch_title_records", AsyncMock()) as fetch:
+                result = await official_building_registry.enrich_verified_footprint(FOOTPRINT)
+
+        fetch.assert_not_awaited()
+        self.assertEqual(result["registry_reason"], "molit_building_hub_quota_exceeded")
+
 
 if __name__ == "__main__":
     unittest.main()
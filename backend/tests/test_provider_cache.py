@@ -0,0 +1,137 @@
+import asyncio
+from pathlib import Path
+import sys
+import unittest
+from unittest.mock import patch
+
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import provider_cache  # noqa: E402
+from provider_cache import EvidenceCache, SingleFlight  # noqa: E402
+from request_deadline import remaining_s, request_deadline  # noqa: E402
+
+
+class EvidenceCacheTests(unittest.TestCase):
+    def test_least_recently_used_entry_is_evicted_at_capacity(self):
+        cache = EvidenceCache("test", ttl_s=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get_fresh("a"), 1)
+
+        cache.set("c", 3)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_stale_tier_serves_expired_entries_until_stale_ttl(self):
+        cache = EvidenceCache("test", ttl_s=10, stale_ttl_s=100, max_entries=8)
+        with patch.object(provider_cache.time, "time", return_value=1000.0):
+            cache.set("k", {"value": 1})
+        with patch.object(provider_cache.time, "time", return_value=1050.0):
+            self.assertIsNone(cache.get_fresh("k"))
+            self.assertEqual(cache.get_stale("k"), {"value": 1})
+        with patch.object(provider_cache.time, "time", return_value=1101.0):
+            self.assertIsNone(cache.get_stale("k"))
+
+        self.assertNotIn("k", cache)
+        stats = cache.stats()
+        self.assertEqual((stats["stale_hits"], stats["misses"], stats["expirations"]), (1, 2, 1))
+
+    def test_per_entry_expiry_overrides_ttl_and_shifts_stale_tier(self):
+        cache = EvidenceCache("test", ttl_s=10, stale_ttl_s=30, max_entries=8)
+        with patch.object(provider_cache.time, "time", return_value=1000.0):
+            cache.set("k", "cycle", expires_at=5000.0)
+        with patch.object(provider_cache.time, "time", return_value=4999.0):
+            self.assertEqual(cache.get_fresh("k"), "cycle")
+        with patch.object(provider_cache.time, "time", return_value=5015.0):
+            self.assertIsNone(cache.get_fresh("k"))
+            self.assertEqual(cache.get_stale("k"), "cycle")
+        with patch.object(provider_cache.time, "time", return_value=5021.0):
+            self.assertIsNone(cache.get_stale("k"))
+
+    def test_writes_drop_expired_entries_without_a_read(self):
+        cache = EvidenceCache("test", ttl_s=10, max_entries=8)
+        with patch.object(provider_cache.time, "time", return_value=1000.0):
+            cache.set("old", 1)
+        with patch.object(provider_cache.time, "time", return_value=1020.0):
+            cache.set("new", 2)
+
+        self.assertEqual(list(cache), ["new"])
+
+
+class SingleFlightTests(unittest.IsolatedAsyncioTestCase):
+    async def test_caller_timeout_does_not_cancel_shared_fetch(self):
+        flight = SingleFlight("test")
+        release = asyncio.Event()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await release.wait()
+            return {"value": 1}
+
+        impatient = asyncio.create_task(asyncio.wait_for(flight.run("k", fetch), timeout=0.01))
+        patient = asyncio.create_task(flight.run("k", fetch))
+        with self.assertRaises(asyncio.TimeoutError):
+            await impatient
+        self.assertTrue(flight.inflight("k"))
+
+        release.set()
+        self.assertEqual(await patient, {"value": 1})
+        self.assertEqual(len(calls), 1)
+        self.assertFalse(flight.inflight("k"))
+
+    async def test_completed_fetch_is_not_reused_for_next_miss(self):
+        flight = SingleFlight("test")
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(await flight.run("k", fetch), 1)
+        self.assertEqual(await flight.run("k", fetch), 2)
+
+    async def test_revalidate_outlives_the_request_deadline_that_started_it(self):
+        flight = SingleFlight("test")
+        seen = []
+
+        async def refresh():
+            await asyncio.sleep(0.05)
+            seen.append(remaining_s())
+            return "fresh"
+
+        with request_deadline(0.01):
+            flight.revalidate("k", refresh)
+            self.assertIsNotNone(remaining_s())
+        while flight.inflight("k"):
+            await asyncio.sleep(0.01)
+
+        self.assertEqual(seen, [None])
+
+    async def test_coalesced_fetch_is_not_bound_to_the_first_callers_deadline(self):
+        flight = SingleFlight("test")
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return remaining_s()
+
+        async def hurried():
+            with request_deadline(0.01):
+                return await asyncio.wait_for(flight.run("k", fetch), timeout=0.01)
+
+        first = asyncio.create_task(hurried())
+        await asyncio.sleep(0)
+        second = asyncio.create_task(flight.run("k", fetch))
+        with self.assertRaises(asyncio.TimeoutError):
+            await first
+
+        self.assertIsNone(await second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+import asyncio
+from datetime import date
+from pathlib import Path
+import sys
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import main  # noqa: E402
+import provider_quota  # noqa: E402
+from provider_quota import PROVIDER_QUOTAS, CredentialBudget, ProviderQuotaRegistry, QuotaExhausted  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+        self.today = date(2026, 5, 1)
+
+    def __call__(self):
+        return self.now
+
+    def day(self):
+        return self.today
+
+
+class CredentialBudgetTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+        self.budget = CredentialBudget(
+            "molit_building_hub",
+            "MOLIT_BUILDING_HUB_SERVICE_KEY",
+            rate_per_s=2.0,
+            burst=2,
+            daily_limit=5,
+            clock=self.clock,
+            day=self.clock.day,
+        )
+
+    def test_bucket_allows_a_burst_then_refills_at_the_configured_rate(self):
+        self.assertTrue(self.budget.try_take())
+        self.assertTrue(self.budget.try_take())
+        self.assertFalse(self.budget.try_take())
+        self.assertAlmostEqual(self.budget.wait_s(), 0.5)
+
+        self.clock.now += 0.5
+
+        self.assertTrue(self.budget.try_take())
+        self.assertFalse(self.budget.try_take())
+
+    def test_daily_ledger_closes_the_credential_until_the_quota_day_rolls_over(self):
+        for _ in range(5):
+            self.clock.now += 1.0
+            self.assertTrue(self.budget.try_take())
+        self.clock.now += 1.0
+
+        self.assertFalse(self.budget.try_take())
+        self.assertIsNone(self.budget.wait_s())
+        self.assertEqual(self.budget.snapshot()["remaining_today"], 0)
+
+        self.clock.today = date(2026, 5, 2)
+
+        self.assertTrue(self.budget.try_take())
+        self.assertEqual(self.budget.snapshot()["used_today"], 1)
+
+    def test_gateway_rejections_drain_the_bucket_or_close_the_day(self):
+        self.budget.throttle()
+        self.assertFalse(self.budget.try_take())
+        self.clock.now += 0.5
+        self.assertTrue(self.budget.try_take())
+
+        self.budget.exhaust()
+        self.clock.now += 10.0
+
+        self.assertFalse(self.budget.try_take())
+        snapshot = self.budget.snapshot()
+        self.assertTrue(snapshot["exhausted_today"])
+        self.assertEqual(snapshot["gateway_rejections"], 2)
+        self.assertEqual(snapshot["credential"], "MOLIT_BUILDING_HUB_SERVICE_KEY")
+
+
+class ProviderQuotaRegistryTests(unittest.TestCase):
+    def setUp(self):
+        self.registry = ProviderQuotaRegistry()
+        self.registry.register("molit_building_hub", rate_per_s=1.0, burst=1, daily_limit=0)
+
+    def test_a_burst_spills_over_onto_the_next_credential(self):
+        candidates = [("PRIMARY", "primary-key"), ("SPARE", "spare-key")]
+
+        positions = asyncio.run(self._acquire_many(candidates, 2))
+
+        self.assertEqual(positions, [0, 1])
+
+    def test_sheds_a_request_that_would_wait_past_the_budget(self):
+        candidates = [("PRIMARY", "primary-key")]
+
+        with patch.object(provider_quota, "PROVIDER_QUOTA_MAX_WAIT_S", 0.0):
+            with self.assertRaises(QuotaExhausted) as raised:
+                asyncio.run(self._acquire_many(candidates, 2))
+
+        self.assertEqual(raised.exception.reason, "molit_building_hub_rate_limited")
+        self.assertEqual(self.registry.budget("molit_building_hub", "PRIMARY", "primary-key").shed, 1)
+
+    def test_sheds_with_quota_exceeded_once_every_credential_is_spent_for_the_day(self):
+        self.registry.budget("molit_building_hub", "PRIMARY", "primary-key").exhaust()
+
+        with self.assertRaises(QuotaExhausted) as raised:
+            asyncio.run(self.registry.acquire("molit_building_hub", [("PRIMARY", "primary-key")]))
+
+        self.assertEqual(raised.exception.reason, "molit_building_hub_quota_exceeded")
+
+    async def _acquire_many(self, candidates, count):
+        return [await self.registry.acquire("molit_building_hub", candidates) for _ in range(count)]
+
+
+class KmaQuotaTests(unittest.TestCase):
+    def setUp(self):
+        PROVIDER_QUOTAS.reset()
+        self.addCleanup(PROVIDER_QUOTAS.reset)
+
+    def test_gateway_quota_responses_feed_the_kma_budget(self):
+        with patch.dict(main.os.environ, {"KMA_API_KEY": "kma-key"}, clear=True):
+            main._record_kma_quota_response(
+                "surface", "kma-key", httpx.Response(200, text="LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR")
+            )
+            snapshot = main._kma_quota_snapshot()
+
+        self.assertTrue(snapshot["surface"]["exhausted_today"])
+        self.assertEqual(snapshot["surface"]["credential"], "KMA_API_KEY")
+        self.assertFalse(snapshot["upper_air"]["exhausted_today"])
+        self.assertNotIn("kma-key", repr(snapshot))
+
+    def test_exhausted_key_sheds_the_surface_fetch_with_the_quota_reason(self):
+        PROVIDER_QUOTAS.budget("kma_surface", "KMA_API_KEY", "kma-key").exhaust()
+
+        with (
+            patch.dict(main.os.environ, {"KMA_API_KEY": "kma-key"}, clear=True),
+            self.assertRaises(main.SurfaceWeatherFetchError) as raised,
+        ):
+            asyncio.run(main._fetch_kma_surface_snapshot_response("202605011200", "kma-key"))
+
+        self.assertEqual(raised.exception.reason, main.SURFACE_WEATHER_REASON_QUOTA)
+
+    def test_a_momentary_rate_limit_shed_is_not_reported_as_a_spent_quota(self):
+        budget = PROVIDER_QUOTAS.budget("kma_surface", "KMA_API_KEY", "kma-key")
+        budget.throttle()
+
+        with (
+            patch.object(provider_quota, "PROVIDER_QUOTA_MAX_WAIT_S", 0.0),
+            self.assertRaises(main.SurfaceWeatherFetchError) as raised,
+        ):
+            asyncio.run(main._fetch_kma_surface_snapshot_response("202605011200", "kma-key"))
+
+        self.assertEqual(raised.exception.reason, main.SURFACE_WEATHER_REASON_RATE_LIMITED)
+
+    def test_a_shed_wind_profiler_probe_does_not_fall_back_to_an_older_cycle(self):
+        PROVIDER_QUOTAS.budget("kma_wind_profiler", "KMA_API_KEY", "kma-key").exhaust()
+        cache_key = "L:test-shed"
+        provider = f"kma_wind_profiler:{main.WIND_PROFILER_MODE}"
+        main.PUBLISHED_CYCLES.forget(provider)
+        self.addCleanup(main.PUBLISHED_CYCLES.forget, provider)
+
+        with patch.dict(main.os.environ, {"KMA_API_KEY": "kma-key"}, clear=True):
+            result = asyncio.run(main._fetch_kma_wind_profiler_profile_upstream(
+                37.5665, 126.9780, main.WIND_PROFILER_MODE, "kma-key", cache_key
+            ))
+
+        self.assertIsNone(result)
+        self.assertIsNone(main.PUBLISHED_CYCLES.last(provider))
+        self.assertNotIn(cache_key, list(main.WIND_PROFILER_CACHE))
+
+
+if __name__ == "__main__":
+    unittest.main()
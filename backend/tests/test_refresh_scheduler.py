@@ -0,0 +1,74 @@
+import asyncio
+from datetime import datetime, timezone
+from pathlib import Path
+import sys
+import unittest
+
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import main  # noqa: E402
+from refresh_scheduler import RefreshJob, RefreshScheduler, parse_operating_areas  # noqa: E402
+
+
+class RefreshJobCadenceTests(unittest.TestCase):
+    def test_upper_air_job_aligns_to_radiosonde_cycles_after_publication_lag(self):
+        job = RefreshJob(
+            "kma_upper_air",
+            main.KMA_UPPER_AIR_REFRESH_INTERVAL_S,
+            lambda: None,
+            offset_s=main.KMA_UPPER_AIR_REFRESH_OFFSET_S,
+        )
+        now = datetime(2026, 8, 8, 3, 0, tzinfo=timezone.utc).timestamp()
+
+        next_run = datetime.fromtimestamp(now + job.next_delay_s(now), tz=timezone.utc)
+
+        self.assertEqual(next_run, datetime(2026, 8, 8, 13, 30, tzinfo=timezone.utc))
+
+    def test_ten_minute_job_runs_on_the_next_wall_clock_boundary(self):
+        job = RefreshJob("kma_surface", 600, lambda: None)
+        now = datetime(2026, 8, 8, 3, 4, 30, tzinfo=timezone.utc).timestamp()
+
+        self.assertEqual(job.next_delay_s(now), 330.0)
+
+    def test_operating_areas_skip_malformed_pairs(self):
+        self.assertEqual(
+            parse_operating_areas("37.5,126.9; bad ;91,0;35.1, 129.0"),
+            [{"lat": 37.5, "lon": 126.9}, {"lat": 35.1, "lon": 129.0}],
+        )
+
+
+class RefreshSchedulerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_jobs_warm_immediately_and_record_failures_without_stopping(self):
+        calls = []
+
+        async def warm():
+            calls.append("warm")
+
+        async def broken():
+            calls.append("broken")
+            raise RuntimeError("upstream down")
+
+        scheduler = RefreshScheduler()
+        scheduler.register(RefreshJob("warm", 3600, warm))
+        scheduler.register(RefreshJob("broken", 3600, broken))
+
+        await scheduler.start()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        self.assertTrue(scheduler.running)
+        await scheduler.aclose()
+
+        self.assertFalse(scheduler.running)
+        self.assertCountEqual(calls, ["warm", "broken"])
+        status = {item["job"]: item for item in scheduler.snapshot()}
+        self.assertEqual(status["warm"]["runs"], 1)
+        self.assertIsNone(status["warm"]["last_error"])
+        self.assertEqual(status["broken"]["failures"], 1)
+        self.assertEqual(status["broken"]["last_error"], "RuntimeError")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import asyncio
+from pathlib import Path
+import socket
+import sys
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import httpx
+from fastapi.testclient import TestClient
+
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import building_footprint  # noqa: E402
+import main  # noqa: E402
+from request_deadline import (  # noqa: E402
+    RequestDeadlineExceeded,
+    bounded_timeout,
+    deadline_wait_for,
+    remaining_s,
+    request_deadline,
+    within_deadline,
+)
+from upstream_clients import ProviderClientProfile  # noqa: E402
+from tests.task7_evaluation_fixtures import (  # noqa: E402
+    SELECTION_ID,
+    authoritative_weather,
+    official_canyon,
+    server_building,
+)
+
+
+class RequestDeadlineTests(unittest.IsolatedAsyncioTestCase):
+    async def test_timeouts_are_unbounded_outside_a_request(self):
+        self.assertIsNone(remaining_s())
+        self.assertEqual(bounded_timeout(7.5), 7.5)
+
+    async def test_nested_deadline_only_tightens_the_budget(self):
+        with request_deadline(0.5):
+            self.assertLessEqual(within_deadline(10.0), 0.5)
+            with request_deadline(30.0):
+                self.assertLessEqual(remaining_s(), 0.5)
+            with request_deadline(0.1):
+                self.assertLessEqual(remaining_s(), 0.1)
+        self.assertIsNone(remaining_s())
+
+    async def test_spent_budget_fails_fast_as_a_timeout(self):
+        fetch = AsyncMock(return_value="late")
+        with request_deadline(0.0):
+            with self.assertRaises(asyncio.TimeoutError):
+                await deadline_wait_for(fetch(), 5.0)
+            with self.assertRaises(socket.timeout):
+                bounded_timeout(5.0)
+        fetch.assert_called_once()
+
+    async def test_deadline_follows_the_request_into_worker_threads(self):
+        with request_deadline(0.25):
+            timeout = await asyncio.to_thread(within_deadline, 20.0)
+        self.assertLessEqual(timeout, 0.25)
+
+    async def test_pooled_client_caps_each_request_timeout_at_the_remaining_budget(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.extensions["timeout"])
+            return httpx.Response(200, json={})
+
+        profile = ProviderClientProfile("kma_surface", timeout_s=5.0)
+        async with httpx.AsyncClient(**profile.client_kwargs(), transport=httpx.MockTransport(handler)) as client:
+            await client.get("https://example.test/a")
+            with request_deadline(0.5):
+                await client.get("https://example.test/b")
+            with request_deadline(0.0):
+                with self.assertRaises(httpx.TimeoutException):
+                    await client.get("https://example.test/c")
+
+        self.assertEqual(seen[0]["read"], 5.0)
+        self.assertLessEqual(seen[1]["read"], 0.5)
+        self.assertLessEqual(seen[1]["connect"], 0.5)
+        self.assertEqual(len(seen), 2)
+
+    def test_footprint_wfs_fetch_uses_the_remaining_budget(self):
+        seen = []
+        real_async_client = httpx.AsyncClient
+
+        def handler(request):
+            seen.append(request.extensions["timeout"])
+            raise httpx.ReadTimeout("slow", request=request)
+
+        def client_factory(*args, **kwargs):
+            return real_async_client(*args, transport=httpx.MockTransport(handler), **kwargs)
+
+        async def fetch(budget_s, **kwargs):
+            with request_deadline(budget_s):
+                await building_footprint._fetch_text_with_retries({"SERVICE": "WFS"}, timeout_s=20.0, **kwargs)
+
+        with (
+            patch.object(httpx, "AsyncClient", side_effect=client_factory),
+            patch.object(building_footprint.asyncio, "sleep", new=AsyncMock()) as sleep,
+        ):
+            with self.assertRaises(httpx.TimeoutException):
+                asyncio.run(fetch(0.0, retries=1))
+            self.assertEqual(seen, [])
+
+            with self.assertRaises(httpx.TimeoutException):
+                asyncio.run(fetch(1.0, retries=2))
+
+        self.assertEqual(len(seen), 2)
+        self.assertLessEqual(seen[0]["read"], 1.0)
+        self.assertLessEqual(sleep.call_args.args[0], 0.6)
+
+
+class EvaluateRequestDeadlineTests(unittest.TestCase):
+    def test_evaluate_returns_unavailable_evidence_when_the_request_budget_is_spent(self):
+        # Given: a road lookup slower than the whole /api/evaluate budget.
+        async def slow_road(lat, lon, road_name=None):
+            await asyncio.sleep(5)
+
+        request_payload = {
+            "latitude": 37.5665,
+            "longitude": 126.9780,
+            "selection_id": SELECTION_ID,
+            "building_height": 20.0,
+            "street_width": 10.0,
+            "wind_alignment": "직각",
+            "mission_altitude": 30,
+            "no_fly_zone": False,
+            "crowd_area": False,
+            "gps_locked": 12,
+            "glonass_locked": 6,
+            "drone_model": main.DroneModel.MAVIC_3.value,
+        }
+        with (
+            patch.dict(main.ENDPOINT_REQUEST_DEADLINES_S, {"/api/evaluate": 0.2}),
+            patch.object(main, "_lookup_building_selection", AsyncMock(return_value=server_building())),
+            patch.object(main, "fetch_road_width_evidence", side_effect=slow_road),
+            patch.object(main, "fetch_canyon_width_evidence", AsyncMock(return_value=official_canyon(SELECTION_ID, SELECTION_ID))),
+            patch.object(main, "fetch_weather_safe", AsyncMock(return_value=authoritative_weather())),
+            patch.object(main, "fetch_kp_index_safe", AsyncMock(return_value=3.0)),
+            patch.object(main, "fetch_kma_upper_air_profile_safe", AsyncMock(return_value=None)),
+            patch.object(main, "fetch_kma_wind_profiler_profile_safe", AsyncMock(return_value=None)),
+        ):
+            # When: the evaluation runs.
+            response = TestClient(main.app).post("/api/evaluate", json=request_payload)
+
+        # Then: the response arrives within budget with the road evidence typed unavailable.
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('road;dur=', response.headers["server-timing"])
+        self.assertIn('desc="deadline_exceeded"', response.headers["server-timing"])
+        road = response.json()["road_evidence"]
+        self.assertFalse(road["available"])
+        self.assertEqual(road["reason"], "evaluation_deadline_exceeded")
+
+    def test_static_routes_are_not_bounded(self):
+        self.assertIsNone(main._request_deadline_budget_s("/"))
+        self.assertEqual(main._request_deadline_budget_s("/api/road-width"), main.API_REQUEST_DEADLINE_S)
+
+
+if __name__ == "__main__":
+    unittest.main()
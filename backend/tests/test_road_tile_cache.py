@@ -0,0 +1,226 @@
+import asyncio
+import json
+from pathlib import Path
+import sys
+import time
+import unittest
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import main  # noqa: E402
+from mercator_tiles import tiles_for_bbox  # noqa: E402
+from spatial_index import bboxes_intersect, ring_bbox  # noqa: E402
+
+
+CLICK = (37.5665, 126.9780)
+
+
+def _road(feature_id, lon, lat, width_m, half_m=6.0):
+    x, y = main._lonlat_to_mercator(lon, lat)
+    return {
+        "id": f"lt_l_n3a0020000.{feature_id}",
+        "geometry": {"type": "LineString", "coordinates": [[x - half_m, y], [x + half_m, y]]},
+        "properties": {"rvwd": str(width_m), "rdln": "4", "rdnm": feature_id},
+    }
+
+
+class FakeRoadWfs:
+    """Answers road GetFeature like VWorld: segments whose box meets the BBOX, up to maxfeatures."""
+
+    def __init__(self, features, status_code=200, delays=None, failing_modes=()):
+        self.features = features
+        self.status_code = status_code
+        self.failing_modes = failing_modes
+        self.delays = delays or {}
+        self.requests = []
+        self.cancelled = []
+        self.inflight = set()
+        self.peak_tiles_inflight = 0
+        self.inflight_history = []
+
+    async def handler(self, request):
+        query = {key.lower(): values[0] for key, values in parse_qs(urlparse(str(request.url)).query).items()}
+        mode = "api" if request.url.host == "api.vworld.kr" else "map"
+        self.requests.append((mode, query["bbox"]))
+        self.inflight.add(query["bbox"])
+        self.peak_tiles_inflight = max(self.peak_tiles_inflight, len(self.inflight))
+        self.inflight_history.append(frozenset(self.inflight))
+        try:
+            await asyncio.sleep(self.delays.get(mode, 0.0))
+        except asyncio.CancelledError:
+            self.cancelled.append((mode, query["bbox"]))
+            raise
+        finally:
+            self.inflight.discard(query["bbox"])
+        if self.status_code != 200 or mode in self.failing_modes:
+            return httpx.Response(503 if mode in self.failing_modes else self.status_code, text="maintenance")
+        bbox = tuple(float(value) for value in query["bbox"].split(","))
+        matching = [
+            feature for feature in self.features
+            if bboxes_intersect(ring_bbox(feature["geometry"]["coordinates"]), bbox)
+        ]
+        payload = {"response": {"result": {"featureCollection": {"features": matching[: int(query["maxfeatures"])]}}}}
+        return httpx.Response(200, text=json.dumps(payload))
+
+
+class RoadTileCacheTests(unittest.TestCase):
+    def setUp(self):
+        main.ROAD_TILE_CACHE.clear()
+        main.CIRCUIT_BREAKERS.reset()
+        self.addCleanup(main.ROAD_TILE_CACHE.clear)
+        self.addCleanup(main.CIRCUIT_BREAKERS.reset)
+
+    def _lookup(self, wfs, *clicks, budget_s=None):
+        real_async_client = httpx.AsyncClient
+
+        def client_factory(*args, **kwargs):
+            return real_async_client(*args, transport=httpx.MockTransport(wfs.handler), **kwargs)
+
+        async def run():
+            with (
+                patch.object(main, "_vworld_api_key", return_value="server-key"),
+                patch.object(main.httpx, "AsyncClient", side_effect=client_factory),
+            ):
+                with main.request_deadline(budget_s):
+                    return await asyncio.gather(*(main.fetch_road_width_evidence(lat, lon) for lat, lon in clicks))
+
+        return asyncio.run(run())
+
+    def _tiles(self, radius_m):
+        return tiles_for_bbox(main._mercator_bbox(CLICK[1], CLICK[0], radius_m), main.VWORLD_ROAD_TILE_ZOOM)
+
+    def test_repeat_and_concurrent_clicks_share_one_fetch_per_tile(self):
+        wfs = FakeRoadWfs([_road("Sejong-daero", 126.9780, 37.5666, 14.5), _road("Far Road", 126.9830, 37.5700, 21.0)])
+
+        first, concurrent = self._lookup(wfs, CLICK, (CLICK[0] + 0.0001, CLICK[1]))
+        (again,) = self._lookup(wfs, CLICK)
+
+        self.assertEqual(len(wfs.requests), len(self._tiles(180)))
+        for result in (first, concurrent, again):
+            self.assertEqual(result["road_name"], "Sejong-daero")
+            self.assertEqual(result["width_m"], 14.5)
+        self.assertEqual(again["query_meta"]["tile_zoom"], main.VWORLD_ROAD_TILE_ZOOM)
+        self.assertEqual(again["query_meta"]["radius_m"], 180)
+
+    def test_wider_radius_only_fetches_tiles_not_already_cached(self):
+        # Only a road ~400 m east, so the 180 m pass misses and the 500 m pass matches.
+        wfs = FakeRoadWfs([_road("Distant-ro", 126.9825, 37.5665, 10.0)])
+
+        (result,) = self._lookup(wfs, CLICK)
+
+        self.assertEqual(result["road_name"], "Distant-ro")
+        self.assertEqual(result["query_meta"]["radius_m"], 500)
+        api_bboxes = [bbox for mode, bbox in wfs.requests if mode == "api"]
+        self.assertEqual(len(api_bboxes), len(set(api_bboxes)))
+        self.assertEqual(len(api_bboxes), len(self._tiles(500)))
+
+    def test_provider_failure_does_not_escalate_the_radius(self):
+        wfs = FakeRoadWfs([], status_code=503)
+
+        (result,) = self._lookup(wfs, CLICK)
+
+        self.assertFalse(result["available"])
+        self.assertEqual(result["reason"], "upstream_status_503")
+        self.assertEqual(len(wfs.requests), len(self._tiles(180)) * len(main.VWORLD_WFS_API_ENDPOINTS))
+
+    def test_slow_endpoint_loses_the_race_and_is_cancelled(self):
+        wfs = FakeRoadWfs([_road("Sejong-daero", 126.9780, 37.5666, 14.5)], delays={"api": 5.0})
+        started = time.monotonic()
+
+        with patch.object(main, "VWORLD_WFS_ENDPOINT_HEDGE_S", 0.05):
+            (result,) = self._lookup(wfs, CLICK)
+
+        self.assertLess(time.monotonic() - started, 2.0)
+        self.assertEqual(result["road_name"], "Sejong-daero")
+        self.assertEqual(result["query_meta"]["endpoint_mode"], "map")
+        self.assertEqual([mode for mode, _bbox in wfs.cancelled], ["api"] * len(self._tiles(180)))
+
+    def test_small_wider_passes_are_fetched_alongside_a_slow_narrow_pass(self):
+        features = [_road("Distant-ro", 126.9900, 37.5665, 10.0)]
+        delays = {"api": 0.2, "map": 0.2}
+
+        with patch.object(main, "VWORLD_ROAD_RADIUS_HEDGE_S", 0.01):
+            (hedged_result,) = self._lookup(hedged := FakeRoadWfs(features, delays=delays), CLICK)
+        main.ROAD_TILE_CACHE.clear()
+        with patch.object(main, "VWORLD_ROAD_HEDGED_SEARCH", False):
+            (sequential_result,) = self._lookup(sequential := FakeRoadWfs(features, delays=delays), CLICK)
+
+        self.assertEqual(hedged_result, sequential_result)
+        self.assertEqual(hedged_result["query_meta"]["radius_m"], 1500)
+        # Hedged: the 180 m and 500 m tiles are requested together; the wide
+        # 1500 m pass only starts once they have missed, as in the sequential walk.
+        narrow_bboxes = {main.bbox_param(main.tile_bounds(tile)) for tile in self._tiles(500)}
+        self.assertEqual({bbox for _mode, bbox in hedged.requests[: len(narrow_bboxes)]}, narrow_bboxes)
+        self.assertIn(frozenset(narrow_bboxes), hedged.inflight_history)
+        self.assertNotIn(frozenset(narrow_bboxes), sequential.inflight_history)
+        self.assertEqual(hedged.peak_tiles_inflight, sequential.peak_tiles_inflight)
+        self.assertEqual(sequential.peak_tiles_inflight, len(self._tiles(1500)) - len(self._tiles(500)))
+
+    def test_a_slow_narrow_match_never_starts_the_wide_pass(self):
+        wfs = FakeRoadWfs([_road("Sejong-daero", 126.9780, 37.5666, 14.5)], delays={"api": 0.1, "map": 0.1})
+
+        with patch.object(main, "VWORLD_ROAD_RADIUS_HEDGE_S", 0.01):
+            (result,) = self._lookup(wfs, CLICK)
+
+        self.assertEqual(result["query_meta"]["radius_m"], 180)
+        fetched = {bbox for _mode, bbox in wfs.requests}
+        self.assertLessEqual(len(fetched), len(self._tiles(500)))
+
+    def test_hedged_search_keeps_the_narrowest_radius_match(self):
+        lanes_only = _road("Alley-gil", 126.9781, 37.5666, 0.0)
+        lanes_only["properties"].pop("rvwd")
+        wfs = FakeRoadWfs([lanes_only, _road("Official-ro", 126.9825, 37.5665, 20.0)])
+
+        with patch.object(main, "VWORLD_ROAD_RADIUS_HEDGE_S", 0.0):
+            (result,) = self._lookup(wfs, CLICK)
+
+        self.assertEqual(result["road_name"], "Alley-gil")
+        self.assertEqual(result["query_meta"]["radius_m"], 180)
+
+    def test_a_healthy_endpoint_is_not_hedged_with_a_second_request(self):
+        wfs = FakeRoadWfs([_road("Sejong-daero", 126.9780, 37.5666, 14.5)], delays={"api": 0.05})
+
+        (result,) = self._lookup(wfs, CLICK)
+
+        self.assertEqual(result["query_meta"]["endpoint_mode"], "api")
+        self.assertEqual([mode for mode, _bbox in wfs.requests], ["api"] * len(self._tiles(180)))
+
+    def test_an_empty_answer_is_not_cached_when_the_other_endpoint_failed(self):
+        (result,) = self._lookup(FakeRoadWfs([], failing_modes=("map",)), CLICK)
+
+        self.assertFalse(result["available"])
+        self.assertEqual(result["reason"], "upstream_status_503")
+        self.assertEqual(len(main.ROAD_TILE_CACHE), 0)
+
+    def test_a_cold_tile_cannot_outlive_the_request_budget(self):
+        wfs = FakeRoadWfs([_road("Sejong-daero", 126.9780, 37.5666, 14.5)], delays={"api": 2.0, "map": 2.0})
+        started = time.monotonic()
+
+        (result,) = self._lookup(wfs, CLICK, budget_s=0.3)
+
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertFalse(result["available"])
+        self.assertEqual(result["reason"], "network_error")
+
+    def test_failed_refresh_serves_the_stale_tile(self):
+        self._lookup(FakeRoadWfs([_road("Sejong-daero", 126.9780, 37.5666, 14.5)]), CLICK)
+        for key in main.ROAD_TILE_CACHE:
+            main.ROAD_TILE_CACHE[key]["ts"] = time.time() - main.VWORLD_ROAD_TILE_TTL_S - 1
+
+        failing = FakeRoadWfs([], status_code=503)
+        (result,) = self._lookup(failing, CLICK)
+
+        self.assertTrue(failing.requests)
+        self.assertTrue(result["official_available"])
+        self.assertEqual(result["road_name"], "Sejong-daero")
+
+
+if __name__ == "__main__":
+    unittest.main()
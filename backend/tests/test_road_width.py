@@ -46,6 +46,8 @@ class _FakeAsyncClient:
 class RoadWidthRouteTests(unittest.TestCase):
     def setUp(self):
         self.client = TestClient(main.app)
+        main.ROAD_TILE_CACHE.clear()
+        main.CIRCUIT_BREAKERS.reset()
 
     def test_api_wfs_request_uses_registered_host_without_scheme_or_path(self):
         request_url = main._build_vworld_wfs_request_url(
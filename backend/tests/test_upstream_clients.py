@@ -0,0 +1,81 @@
+from pathlib import Path
+import sys
+import unittest
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+import main  # noqa: E402
+from upstream_clients import ProviderClientProfile, ProviderClientRegistry  # noqa: E402
+
+
+class ProviderClientRegistryTests(unittest.IsolatedAsyncioTestCase):
+    async def test_started_registry_reuses_one_pool_per_provider(self):
+        registry = ProviderClientRegistry()
+        registry.register(ProviderClientProfile("kma_surface", timeout_s=2.0))
+        registry.register(ProviderClientProfile("vworld_wfs", timeout_s=5.0, max_connections=4))
+
+        await registry.start()
+        try:
+            async with registry.client("kma_surface") as first:
+                pass
+            async with registry.client("kma_surface") as second:
+                pass
+            async with registry.client("vworld_wfs") as vworld:
+                pass
+            self.assertIs(first, second)
+            self.assertIsNot(first, vworld)
+            self.assertFalse(first.is_closed)
+            self.assertEqual(first.timeout.read, 2.0)
+        finally:
+            await registry.aclose()
+
+        self.assertTrue(first.is_closed)
+        self.assertTrue(vworld.is_closed)
+
+    async def test_registry_outside_lifespan_uses_short_lived_client_with_same_profile(self):
+        registry = ProviderClientRegistry()
+        registry.register(ProviderClientProfile("molit_building_hub", timeout_s=6.0, connect_timeout_s=3.0))
+
+        async with registry.client("molit_building_hub") as client:
+            self.assertEqual(client.timeout.read, 6.0)
+            self.assertEqual(client.timeout.connect, 3.0)
+
+        self.assertTrue(client.is_closed)
+
+    async def test_unregistered_provider_is_rejected(self):
+        registry = ProviderClientRegistry()
+
+        with self.assertRaises(KeyError):
+            async with registry.client("unknown_provider"):
+                pass
+
+
+class UpstreamClientLifespanTests(unittest.TestCase):
+    def test_app_lifespan_opens_and_closes_every_provider_pool(self):
+        with patch.object(main, "WEATHER_REFRESH_ENABLED", False), TestClient(main.app):
+            self.assertTrue(main.UPSTREAM_CLIENTS.started)
+            providers = {item["provider"]: item for item in main.UPSTREAM_CLIENTS.snapshot()}
+            for provider in (
+                "kma_surface",
+                "kma_upper_air",
+                "kma_wind_profiler",
+                "wis2_station",
+                "open_meteo",
+                "noaa_kp",
+                "vworld_wfs",
+                "official_gis_bridge",
+                "molit_building_hub",
+            ):
+                self.assertTrue(providers[provider]["pooled"], provider)
+
+        self.assertFalse(main.UPSTREAM_CLIENTS.started)
+
+
+if __name__ == "__main__":
+    unittest.main()
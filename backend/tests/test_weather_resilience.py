@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import sys
@@ -81,11 +82,13 @@ class WeatherResilienceTests(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         main.WEATHER_CACHE.clear()
         main.WEATHER_LAST_GOOD_CACHE.clear()
+        main.KMA_SURFACE_SNAPSHOT_CACHE.clear()
+        main.PUBLISHED_CYCLES.forget()
+        main.CIRCUIT_BREAKERS.reset()
 
     async def test_fetch_weather_safe_uses_fresh_kma_cache_during_timeout(self):
         cache_key = main._cache_key_for_latlon(37.5665, 126.9780)
-        main._cache_set(
-            main.WEATHER_CACHE,
+        main.WEATHER_CACHE.set(
             cache_key,
             authoritative_weather(latitude=37.5665, longitude=126.9780),
         )
@@ -367,6 +370,136 @@ class WeatherResilienceTests(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(payload["authoritative"])
         self.assertEqual(payload["reason"], "surface_weather_timeout")
 
+    async def test_surface_snapshot_serves_every_grid_cell_near_a_station_with_one_request(self):
+        surface_requests = []
+        snapshot_text = "\n".join(
+            [
+                kma_surface_text(datetime.now(main.KST) - timedelta(minutes=5)),
+                f"{(datetime.now(main.KST) - timedelta(minutes=5)).strftime('%Y%m%d%H%M')} 112 27 2.0 27 3.1 1230 1008.4 1014.2 25.1 20.0 70 0.0 6 2000 맑음",
+            ]
+        )
+
+        def handler(url: str, params: dict):
+            if "kma_sfctm2.php" in url:
+                surface_requests.append(dict(params))
+                return FakeResponse(status_code=200, text=snapshot_text)
+            if "open-meteo.com" in url:
+                raise main.httpx.ConnectError("display offline")
+            raise AssertionError(f"unexpected url: {url}")
+
+        with (
+            patch.object(main, "KMA_API_KEY", "test-kma-key"),
+            patch.object(main.httpx, "AsyncClient", side_effect=lambda *args, **kwargs: FakeAsyncClient(handler)),
+        ):
+            seoul_a = await main.fetch_weather_safe(37.5665, 126.9780)
+            cold_requests = len(surface_requests)
+            seoul_b = await main.fetch_weather_safe(37.5812, 126.9501)
+            incheon = await main.fetch_weather_safe(37.4563, 126.7052)
+
+        self.assertEqual(len(surface_requests), cold_requests)
+        self.assertEqual({request["stn"] for request in surface_requests}, {0})
+        self.assertEqual(len({request["tm"] for request in surface_requests}), cold_requests)
+        self.assertEqual((seoul_a["station_id"], seoul_b["station_id"], incheon["station_id"]), (108, 108, 112))
+        self.assertTrue(all(payload["authoritative"] for payload in (seoul_a, seoul_b, incheon)))
+        self.assertEqual(incheon["wind_speed"], 2.0)
+
+    async def test_expired_weather_is_served_while_one_background_fetch_revalidates(self):
+        cache_key = main._cache_key_for_latlon(37.5665, 126.9780)
+        previous = authoritative_weather(latitude=37.5665, longitude=126.9780)
+        main.WEATHER_CACHE[cache_key] = {
+            "ts": main.time.time() - main.WEATHER_CACHE_TTL_S - 1.0,
+            "value": previous,
+        }
+        release = asyncio.Event()
+        refreshed = dict(previous, wind_speed=1.25)
+
+        async def slow_surface(lat: float, lon: float):
+            await release.wait()
+            return refreshed
+
+        with (
+            patch.object(main, "fetch_kma_surface_observation", side_effect=slow_surface) as surface,
+            patch.object(main, "fetch_open_meteo_surface_display", AsyncMock(return_value=None)),
+        ):
+            first = await main.fetch_weather(37.5665, 126.9780)
+            second = await main.fetch_weather(37.5665, 126.9780)
+            self.assertEqual((first["wind_speed"], second["wind_speed"]), (previous["wind_speed"], previous["wind_speed"]))
+            self.assertTrue(main.WEATHER_SINGLE_FLIGHT.inflight(cache_key))
+
+            release.set()
+            while main.WEATHER_SINGLE_FLIGHT.inflight(cache_key):
+                await asyncio.sleep(0)
+
+        self.assertEqual(surface.await_count, 1)
+        self.assertEqual(main.WEATHER_CACHE.get_fresh(cache_key)["wind_speed"], 1.25)
+
+    async def test_concurrent_weather_misses_share_one_upstream_fetch(self):
+        surface_calls = []
+        release = asyncio.Event()
+
+        async def fake_surface(lat: float, lon: float):
+            surface_calls.append((lat, lon))
+            await release.wait()
+            return authoritative_weather(latitude=lat, longitude=lon)
+
+        with (
+            patch.object(main, "fetch_kma_surface_observation", side_effect=fake_surface),
+            patch.object(main, "fetch_open_meteo_surface_display", AsyncMock(return_value=None)) as open_meteo,
+        ):
+            waiters = [asyncio.create_task(main.fetch_weather(37.5665, 126.9780)) for _ in range(30)]
+            await asyncio.sleep(0)
+            release.set()
+            payloads = await asyncio.gather(*waiters)
+
+        self.assertEqual(len(surface_calls), 1)
+        self.assertEqual(open_meteo.await_count, 1)
+        self.assertEqual({payload["source"] for payload in payloads}, {"kma_surface_observation"})
+        self.assertEqual(len({id(payload) for payload in payloads}), 30)
+        self.assertEqual(len(main.WEATHER_SINGLE_FLIGHT), 0)
+
+    async def test_concurrent_weather_misses_share_typed_surface_error(self):
+        surface_calls = []
+        release = asyncio.Event()
+
+        async def failing_surface(lat: float, lon: float):
+            surface_calls.append((lat, lon))
+            await release.wait()
+            raise main.SurfaceWeatherFetchError(main.SURFACE_WEATHER_REASON_AUTH)
+
+        with (
+            patch.object(main, "fetch_kma_surface_observation", side_effect=failing_surface),
+            patch.object(main, "fetch_open_meteo_surface_display", AsyncMock(return_value=None)),
+        ):
+            waiters = [asyncio.create_task(main.fetch_weather_safe(37.5665, 126.9780)) for _ in range(5)]
+            await asyncio.sleep(0)
+            release.set()
+            payloads = await asyncio.gather(*waiters)
+
+        self.assertEqual(len(surface_calls), 1)
+        self.assertEqual({payload["reason"] for payload in payloads}, {main.SURFACE_WEATHER_REASON_AUTH})
+        self.assertTrue(all(not payload["available"] for payload in payloads))
+
+    async def test_surface_weather_stays_fresh_until_the_next_hourly_observation(self):
+        observed_at_kst = (datetime.now(main.KST) - timedelta(minutes=5)).replace(second=0, microsecond=0)
+
+        def handler(url: str, params: dict):
+            if "kma_sfctm2.php" in url:
+                return FakeResponse(status_code=200, text=kma_surface_text(observed_at_kst))
+            if "open-meteo.com" in url:
+                raise main.httpx.ConnectError("display offline")
+            raise AssertionError(f"unexpected url: {url}")
+
+        with (
+            patch.object(main, "KMA_API_KEY", "test-kma-key"),
+            patch.object(main.httpx, "AsyncClient", side_effect=lambda *args, **kwargs: FakeAsyncClient(handler)),
+        ):
+            await main.fetch_weather(37.5665, 126.9780)
+
+        entry = main.WEATHER_CACHE[main._cache_key_for_latlon(37.5665, 126.9780)]
+        receipt_expiry = observed_at_kst.astimezone(timezone.utc) + main.SURFACE_WEATHER_RECEIPT_TTL
+        self.assertEqual(entry["expires_at"], receipt_expiry.timestamp())
+        self.assertGreater(entry["expires_at"] - entry["ts"], main.WEATHER_CACHE_TTL_S)
+
     def test_weather_route_marks_open_meteo_only_weather_as_non_authoritative(self):
         client = TestClient(main.app)
         weather_payload = {
@@ -514,5 +647,51 @@ class WeatherResilienceTests(unittest.IsolatedAsyncioTestCase):
         self.assertIsNone(stale_payload["correlation_id"])
 
 
+class KmaCycleCacheTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        for cache in (main.UPPER_AIR_CACHE, main.UPPER_AIR_LAST_GOOD_CACHE, main.UPPER_AIR_CYCLE_CACHE):
+            cache.clear()
+        main.CIRCUIT_BREAKERS.reset()
+
+    async def test_past_upper_air_cycle_is_reused_per_station_and_expires_on_the_next_cycle(self):
+        cycles = main.latest_kma_cycles()
+        requests = []
+
+        def handler(url: str, params: dict):
+            if "upp_temp.php" not in url:
+                raise AssertionError(f"unexpected url: {url}")
+            requests.append((params["stn"], params["tm"]))
+            if params["tm"] == cycles[0]:
+                return FakeResponse(status_code=404, text="not published")
+            return FakeResponse(
+                status_code=200,
+                text=f"{params['tm']} {params['stn']} 1000.0 110.0 18.5 12.0 270.0 6.5 0\n",
+            )
+
+        with (
+            patch.object(main, "KMA_API_KEY", "test-kma-key"),
+            patch.object(main.httpx, "AsyncClient", side_effect=lambda *args, **kwargs: FakeAsyncClient(handler)),
+        ):
+            first = await main.fetch_kma_upper_air_profile(37.5665, 126.9780)
+            second = await main.fetch_kma_upper_air_profile(37.4000, 127.1000)
+
+        self.assertEqual((first["observed_at_utc"], second["observed_at_utc"]), (cycles[1], cycles[1]))
+        self.assertEqual(first["station_id"], second["station_id"])
+        self.assertEqual(requests.count((first["station_id"], cycles[1])), 1)
+        self.assertEqual(requests.count((first["station_id"], cycles[0])), 2)
+
+        entry = main.UPPER_AIR_CACHE[main._cache_key_for_latlon(37.5665, 126.9780)]
+        expected_next = (
+            datetime.strptime(cycles[1], "%Y%m%d%H%M").replace(tzinfo=timezone.utc)
+            + main.KMA_UPPER_AIR_CYCLE_INTERVAL
+            + timedelta(seconds=main.KMA_UPPER_AIR_PUBLICATION_LAG_S)
+        ).timestamp()
+        self.assertAlmostEqual(
+            entry["expires_at"],
+            max(expected_next, entry["ts"] + main.UPPER_AIR_CACHE_TTL_S),
+            delta=1.0,
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,98 @@
+import asyncio
+from pathlib import Path
+import sys
+import unittest
+
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from write_behind import WriteBehindQueue  # noqa: E402
+
+
+class WriteBehindQueueTests(unittest.TestCase):
+    def test_burst_of_writes_is_coalesced_into_one_interval_flush(self):
+        flushed = []
+        queue = WriteBehindQueue("test", flushed.append, interval_s=0.05, max_pending=100)
+
+        async def scenario():
+            await queue.start()
+            queue.submit("a", 1)
+            queue.submit("b", 2)
+            queue.submit("a", 3)
+            self.assertEqual(queue.get("a"), 3)
+            await asyncio.sleep(0.2)
+            await queue.aclose()
+
+        asyncio.run(scenario())
+
+        self.assertEqual(flushed, [[("a", 3), ("b", 2)]])
+        self.assertEqual(queue.pending(), [])
+
+    def test_reaching_max_pending_flushes_before_the_interval(self):
+        flushed = []
+        queue = WriteBehindQueue("test", flushed.append, interval_s=60, max_pending=2)
+
+        async def scenario():
+            await queue.start()
+            queue.submit("a", 1)
+            queue.submit("b", 2)
+            for _ in range(50):
+                if flushed:
+                    break
+                await asyncio.sleep(0.01)
+            snapshot = queue.snapshot()
+            await queue.aclose()
+            return snapshot
+
+        snapshot = asyncio.run(scenario())
+
+        self.assertEqual(flushed, [[("a", 1), ("b", 2)]])
+        self.assertEqual(snapshot["flushes"], 1)
+
+    def test_close_drains_pending_writes(self):
+        flushed = []
+        queue = WriteBehindQueue("test", flushed.append, interval_s=60, max_pending=100)
+
+        async def scenario():
+            await queue.start()
+            self.assertTrue(queue.running)
+            queue.submit("a", 1)
+            await queue.aclose()
+
+        asyncio.run(scenario())
+
+        self.assertEqual(flushed, [[("a", 1)]])
+        self.assertFalse(queue.running)
+
+    def test_failed_flush_keeps_items_pending_for_retry(self):
+        attempts = []
+
+        def flaky(batch):
+            attempts.append(batch)
+            if len(attempts) == 1:
+                raise OSError("disk busy")
+
+        queue = WriteBehindQueue("test", flaky, interval_s=60, max_pending=100)
+        queue.submit("a", 1)
+
+        first = asyncio.run(queue.flush_pending())
+        self.assertEqual((first, queue.pending()), (0, [("a", 1)]))
+        self.assertEqual(queue.snapshot()["last_error"], "OSError")
+        second = asyncio.run(queue.flush_pending())
+
+        self.assertEqual((second, queue.pending()), (1, []))
+        self.assertEqual(len(attempts), 2)
+
+    def test_item_resubmitted_during_a_flush_stays_pending(self):
+        queue = WriteBehindQueue("test", lambda batch: queue.submit("a", 2), interval_s=60, max_pending=100)
+        queue.submit("a", 1)
+
+        asyncio.run(queue.flush_pending())
+
+        self.assertEqual(queue.pending(), [("a", 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""Keep-alive HTTP client pools for server-side upstream providers.
+
+Each provider owns one ``httpx.AsyncClient`` with its own timeout and
+connection limits. The pools are opened and closed by the FastAPI lifespan;
+outside of it (scripts, unit tests) callers transparently receive a
+short-lived client with the same profile so behaviour stays identical.
+Every request's timeouts are also capped at the remaining request deadline.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+from request_deadline import REQUEST_DEADLINE_REASON, RequestDeadlineExceeded, cap_httpx_timeouts
+
+
+async def _apply_request_deadline(request: httpx.Request) -> None:
+    try:
+        request.extensions["timeout"] = cap_httpx_timeouts(request.extensions.get("timeout"))
+    except RequestDeadlineExceeded as error:
+        raise httpx.TimeoutException(REQUEST_DEADLINE_REASON, request=request) from error
+
+
+@dataclass(frozen=True)
+class ProviderClientProfile:
+    """Connection policy for one upstream provider pool."""
+
+    name: str
+    timeout_s: float
+    connect_timeout_s: Optional[float] = None
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_s: float = 30.0
+    follow_redirects: bool = False
+
+    def client_kwargs(self) -> Dict[str, Any]:
+        connect_timeout_s = self.timeout_s
+        if self.connect_timeout_s is not None:
+            connect_timeout_s = min(self.timeout_s, self.connect_timeout_s)
+        return {
+            "timeout": httpx.Timeout(self.timeout_s, connect=connect_timeout_s),
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry_s,
+            ),
+            "follow_redirects": self.follow_redirects,
+            "event_hooks": {"request": [_apply_request_deadline]},
+        }
+
+
+class ProviderClientRegistry:
+    """Lifespan-managed registry of one pooled client per provider."""
+
+    def __init__(self) -> None:
+        self._profiles: Dict[str, ProviderClientProfile] = {}
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._started = False
+
+    def register(self, profile: ProviderClientProfile) -> ProviderClientProfile:
+        self._profiles[profile.name] = profile
+        return profile
+
+    def profile(self, name: str) -> ProviderClientProfile:
+        try:
+            return self._profiles[name]
+        except KeyError as error:
+            raise KeyError(f"unregistered_upstream_provider:{name}") from error
+
+    @property
+    def started(self) -> bool:
+        return self._started
+
+    async def start(self) -> None:
+        self._started = True
+        for name in self._profiles:
+            self._pooled_client(name)
+
+    async def aclose(self) -> None:
+        self._started = False
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+    def _pooled_client(self, name: str) -> httpx.AsyncClient:
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(**self.profile(name).client_kwargs())
+            self._clients[name] = client
+        return client
+
+    @asynccontextmanager
+    async def client(self, name: str) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the provider pool, or a one-shot client before lifespan startup."""
+        if self._started:
+            yield self._pooled_client(name)
+            return
+        async with httpx.AsyncClient(**self.profile(name).client_kwargs()) as client:
+            yield client
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Describe pool configuration without exposing request state."""
+        return [
+            {
+                "provider": name,
+                "pooled": self._started and name in self._clients,
+                "timeout_s": profile.timeout_s,
+                "max_connections": profile.max_connections,
+                "max_keepalive_connections": profile.max_keepalive_connections,
+            }
+            for name, profile in sorted(self._profiles.items())
+        ]
+
+
+UPSTREAM_CLIENTS = ProviderClientRegistry()
+
+
+def register_provider(name: str, timeout_s: float, **options: Any) -> ProviderClientProfile:
+    return UPSTREAM_CLIENTS.register(ProviderClientProfile(name=name, timeout_s=timeout_s, **options))
+
+
+def upstream_client(name: str):
+    return UPSTREAM_CLIENTS.client(name)
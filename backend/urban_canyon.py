@@ -1,8 +1,15 @@
 from __future__ import annotations
 
-from math import hypot, isfinite
+from math import hypot, inf, isfinite, sqrt
 from typing import Sequence, TypedDict
 
+from spatial_index import BBox, GridIndex, ring_bbox
+
+try:
+    import urban_canyon_numpy as _vectorized
+except ImportError:  # NumPy is optional; the pure-Python geometry below is the fallback.
+    _vectorized = None
+
 
 class BuildingGeometry(TypedDict, total=False):
     id: str
@@ -25,6 +32,15 @@ class FacadeGapMeasurement(TypedDict):
 
 Point = tuple[float, float]
 
+# Pruning only skips work whose lower bound exceeds the best gap by more than
+# this, so float noise in the bounds can never change the selected result.
+_PRUNE_TOLERANCE_M = 1e-6
+# Rings with more segments than this get a segment grid index.
+_SEGMENT_INDEX_MIN_SEGMENTS = 48
+# Below these sizes NumPy call overhead outweighs the vectorised math.
+_VECTORIZED_MIN_PAIRS = 1024
+_VECTORIZED_MIN_ROAD_SEGMENTS = 64
+
 
 def _points(raw_points: Sequence[Sequence[float]]) -> list[Point]:
     points: list[Point] = []
@@ -53,12 +69,16 @@ def _normalized_ring_key(points: Sequence[Point]) -> tuple[Point, ...]:
     return min(rotations)
 
 
+def _official_stable_id(building: BuildingGeometry) -> str:
+    return str(building.get("stable_id") or building.get("id") or "").strip()
+
+
 def _official_building_tie_break_key(
     building: BuildingGeometry,
     points: Sequence[Point],
 ) -> tuple[str, tuple[Point, ...]] | None:
     """Use an official stable identifier, then normalized geometry, for equal gaps."""
-    stable_id = str(building.get("stable_id") or building.get("id") or "").strip()
+    stable_id = _official_stable_id(building)
     if not stable_id:
         return None
     return (stable_id, _normalized_ring_key(points))
@@ -134,13 +154,97 @@ def _closest_segment_pair(
     return (_distance(closest[0], closest[1]), closest[0], closest[1])
 
 
-def _closest_rings(first_ring: Sequence[Point], second_ring: Sequence[Point]) -> tuple[float, Point, Point]:
-    candidates = [
-        _closest_segment_pair(first_start, first_end, second_start, second_end)
-        for first_start, first_end in _segments(first_ring)
-        for second_start, second_end in _segments(second_ring)
-    ]
-    return min(candidates, key=lambda candidate: candidate[0])
+def _bbox_distance(first: BBox, second: BBox) -> float:
+    """Lower bound on the distance between anything inside the two boxes."""
+    dx = max(first[0] - second[2], second[0] - first[2], 0.0)
+    dy = max(first[1] - second[3], second[1] - first[3], 0.0)
+    return hypot(dx, dy)
+
+
+def _expand(bbox: BBox, margin: float) -> BBox:
+    return (bbox[0] - margin, bbox[1] - margin, bbox[2] + margin, bbox[3] + margin)
+
+
+class _IndexedRing:
+    """A ring's segments with their boxes, plus a grid index when the ring is large."""
+
+    def __init__(self, points: Sequence[Point]) -> None:
+        self.points = points
+        self.segments = _segments(points)
+        self.segment_bboxes = [ring_bbox(segment) for segment in self.segments]
+        self.bbox = ring_bbox(points)
+        self.index: GridIndex[int] | None = None
+        self._arrays = None
+        if len(self.segments) > _SEGMENT_INDEX_MIN_SEGMENTS:
+            extent = max(self.bbox[2] - self.bbox[0], self.bbox[3] - self.bbox[1])
+            self.index = GridIndex(max(extent / sqrt(len(self.segments)), 1e-9))
+            for position, segment_bbox in enumerate(self.segment_bboxes):
+                self.index.insert(position, segment_bbox)
+
+    @property
+    def arrays(self):
+        if self._arrays is None:
+            self._arrays = _vectorized.segment_arrays(self.points)
+        return self._arrays
+
+    def near(self, bbox: BBox, within: float) -> Sequence[int]:
+        """Positions of segments that may lie within ``within`` of ``bbox``, in ring order."""
+        if self.index is None or within == inf:
+            return range(len(self.segments))
+        # Clip to the ring's own box so a loose bound never walks empty cells.
+        query = _expand(bbox, within)
+        clipped = (
+            max(query[0], self.bbox[0]),
+            max(query[1], self.bbox[1]),
+            min(query[2], self.bbox[2]),
+            min(query[3], self.bbox[3]),
+        )
+        if clipped[0] > clipped[2] or clipped[1] > clipped[3]:
+            return ()
+        return self.index.query(clipped)
+
+
+def _closest_rings(
+    first: _IndexedRing,
+    second: _IndexedRing,
+    bound: float = inf,
+) -> tuple[float, Point, Point] | None:
+    """Closest segment pair between two rings, or ``None`` if none is within ``bound``.
+
+    Matches an exhaustive scan in ``first`` x ``second`` order: among equal
+    distances the earliest pair wins. Pairs whose box distance exceeds the
+    best distance found so far (or ``bound``) are skipped.
+    """
+    if _vectorized is not None and len(first.segments) * len(second.segments) >= _VECTORIZED_MIN_PAIRS:
+        if _bbox_distance(first.bbox, second.bbox) > bound + _PRUNE_TOLERANCE_M:
+            return None
+        closest = _vectorized.closest_segment_pair(first.arrays, second.arrays, _PRUNE_TOLERANCE_M)
+        if closest is None:
+            return None
+        _distance_m, first_point, second_point, _first_position, _second_position = closest
+        distance = _distance(first_point, second_point)
+        if distance > bound + _PRUNE_TOLERANCE_M:
+            return None
+        return (distance, first_point, second_point)
+
+    best: tuple[float, int, int, Point, Point] | None = None
+    limit = bound
+    for second_position, second_segment in enumerate(second.segments):
+        second_bbox = second.segment_bboxes[second_position]
+        if _bbox_distance(second_bbox, first.bbox) > limit + _PRUNE_TOLERANCE_M:
+            continue
+        for first_position in first.near(second_bbox, limit + _PRUNE_TOLERANCE_M):
+            if _bbox_distance(first.segment_bboxes[first_position], second_bbox) > limit + _PRUNE_TOLERANCE_M:
+                continue
+            first_start, first_end = first.segments[first_position]
+            distance, first_point, second_point = _closest_segment_pair(first_start, first_end, *second_segment)
+            candidate = (distance, first_position, second_position, first_point, second_point)
+            if best is None or candidate[:3] < best[:3]:
+                best = candidate
+                limit = min(limit, distance)
+    if best is None or best[0] > bound + _PRUNE_TOLERANCE_M:
+        return None
+    return (best[0], best[3], best[4])
 
 
 def _closest_road_segment(point: Point, road_segments: Sequence[tuple[Point, Point]]) -> tuple[Point, Point]:
@@ -154,26 +258,43 @@ def _signed_road_side(point: Point, road_segment: tuple[Point, Point]) -> float:
     return _cross(road_segment[0], road_segment[1], point)
 
 
+def _first_road_crossing(
+    target_point: Point,
+    opposing_point: Point,
+    road_segments: Sequence[tuple[Point, Point]],
+) -> tuple[Point, Point] | None:
+    for road_start, road_end in road_segments:
+        if not _segments_intersect(target_point, opposing_point, road_start, road_end):
+            continue
+        if hypot(road_end[0] - road_start[0], road_end[1] - road_start[1]) == 0.0:
+            continue
+        return (road_start, road_end)
+    return None
+
+
 def _road_crossing_is_normal(
     target_point: Point,
     opposing_point: Point,
     road_segments: Sequence[tuple[Point, Point]],
+    road_arrays=None,
 ) -> tuple[bool, float | None]:
     dx, dy = opposing_point[0] - target_point[0], opposing_point[1] - target_point[1]
     gap_length = hypot(dx, dy)
     if gap_length == 0.0:
         return (False, None)
-    for road_start, road_end in road_segments:
-        if not _segments_intersect(target_point, opposing_point, road_start, road_end):
-            continue
-        road_dx, road_dy = road_end[0] - road_start[0], road_end[1] - road_start[1]
-        road_length = hypot(road_dx, road_dy)
-        if road_length == 0.0:
-            continue
-        parallel_component = abs((dx * road_dx + dy * road_dy) / (gap_length * road_length))
-        normal_alignment = 1.0 - parallel_component
-        return (normal_alignment >= 0.707, round(normal_alignment, 4))
-    return (False, None)
+    if road_arrays is not None:
+        position = _vectorized.first_crossing(target_point, opposing_point, road_arrays)
+        crossing = road_segments[position] if position is not None else None
+    else:
+        crossing = _first_road_crossing(target_point, opposing_point, road_segments)
+    if crossing is None:
+        return (False, None)
+    road_start, road_end = crossing
+    road_dx, road_dy = road_end[0] - road_start[0], road_end[1] - road_start[1]
+    road_length = hypot(road_dx, road_dy)
+    parallel_component = abs((dx * road_dx + dy * road_dy) / (gap_length * road_length))
+    normal_alignment = 1.0 - parallel_component
+    return (normal_alignment >= 0.707, round(normal_alignment, 4))
 
 
 def measure_facade_gap(
@@ -226,27 +347,47 @@ def measure_facade_gap(
             "reason": "target_building_road_side_ambiguous",
         }
 
-    measurements: list[
-        tuple[float, str, tuple[Point, ...], Point, Point, BuildingGeometry, float]
-    ] = []
-    for building in buildings:
+    # Cheap side-of-road filtering first, then the exact ring distance in
+    # order of box distance, so buildings that cannot beat the best gap so
+    # far are never measured.
+    target = _IndexedRing(target_points)
+    road_arrays = None
+    if _vectorized is not None and len(road_segments) >= _VECTORIZED_MIN_ROAD_SEGMENTS:
+        road_arrays = _vectorized.segment_arrays(road_points)
+    candidates: list[tuple[float, int, list[Point], BuildingGeometry]] = []
+    for order, building in enumerate(buildings):
         candidate_points = _points(building["ring"])
-        candidate_segments = _segments(candidate_points)
-        if len(candidate_points) < 4 or not candidate_segments:
+        if len(candidate_points) < 4:
             continue
-        tie_break_key = _official_building_tie_break_key(building, candidate_points)
-        if tie_break_key is None:
+        if not _official_stable_id(building):
             continue
         candidate_center = _centroid(candidate_points[:-1] if candidate_points[0] == candidate_points[-1] else candidate_points)
         candidate_side = _signed_road_side(candidate_center, target_road_segment)
         if candidate_side == 0.0 or (candidate_side > 0.0) == (target_side > 0.0):
             continue
-        gap_m, target_point, opposing_point = _closest_rings(target_points, candidate_points)
-        crossing_verified, normal_alignment = _road_crossing_is_normal(target_point, opposing_point, road_segments)
+        lower_bound = _bbox_distance(target.bbox, ring_bbox(candidate_points))
+        candidates.append((lower_bound, order, candidate_points, building))
+    candidates.sort(key=lambda candidate: (candidate[0], candidate[1]))
+
+    measurements: list[
+        tuple[float, str, tuple[Point, ...], int, Point, Point, BuildingGeometry, float]
+    ] = []
+    best_gap = inf
+    for lower_bound, order, candidate_points, building in candidates:
+        if lower_bound > best_gap + _PRUNE_TOLERANCE_M:
+            break
+        closest = _closest_rings(target, _IndexedRing(candidate_points), best_gap)
+        if closest is None:
+            continue
+        gap_m, target_point, opposing_point = closest
+        crossing_verified, normal_alignment = _road_crossing_is_normal(target_point, opposing_point, road_segments, road_arrays)
         if not crossing_verified or normal_alignment is None:
             continue
-        stable_id, normalized_geometry = tie_break_key
-        measurements.append((gap_m, stable_id, normalized_geometry, target_point, opposing_point, building, normal_alignment))
+        # The tie-break key normalises the whole ring, so it is only built
+        # for buildings that were actually measured.
+        stable_id, normalized_geometry = _official_building_tie_break_key(building, candidate_points)
+        measurements.append((gap_m, stable_id, normalized_geometry, order, target_point, opposing_point, building, normal_alignment))
+        best_gap = min(best_gap, gap_m)
 
     if not measurements:
         return {
@@ -263,9 +404,9 @@ def measure_facade_gap(
 
     # Equal measured gaps are ordered by authoritative identifier and then by
     # normalized official geometry, never by upstream WFS feature order.
-    gap_m, _, _, target_point, opposing_point, opposing_building, normal_alignment = min(
+    gap_m, _, _, _, target_point, opposing_point, opposing_building, normal_alignment = min(
         measurements,
-        key=lambda result: (result[0], result[1], result[2]),
+        key=lambda result: (result[0], result[1], result[2], result[3]),
     )
     return {
         "available": True,
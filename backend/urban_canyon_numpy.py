@@ -0,0 +1,169 @@
+"""NumPy kernels for the facade gap search in ``urban_canyon``.
+
+NumPy is optional: ``urban_canyon`` imports this module when it can and
+otherwise keeps its pure-Python geometry. Every kernel mirrors the scalar
+code operation for operation (same cross products, same tolerances, first
+minimum wins), so both backends select the same segment pairs and road
+crossings.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+
+_POINT_TOLERANCE = 1e-6
+# Caps the temporaries of one exact pair evaluation at a few MB.
+_MAX_PAIRS_PER_CHUNK = 1 << 15
+
+Point = Tuple[float, float]
+SegmentArrays = Tuple[np.ndarray, np.ndarray]
+
+
+def segment_arrays(points: Sequence[Point]) -> SegmentArrays:
+    """Start and end points of a polyline's segments, as ``(n, 2)`` arrays."""
+    coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    return coords[:-1], coords[1:]
+
+
+def _cross(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    return ((b[..., 0] - a[..., 0]) * (c[..., 1] - a[..., 1])) - ((b[..., 1] - a[..., 1]) * (c[..., 0] - a[..., 0]))
+
+
+def _within_box(point: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    return (
+        (np.minimum(start[..., 0], end[..., 0]) - _POINT_TOLERANCE <= point[..., 0])
+        & (point[..., 0] <= np.maximum(start[..., 0], end[..., 0]) + _POINT_TOLERANCE)
+        & (np.minimum(start[..., 1], end[..., 1]) - _POINT_TOLERANCE <= point[..., 1])
+        & (point[..., 1] <= np.maximum(start[..., 1], end[..., 1]) + _POINT_TOLERANCE)
+    )
+
+
+def segments_intersect(first: np.ndarray, second: np.ndarray, third: np.ndarray, fourth: np.ndarray) -> np.ndarray:
+    """Elementwise ``urban_canyon._segments_intersect`` over broadcast point arrays."""
+    first_side = _cross(first, second, third)
+    second_side = _cross(first, second, fourth)
+    third_side = _cross(third, fourth, first)
+    fourth_side = _cross(third, fourth, second)
+    # A zero cross product already satisfies _point_on_segment's collinearity
+    # test, so only its box test remains.
+    touching = (
+        ((first_side == 0.0) & _within_box(third, first, second))
+        | ((second_side == 0.0) & _within_box(fourth, first, second))
+        | ((third_side == 0.0) & _within_box(first, third, fourth))
+        | ((fourth_side == 0.0) & _within_box(second, third, fourth))
+    )
+    crossing = ((first_side > 0.0) != (second_side > 0.0)) & ((third_side > 0.0) != (fourth_side > 0.0))
+    return touching | crossing
+
+
+def closest_points_on_segments(point: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Elementwise ``urban_canyon._closest_point_on_segment``."""
+    dx = end[..., 0] - start[..., 0]
+    dy = end[..., 1] - start[..., 1]
+    denominator = (dx * dx) + (dy * dy)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = ((point[..., 0] - start[..., 0]) * dx + (point[..., 1] - start[..., 1]) * dy) / denominator
+    bounded_ratio = np.clip(ratio, 0.0, 1.0)
+    closest = np.stack((start[..., 0] + (bounded_ratio * dx), start[..., 1] + (bounded_ratio * dy)), axis=-1)
+    return np.where((denominator == 0.0)[..., None], np.broadcast_to(start, closest.shape), closest)
+
+
+def _closest_pairs(
+    first_starts: np.ndarray,
+    first_ends: np.ndarray,
+    second_starts: np.ndarray,
+    second_ends: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """``_closest_segment_pair`` for aligned arrays of segment pairs."""
+    # The four endpoint projections of _closest_segment_pair, in its order.
+    first_points = np.stack((
+        first_starts,
+        first_ends,
+        closest_points_on_segments(second_starts, first_starts, first_ends),
+        closest_points_on_segments(second_ends, first_starts, first_ends),
+    ))
+    second_points = np.stack((
+        closest_points_on_segments(first_starts, second_starts, second_ends),
+        closest_points_on_segments(first_ends, second_starts, second_ends),
+        second_starts,
+        second_ends,
+    ))
+    distances = np.hypot(first_points[..., 0] - second_points[..., 0], first_points[..., 1] - second_points[..., 1])
+    choice = np.argmin(distances, axis=0)
+    pairs = np.arange(len(first_starts))
+    distance = distances[choice, pairs]
+    first_chosen = first_points[choice, pairs]
+    second_chosen = second_points[choice, pairs]
+
+    intersecting = segments_intersect(first_starts, first_ends, second_starts, second_ends)
+    distance = np.where(intersecting, 0.0, distance)
+    first_chosen = np.where(intersecting[:, None], first_starts, first_chosen)
+    second_chosen = np.where(intersecting[:, None], first_starts, second_chosen)
+    return distance, first_chosen, second_chosen
+
+
+def _box_gaps(first_starts: np.ndarray, first_ends: np.ndarray, second_starts: np.ndarray, second_ends: np.ndarray) -> np.ndarray:
+    """Lower bound on each ``first`` x ``second`` segment distance from their boxes."""
+    first_min, first_max = np.minimum(first_starts, first_ends)[:, None, :], np.maximum(first_starts, first_ends)[:, None, :]
+    second_min, second_max = np.minimum(second_starts, second_ends)[None, :, :], np.maximum(second_starts, second_ends)[None, :, :]
+    gap = np.maximum(np.maximum(first_min - second_max, second_min - first_max), 0.0)
+    return np.hypot(gap[..., 0], gap[..., 1])
+
+
+def closest_segment_pair(
+    first: SegmentArrays,
+    second: SegmentArrays,
+    tolerance: float = _POINT_TOLERANCE,
+) -> Optional[Tuple[float, Point, Point, int, int]]:
+    """Closest pair over every ``first`` x ``second`` segment pair.
+
+    Returns ``(distance, first_point, second_point, first_position,
+    second_position)``; among equal distances the earliest pair in
+    ``first``-major order wins, as in the scalar scan. Only pairs whose box
+    distance is within ``tolerance`` of the closest endpoint-to-endpoint
+    distance (an upper bound on the answer) are measured exactly.
+    """
+    first_starts, first_ends = first
+    second_starts, second_ends = second
+    if not len(first_starts) or not len(second_starts):
+        return None
+    upper_bound = float(np.min(np.hypot(
+        first_starts[:, None, 0] - second_starts[None, :, 0],
+        first_starts[:, None, 1] - second_starts[None, :, 1],
+    )))
+    candidates = np.flatnonzero(_box_gaps(first_starts, first_ends, second_starts, second_ends) <= upper_bound + tolerance)
+    best: Optional[Tuple[float, Point, Point, int, int]] = None
+    for offset in range(0, len(candidates), _MAX_PAIRS_PER_CHUNK):
+        # flatnonzero keeps first-major order, so argmin's first hit is the
+        # earliest pair.
+        chunk = candidates[offset:offset + _MAX_PAIRS_PER_CHUNK]
+        rows, columns = np.divmod(chunk, len(second_starts))
+        distance, first_chosen, second_chosen = _closest_pairs(
+            first_starts[rows], first_ends[rows], second_starts[columns], second_ends[columns]
+        )
+        position = int(np.argmin(distance))
+        value = float(distance[position])
+        if best is None or value < best[0]:
+            best = (
+                value,
+                (float(first_chosen[position, 0]), float(first_chosen[position, 1])),
+                (float(second_chosen[position, 0]), float(second_chosen[position, 1])),
+                int(rows[position]),
+                int(columns[position]),
+            )
+    return best
+
+
+def first_crossing(start: Point, end: Point, segments: SegmentArrays) -> Optional[int]:
+    """Position of the first non-degenerate segment that ``start``-``end`` crosses."""
+    segment_starts, segment_ends = segments
+    if not len(segment_starts):
+        return None
+    crossed = segments_intersect(np.asarray(start, dtype=np.float64), np.asarray(end, dtype=np.float64), segment_starts, segment_ends)
+    crossed &= np.any(segment_starts != segment_ends, axis=-1)
+    if not crossed.any():
+        return None
+    return int(np.argmax(crossed))
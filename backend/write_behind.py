@@ -0,0 +1,147 @@
+"""Write-behind queue that takes persistence off the request path.
+
+Callers ``submit`` an item under a key and return at once. A lifespan-scoped
+task hands everything pending to ``flush`` in a worker thread every
+``interval_s``, or sooner once ``max_pending`` items are waiting, so a burst
+of writes becomes one flush. Resubmitting a pending key replaces its item,
+and ``aclose`` drains whatever is still pending before shutdown.
+
+Until ``start`` runs (scripts, tests without a lifespan) the queue is not
+``running`` and callers are expected to write through synchronously.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class WriteBehindQueue(Generic[T]):
+    def __init__(
+        self,
+        name: str,
+        flush: Callable[[List[Tuple[Hashable, T]]], None],
+        *,
+        interval_s: float,
+        max_pending: int,
+    ) -> None:
+        self.name = name
+        self.interval_s = max(0.01, float(interval_s))
+        self.max_pending = max(1, int(max_pending))
+        self._flush = flush
+        self._pending: Dict[Hashable, Tuple[int, T]] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flushing: Optional[asyncio.Lock] = None
+        self._closing = False
+        self._status: Dict[str, Any] = {"flushes": 0, "flushed": 0, "failures": 0, "last_error": None, "last_flush_at": None}
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done() and not self._closing
+
+    def submit(self, key: Hashable, item: T) -> None:
+        with self._lock:
+            self._version += 1
+            self._pending[key] = (self._version, item)
+            full = len(self._pending) >= self.max_pending
+        if full and self._wakeup is not None and self._loop is not None:
+            # Writers may be asyncio.to_thread workers, so wake the flusher
+            # through the loop instead of touching the Event directly.
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def pending(self) -> List[Tuple[Hashable, T]]:
+        with self._lock:
+            return [(key, item) for key, (_version, item) in self._pending.items()]
+
+    def get(self, key: Hashable) -> Optional[T]:
+        with self._lock:
+            entry = self._pending.get(key)
+            return entry[1] if entry is not None else None
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._flushing = asyncio.Lock()
+        self._closing = False
+        self._task = asyncio.create_task(self._run(), name=f"write_behind:{self.name}")
+
+    async def aclose(self) -> None:
+        """Stop the flusher after it has written everything still pending."""
+        task = self._task
+        if task is None:
+            return
+        # Let the loop finish its current flush and drain instead of
+        # cancelling it mid-write, which would leave the worker thread
+        # running while the drain writes the same batch again.
+        self._closing = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+        await asyncio.gather(task, return_exceptions=True)
+        self._task = None
+
+    async def flush_pending(self) -> int:
+        """Flush everything pending now; returns the number of items written."""
+        flushing = self._flushing or asyncio.Lock()
+        async with flushing:
+            with self._lock:
+                batch = [(key, version, item) for key, (version, item) in self._pending.items()]
+            if not batch:
+                return 0
+            try:
+                await asyncio.to_thread(self._flush, [(key, item) for key, _version, item in batch])
+            except Exception as error:
+                # Items stay pending and are retried on the next interval.
+                self._status["failures"] += 1
+                self._status["last_error"] = type(error).__name__
+                LOGGER.warning("write_behind_flush_failure queue=%s pending=%d error=%s", self.name, len(batch), type(error).__name__)
+                return 0
+            with self._lock:
+                for key, version, _item in batch:
+                    current = self._pending.get(key)
+                    if current is not None and current[0] == version:
+                        del self._pending[key]
+            self._status["flushes"] += 1
+            self._status["flushed"] += len(batch)
+            self._status["last_error"] = None
+            self._status["last_flush_at"] = time.time()
+            return len(batch)
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval_s)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush_pending()
+            if self._closing:
+                if self.pending():
+                    LOGGER.warning("write_behind_drain_incomplete queue=%s pending=%d", self.name, len(self.pending()))
+                return
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "queue": self.name,
+            "running": self.running,
+            "pending": pending,
+            "interval_s": self.interval_s,
+            "max_pending": self.max_pending,
+            **self._status,
+        }